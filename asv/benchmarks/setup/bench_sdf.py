@@ -41,6 +41,10 @@ def _build_sdf(mesh: "newton.Mesh", *, max_resolution: int) -> "newton.SDF":
     return mesh.build_sdf(max_resolution=max_resolution)
 
 
+# ``Mesh.build_sdfs`` (concurrent multi-mesh cooking) does not exist on older
+# base commits; the batch benchmark is skipped there instead of failing setup.
+_HAS_BUILD_SDFS = hasattr(newton.Mesh, "build_sdfs")
+
 # Subdivision 4 yields 20 * 4**4 = 5120 triangles, which is representative of
 # typical collision meshes used with SDF-based contact (YCB, nut-bolt, gears).
 _SPHERE_SUBDIVISIONS = 4
@@ -204,6 +208,57 @@ class FastBuildSdf:
         wp.synchronize_device()
 
 
+# Number of distinct meshes cooked per ``FastBuildSdfBatch`` sample, standing in
+# for a clutter scene (YCB-style) with many unique collision meshes.
+_BATCH_MESH_COUNT = 16
+
+
+class FastBuildSdfBatch:
+    """Time ``Mesh.build_sdfs`` on a batch of distinct meshes, sequential vs. concurrent.
+
+    Each mesh is the benchmark icosphere with a different anisotropic scale, so
+    no two cooks share a cache key and every mesh is cooked.  ``max_workers=1``
+    is the sequential baseline; ``None`` uses one worker per CPU core.
+    """
+
+    params = ([1, None],)
+    param_names = ["max_workers"]
+
+    rounds = 2
+    repeat = 3
+    number = 1
+    min_run_count = 1
+    timeout = 600
+
+    def setup(self, max_workers):
+        wp.init()
+        if wp.get_cuda_device_count() == 0 or not _HAS_BUILD_SDFS:
+            return
+
+        vertices, indices = _create_icosphere(radius=0.5, subdivisions=_SPHERE_SUBDIVISIONS)
+        rng = np.random.default_rng(0)
+        self._meshes = [
+            newton.Mesh(vertices * rng.uniform(0.5, 1.5, size=3).astype(np.float32), indices, compute_inertia=False)
+            for _ in range(_BATCH_MESH_COUNT)
+        ]
+
+        # Warm up kernel compilation and the GPU clocks on one mesh.
+        for _ in range(_WARMUP_BUILDS):
+            self._meshes[0].clear_sdf()
+            _build_sdf(self._meshes[0], max_resolution=64)
+        self._meshes[0].clear_sdf()
+        wp.synchronize_device()
+
+    @skip_benchmark_if(wp.get_cuda_device_count() == 0 or not _HAS_BUILD_SDFS)
+    def time_build_sdfs(self, max_workers):
+        newton.Mesh.build_sdfs(
+            self._meshes, max_workers=max_workers, max_resolution=64, edge_lower_angle_threshold_rad=-1.0
+        )
+        wp.synchronize_device()
+        for mesh in self._meshes:
+            mesh.clear_sdf()
+
+
 if __name__ == "__main__":
     import argparse
 
@@ -211,6 +266,7 @@ if __name__ == "__main__":
 
     benchmark_list = {
         "FastBuildSdf": FastBuildSdf,
+        "FastBuildSdfBatch": FastBuildSdfBatch,
     }
 
     parser = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
@@ -13,12 +13,14 @@ from typing import ClassVar
 import numpy as np
 
 import newton.examples
+import newton.geometry
 from newton.viewer import ViewerNull
 
 ISAACGYM_ENVS_REPO_URL = "https://github.com/isaac-sim/IsaacGymEnvs.git"
 ISAACGYM_NUT_BOLT_FOLDER = "assets/factory/mesh/factory_nut_bolt"
 IRREGULAR_ROCK_VERTEX_COUNTS = (10, 14, 18, 26)
 CONVEX_COLLISION_CASES = (("hulls", 56), ("hulls_duplicate", 192), ("mixed", 191))
+BROAD_PHASE_DEBRIS_CASES = ((1, 4096), (1, 32768), (64, 512))
 MIXED_CONVEX_PAIR_TYPES = (
     ("sphere", "sphere"),
     ("capsule", "capsule"),
@@ -314,6 +316,73 @@ class FastConvexCollision:
         wp.synchronize_device()
 
 
+class FastBroadPhaseDebris:
+    """Benchmark broad phases on many similarly sized shapes per world."""
+
+    params = (("nxn", "sap", "spatial_hash"), BROAD_PHASE_DEBRIS_CASES)
+    param_names: ClassVar[list[str]] = ["broad_phase", "case"]
+    repeat = 5
+    number = 1
+
+    def setup(self, broad_phase, case):
+        device = wp.get_device()
+        if not device.is_cuda or not wp.is_mempool_enabled(device):
+            raise SkipNotImplemented
+
+        world_count, shapes_per_world = case
+        if broad_phase == "nxn" and shapes_per_world > 4096:
+            raise SkipNotImplemented
+
+        self.launch_count = 100
+        shape_count = world_count * shapes_per_world
+        rng = np.random.default_rng(42)
+        # Debris field with a density of roughly one shape per 0.1 m cube
+        extent = 0.1 * shapes_per_world ** (1.0 / 3.0)
+        centers = rng.random((shape_count, 3)) * extent
+        half_extents = rng.uniform(0.02, 0.05, size=(shape_count, 3))
+        shape_world = np.repeat(np.arange(world_count, dtype=np.int32), shapes_per_world)
+
+        with wp.ScopedDevice(device):
+            self.shape_lower = wp.array(centers - half_extents, dtype=wp.vec3)
+            self.shape_upper = wp.array(centers + half_extents, dtype=wp.vec3)
+            self.shape_gap = wp.zeros(shape_count, dtype=wp.float32)
+            self.shape_collision_group = wp.ones(shape_count, dtype=wp.int32)
+            self.shape_world = wp.array(shape_world, dtype=wp.int32)
+            self.candidate_pair = wp.zeros(16 * shape_count, dtype=wp.vec2i)
+            self.candidate_pair_count = wp.zeros(1, dtype=wp.int32)
+
+        if broad_phase == "nxn":
+            self.broad_phase = newton.geometry.BroadPhaseAllPairs(self.shape_world)
+        elif broad_phase == "sap":
+            self.broad_phase = newton.geometry.BroadPhaseSAP(self.shape_world)
+        else:
+            self.broad_phase = newton.geometry.BroadPhaseSpatialHash(self.shape_world)
+        self.shape_count = shape_count
+
+        self._launch()
+        with wp.ScopedCapture(device=device) as capture:
+            self._launch()
+        self.graph = capture.graph
+
+    def _launch(self):
+        self.broad_phase.launch(
+            self.shape_lower,
+            self.shape_upper,
+            self.shape_gap,
+            self.shape_collision_group,
+            self.shape_world,
+            self.shape_count,
+            self.candidate_pair,
+            self.candidate_pair_count,
+        )
+
+    @skip_benchmark_if(wp.get_cuda_device_count() == 0)
+    def time_broad_phase(self, broad_phase, case):
+        for _ in range(self.launch_count):
+            wp.capture_launch(self.graph)
+        wp.synchronize_device()
+
+
 if __name__ == "__main__":
     import argparse
 
@@ -324,6 +393,7 @@ if __name__ == "__main__":
         "FastExampleContactHydroWorkingDefaults": FastExampleContactHydroWorkingDefaults,
         "FastExampleContactPyramidDefaults": FastExampleContactPyramidDefaults,
         "FastConvexCollision": FastConvexCollision,
+        "FastBroadPhaseDebris": FastBroadPhaseDebris,
     }
 
     parser = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
@@ -80,6 +80,7 @@ from ._src.sim import (  # noqa: E402
     BodyFlags,
     CollisionPipeline,
     Contacts,
+    ContactStream,
     Control,
     EqType,
     JointTargetMode,
@@ -87,6 +88,7 @@ from ._src.sim import (  # noqa: E402
     Model,
     ModelBuilder,
     ModelFlags,
+    SleepManager,
     State,
     StateFlags,
     eval_fk,
@@ -101,6 +103,7 @@ from ._src.sim import (  # noqa: E402
 __all__ += [
     "BodyFlags",
     "CollisionPipeline",
+    "ContactStream",
     "Contacts",
     "Control",
     "EqType",
@@ -109,6 +112,7 @@ __all__ += [
     "Model",
     "ModelBuilder",
     "ModelFlags",
+    "SleepManager",
     "State",
     "StateFlags",
     "eval_fk",
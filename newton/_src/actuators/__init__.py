@@ -5,11 +5,13 @@ from .actuator import Actuator
 from .clamping import Clamping, ClampingDCMotor, ClampingMaxEffort, ClampingPositionBased
 from .controllers import Controller, ControllerNeuralLSTM, ControllerNeuralMLP, ControllerPD, ControllerPID
 from .delay import Delay
+from .scheduler import ActuatorScheduler
 from .usd_parser import ActuatorParsed, ComponentKind, SchemaNames, parse_actuator_prim, register_actuator_component
 
 __all__ = [
     "Actuator",
     "ActuatorParsed",
+    "ActuatorScheduler",
     "Clamping",
     "ClampingDCMotor",
     "ClampingMaxEffort",
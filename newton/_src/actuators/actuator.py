@@ -12,6 +12,7 @@ import warp as wp
 from .clamping.base import Clamping
 from .controllers.base import Controller
 from .delay import Delay
+from .fused import fused_actuator_inputs, get_fused_actuator_kernel
 
 
 @wp.kernel
@@ -94,6 +95,7 @@ class Actuator:
         control_output_attr: str = "joint_f",
         control_computed_output_attr: str | None = None,
         requires_grad: bool = False,
+        fused: bool = True,
     ):
         """Initialize actuator.
 
@@ -128,6 +130,12 @@ class Actuator:
                 effort. None to skip writing computed effort.
             requires_grad: Allocate intermediate arrays with gradient support
                 for differentiable simulation.
+            fused: Run delay, controller, clamping, and scatter-add as a
+                single kernel when the components form a supported
+                combination (:class:`ControllerPD` or :class:`ControllerPID`,
+                optional :class:`Delay`, at most one built-in clamping stage,
+                and ``requires_grad=False``).  Other combinations always use
+                the composed per-component launches.
         """
         self.indices = indices
         self.pos_indices = pos_indices if pos_indices is not None else indices
@@ -182,6 +190,13 @@ class Actuator:
         for clamp in self.clamping:
             clamp.finalize(self.device, self.num_actuators)
 
+        self._fused_kernel = get_fused_actuator_kernel(self) if fused else None
+
+    @property
+    def is_fused(self) -> bool:
+        """Whether :meth:`step` runs the whole pipeline as a single kernel."""
+        return self._fused_kernel is not None
+
     def is_stateful(self) -> bool:
         """Return True if delay or controller maintains internal state."""
         return self.delay is not None or self.controller.is_stateful()
@@ -222,6 +237,9 @@ class Actuator:
         5. **State updates** — controller state update, then delay
            buffer write (push current targets into ``next_state``).
 
+        When :attr:`is_fused` is ``True`` all five stages run in a single
+        kernel launch with identical results.
+
         Args:
             sim_state: Simulation state with position/velocity arrays.
             sim_control: Control structure with target/output arrays.
@@ -243,6 +261,39 @@ class Actuator:
         if self.control_feedforward_attr is not None:
             orig_feedforward = getattr(sim_control, self.control_feedforward_attr, None)
 
+        applied_output = getattr(sim_control, self.control_output_attr)
+        computed_output = None
+        if (
+            self.control_computed_output_attr is not None
+            and self.control_computed_output_attr != self.control_output_attr
+        ):
+            computed_output = getattr(sim_control, self.control_computed_output_attr)
+
+        if self._fused_kernel is not None:
+            delay_state = current_act_state.delay_state if current_act_state else None
+            next_delay_state = next_act_state.delay_state if next_act_state else None
+            ctrl_state = current_act_state.controller_state if current_act_state else None
+            next_ctrl_state = next_act_state.controller_state if next_act_state else None
+            wp.launch(
+                kernel=self._fused_kernel,
+                dim=self.num_actuators,
+                inputs=[
+                    positions,
+                    velocities,
+                    orig_target_pos,
+                    orig_target_vel,
+                    orig_feedforward,
+                    self.pos_indices,
+                    self.indices,
+                    self.target_pos_indices,
+                    self.effort_indices,
+                    *fused_actuator_inputs(self, delay_state, next_delay_state, ctrl_state, next_ctrl_state, dt),
+                ],
+                outputs=[self._computed_forces, self._applied_forces, applied_output, computed_output],
+                device=self.device,
+            )
+            return
+
         target_pos = orig_target_pos
         target_vel = orig_target_vel
         feedforward = orig_feedforward
@@ -299,13 +350,6 @@ class Actuator:
             output_forces = self._computed_forces
 
         # --- 4. Scatter-add to output ---
-        applied_output = getattr(sim_control, self.control_output_attr)
-        computed_output = None
-        if (
-            self.control_computed_output_attr is not None
-            and self.control_computed_output_attr != self.control_output_attr
-        ):
-            computed_output = getattr(sim_control, self.control_computed_output_attr)
         wp.launch(
             kernel=_scatter_add_kernel,
             dim=self.num_actuators,
@@ -0,0 +1,260 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Single-kernel code path for common delay → controller → clamping chains."""
+
+from __future__ import annotations
+
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+import warp as wp
+
+from .clamping.clamping_dc_motor import ClampingDCMotor
+from .clamping.clamping_max_effort import ClampingMaxEffort
+from .clamping.clamping_position_based import ClampingPositionBased, _interp_1d
+from .controllers.controller_pd import ControllerPD
+from .controllers.controller_pid import ControllerPID
+from .delay import Delay
+
+if TYPE_CHECKING:
+    from .actuator import Actuator
+
+
+class _ControllerKind(IntEnum):
+    PD = 0
+    PID = 1
+
+
+class _ClampKind(IntEnum):
+    NONE = 0
+    MAX_EFFORT = 1
+    DC_MOTOR = 2
+    POSITION_BASED = 3
+
+
+_CONTROLLER_KINDS = {ControllerPD: _ControllerKind.PD, ControllerPID: _ControllerKind.PID}
+_CLAMP_KINDS = {
+    ClampingMaxEffort: _ClampKind.MAX_EFFORT,
+    ClampingDCMotor: _ClampKind.DC_MOTOR,
+    ClampingPositionBased: _ClampKind.POSITION_BASED,
+}
+
+_fused_kernel_cache: dict[tuple[int, int, bool], wp.Kernel] = {}
+
+
+def create_fused_actuator_kernel(controller_kind: int, clamp_kind: int, has_delay: bool) -> wp.Kernel:
+    """Create the fused actuator kernel for one controller/clamping/delay combination.
+
+    Unused stages are removed at code-generation time through ``wp.static``,
+    so every combination compiles to a kernel that only touches the arrays it
+    needs. Kernels are cached per combination.
+    """
+    key = (int(controller_kind), int(clamp_kind), bool(has_delay))
+    kernel = _fused_kernel_cache.get(key)
+    if kernel is not None:
+        return kernel
+
+    is_pid = controller_kind == _ControllerKind.PID
+
+    @wp.kernel(module="unique", enable_backward=False)
+    def fused_actuator_kernel(
+        positions: wp.array[float],
+        velocities: wp.array[float],
+        target_pos: wp.array[float],
+        target_vel: wp.array[float],
+        feedforward: wp.array[float],
+        pos_indices: wp.array[wp.uint32],
+        vel_indices: wp.array[wp.uint32],
+        target_pos_indices: wp.array[wp.uint32],
+        effort_indices: wp.array[wp.uint32],
+        # delay
+        delay_steps: wp.array[int],
+        buf_depth: int,
+        current_buffer_pos: wp.array2d[float],
+        current_buffer_vel: wp.array2d[float],
+        current_buffer_act: wp.array2d[float],
+        current_num_pushes: wp.array[int],
+        current_write_idx: wp.array[int],
+        next_buffer_pos: wp.array2d[float],
+        next_buffer_vel: wp.array2d[float],
+        next_buffer_act: wp.array2d[float],
+        next_num_pushes: wp.array[int],
+        next_write_idx: wp.array[int],
+        # controller
+        kp: wp.array[float],
+        ki: wp.array[float],
+        kd: wp.array[float],
+        integral_max: wp.array[float],
+        const_effort: wp.array[float],
+        dt: float,
+        current_integral: wp.array[float],
+        next_integral: wp.array[float],
+        # clamping
+        max_effort: wp.array[float],
+        saturation_effort: wp.array[float],
+        velocity_limit: wp.array[float],
+        corner_velocity: wp.array[float],
+        lookup_positions: wp.array[float],
+        lookup_efforts: wp.array[float],
+        lookup_size: int,
+        # outputs
+        computed_forces: wp.array[float],
+        applied_forces: wp.array[float],
+        output: wp.array[float],
+        computed_output: wp.array[float],
+    ):
+        i = wp.tid()
+        pos_idx = pos_indices[i]
+        vel_idx = vel_indices[i]
+
+        cmd_pos = target_pos[target_pos_indices[i]]
+        cmd_vel = target_vel[vel_idx]
+        cmd_act = float(0.0)
+        if feedforward:
+            cmd_act = feedforward[vel_idx]
+
+        # --- Delay: read the delayed command, then push the current one ---
+        tgt_pos = cmd_pos
+        tgt_vel = cmd_vel
+        ff = cmd_act
+        if wp.static(has_delay):
+            num_pushes = current_num_pushes[i]
+            copy_idx = current_write_idx[0]
+            if num_pushes > 0 and delay_steps[i] > 0:
+                lag = wp.min(delay_steps[i] - 1, num_pushes - 1)
+                read_idx = (copy_idx - lag + buf_depth) % buf_depth
+                tgt_pos = current_buffer_pos[read_idx, i]
+                tgt_vel = current_buffer_vel[read_idx, i]
+                ff = current_buffer_act[read_idx, i]
+
+            write_idx = (copy_idx + 1) % buf_depth
+            next_buffer_pos[copy_idx, i] = current_buffer_pos[copy_idx, i]
+            next_buffer_vel[copy_idx, i] = current_buffer_vel[copy_idx, i]
+            next_buffer_act[copy_idx, i] = current_buffer_act[copy_idx, i]
+            next_buffer_pos[write_idx, i] = cmd_pos
+            next_buffer_vel[write_idx, i] = cmd_vel
+            next_buffer_act[write_idx, i] = cmd_act
+            next_num_pushes[i] = wp.min(num_pushes + 1, buf_depth)
+            if i == 0:
+                next_write_idx[0] = write_idx
+
+        # --- Controller ---
+        position_error = tgt_pos - positions[pos_idx]
+        velocity_error = tgt_vel - velocities[vel_idx]
+        const_e = float(0.0)
+        if const_effort:
+            const_e = const_effort[i]
+        integral_term = float(0.0)
+        if wp.static(is_pid):
+            integral = wp.clamp(current_integral[i] + position_error * dt, -integral_max[i], integral_max[i])
+            integral_term = ki[i] * integral
+            next_integral[i] = integral
+        effort = const_e + ff + kp[i] * position_error + integral_term + kd[i] * velocity_error
+
+        # --- Clamping ---
+        applied = effort
+        if wp.static(clamp_kind == _ClampKind.MAX_EFFORT):
+            applied = wp.clamp(effort, -max_effort[i], max_effort[i])
+        elif wp.static(clamp_kind == _ClampKind.DC_MOTOR):
+            vel = wp.clamp(velocities[vel_idx], -corner_velocity[i], corner_velocity[i])
+            effort_max = wp.min(saturation_effort[i] * (1.0 - vel / velocity_limit[i]), max_effort[i])
+            effort_min = wp.max(saturation_effort[i] * (-1.0 - vel / velocity_limit[i]), -max_effort[i])
+            applied = wp.clamp(effort, effort_min, effort_max)
+        elif wp.static(clamp_kind == _ClampKind.POSITION_BASED):
+            limit = _interp_1d(positions[pos_idx], lookup_positions, lookup_efforts, lookup_size)
+            applied = wp.clamp(effort, -limit, limit)
+
+        # --- Scatter-add ---
+        computed_forces[i] = effort
+        if applied_forces:
+            applied_forces[i] = applied
+        out_idx = effort_indices[i]
+        output[out_idx] = output[out_idx] + applied
+        if computed_output:
+            computed_output[out_idx] = computed_output[out_idx] + effort
+
+    _fused_kernel_cache[key] = fused_actuator_kernel
+    return fused_actuator_kernel
+
+
+def get_fused_actuator_kernel(actuator: Actuator) -> wp.Kernel | None:
+    """Return the fused kernel matching *actuator*'s components, or ``None``.
+
+    Only exact :class:`ControllerPD` / :class:`ControllerPID` controllers with
+    at most one built-in clamping stage and an optional built-in
+    :class:`Delay` are supported; subclasses may override the component
+    launches and always take the composed path.
+    """
+    controller_kind = _CONTROLLER_KINDS.get(type(actuator.controller))
+    if controller_kind is None or actuator.requires_grad or len(actuator.clamping) > 1:
+        return None
+    clamp_kind = _ClampKind.NONE
+    if actuator.clamping:
+        clamp_kind = _CLAMP_KINDS.get(type(actuator.clamping[0]))
+        if clamp_kind is None:
+            return None
+    if actuator.delay is not None and type(actuator.delay) is not Delay:
+        return None
+    return create_fused_actuator_kernel(controller_kind, clamp_kind, actuator.delay is not None)
+
+
+def fused_actuator_inputs(
+    actuator: Actuator,
+    delay_state: Delay.State | None,
+    next_delay_state: Delay.State | None,
+    controller_state: ControllerPID.State | None,
+    next_controller_state: ControllerPID.State | None,
+    dt: float | None,
+) -> list:
+    """Collect the delay, controller, and clamping arguments of the fused kernel."""
+    ctrl = actuator.controller
+    delay = actuator.delay
+    if delay is not None:
+        delay_args = [
+            delay.delay_steps,
+            delay.buf_depth,
+            delay_state.buffer_pos,
+            delay_state.buffer_vel,
+            delay_state.buffer_act,
+            delay_state.num_pushes,
+            delay_state.write_idx,
+            next_delay_state.buffer_pos,
+            next_delay_state.buffer_vel,
+            next_delay_state.buffer_act,
+            next_delay_state.num_pushes,
+            next_delay_state.write_idx,
+        ]
+    else:
+        delay_args = [None, 0, None, None, None, None, None, None, None, None, None, None]
+
+    if isinstance(ctrl, ControllerPID):
+        controller_args = [
+            ctrl.kp,
+            ctrl.ki,
+            ctrl.kd,
+            ctrl.integral_max,
+            ctrl.const_effort,
+            dt,
+            controller_state.integral,
+            next_controller_state.integral,
+        ]
+    else:
+        controller_args = [ctrl.kp, None, ctrl.kd, None, ctrl.const_effort, 0.0, None, None]
+
+    clamp_args = [None, None, None, None, None, None, 0]
+    if actuator.clamping:
+        clamp = actuator.clamping[0]
+        if isinstance(clamp, ClampingMaxEffort):
+            clamp_args[0] = clamp.max_effort
+        elif isinstance(clamp, ClampingDCMotor):
+            clamp_args[:4] = [
+                clamp.max_motor_effort,
+                clamp.saturation_effort,
+                clamp.velocity_limit,
+                clamp.corner_velocity,
+            ]
+        else:
+            clamp_args[4:] = [clamp.lookup_positions, clamp.lookup_efforts, clamp.lookup_size]
+
+    return delay_args + controller_args + clamp_args
@@ -0,0 +1,454 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import warp as wp
+
+from .actuator import Actuator
+from .controllers.base import Controller
+from .controllers.controller_neural_lstm import ControllerNeuralLSTM
+from .controllers.controller_neural_lstm import _compute_inputs_kernel as _lstm_inputs_kernel
+from .controllers.controller_neural_mlp import ControllerNeuralMLP, _roll_history_kernel
+from .utils import _runtime_shape, load_checkpoint
+
+
+@wp.kernel
+def _mlp_batch_inputs_kernel(
+    target_pos: wp.array[float],
+    positions: wp.array[float],
+    velocities: wp.array[float],
+    pos_indices: wp.array[wp.uint32],
+    vel_indices: wp.array[wp.uint32],
+    target_pos_indices: wp.array[wp.uint32],
+    pos_history: wp.array2d[float],
+    vel_history: wp.array2d[float],
+    input_idx: wp.array[int],
+    pos_scale: float,
+    vel_scale: float,
+    k_per_block: int,
+    pos_first: int,
+    has_history: int,
+    pos_error: wp.array[float],
+    vel: wp.array[float],
+    out: wp.array2d[float],
+):
+    """Gather position error and velocity and assemble the MLP input in one pass."""
+    i, k = wp.tid()
+    e = target_pos[target_pos_indices[i]] - positions[pos_indices[i]]
+    v = velocities[vel_indices[i]]
+    if k == 0:
+        pos_error[i] = e
+        vel[i] = v
+
+    block = k // k_per_block
+    idx = input_idx[k % k_per_block]
+    is_pos = (block == 0) == (pos_first != 0)
+    value = float(0.0)
+    if is_pos:
+        if idx == 0:
+            value = e * pos_scale
+        elif has_history != 0:
+            value = pos_history[idx - 1, i] * pos_scale
+    else:
+        if idx == 0:
+            value = v * vel_scale
+        elif has_history != 0:
+            value = vel_history[idx - 1, i] * vel_scale
+    out[i, k] = value
+
+
+@wp.kernel
+def _scale_scatter_effort_kernel(
+    effort: wp.array2d[float],
+    scale: float,
+    effort_indices: wp.array[wp.uint32],
+    scatter: int,
+    computed: wp.array[float],
+    applied: wp.array[float],
+    output: wp.array[float],
+    computed_output: wp.array[float],
+):
+    """Scale network effort and, when no clamping follows, accumulate it into the output."""
+    i = wp.tid()
+    f = effort[i, 0] * scale
+    computed[i] = f
+    if applied:
+        applied[i] = f
+    if scatter != 0:
+        idx = effort_indices[i]
+        wp.atomic_add(output, int(idx), f)
+        if computed_output:
+            wp.atomic_add(computed_output, int(idx), f)
+
+
+@wp.kernel
+def _scatter_add_batch_kernel(
+    forces: wp.array[float],
+    computed_forces: wp.array[float],
+    indices: wp.array[wp.uint32],
+    output: wp.array[float],
+    computed_output: wp.array[float],
+):
+    i = wp.tid()
+    idx = indices[i]
+    wp.atomic_add(output, int(idx), forces[i])
+    if computed_output:
+        wp.atomic_add(computed_output, int(idx), computed_forces[i])
+
+
+class _NeuralGroup:
+    """Actuators sharing one neural checkpoint, evaluated as a single batch."""
+
+    def __init__(self, actuators: list[Actuator]):
+        first = actuators[0]
+        self.actuators = actuators
+        self.controller = first.controller
+        self.device = first.device
+        self.is_lstm = isinstance(self.controller, ControllerNeuralLSTM)
+
+        counts = [a.num_actuators for a in actuators]
+        self.offsets = np.concatenate(([0], np.cumsum(counts))).tolist()
+        n = self.offsets[-1]
+        self.num_actuators = n
+
+        def _concat(attr: str) -> wp.array:
+            return wp.array(
+                np.concatenate([getattr(a, attr).numpy() for a in actuators]).astype(np.uint32),
+                dtype=wp.uint32,
+                device=self.device,
+            )
+
+        self.pos_indices = _concat("pos_indices")
+        self.vel_indices = _concat("indices")
+        self.target_pos_indices = _concat("target_pos_indices")
+        self.effort_indices = _concat("effort_indices")
+
+        self.has_clamping = any(a.clamping for a in actuators)
+        self.computed_forces = wp.zeros(n, dtype=wp.float32, device=self.device)
+        self.applied_forces = wp.zeros(n, dtype=wp.float32, device=self.device) if self.has_clamping else None
+
+        ctrl = self.controller
+        if self.is_lstm:
+            runtime, _ = load_checkpoint(
+                ctrl.model_path,
+                device=self.device,
+                batch_size=n,
+                input_batch_axes={ctrl._input_name: 1, ctrl._hidden_in_name: 1, ctrl._cell_in_name: 1},
+            )
+            self.input_name = ctrl._input_name
+            self.output_name = ctrl._output_name
+            self.net_input = wp.zeros((1, n, 2), dtype=wp.float32, device=self.device)
+        else:
+            runtime, _ = load_checkpoint(ctrl.model_path, device=self.device, batch_size=n, input_batch_axes=0)
+            self.input_name = runtime.input_names[0]
+            self.output_name = runtime.output_names[0]
+            self.net_input = wp.zeros((n, 2 * len(ctrl.input_idx)), dtype=wp.float32, device=self.device)
+            self.pos_error = wp.zeros(n, dtype=wp.float32, device=self.device)
+            self.vel = wp.zeros(n, dtype=wp.float32, device=self.device)
+            self.input_idx = wp.array(ctrl.input_idx, dtype=wp.int32, device=self.device)
+        self.network = runtime
+
+        try:
+            out_shape = _runtime_shape(runtime, self.output_name)
+        except ValueError:
+            runtime({self.input_name: self.net_input})
+            out_shape = _runtime_shape(runtime, self.output_name)
+        if out_shape != (n, 1):
+            raise ValueError(
+                f"ActuatorScheduler: network output '{self.output_name}' of '{ctrl.model_path}' has shape "
+                f"{out_shape}, expected {(n, 1)} (one scalar effort per actuator)"
+            )
+
+    def state(self) -> tuple[Controller.State, list[Actuator.State]]:
+        """Allocate a batched controller state and per-actuator views into it."""
+        batched = self.controller.state(self.num_actuators, self.device)
+        views = []
+        for k in range(len(self.actuators)):
+            lo, hi = self.offsets[k], self.offsets[k + 1]
+            if self.is_lstm:
+                ctrl_state = ControllerNeuralLSTM.State(
+                    hidden=batched.hidden[:, lo:hi, :], cell=batched.cell[:, lo:hi, :]
+                )
+            else:
+                ctrl_state = ControllerNeuralMLP.State(
+                    pos_error_history=batched.pos_error_history[:, lo:hi],
+                    vel_history=batched.vel_history[:, lo:hi],
+                )
+            views.append(Actuator.State(delay_state=None, controller_state=ctrl_state))
+        return batched, views
+
+    def step(
+        self,
+        sim_state: Any,
+        sim_control: Any,
+        current: Controller.State,
+        next_state: Controller.State,
+    ) -> None:
+        first = self.actuators[0]
+        ctrl = self.controller
+        n = self.num_actuators
+        positions = getattr(sim_state, first.state_pos_attr)
+        velocities = getattr(sim_state, first.state_vel_attr)
+        target_pos = getattr(sim_control, first.control_target_pos_attr)
+
+        if self.is_lstm:
+            wp.launch(
+                _lstm_inputs_kernel,
+                dim=n,
+                inputs=[
+                    target_pos,
+                    positions,
+                    velocities,
+                    self.pos_indices,
+                    self.vel_indices,
+                    self.target_pos_indices,
+                    ctrl.pos_scale,
+                    ctrl.vel_scale,
+                    self.net_input,
+                ],
+                device=self.device,
+            )
+            out = self.network(
+                {
+                    ctrl._input_name: self.net_input,
+                    ctrl._hidden_in_name: current.hidden,
+                    ctrl._cell_in_name: current.cell,
+                }
+            )
+        else:
+            k_per_block = len(ctrl.input_idx)
+            wp.launch(
+                _mlp_batch_inputs_kernel,
+                dim=(n, 2 * k_per_block),
+                inputs=[
+                    target_pos,
+                    positions,
+                    velocities,
+                    self.pos_indices,
+                    self.vel_indices,
+                    self.target_pos_indices,
+                    current.pos_error_history,
+                    current.vel_history,
+                    self.input_idx,
+                    ctrl.pos_scale,
+                    ctrl.vel_scale,
+                    k_per_block,
+                    1 if ctrl.input_order == "pos_vel" else 0,
+                    1 if ctrl.history_length > 1 else 0,
+                ],
+                outputs=[self.pos_error, self.vel, self.net_input],
+                device=self.device,
+            )
+            out = self.network({self.input_name: self.net_input})
+
+        output = getattr(sim_control, first.control_output_attr)
+        computed_output = None
+        if first.control_computed_output_attr is not None and first.control_computed_output_attr != (
+            first.control_output_attr
+        ):
+            computed_output = getattr(sim_control, first.control_computed_output_attr)
+
+        wp.launch(
+            _scale_scatter_effort_kernel,
+            dim=n,
+            inputs=[out[self.output_name], ctrl.effort_scale, self.effort_indices, 0 if self.has_clamping else 1],
+            outputs=[self.computed_forces, self.applied_forces, output, computed_output],
+            device=self.device,
+        )
+
+        if self.has_clamping:
+            for k, actuator in enumerate(self.actuators):
+                if not actuator.clamping:
+                    continue
+                lo, hi = self.offsets[k], self.offsets[k + 1]
+                src = self.computed_forces[lo:hi]
+                dst = self.applied_forces[lo:hi]
+                for clamp in actuator.clamping:
+                    clamp.modify_forces(
+                        src,
+                        dst,
+                        positions,
+                        velocities,
+                        actuator.pos_indices,
+                        actuator.indices,
+                        device=self.device,
+                    )
+                    src = dst
+            wp.launch(
+                _scatter_add_batch_kernel,
+                dim=n,
+                inputs=[self.applied_forces, self.computed_forces, self.effort_indices],
+                outputs=[output, computed_output],
+                device=self.device,
+            )
+
+        if self.is_lstm:
+            shape = (ctrl._num_layers, n, ctrl._hidden_size)
+            wp.copy(next_state.hidden, out[ctrl._hidden_out_name].reshape(shape))
+            wp.copy(next_state.cell, out[ctrl._cell_out_name].reshape(shape))
+        else:
+            h = current.pos_error_history.shape[0]
+            wp.launch(
+                _roll_history_kernel,
+                dim=(h, n),
+                inputs=[
+                    current.pos_error_history,
+                    current.vel_history,
+                    self.pos_error,
+                    self.vel,
+                    next_state.pos_error_history,
+                    next_state.vel_history,
+                    h,
+                ],
+                device=self.device,
+            )
+
+
+def _batch_key(actuator: Actuator) -> tuple | None:
+    """Return the grouping key of a batchable neural actuator, or ``None``."""
+    ctrl = actuator.controller
+    if not isinstance(ctrl, (ControllerNeuralMLP, ControllerNeuralLSTM)):
+        return None
+    if ctrl._is_torch_checkpoint or actuator.delay is not None:
+        return None
+    return (
+        type(ctrl),
+        ctrl.model_path,
+        str(actuator.device),
+        actuator.state_pos_attr,
+        actuator.state_vel_attr,
+        actuator.control_target_pos_attr,
+        actuator.control_output_attr,
+        actuator.control_computed_output_attr,
+    )
+
+
+class ActuatorScheduler:
+    """Steps a set of actuators, batching neural-network inference across them.
+
+    Neural actuators (:class:`~newton.actuators.ControllerNeuralMLP` and
+    :class:`~newton.actuators.ControllerNeuralLSTM`)
+    that load the same ONNX checkpoint and read/write the same simulation
+    attributes are grouped, and each group is evaluated with one network call
+    over the concatenated actuators. Input gathering and assembly run as a
+    single fused kernel per group, and effort scaling is fused with the
+    scatter-add into the output array when no clamping is configured. The
+    per-step launch count therefore depends on the number of distinct
+    networks rather than on the number of actuator groups.
+
+    Actuators that cannot be batched — non-neural controllers, Torch
+    checkpoints, and actuators with a :class:`~newton.actuators.Delay` — are
+    stepped individually through :meth:`~newton.actuators.Actuator.step`.
+
+    Usage::
+
+        scheduler = ActuatorScheduler(model.actuators)
+        act_state_0 = scheduler.state()
+        act_state_1 = scheduler.state()
+
+        # Simulation loop
+        control.joint_f.zero_()
+        scheduler.step(sim_state, control, act_state_0, act_state_1, dt=0.01)
+        act_state_0, act_state_1 = act_state_1, act_state_0
+    """
+
+    @dataclass
+    class State:
+        """Composed state for an :class:`ActuatorScheduler`."""
+
+        actuator_states: list[Actuator.State | None] = field(default_factory=list)
+        """Per-actuator states aligned with :attr:`ActuatorScheduler.actuators`.
+        States of batched actuators are views into :attr:`group_states`."""
+        group_states: list[Controller.State] = field(default_factory=list)
+        """Batched controller state of each neural group."""
+
+        def reset(self, mask: list[wp.array[wp.bool] | None] | None = None) -> None:
+            """Reset composed state.
+
+            Args:
+                mask: Per-actuator boolean masks aligned with
+                    :attr:`actuator_states`. A ``None`` entry resets the whole
+                    actuator; ``None`` resets all actuators.
+            """
+            if mask is not None and len(mask) != len(self.actuator_states):
+                raise ValueError(f"Expected {len(self.actuator_states)} masks, got {len(mask)}")
+            for i, state in enumerate(self.actuator_states):
+                if state is not None:
+                    state.reset(None if mask is None else mask[i])
+
+    def __init__(self, actuators: list[Actuator]):
+        """Initialize the scheduler and allocate batched network runtimes.
+
+        Args:
+            actuators: Actuators to step, typically ``model.actuators``.
+        """
+        self.actuators = list(actuators)
+
+        groups: dict[tuple, list[int]] = {}
+        self._individual: list[int] = []
+        for i, actuator in enumerate(self.actuators):
+            key = _batch_key(actuator)
+            if key is None:
+                self._individual.append(i)
+            else:
+                groups.setdefault(key, []).append(i)
+
+        self._group_members = list(groups.values())
+        self._groups = [_NeuralGroup([self.actuators[i] for i in members]) for members in self._group_members]
+
+    @property
+    def num_groups(self) -> int:
+        """Number of batched neural groups."""
+        return len(self._groups)
+
+    def is_graphable(self) -> bool:
+        """Return True if all actuators can be captured in a CUDA graph."""
+        return all(a.is_graphable() for a in self.actuators)
+
+    def state(self) -> ActuatorScheduler.State:
+        """Return a new composed state for all actuators."""
+        result = ActuatorScheduler.State(actuator_states=[None] * len(self.actuators))
+        for i in self._individual:
+            result.actuator_states[i] = self.actuators[i].state()
+        for group, members in zip(self._groups, self._group_members, strict=True):
+            batched, views = group.state()
+            result.group_states.append(batched)
+            for i, view in zip(members, views, strict=True):
+                result.actuator_states[i] = view
+        return result
+
+    def step(
+        self,
+        sim_state: Any,
+        sim_control: Any,
+        current_state: ActuatorScheduler.State,
+        next_state: ActuatorScheduler.State,
+        dt: float | None = None,
+    ) -> None:
+        """Execute one control step for all actuators.
+
+        Effort is **accumulated** into the output arrays, as with
+        :meth:`~newton.actuators.Actuator.step`; the caller must zero them first.
+
+        Args:
+            sim_state: Simulation state with position/velocity arrays.
+            sim_control: Control structure with target/output arrays.
+            current_state: Current composed state from :meth:`state`.
+            next_state: Next composed state from :meth:`state`.
+            dt: Timestep [s].
+        """
+        for group, cur, nxt in zip(self._groups, current_state.group_states, next_state.group_states, strict=True):
+            group.step(sim_state, sim_control, cur, nxt)
+        for i in self._individual:
+            self.actuators[i].step(
+                sim_state,
+                sim_control,
+                current_state.actuator_states[i],
+                next_state.actuator_states[i],
+                dt,
+            )
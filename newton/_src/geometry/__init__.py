@@ -4,6 +4,7 @@
 from .broad_phase_common import test_group_pair, test_world_and_group_pair
 from .broad_phase_nxn import BroadPhaseAllPairs, BroadPhaseExplicit
 from .broad_phase_sap import BroadPhaseSAP
+from .broad_phase_spatial_hash import BroadPhaseSpatialHash
 from .collision_primitive import (
     collide_box_box,
     collide_capsule_box,
@@ -37,6 +38,7 @@ __all__ = [
     "BroadPhaseAllPairs",
     "BroadPhaseExplicit",
     "BroadPhaseSAP",
+    "BroadPhaseSpatialHash",
     "Gaussian",
     "GeoType",
     "Heightfield",
@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
 # SPDX-License-Identifier: Apache-2.0
 
-"""On-disk cache for cooked texture SDFs.
+"""On-disk and in-process cache for cooked texture SDFs.
 
 The mesh SDF cooking pipeline produces a dictionary of plain numpy arrays
 (see :func:`newton._src.geometry.sdf_texture.build_sparse_sdf_from_mesh`)
@@ -22,6 +22,26 @@ replacement atomic; the unique tmp suffix lets multiple processes cook
 the same hash concurrently without trampling each other's in-flight
 writes.
 
+With ``cache_format="mmap"`` the same arrays are instead written as
+individual uncompressed ``.npy`` members of a ``{hash}.sdf.mmap``
+directory, published atomically by renaming a per-writer
+``{hash}.sdf.mmap.{pid}.{token}.tmp`` directory; an existing entry that
+fails validation is first moved aside so the fresh cook replaces it.
+The large arrays of a
+``.sdf.mmap`` entry are opened with ``np.load(..., mmap_mode="r")``, so
+worker processes on one host share the OS page cache instead of each
+decompressing and copying the archive.
+
+In-process cache
+----------------
+
+Every entry loaded or written in this process is also kept in an LRU
+keyed by the content hash (bounded by :data:`MEMORY_CACHE_MAX_BYTES`), so
+shapes sharing a mesh skip the disk entirely.  Entries are shared between
+callers and must be treated as read-only.  :func:`cache_stats` reports
+memory/disk hits, misses, and bytes read or mapped from disk;
+:func:`clear_memory_cache` empties the LRU and resets the counters.
+
 Cooked array layout (``.npz`` contents)
 ---------------------------------------
 
@@ -51,6 +71,8 @@ Cooked array layout (``.npz`` contents)
 * ``__created_utc__`` — 0-d ``str``: ISO-8601 UTC timestamp of the
   write.  Diagnostic only.
 
+A ``.sdf.mmap`` directory holds the same keys, one ``{key}.npy`` file each.
+
 The ``__kind__`` field is validated at load time. The ``__newton_version__`` and
 ``__created_utc__`` fields are diagnostic only.
 
@@ -90,7 +112,10 @@ import json
 import logging
 import os
 import secrets
+import shutil
+import threading
 import zipfile
+from collections import OrderedDict
 from collections.abc import Mapping
 from datetime import datetime, timezone
 from pathlib import Path
@@ -116,6 +141,8 @@ _KIND_KEY = "__kind__"
 _NEWTON_VERSION_KEY = "__newton_version__"
 _CREATED_UTC_KEY = "__created_utc__"
 _NPZ_SUFFIX = ".sdf.npz"
+_MMAP_SUFFIX = ".sdf.mmap"
+_CACHE_FORMATS = ("npz", "mmap")
 _KIND = "newton.texture_sdf"
 # Match the sentinels in ``sdf_texture``. Valid slots pack three 10-bit
 # coordinates into bits 0-29, leaving the two highest uint32 values reserved.
@@ -151,6 +178,19 @@ _FLOAT_SCALARS: tuple[tuple[str, np.dtype, type], ...] = (
 )
 _VEC3_SCALARS: tuple[str, ...] = ("min_extents", "max_extents", "cell_size")
 
+MEMORY_CACHE_MAX_BYTES: int = 1 << 30
+"""Byte budget of the in-process LRU of cooked SDFs.
+
+Least recently used entries are evicted once the summed array sizes
+exceed this budget; an entry larger than the budget is never retained.
+"""
+
+_memory_cache: OrderedDict[str, tuple[dict[str, Any], int]] = OrderedDict()
+# Counters reported by cache_stats(); ``memory_bytes`` tracks the LRU's current size.
+_stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "bytes_loaded": 0, "bytes_mapped": 0, "memory_bytes": 0}
+# Guards the LRU and the counters; cooks may run on several threads.
+_lock = threading.Lock()
+
 
 def _digest_array(arr: np.ndarray, dtype: np.dtype) -> str:
     """SHA-256 over ``arr`` after a deterministic dtype/contiguity cast."""
@@ -239,14 +279,80 @@ def hash_inputs(
     return hashlib.blake2b(encoded, digest_size=16).hexdigest()
 
 
-def cache_path(cache_dir: str | os.PathLike[str], hash_hex: str) -> Path:
-    """Return the ``.npz`` path for a given cache key."""
+def _check_cache_format(cache_format: str) -> None:
+    if cache_format not in _CACHE_FORMATS:
+        raise ValueError(f"Unknown cache_format {cache_format!r}. Expected one of {list(_CACHE_FORMATS)}.")
+
+
+def cache_path(cache_dir: str | os.PathLike[str], hash_hex: str, cache_format: str = "npz") -> Path:
+    """Return the ``.npz`` file (or ``.sdf.mmap`` directory) path for a given cache key."""
+
+    _check_cache_format(cache_format)
+    suffix = _NPZ_SUFFIX if cache_format == "npz" else _MMAP_SUFFIX
+    return Path(cache_dir) / f"{hash_hex}{suffix}"
+
 
-    return Path(cache_dir) / f"{hash_hex}{_NPZ_SUFFIX}"
+def _sparse_data_nbytes(sparse_data: Mapping[str, Any]) -> int:
+    return sum(int(np.asarray(sparse_data[k]).nbytes) for k in _NDARRAY_KEYS)
+
+
+def _memory_get(hash_hex: str) -> dict[str, Any] | None:
+    with _lock:
+        entry = _memory_cache.get(hash_hex)
+        if entry is None:
+            return None
+        _memory_cache.move_to_end(hash_hex)
+        _stats["memory_hits"] += 1
+    return dict(entry[0])
+
+
+def _memory_put(hash_hex: str, sparse_data: Mapping[str, Any]) -> None:
+    nbytes = _sparse_data_nbytes(sparse_data)
+    if nbytes > MEMORY_CACHE_MAX_BYTES:
+        return
+    with _lock:
+        previous = _memory_cache.pop(hash_hex, None)
+        if previous is not None:
+            _stats["memory_bytes"] -= previous[1]
+        _memory_cache[hash_hex] = (dict(sparse_data), nbytes)
+        _stats["memory_bytes"] += nbytes
+        while _stats["memory_bytes"] > MEMORY_CACHE_MAX_BYTES:
+            _, (_, evicted) = _memory_cache.popitem(last=False)
+            _stats["memory_bytes"] -= evicted
+
+
+def cache_stats() -> dict[str, int]:
+    """Return a snapshot of the SDF cache counters.
+
+    Returns:
+        A dictionary with ``memory_hits`` and ``disk_hits`` (lookups served
+        by the in-process LRU and by a cache file), ``misses`` (lookups that
+        fell back to cooking), ``bytes_loaded`` (array bytes read from
+        ``.npz`` files), ``bytes_mapped`` (array bytes memory-mapped from
+        ``.sdf.mmap`` entries), and the current ``memory_entries`` /
+        ``memory_bytes`` held by the LRU.
+    """
+
+    with _lock:
+        stats = dict(_stats)
+        stats["memory_entries"] = len(_memory_cache)
+    return stats
+
+
+def clear_memory_cache() -> None:
+    """Drop all in-process entries and reset the :func:`cache_stats` counters.
+
+    Files already written to a ``cache_dir`` are left untouched.
+    """
+
+    with _lock:
+        _memory_cache.clear()
+        for key in _stats:
+            _stats[key] = 0
 
 
 def _require_array(
-    npz: np.lib.npyio.NpzFile,
+    npz: np.lib.npyio.NpzFile | _NpyDirectory,
     key: str,
     dtype: np.dtype,
     shape: tuple[int, ...],
@@ -368,6 +474,7 @@ def save_sparse_data(
     sparse_data: Mapping[str, Any],
     *,
     newton_version: str | None = None,
+    cache_format: str = "npz",
 ) -> Path:
     """Persist a cooked SDF dict to the cache.
 
@@ -378,15 +485,20 @@ def save_sparse_data(
             :func:`newton._src.geometry.sdf_texture.build_sparse_sdf_from_mesh`.
         newton_version: Newton package version string for provenance.
             Resolved from ``newton.__version__`` when ``None``.
+        cache_format: ``"npz"`` for a single ``.npz`` archive or
+            ``"mmap"`` for a ``.sdf.mmap`` directory of memory-mappable
+            ``.npy`` members.
 
     Returns:
-        Path to the ``.npz`` file written.
+        Path to the ``.npz`` file or ``.sdf.mmap`` directory written.
 
     Raises:
         OSError: On filesystem errors.  Callers should treat any failure
             as non-fatal and fall back to live cooking.
+        ValueError: If ``cache_format`` is not recognized.
     """
 
+    _check_cache_format(cache_format)
     cache_dir_path = Path(cache_dir)
     cache_dir_path.mkdir(parents=True, exist_ok=True)
     npz_path = cache_path(cache_dir_path, hash_hex)
@@ -411,6 +523,9 @@ def save_sparse_data(
     )
     arrays[_CREATED_UTC_KEY] = np.asarray(datetime.now(timezone.utc).isoformat(), dtype=np.str_)
 
+    if cache_format == "mmap":
+        return _save_mmap_dir(cache_path(cache_dir_path, hash_hex, "mmap"), arrays)
+
     # ``np.savez`` appends ``.npz`` to its target, so the tmp path must
     # already end in ``.npz`` for the post-save ``os.replace`` to find
     # the right file.
@@ -456,112 +571,231 @@ def save_sparse_data(
     return npz_path
 
 
+def _save_mmap_dir(mmap_path: Path, arrays: Mapping[str, np.ndarray]) -> Path:
+    """Publish ``arrays`` as one ``.npy`` file per key under ``mmap_path``.
+
+    Mirrors the ``.npz`` publish: members are written into a per-writer tmp
+    directory that is renamed into place, and a rename lost to a peer that
+    already published the same content hash is treated as success.
+
+    Unlike a file, a populated directory cannot be replaced in one rename.
+    An existing entry that does not validate (stale format version, missing
+    or corrupt members) is therefore renamed aside to a per-writer
+    ``*.stale`` directory first, so a fresh cook repairs it instead of
+    deferring to it.
+    """
+
+    token = f"{os.getpid()}.{secrets.token_hex(8)}"
+    tmp_dir = mmap_path.parent / f"{mmap_path.name}.{token}.tmp"
+    stale_dir = mmap_path.parent / f"{mmap_path.name}.{token}.stale"
+    try:
+        tmp_dir.mkdir()
+        for key, array in arrays.items():
+            np.save(tmp_dir / f"{key}.npy", array, allow_pickle=False)
+        try:
+            os.replace(tmp_dir, mmap_path)
+        except OSError as exc:
+            if not mmap_path.exists():
+                raise
+            if not _mmap_entry_is_valid(mmap_path):
+                logger.info("SDF cache: replacing invalid entry %s", mmap_path)
+                # A peer may quarantine or republish the entry concurrently, so
+                # either rename may fail; the published entry is re-checked below.
+                with contextlib.suppress(OSError):
+                    os.replace(mmap_path, stale_dir)
+                try:
+                    os.replace(tmp_dir, mmap_path)
+                    return mmap_path
+                except OSError:
+                    if not _mmap_entry_is_valid(mmap_path):
+                        raise
+            logger.debug(
+                "SDF cache: concurrent publish of %s won by peer (%s); discarding tmp directory",
+                mmap_path.name,
+                exc,
+            )
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    finally:
+        shutil.rmtree(stale_dir, ignore_errors=True)
+    return mmap_path
+
+
+def _mmap_entry_is_valid(mmap_path: Path) -> bool:
+    """Return whether the published ``.sdf.mmap`` directory decodes and validates."""
+
+    try:
+        return _read_sparse_data(_NpyDirectory(mmap_path), mmap_path) is not None
+    except (OSError, ValueError, KeyError):
+        return False
+
+
+class _NpyDirectory:
+    """Read-only ``NpzFile`` look-alike over a ``.sdf.mmap`` directory.
+
+    The large cooked arrays are memory-mapped; the small metadata members
+    are read normally.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        member = self.path / f"{key}.npy"
+        if not member.is_file():
+            raise KeyError(key)
+        return np.load(member, mmap_mode="r" if key in _NDARRAY_KEYS else None, allow_pickle=False)
+
+
+def _read_sparse_data(source: np.lib.npyio.NpzFile | _NpyDirectory, path: Path) -> dict[str, Any] | None:
+    """Decode and validate one cache entry from an ``NpzFile`` or :class:`_NpyDirectory`.
+
+    Returns ``None`` when the embedded format version does not match.
+    """
+
+    embedded = int(_require_array(source, _VERSION_KEY, np.dtype(np.int32), ()).item())
+    if embedded != CACHE_FORMAT_VERSION:
+        logger.info(
+            "SDF cache: embedded version %d != %d, treating as miss (%s)",
+            embedded,
+            CACHE_FORMAT_VERSION,
+            path,
+        )
+        return None
+
+    kind = np.asarray(source[_KIND_KEY])
+    if kind.shape != () or kind.dtype.kind != "U" or str(kind.item()) != _KIND:
+        raise ValueError(f"invalid {_KIND_KEY}: expected {_KIND!r}")
+
+    coarse_dims_array = _require_array(source, "coarse_dims", np.dtype(np.int32), (3,))
+    coarse_dims = tuple(int(v) for v in coarse_dims_array)
+    if any(dim <= 0 for dim in coarse_dims):
+        raise ValueError(f"invalid coarse_dims: expected positive dimensions, got {coarse_dims}")
+    total_subgrids = coarse_dims[0] * coarse_dims[1] * coarse_dims[2]
+    data: dict[str, Any] = {
+        "coarse_sdf": _require_array(
+            source,
+            "coarse_sdf",
+            np.dtype(np.float32),
+            (coarse_dims[2] + 1, coarse_dims[1] + 1, coarse_dims[0] + 1),
+        ),
+        "subgrid_start_slots": _require_array(
+            source,
+            "subgrid_start_slots",
+            np.dtype(np.uint32),
+            coarse_dims,
+        ),
+        "subgrid_required": _require_array(
+            source,
+            "subgrid_required",
+            np.dtype(np.int32),
+            (total_subgrids,),
+        ),
+        "coarse_dims": coarse_dims,
+    }
+    for k, dtype, cast in _INT_SCALARS:
+        data[k] = cast(_require_array(source, k, dtype, ()).item())
+    for k, dtype, cast in _FLOAT_SCALARS:
+        data[k] = cast(_require_array(source, k, dtype, ()).item())
+    for k in _VEC3_SCALARS:
+        data[k] = _require_array(source, k, np.dtype(np.float64), (3,))
+    subgrid_tex_size = data["subgrid_tex_size"]
+    data["subgrid_data"] = np.asarray(source["subgrid_data"])
+    if data["subgrid_data"].ndim != 3 or data["subgrid_data"].shape != (subgrid_tex_size,) * 3:
+        raise ValueError(
+            f"invalid subgrid_data shape: expected {(subgrid_tex_size,) * 3}, got {data['subgrid_data'].shape}"
+        )
+    _validate_sparse_data(data)
+    return data
+
+
 def try_load_sparse_data(
     cache_dir: str | os.PathLike[str],
     hash_hex: str,
+    *,
+    cache_format: str = "npz",
 ) -> dict[str, Any] | None:
     """Load a cooked SDF dict from the cache, or ``None`` on miss.
 
-    Verifies the embedded ``__cache_format_version__`` in the ``.npz``;
-    a mismatch, missing file, or any IO/parse error is logged and
-    treated as a miss.
+    The in-process LRU is consulted first; otherwise the entry is read
+    from ``cache_dir`` in ``cache_format`` and retained in the LRU.
+    Verifies the embedded ``__cache_format_version__``; a mismatch,
+    missing entry, or any IO/parse error is logged and treated as a miss.
 
     Args:
         cache_dir: Directory holding the cache files.
         hash_hex: Cache key from :func:`hash_inputs`.
+        cache_format: ``"npz"`` or ``"mmap"``; see :func:`save_sparse_data`.
 
     Returns:
         The reconstructed ``sparse_data`` dict suitable for
         :func:`newton._src.geometry.sdf_texture.create_sparse_sdf_textures`,
-        or ``None`` if the entry is missing or invalid.
+        or ``None`` if the entry is missing or invalid.  The arrays of a
+        ``"mmap"`` entry are read-only memory maps.
+
+    Raises:
+        ValueError: If ``cache_format`` is not recognized.
     """
 
-    npz_path = cache_path(cache_dir, hash_hex)
+    _check_cache_format(cache_format)
+    data = _memory_get(hash_hex)
+    if data is not None:
+        return data
 
-    if not npz_path.exists():
+    path = cache_path(cache_dir, hash_hex, cache_format)
+    data = None
+    if path.exists():
+        try:
+            if cache_format == "mmap":
+                data = _read_sparse_data(_NpyDirectory(path), path)
+            else:
+                with path.open("rb") as cache_file, np.load(cache_file, allow_pickle=False) as npz:
+                    data = _read_sparse_data(npz, path)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as exc:
+            logger.warning("SDF cache: failed to load %s: %s", path, exc)
+            data = None
+
+    if data is None:
+        with _lock:
+            _stats["misses"] += 1
         return None
 
-    try:
-        with npz_path.open("rb") as cache_file, np.load(cache_file, allow_pickle=False) as npz:
-            embedded = int(_require_array(npz, _VERSION_KEY, np.dtype(np.int32), ()).item())
-            if embedded != CACHE_FORMAT_VERSION:
-                logger.info(
-                    "SDF cache: embedded version %d != %d, treating as miss (%s)",
-                    embedded,
-                    CACHE_FORMAT_VERSION,
-                    npz_path,
-                )
-                return None
-
-            kind = np.asarray(npz[_KIND_KEY])
-            if kind.shape != () or kind.dtype.kind != "U" or str(kind.item()) != _KIND:
-                raise ValueError(f"invalid {_KIND_KEY}: expected {_KIND!r}")
-
-            coarse_dims_array = _require_array(npz, "coarse_dims", np.dtype(np.int32), (3,))
-            coarse_dims = tuple(int(v) for v in coarse_dims_array)
-            if any(dim <= 0 for dim in coarse_dims):
-                raise ValueError(f"invalid coarse_dims: expected positive dimensions, got {coarse_dims}")
-            total_subgrids = coarse_dims[0] * coarse_dims[1] * coarse_dims[2]
-            data: dict[str, Any] = {
-                "coarse_sdf": _require_array(
-                    npz,
-                    "coarse_sdf",
-                    np.dtype(np.float32),
-                    (coarse_dims[2] + 1, coarse_dims[1] + 1, coarse_dims[0] + 1),
-                ),
-                "subgrid_start_slots": _require_array(
-                    npz,
-                    "subgrid_start_slots",
-                    np.dtype(np.uint32),
-                    coarse_dims,
-                ),
-                "subgrid_required": _require_array(
-                    npz,
-                    "subgrid_required",
-                    np.dtype(np.int32),
-                    (total_subgrids,),
-                ),
-                "coarse_dims": coarse_dims,
-            }
-            for k, dtype, cast in _INT_SCALARS:
-                data[k] = cast(_require_array(npz, k, dtype, ()).item())
-            for k, dtype, cast in _FLOAT_SCALARS:
-                data[k] = cast(_require_array(npz, k, dtype, ()).item())
-            for k in _VEC3_SCALARS:
-                data[k] = _require_array(npz, k, np.dtype(np.float64), (3,))
-            subgrid_tex_size = data["subgrid_tex_size"]
-            data["subgrid_data"] = np.asarray(npz["subgrid_data"])
-            if data["subgrid_data"].ndim != 3 or data["subgrid_data"].shape != (subgrid_tex_size,) * 3:
-                raise ValueError(
-                    f"invalid subgrid_data shape: expected {(subgrid_tex_size,) * 3}, got {data['subgrid_data'].shape}"
-                )
-            _validate_sparse_data(data)
-            return data
-    except (OSError, ValueError, KeyError, zipfile.BadZipFile) as exc:
-        logger.warning("SDF cache: failed to load %s: %s", npz_path, exc)
-        return None
+    with _lock:
+        _stats["disk_hits"] += 1
+        _stats["bytes_mapped" if cache_format == "mmap" else "bytes_loaded"] += _sparse_data_nbytes(data)
+    _memory_put(hash_hex, data)
+    return dict(data)
 
 
 def write(
     cache_dir: str | os.PathLike[str],
     hash_hex: str,
     sparse_data: Mapping[str, Any],
+    *,
+    cache_format: str = "npz",
 ) -> None:
     """Best-effort persist; logs and swallows ``OSError``.
 
     Convenience wrapper used by :meth:`SDF.create_from_mesh` so cache
-    failures never abort an otherwise-successful cook.
+    failures never abort an otherwise-successful cook.  The cooked data
+    is retained in the in-process LRU even when the disk write fails.
     """
 
+    _memory_put(hash_hex, sparse_data)
     try:
-        save_sparse_data(cache_dir, hash_hex, sparse_data)
+        save_sparse_data(cache_dir, hash_hex, sparse_data, cache_format=cache_format)
     except OSError as exc:
         logger.warning("SDF cache: failed to write %s: %s", cache_dir, exc)
 
 
 __all__ = [
     "CACHE_FORMAT_VERSION",
+    "MEMORY_CACHE_MAX_BYTES",
     "cache_path",
+    "cache_stats",
+    "clear_memory_cache",
     "hash_inputs",
     "save_sparse_data",
     "try_load_sparse_data",
@@ -201,6 +201,37 @@ def is_shape_pair_immovable_filtered(
     return immovable_a and immovable_b
 
 
+@wp.func
+def is_shape_pair_sleeping(
+    shape_a: int,
+    shape_b: int,
+    shape_body: wp.array[int],
+    body_sleeping: wp.array[wp.int32],
+) -> bool:
+    """Return whether a shape pair connects only sleeping or static bodies.
+
+    At least one side must be asleep; static-static pairs are left to
+    :func:`is_shape_pair_immovable_filtered`. An empty ``body_sleeping`` array
+    disables the test.
+    """
+    if body_sleeping.shape[0] == 0 or shape_body.shape[0] == 0:
+        return False
+
+    body_a = shape_body[shape_a]
+    body_b = shape_body[shape_b]
+
+    asleep_a = False
+    asleep_b = False
+    if body_a >= 0:
+        asleep_a = body_sleeping[body_a] != 0
+    if body_b >= 0:
+        asleep_b = body_sleeping[body_b] != 0
+
+    inactive_a = body_a < 0 or asleep_a
+    inactive_b = body_b < 0 or asleep_b
+    return inactive_a and inactive_b and (asleep_a or asleep_b)
+
+
 @wp.func
 def write_pair(
     pair: wp.vec2i,
@@ -20,6 +20,7 @@ from .broad_phase_common import (
     check_aabb_overlap_moving,
     is_pair_excluded,
     is_shape_pair_immovable_filtered,
+    is_shape_pair_sleeping,
     precompute_world_map,
     test_world_and_group_pair,
     write_pair,
@@ -37,6 +38,7 @@ def _nxn_broadphase_precomputed_pairs(
     shape_body: wp.array[int],
     body_flags: wp.array[int],
     include_static_kinematic_pairs: bool,
+    body_sleeping: wp.array[wp.int32],
     # Output arrays
     candidate_pair: wp.array[wp.vec2i],
     candidate_pair_count: wp.array[int],  # Size one array
@@ -51,6 +53,9 @@ def _nxn_broadphase_precomputed_pairs(
     if is_shape_pair_immovable_filtered(shape1, shape2, shape_body, body_flags, include_static_kinematic_pairs):
         return
 
+    if is_shape_pair_sleeping(shape1, shape2, shape_body, body_sleeping):
+        return
+
     # Check if gaps are provided (empty array means AABBs are pre-expanded)
     gap1 = 0.0
     gap2 = 0.0
@@ -141,6 +146,7 @@ def _nxn_broadphase_kernel(
     shape_body: wp.array[int],
     body_flags: wp.array[int],
     include_static_kinematic_pairs: bool,
+    body_sleeping: wp.array[wp.int32],
     world_cumsum_lower_tri: wp.array[int],  # Cumulative sum of lower tri elements per world
     world_slice_ends: wp.array[int],  # End indices of each world slice
     world_index_map: wp.array[int],  # Index map into source geometry
@@ -197,6 +203,9 @@ def _nxn_broadphase_kernel(
     if is_shape_pair_immovable_filtered(shape1, shape2, shape_body, body_flags, include_static_kinematic_pairs):
         return
 
+    if is_shape_pair_sleeping(shape1, shape2, shape_body, body_sleeping):
+        return
+
     # Check if gaps are provided (empty array means AABBs are pre-expanded)
     gap1 = 0.0
     gap2 = 0.0
@@ -325,6 +334,7 @@ class BroadPhaseAllPairs:
         shape_body: wp.array[int] | None = None,
         body_flags: wp.array[int] | None = None,
         include_static_kinematic_pairs: bool = True,
+        body_sleeping: wp.array[wp.int32] | None = None,
         shape_displacement: wp.array[wp.vec3] | None = None,
     ) -> None:
         """Launch the N x N broad phase collision detection.
@@ -359,6 +369,9 @@ class BroadPhaseAllPairs:
                 an all-static model when ``shape_body`` is provided.
             include_static_kinematic_pairs: Whether to include pairs where both shapes are immovable. Set to
                 ``False`` to filter static-static, static-kinematic, and kinematic-kinematic pairs.
+            body_sleeping: Optional per-body sleep flags (nonzero = asleep), typically
+                :attr:`State.body_sleeping <newton.State.body_sleeping>`. Pairs whose bodies are all sleeping or static
+                are skipped. Requires ``shape_body``.
             shape_displacement: Optional world-space displacement of each shape over the collision-update interval
                 ``dt``,
                 used for speculative-contact swept-AABB tests [m]. See
@@ -386,6 +399,8 @@ class BroadPhaseAllPairs:
             shape_body = wp.empty(0, dtype=wp.int32, device=device)
         if body_flags is None:
             body_flags = wp.empty(0, dtype=wp.int32, device=device)
+        if body_sleeping is None:
+            body_sleeping = wp.empty(0, dtype=wp.int32, device=device)
         if shape_displacement is not None and shape_displacement.shape[0] != shape_lower.shape[0]:
             raise ValueError(
                 "shape_displacement length must match the shape bounds "
@@ -414,6 +429,7 @@ class BroadPhaseAllPairs:
                 shape_body,
                 body_flags,
                 include_static_kinematic_pairs,
+                body_sleeping,
                 self.world_cumsum_lower_tri,
                 self.world_slice_ends,
                 self.world_index_map,
@@ -454,6 +470,7 @@ class BroadPhaseExplicit:
         shape_body: wp.array[int] | None = None,
         body_flags: wp.array[int] | None = None,
         include_static_kinematic_pairs: bool = True,
+        body_sleeping: wp.array[wp.int32] | None = None,
         shape_displacement: wp.array[wp.vec3] | None = None,
     ) -> None:
         """Launch the explicit pairs broad phase collision detection.
@@ -482,6 +499,9 @@ class BroadPhaseExplicit:
                 an all-static model when ``shape_body`` is provided.
             include_static_kinematic_pairs: Whether to include pairs where both shapes are immovable. Set to
                 ``False`` to filter static-static, static-kinematic, and kinematic-kinematic pairs.
+            body_sleeping: Optional per-body sleep flags (nonzero = asleep), typically
+                :attr:`State.body_sleeping <newton.State.body_sleeping>`. Pairs whose bodies are all sleeping or static
+                are skipped. Requires ``shape_body``.
             shape_displacement: Optional world-space displacement of each shape over the collision-update interval
                 ``dt``,
                 used for speculative-contact swept-AABB tests [m]. See
@@ -508,6 +528,8 @@ class BroadPhaseExplicit:
             shape_body = wp.empty(0, dtype=wp.int32, device=device)
         if body_flags is None:
             body_flags = wp.empty(0, dtype=wp.int32, device=device)
+        if body_sleeping is None:
+            body_sleeping = wp.empty(0, dtype=wp.int32, device=device)
         if shape_displacement is not None and shape_displacement.shape[0] != shape_lower.shape[0]:
             raise ValueError(
                 "shape_displacement length must match the shape bounds "
@@ -526,6 +548,7 @@ class BroadPhaseExplicit:
                 shape_body,
                 body_flags,
                 include_static_kinematic_pairs,
+                body_sleeping,
                 candidate_pair,
                 candidate_pair_count,
                 max_candidate_pair,
@@ -23,6 +23,7 @@ from .broad_phase_common import (
     check_aabb_overlap_moving,
     is_pair_excluded,
     is_shape_pair_immovable_filtered,
+    is_shape_pair_sleeping,
     precompute_world_map,
     test_world_and_group_pair,
     write_pair,
@@ -31,13 +32,13 @@ from .broad_phase_common import (
 wp.set_module_options({"enable_backward": False})
 
 
-SAPSortMode = Literal["segmented", "tile"]
+SAPSortMode = Literal["segmented", "tile", "incremental"]
 
 
 def _normalize_sort_mode(mode: str) -> SAPSortMode:
     normalized = mode.strip().lower()
-    if normalized not in ("segmented", "tile"):
-        raise ValueError(f"Unsupported SAP sort mode: {mode!r}. Expected 'segmented' or 'tile'.")
+    if normalized not in ("segmented", "tile", "incremental"):
+        raise ValueError(f"Unsupported SAP sort mode: {mode!r}. Expected 'segmented', 'tile', or 'incremental'.")
     return normalized
 
 
@@ -285,6 +286,7 @@ def _process_single_sap_pair(
     shape_body: wp.array[int],
     body_flags: wp.array[int],
     include_static_kinematic_pairs: bool,
+    body_sleeping: wp.array[wp.int32],
 ):
     shape1 = pair[0]
     shape2 = pair[1]
@@ -292,6 +294,9 @@ def _process_single_sap_pair(
     if is_shape_pair_immovable_filtered(shape1, shape2, shape_body, body_flags, include_static_kinematic_pairs):
         return
 
+    if is_shape_pair_sleeping(shape1, shape2, shape_body, body_sleeping):
+        return
+
     # Skip explicitly excluded pairs (e.g. shape_collision_filter_pairs)
     if num_filter_pairs > 0 and is_pair_excluded(pair, filter_pairs, num_filter_pairs):
         return
@@ -335,6 +340,7 @@ def _process_sap_work_package(
     shape_body: wp.array[int],
     body_flags: wp.array[int],
     include_static_kinematic_pairs: bool,
+    body_sleeping: wp.array[wp.int32],
     candidate_pair: wp.array[wp.vec2i],
     candidate_pair_count: wp.array[int],
     max_candidate_pair: int,
@@ -398,6 +404,7 @@ def _process_sap_work_package(
             shape_body,
             body_flags,
             include_static_kinematic_pairs,
+            body_sleeping,
         )
 
 
@@ -431,6 +438,7 @@ def _sap_broadphase_kernel(
     shape_body: wp.array[int],
     body_flags: wp.array[int],
     include_static_kinematic_pairs: bool,
+    body_sleeping: wp.array[wp.int32],
     # Output arrays
     candidate_pair: wp.array[wp.vec2i],
     candidate_pair_count: wp.array[int],  # Size one array
@@ -467,6 +475,7 @@ def _sap_broadphase_kernel(
                 shape_body,
                 body_flags,
                 include_static_kinematic_pairs,
+                body_sleeping,
                 candidate_pair,
                 candidate_pair_count,
                 max_candidate_pair,
@@ -508,6 +517,7 @@ def _sap_broadphase_kernel(
                 shape_body,
                 body_flags,
                 include_static_kinematic_pairs,
+                body_sleeping,
                 candidate_pair,
                 candidate_pair_count,
                 max_candidate_pair,
@@ -515,12 +525,100 @@ def _sap_broadphase_kernel(
         chunk_base = _advance_sap_chunk_base(chunk_base, chunk_stride, total_work_packages)
 
 
+@wp.kernel(enable_backward=False)
+def _sap_identity_sort_index_kernel(
+    max_shapes_per_world: int,
+    sap_projection_lower_local: wp.array[float],
+    sap_sort_index_out: wp.array[int],
+):
+    world_id, local_shape_id = wp.tid()
+    idx = world_id * max_shapes_per_world + local_shape_id
+    if sap_projection_lower_local[idx] >= 1e30:
+        sap_sort_index_out[idx] = -1
+    else:
+        sap_sort_index_out[idx] = local_shape_id
+
+
+@wp.kernel(enable_backward=False)
+def _sap_incremental_gather_kernel(
+    max_shapes_per_world: int,
+    displacement_threshold: float,
+    permutation_valid: wp.array[int],  # Size one array
+    sap_projection_lower_local: wp.array[float],  # Projections in local shape order
+    sap_permutation: wp.array[int],  # Sort permutation from the previous launch
+    sap_previous_lower: wp.array[float],  # Projections from the previous launch, local shape order
+    # Outputs
+    sap_projection_lower_out: wp.array[float],
+    sap_sort_index_out: wp.array[int],
+    full_sort_required: wp.array[int],  # Size one array
+):
+    """Apply the previous sort permutation to the new projections and detect large moves."""
+    world_id, slot = wp.tid()
+    base_idx = world_id * max_shapes_per_world
+    idx = base_idx + slot
+
+    lower = sap_projection_lower_local[idx]
+    # Shapes entering or leaving the active set also exceed the threshold
+    if permutation_valid[0] == 0 or wp.abs(lower - sap_previous_lower[idx]) > displacement_threshold:
+        full_sort_required[0] = 1
+    sap_previous_lower[idx] = lower
+
+    local_shape_id = sap_permutation[idx]
+    key = float(1e30)
+    if local_shape_id >= 0 and local_shape_id < max_shapes_per_world:
+        key = sap_projection_lower_local[base_idx + local_shape_id]
+    if key >= 1e30:
+        # Shapes that became inactive are treated as padding
+        local_shape_id = -1
+    sap_projection_lower_out[idx] = key
+    sap_sort_index_out[idx] = local_shape_id
+
+
+@wp.kernel(enable_backward=False)
+def _sap_incremental_insertion_sort_kernel(
+    max_shapes_per_world: int,
+    full_sort_required: wp.array[int],  # Size one array
+    sap_projection_lower: wp.array[float],
+    sap_sort_index: wp.array[int],
+    sap_permutation_out: wp.array[int],
+):
+    """Repair each nearly sorted world segment with an insertion sort.
+
+    The cost is linear in the segment size plus the number of order swaps
+    since the previous launch. Skipped when a full sort was requested.
+    """
+    world_id = wp.tid()
+    if full_sort_required[0] != 0:
+        return
+
+    base_idx = world_id * max_shapes_per_world
+    for i in range(1, max_shapes_per_world):
+        key = sap_projection_lower[base_idx + i]
+        value = sap_sort_index[base_idx + i]
+        j = i - 1
+        while j >= 0 and sap_projection_lower[base_idx + j] > key:
+            sap_projection_lower[base_idx + j + 1] = sap_projection_lower[base_idx + j]
+            sap_sort_index[base_idx + j + 1] = sap_sort_index[base_idx + j]
+            j -= 1
+        sap_projection_lower[base_idx + j + 1] = key
+        sap_sort_index[base_idx + j + 1] = value
+
+    for i in range(max_shapes_per_world):
+        sap_permutation_out[base_idx + i] = sap_sort_index[base_idx + i]
+
+
 class BroadPhaseSAP:
     """Sweep and Prune (SAP) broad phase collision detection.
 
     This class implements the sweep and prune algorithm for broad phase collision detection.
     It efficiently finds potentially colliding pairs of objects by sorting their bounding box
     projections along a fixed axis and checking for overlaps.
+
+    With ``sort_type="incremental"``, the sort permutation of the previous launch is kept and
+    repaired with a per-world insertion sort, which is linear in the number of shapes when the
+    shape ordering changes little between launches. A full segmented sort is used on the first
+    launch and whenever a projected AABB moved by more than ``incremental_resort_threshold``
+    since the previous launch.
     """
 
     def __init__(
@@ -528,9 +626,10 @@ class BroadPhaseSAP:
         shape_world: wp.array[wp.int32] | np.ndarray,
         shape_flags: wp.array[wp.int32] | np.ndarray | None = None,
         sweep_thread_count_multiplier: int = 5,
-        sort_type: Literal["segmented", "tile"] = "segmented",
+        sort_type: Literal["segmented", "tile", "incremental"] = "segmented",
         tile_block_dim: int | None = None,
         device: Devicelike | None = None,
+        incremental_resort_threshold: float = 0.1,
     ) -> None:
         """Initialize arrays for sweep and prune broad phase collision detection.
 
@@ -542,14 +641,24 @@ class BroadPhaseSAP:
                 This efficiently filters out visual-only shapes.
             sweep_thread_count_multiplier: Multiplier for number of threads used in sweep phase
             sort_type: SAP sort mode. Use ``"segmented"`` (default) for
-                ``wp.utils.segmented_sort_pairs`` or ``"tile"`` for
-                tile-based sorting via ``wp.tile_sort``.
+                ``wp.utils.segmented_sort_pairs``, ``"tile"`` for
+                tile-based sorting via ``wp.tile_sort``, or ``"incremental"`` to
+                repair the previous launch's sort order with an insertion sort.
             tile_block_dim: Block dimension for tile-based sorting (optional, auto-calculated if None).
                 If None, will be set to next power of 2 >= ``max_shapes_per_world``, capped at 512.
                 Minimum value is 32 (required by wp.tile_sort). If provided, will be clamped to [32, 1024].
             device: Device to store the precomputed arrays on. If None, uses CPU for numpy
                 arrays or the device of the input warp array.
+            incremental_resort_threshold: Largest displacement of a projected AABB along the
+                sweep axis between two launches that is repaired incrementally when
+                ``sort_type="incremental"`` [m]. Larger displacements trigger a full sort.
         """
+        if not np.isfinite(incremental_resort_threshold) or incremental_resort_threshold < 0.0:
+            raise ValueError(
+                "incremental_resort_threshold must be a non-negative finite number, "
+                f"got {incremental_resort_threshold!r}"
+            )
+        self.incremental_resort_threshold = float(incremental_resort_threshold)
         self.sweep_thread_count_multiplier = sweep_thread_count_multiplier
         self.sort_type = _normalize_sort_mode(sort_type)
         self.tile_block_dim_override = tile_block_dim  # Store user override if provided
@@ -628,6 +737,102 @@ class BroadPhaseSAP:
         )
         self.segment_indices = wp.array(segment_indices_np, dtype=wp.int32, device=device)
 
+        # Temporal coherence state for incremental sorting
+        if self.sort_type == "incremental":
+            self.sap_projection_lower_local = wp.zeros(total_elements, dtype=wp.float32, device=device)
+            self.sap_previous_lower = wp.zeros(total_elements, dtype=wp.float32, device=device)
+            self.sap_permutation = wp.full(total_elements, -1, dtype=wp.int32, device=device)
+            self.permutation_valid = wp.zeros(1, dtype=wp.int32, device=device)
+            self.full_sort_required = wp.zeros(1, dtype=wp.int32, device=device)
+
+    def reset_incremental_state(self) -> None:
+        """Discard the cached sort order so the next incremental launch performs a full sort.
+
+        Call this after teleporting shapes, e.g. when resetting worlds.
+        """
+        if self.sort_type == "incremental":
+            self.permutation_valid.zero_()
+
+    def _full_sort(self, device: Devicelike | None = None) -> None:
+        """Sort the projected lower bounds of every world segment from scratch."""
+        if self.sort_type == "tile" and self.tile_sort_kernel is not None:
+            # Use tile-based sort with shared memory
+            wp.launch_tiled(
+                kernel=self.tile_sort_kernel,
+                dim=self.world_count,
+                inputs=[
+                    self.sap_projection_lower,
+                    self.sap_sort_index,
+                    self.max_shapes_per_world,
+                ],
+                block_dim=self.tile_block_dim,
+                device=device,
+                record_tape=False,
+            )
+        else:
+            # Use segmented sort (default)
+            # The count is the number of actual elements to sort (not including scratch space)
+            wp.utils.segmented_sort_pairs(
+                keys=self.sap_projection_lower,
+                values=self.sap_sort_index,
+                count=self.world_count * self.max_shapes_per_world,
+                segment_start_indices=self.segment_indices,
+            )
+
+    def _incremental_sort(self, device: Devicelike | None = None) -> None:
+        """Repair the previous sort permutation, falling back to a full sort on large moves."""
+        total_elements = self.world_count * self.max_shapes_per_world
+        self.full_sort_required.zero_()
+        wp.launch(
+            kernel=_sap_incremental_gather_kernel,
+            dim=(self.world_count, self.max_shapes_per_world),
+            inputs=[
+                self.max_shapes_per_world,
+                self.incremental_resort_threshold,
+                self.permutation_valid,
+                self.sap_projection_lower_local,
+                self.sap_permutation,
+                self.sap_previous_lower,
+            ],
+            outputs=[
+                self.sap_projection_lower,
+                self.sap_sort_index,
+                self.full_sort_required,
+            ],
+            device=device,
+            record_tape=False,
+        )
+        wp.launch(
+            kernel=_sap_incremental_insertion_sort_kernel,
+            dim=self.world_count,
+            inputs=[
+                self.max_shapes_per_world,
+                self.full_sort_required,
+                self.sap_projection_lower,
+                self.sap_sort_index,
+            ],
+            outputs=[self.sap_permutation],
+            device=device,
+            record_tape=False,
+        )
+
+        def full_sort():
+            # Restart from the unsorted projections; the gather above overwrote them.
+            wp.copy(self.sap_projection_lower, self.sap_projection_lower_local, count=total_elements)
+            wp.launch(
+                kernel=_sap_identity_sort_index_kernel,
+                dim=(self.world_count, self.max_shapes_per_world),
+                inputs=[self.max_shapes_per_world, self.sap_projection_lower_local],
+                outputs=[self.sap_sort_index],
+                device=device,
+                record_tape=False,
+            )
+            self._full_sort(device)
+            wp.copy(self.sap_permutation, self.sap_sort_index, count=total_elements)
+
+        wp.capture_if(self.full_sort_required, on_true=full_sort)
+        self.permutation_valid.fill_(1)
+
     def launch(
         self,
         shape_lower: wp.array[wp.vec3],  # Lower bounds of shape bounding boxes
@@ -647,6 +852,7 @@ class BroadPhaseSAP:
         shape_body: wp.array[int] | None = None,
         body_flags: wp.array[int] | None = None,
         include_static_kinematic_pairs: bool = True,
+        body_sleeping: wp.array[wp.int32] | None = None,
         shape_displacement: wp.array[wp.vec3] | None = None,
         sort_axis_displacement_limit: float | None = None,
     ) -> None:
@@ -682,6 +888,9 @@ class BroadPhaseSAP:
                 an all-static model when ``shape_body`` is provided.
             include_static_kinematic_pairs: Whether to include pairs where both shapes are immovable. Set to
                 ``False`` to filter static-static, static-kinematic, and kinematic-kinematic pairs.
+            body_sleeping: Optional per-body sleep flags (nonzero = asleep), typically
+                :attr:`State.body_sleeping <newton.State.body_sleeping>`. Pairs whose bodies are all sleeping or static
+                are skipped. Requires ``shape_body``.
             shape_displacement: Optional world-space displacement of each shape over the collision-update interval
                 ``dt``,
                 used for speculative-contact swept-AABB tests [m]. See
@@ -719,6 +928,8 @@ class BroadPhaseSAP:
             shape_body = wp.empty(0, dtype=wp.int32, device=device)
         if body_flags is None:
             body_flags = wp.empty(0, dtype=wp.int32, device=device)
+        if body_sleeping is None:
+            body_sleeping = wp.empty(0, dtype=wp.int32, device=device)
         if shape_displacement is not None and shape_displacement.shape[0] != shape_lower.shape[0]:
             raise ValueError(
                 "shape_displacement length must match the shape bounds "
@@ -757,7 +968,7 @@ class BroadPhaseSAP:
                 self.world_slice_ends,
                 self.max_shapes_per_world,
                 shape_count,
-                self.sap_projection_lower,
+                self.sap_projection_lower_local if self.sort_type == "incremental" else self.sap_projection_lower,
                 self.sap_projection_upper,
                 self.sap_sort_index,
             ],
@@ -765,31 +976,12 @@ class BroadPhaseSAP:
             record_tape=False,
         )
 
-        # Perform segmented sort - each world is sorted independently
-        # Two strategies: tile-based (faster for certain sizes) or segmented (more flexible)
-        if self.sort_type == "tile" and self.tile_sort_kernel is not None:
-            # Use tile-based sort with shared memory
-            wp.launch_tiled(
-                kernel=self.tile_sort_kernel,
-                dim=self.world_count,
-                inputs=[
-                    self.sap_projection_lower,
-                    self.sap_sort_index,
-                    self.max_shapes_per_world,
-                ],
-                block_dim=self.tile_block_dim,
-                device=device,
-                record_tape=False,
-            )
+        # Sort each world independently: tile-based (faster for certain sizes), segmented
+        # (more flexible), or an incremental repair of the previous launch's order
+        if self.sort_type == "incremental":
+            self._incremental_sort(device)
         else:
-            # Use segmented sort (default)
-            # The count is the number of actual elements to sort (not including scratch space)
-            wp.utils.segmented_sort_pairs(
-                keys=self.sap_projection_lower,
-                values=self.sap_sort_index,
-                count=self.world_count * self.max_shapes_per_world,
-                segment_start_indices=self.segment_indices,
-            )
+            self._full_sort(device)
 
         # Compute range of overlapping geometries for each geometry in each world
         wp.launch(
@@ -838,6 +1030,7 @@ class BroadPhaseSAP:
                 shape_body,
                 body_flags,
                 include_static_kinematic_pairs,
+                body_sleeping,
             ],
             outputs=[
                 candidate_pair,
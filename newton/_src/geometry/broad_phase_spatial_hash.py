@@ -0,0 +1,731 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Uniform-grid (spatial hash) broad phase collision detection.
+
+Bins the AABBs of every world into a uniform grid whose occupied cells are
+stored in a :class:`~newton._src.geometry.hashtable.HashTable`. Only shapes
+sharing a cell are tested against each other, which scales close to linearly
+for scenes with many similarly sized shapes per world (debris, granular rigid
+bodies, tiled clutter) where SAP's single sweep axis prunes poorly.
+
+Shapes that cover too many cells, shared shapes (world -1) such as ground
+planes, and shapes whose cells cannot be hashed are tested against all other
+shapes instead.
+
+See Also:
+    :class:`BroadPhaseSAP` in ``broad_phase_sap.py`` for the sweep-and-prune alternative.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import warp as wp
+
+from ..core.types import Devicelike
+from .broad_phase_common import (
+    check_aabb_overlap_moving,
+    is_pair_excluded,
+    is_shape_pair_immovable_filtered,
+    is_shape_pair_sleeping,
+    test_world_and_group_pair,
+    write_pair,
+)
+from .flags import ShapeFlags
+from .hashtable import HashTable, hashtable_find, hashtable_find_or_insert
+
+# Cell keys pack three signed 15-bit cell coordinates and a 19-bit world index
+# into 64 bits, so distinct cells never share a key. Cells outside this range
+# route their shape to the brute-force path instead.
+_CELL_COORD_BITS = 15
+_CELL_COORD_MIN = wp.constant(-(1 << (_CELL_COORD_BITS - 1)))
+_CELL_COORD_MAX = wp.constant((1 << (_CELL_COORD_BITS - 1)) - 1)
+_CELL_COORD_MASK = wp.constant(wp.uint64((1 << _CELL_COORD_BITS) - 1))
+# The largest world index is reserved so no key equals the hash table's empty sentinel
+_CELL_WORLD_MAX = wp.constant((1 << 19) - 2)
+
+# Lower bound on the AABB extent used to estimate the automatic cell size [m]
+_MIN_CELL_EXTENT = wp.constant(1.0e-4)
+
+
+@wp.func
+def _cell_key(world: int, cell: wp.vec3i) -> wp.uint64:
+    key = wp.uint64(world)
+    key = (key << wp.uint64(_CELL_COORD_BITS)) | (wp.uint64(cell[0] - _CELL_COORD_MIN) & _CELL_COORD_MASK)
+    key = (key << wp.uint64(_CELL_COORD_BITS)) | (wp.uint64(cell[1] - _CELL_COORD_MIN) & _CELL_COORD_MASK)
+    key = (key << wp.uint64(_CELL_COORD_BITS)) | (wp.uint64(cell[2] - _CELL_COORD_MIN) & _CELL_COORD_MASK)
+    return key
+
+
+@wp.func
+def _expanded_bounds(
+    shape: int,
+    shape_lower: wp.array[wp.vec3],
+    shape_upper: wp.array[wp.vec3],
+    shape_gap: wp.array[float],
+    shape_displacement: wp.array[wp.vec3],
+):
+    """Return the AABB of a shape grown by its gap and swept over its displacement."""
+    lower = shape_lower[shape]
+    upper = shape_upper[shape]
+    if shape_gap.shape[0] > 0:
+        gap = shape_gap[shape]
+        lower = lower - wp.vec3(gap)
+        upper = upper + wp.vec3(gap)
+    if shape_displacement.shape[0] > 0:
+        displacement = shape_displacement[shape]
+        lower = lower + wp.min(displacement, wp.vec3(0.0))
+        upper = upper + wp.max(displacement, wp.vec3(0.0))
+    return lower, upper
+
+
+@wp.func
+def _test_and_write_pair(
+    shape_a: int,
+    shape_b: int,
+    shape_lower: wp.array[wp.vec3],
+    shape_upper: wp.array[wp.vec3],
+    shape_gap: wp.array[float],
+    shape_displacement: wp.array[wp.vec3],
+    shape_collision_group: wp.array[int],
+    shape_world: wp.array[int],
+    shape_body: wp.array[int],
+    body_flags: wp.array[int],
+    include_static_kinematic_pairs: bool,
+    body_sleeping: wp.array[wp.int32],
+    filter_pairs: wp.array[wp.vec2i],
+    num_filter_pairs: int,
+    candidate_pair: wp.array[wp.vec2i],
+    candidate_pair_count: wp.array[int],
+    max_candidate_pair: int,
+):
+    shape1 = wp.min(shape_a, shape_b)
+    shape2 = wp.max(shape_a, shape_b)
+
+    if not test_world_and_group_pair(
+        shape_world[shape1], shape_world[shape2], shape_collision_group[shape1], shape_collision_group[shape2]
+    ):
+        return
+
+    if is_shape_pair_immovable_filtered(shape1, shape2, shape_body, body_flags, include_static_kinematic_pairs):
+        return
+
+    if is_shape_pair_sleeping(shape1, shape2, shape_body, body_sleeping):
+        return
+
+    gap1 = 0.0
+    gap2 = 0.0
+    if shape_gap.shape[0] > 0:
+        gap1 = shape_gap[shape1]
+        gap2 = shape_gap[shape2]
+
+    if not check_aabb_overlap_moving(shape1, shape2, shape_lower, shape_upper, gap1, gap2, shape_displacement):
+        return
+
+    pair = wp.vec2i(shape1, shape2)
+    if num_filter_pairs > 0 and is_pair_excluded(pair, filter_pairs, num_filter_pairs):
+        return
+    write_pair(pair, candidate_pair, candidate_pair_count, max_candidate_pair)
+
+
+@wp.kernel(enable_backward=False)
+def _hash_grid_accumulate_extent_kernel(
+    colliding_shapes: wp.array[int],
+    shape_count: int,
+    shape_lower: wp.array[wp.vec3],
+    shape_upper: wp.array[wp.vec3],
+    shape_gap: wp.array[float],
+    shape_displacement: wp.array[wp.vec3],
+    shape_world: wp.array[int],
+    # Outputs
+    log_extent_sum: wp.array[float],  # Size one array
+    extent_count: wp.array[int],  # Size one array
+):
+    """Accumulate the log of the largest AABB extent of every world-local shape."""
+    shape = colliding_shapes[wp.tid()]
+    if shape >= shape_count or shape_world[shape] < 0:
+        return
+    lower, upper = _expanded_bounds(shape, shape_lower, shape_upper, shape_gap, shape_displacement)
+    extent = wp.max(upper - lower)
+    if not wp.isfinite(extent):
+        return
+    wp.atomic_add(log_extent_sum, 0, wp.log(wp.max(extent, _MIN_CELL_EXTENT)))
+    wp.atomic_add(extent_count, 0, 1)
+
+
+@wp.kernel(enable_backward=False)
+def _hash_grid_cell_size_kernel(
+    cell_size_scale: float,
+    log_extent_sum: wp.array[float],
+    extent_count: wp.array[int],
+    # Outputs
+    cell_size: wp.array[float],
+):
+    """Set the cell size from the geometric mean extent, which ignores a few huge shapes."""
+    count = extent_count[0]
+    if count > 0:
+        cell_size[0] = cell_size_scale * wp.exp(log_extent_sum[0] / float(count))
+    else:
+        cell_size[0] = 1.0
+
+
+@wp.kernel(enable_backward=False)
+def _hash_grid_insert_kernel(
+    colliding_shapes: wp.array[int],
+    shape_count: int,
+    shape_lower: wp.array[wp.vec3],
+    shape_upper: wp.array[wp.vec3],
+    shape_gap: wp.array[float],
+    shape_displacement: wp.array[wp.vec3],
+    shape_world: wp.array[int],
+    cell_size: wp.array[float],
+    max_cells_per_axis: int,
+    # Outputs
+    hash_keys: wp.array[wp.uint64],
+    hash_active_slots: wp.array[wp.int32],
+    cell_count: wp.array[int],
+    shape_cell_lower: wp.array[wp.vec3i],
+    shape_cell_upper: wp.array[wp.vec3i],
+    shape_is_large: wp.array[int],
+    large_shapes: wp.array[int],
+    large_shape_count: wp.array[int],  # Size one array
+):
+    """Register each shape in the cells it covers, or route it to the brute-force list."""
+    slot = wp.tid()
+    shape = colliding_shapes[slot]
+    shape_is_large[slot] = 0
+    if shape >= shape_count:
+        return
+
+    world = shape_world[shape]
+    lower, upper = _expanded_bounds(shape, shape_lower, shape_upper, shape_gap, shape_displacement)
+    inv_cell_size = 1.0 / cell_size[0]
+
+    large = world < 0 or world > _CELL_WORLD_MAX
+    cell_lower = wp.vec3i(0)
+    cell_upper = wp.vec3i(0)
+    if not large:
+        for axis in range(3):
+            lo = lower[axis] * inv_cell_size
+            hi = upper[axis] * inv_cell_size
+            # Also catches NaN and infinite bounds
+            if not (lo >= float(_CELL_COORD_MIN) and hi <= float(_CELL_COORD_MAX)):
+                large = True
+            else:
+                cell_lower[axis] = int(wp.floor(lo))
+                cell_upper[axis] = int(wp.floor(hi))
+                if cell_upper[axis] - cell_lower[axis] >= max_cells_per_axis:
+                    large = True
+
+    if not large:
+        for ix in range(cell_lower[0], cell_upper[0] + 1):
+            for iy in range(cell_lower[1], cell_upper[1] + 1):
+                for iz in range(cell_lower[2], cell_upper[2] + 1):
+                    if not large:
+                        entry = hashtable_find_or_insert(
+                            _cell_key(world, wp.vec3i(ix, iy, iz)), hash_keys, hash_active_slots
+                        )
+                        if entry < 0:
+                            # Table full; cells counted so far only over-reserve storage
+                            large = True
+                        else:
+                            wp.atomic_add(cell_count, entry, 1)
+
+    shape_cell_lower[slot] = cell_lower
+    shape_cell_upper[slot] = cell_upper
+    if large:
+        shape_is_large[slot] = 1
+        large_shapes[wp.atomic_add(large_shape_count, 0, 1)] = slot
+
+
+@wp.kernel(enable_backward=False)
+def _hash_grid_fill_kernel(
+    colliding_shapes: wp.array[int],
+    shape_count: int,
+    shape_world: wp.array[int],
+    shape_cell_lower: wp.array[wp.vec3i],
+    shape_cell_upper: wp.array[wp.vec3i],
+    shape_is_large: wp.array[int],
+    hash_keys: wp.array[wp.uint64],
+    cell_start: wp.array[int],
+    # Outputs
+    cell_fill: wp.array[int],
+    cell_shapes: wp.array[int],
+):
+    """Scatter the slot of each gridded shape into the contiguous storage of its cells."""
+    slot = wp.tid()
+    shape = colliding_shapes[slot]
+    if shape >= shape_count or shape_is_large[slot] != 0:
+        return
+
+    world = shape_world[shape]
+    cell_lower = shape_cell_lower[slot]
+    cell_upper = shape_cell_upper[slot]
+    for ix in range(cell_lower[0], cell_upper[0] + 1):
+        for iy in range(cell_lower[1], cell_upper[1] + 1):
+            for iz in range(cell_lower[2], cell_upper[2] + 1):
+                entry = hashtable_find(_cell_key(world, wp.vec3i(ix, iy, iz)), hash_keys)
+                cell_shapes[cell_start[entry] + wp.atomic_add(cell_fill, entry, 1)] = slot
+
+
+@wp.kernel(enable_backward=False)
+def _hash_grid_cell_pairs_kernel(
+    colliding_shapes: wp.array[int],
+    shape_count: int,
+    shape_lower: wp.array[wp.vec3],
+    shape_upper: wp.array[wp.vec3],
+    shape_gap: wp.array[float],
+    shape_displacement: wp.array[wp.vec3],
+    shape_collision_group: wp.array[int],
+    shape_world: wp.array[int],
+    shape_body: wp.array[int],
+    body_flags: wp.array[int],
+    include_static_kinematic_pairs: bool,
+    body_sleeping: wp.array[wp.int32],
+    shape_cell_lower: wp.array[wp.vec3i],
+    shape_cell_upper: wp.array[wp.vec3i],
+    shape_is_large: wp.array[int],
+    hash_keys: wp.array[wp.uint64],
+    cell_start: wp.array[int],
+    cell_fill: wp.array[int],
+    cell_shapes: wp.array[int],
+    filter_pairs: wp.array[wp.vec2i],
+    num_filter_pairs: int,
+    # Outputs
+    candidate_pair: wp.array[wp.vec2i],
+    candidate_pair_count: wp.array[int],  # Size one array
+    max_candidate_pair: int,
+):
+    """Test each gridded shape against the shapes sharing its cells.
+
+    A pair is reported only by its lower slot and only in the first cell shared by
+    both shapes, so pairs spanning several cells are written exactly once.
+    """
+    slot_a = wp.tid()
+    shape_a = colliding_shapes[slot_a]
+    if shape_a >= shape_count or shape_is_large[slot_a] != 0:
+        return
+
+    world = shape_world[shape_a]
+    cell_lower_a = shape_cell_lower[slot_a]
+    cell_upper_a = shape_cell_upper[slot_a]
+    for ix in range(cell_lower_a[0], cell_upper_a[0] + 1):
+        for iy in range(cell_lower_a[1], cell_upper_a[1] + 1):
+            for iz in range(cell_lower_a[2], cell_upper_a[2] + 1):
+                entry = hashtable_find(_cell_key(world, wp.vec3i(ix, iy, iz)), hash_keys)
+                start = cell_start[entry]
+                for k in range(cell_fill[entry]):
+                    slot_b = cell_shapes[start + k]
+                    if slot_b <= slot_a:
+                        continue
+                    cell_lower_b = shape_cell_lower[slot_b]
+                    if (
+                        wp.max(cell_lower_a[0], cell_lower_b[0]) != ix
+                        or wp.max(cell_lower_a[1], cell_lower_b[1]) != iy
+                        or wp.max(cell_lower_a[2], cell_lower_b[2]) != iz
+                    ):
+                        continue
+                    _test_and_write_pair(
+                        shape_a,
+                        colliding_shapes[slot_b],
+                        shape_lower,
+                        shape_upper,
+                        shape_gap,
+                        shape_displacement,
+                        shape_collision_group,
+                        shape_world,
+                        shape_body,
+                        body_flags,
+                        include_static_kinematic_pairs,
+                        body_sleeping,
+                        filter_pairs,
+                        num_filter_pairs,
+                        candidate_pair,
+                        candidate_pair_count,
+                        max_candidate_pair,
+                    )
+
+
+@wp.kernel(enable_backward=False)
+def _hash_grid_large_pairs_kernel(
+    colliding_shapes: wp.array[int],
+    shape_count: int,
+    shape_lower: wp.array[wp.vec3],
+    shape_upper: wp.array[wp.vec3],
+    shape_gap: wp.array[float],
+    shape_displacement: wp.array[wp.vec3],
+    shape_collision_group: wp.array[int],
+    shape_world: wp.array[int],
+    shape_body: wp.array[int],
+    body_flags: wp.array[int],
+    include_static_kinematic_pairs: bool,
+    body_sleeping: wp.array[wp.int32],
+    shape_is_large: wp.array[int],
+    large_shapes: wp.array[int],
+    large_shape_count: wp.array[int],  # Size one array
+    filter_pairs: wp.array[wp.vec2i],
+    num_filter_pairs: int,
+    # Outputs
+    candidate_pair: wp.array[wp.vec2i],
+    candidate_pair_count: wp.array[int],  # Size one array
+    max_candidate_pair: int,
+):
+    """Test every shape against the brute-force list; pairs of two listed shapes are written once."""
+    slot_b = wp.tid()
+    shape_b = colliding_shapes[slot_b]
+    if shape_b >= shape_count:
+        return
+
+    b_is_large = shape_is_large[slot_b] != 0
+    for i in range(large_shape_count[0]):
+        slot_a = large_shapes[i]
+        if slot_a == slot_b or (b_is_large and slot_a > slot_b):
+            continue
+        _test_and_write_pair(
+            colliding_shapes[slot_a],
+            shape_b,
+            shape_lower,
+            shape_upper,
+            shape_gap,
+            shape_displacement,
+            shape_collision_group,
+            shape_world,
+            shape_body,
+            body_flags,
+            include_static_kinematic_pairs,
+            body_sleeping,
+            filter_pairs,
+            num_filter_pairs,
+            candidate_pair,
+            candidate_pair_count,
+            max_candidate_pair,
+        )
+
+
+class BroadPhaseSpatialHash:
+    """Uniform-grid broad phase collision detection backed by a spatial hash.
+
+    Each world-local shape is binned into the grid cells its AABB covers, with cells
+    keyed by world and integer cell coordinates in a :class:`HashTable`. Candidate pairs
+    are only generated between shapes sharing a cell, which keeps the cost close to
+    linear in the number of shapes when they have similar sizes.
+
+    Shapes that span more than ``max_cells_per_axis`` cells along any axis, shared
+    shapes (world -1), and shapes that do not fit in the hash table are tested against
+    all other shapes instead, so the result always matches :class:`BroadPhaseAllPairs`.
+
+    All per-launch work is done on the device with fixed-size buffers, so :meth:`launch`
+    can be captured in a CUDA graph.
+    """
+
+    def __init__(
+        self,
+        shape_world: wp.array[wp.int32] | np.ndarray,
+        shape_flags: wp.array[wp.int32] | np.ndarray | None = None,
+        cell_size: float | None = None,
+        cell_size_scale: float = 2.0,
+        max_cells_per_axis: int = 4,
+        device: Devicelike | None = None,
+    ) -> None:
+        """Initialize the grid storage for the given shapes.
+
+        Args:
+            shape_world: Array of world IDs (numpy or warp array).
+                Positive/zero values represent distinct worlds, negative values represent
+                shared entities that belong to all worlds.
+            shape_flags: Optional array of shape flags (numpy or warp array). If provided,
+                only shapes with the COLLIDE_SHAPES flag will be included in collision checks.
+                This efficiently filters out visual-only shapes.
+            cell_size: Edge length of the grid cells [m]. If None, the cell size is
+                recomputed at every launch as ``cell_size_scale`` times the geometric mean of
+                the largest AABB extent of the world-local shapes.
+            cell_size_scale: Multiplier applied to the mean AABB extent when ``cell_size`` is None.
+            max_cells_per_axis: Shapes spanning more cells than this along any axis are tested
+                against all other shapes instead of being binned.
+            device: Device to store the precomputed arrays on. If None, uses CPU for numpy
+                arrays or the device of the input warp array.
+        """
+        if cell_size is not None and not (np.isfinite(cell_size) and cell_size > 0.0):
+            raise ValueError(f"cell_size must be a positive finite number or None, got {cell_size!r}")
+        if not (np.isfinite(cell_size_scale) and cell_size_scale > 0.0):
+            raise ValueError(f"cell_size_scale must be a positive finite number, got {cell_size_scale!r}")
+        if max_cells_per_axis < 1:
+            raise ValueError(f"max_cells_per_axis must be at least 1, got {max_cells_per_axis}")
+
+        # Convert to numpy if it's a warp array
+        if isinstance(shape_world, wp.array):
+            shape_world_np = shape_world.numpy()
+            if device is None:
+                device = shape_world.device
+        else:
+            shape_world_np = np.asarray(shape_world)
+            if device is None:
+                device = "cpu"
+
+        if np.any(shape_world_np < -1):
+            unique_invalid = np.unique(shape_world_np[shape_world_np < -1])
+            raise ValueError(
+                f"Invalid world IDs detected: {unique_invalid.tolist()}. "
+                f"Only world ID -1 (global/shared) and non-negative IDs (0, 1, 2, ...) are supported."
+            )
+
+        colliding_mask = np.ones(len(shape_world_np), dtype=bool)
+        if shape_flags is not None:
+            shape_flags_np = shape_flags.numpy() if isinstance(shape_flags, wp.array) else np.asarray(shape_flags)
+            if shape_flags_np.shape[0] != shape_world_np.shape[0]:
+                raise ValueError("shape_flags and shape_world must have the same length")
+            colliding_mask = (shape_flags_np & ShapeFlags.COLLIDE_SHAPES) != 0
+        colliding_shapes_np = np.flatnonzero(colliding_mask).astype(np.int32)
+
+        self.device = device
+        self.cell_size_scale = float(cell_size_scale)
+        self.max_cells_per_axis = int(max_cells_per_axis)
+        self.auto_cell_size = cell_size is None
+        self.num_colliding_shapes = len(colliding_shapes_np)
+        num_slots = max(self.num_colliding_shapes, 1)
+        max_cells_per_shape = self.max_cells_per_axis**3
+
+        with wp.ScopedDevice(device):
+            self.colliding_shapes = wp.array(colliding_shapes_np, dtype=wp.int32)
+            self.cell_size = wp.full(1, cell_size if cell_size is not None else 1.0, dtype=wp.float32)
+            self.log_extent_sum = wp.zeros(1, dtype=wp.float32)
+            self.extent_count = wp.zeros(1, dtype=wp.int32)
+
+            # Shapes typically cover up to 8 cells; overflowing shapes fall back to brute force
+            self.hash_table = HashTable(2 * 8 * num_slots, device=device)
+            capacity = self.hash_table.capacity
+            self.cell_count = wp.zeros(capacity, dtype=wp.int32)
+            self.cell_start = wp.zeros(capacity, dtype=wp.int32)
+            self.cell_fill = wp.zeros(capacity, dtype=wp.int32)
+            self.cell_shapes = wp.zeros(num_slots * max_cells_per_shape, dtype=wp.int32)
+
+            self.shape_cell_lower = wp.zeros(num_slots, dtype=wp.vec3i)
+            self.shape_cell_upper = wp.zeros(num_slots, dtype=wp.vec3i)
+            self.shape_is_large = wp.zeros(num_slots, dtype=wp.int32)
+            self.large_shapes = wp.zeros(num_slots, dtype=wp.int32)
+            self.large_shape_count = wp.zeros(1, dtype=wp.int32)
+
+    def launch(
+        self,
+        shape_lower: wp.array[wp.vec3],  # Lower bounds of shape bounding boxes
+        shape_upper: wp.array[wp.vec3],  # Upper bounds of shape bounding boxes
+        shape_gap: wp.array[float] | None,  # Optional per-shape effective gaps
+        shape_collision_group: wp.array[int],  # Collision group ID per box
+        shape_world: wp.array[int],  # World index per box
+        shape_count: int,  # Number of active bounding boxes
+        # Outputs
+        candidate_pair: wp.array[wp.vec2i],  # Array to store overlapping shape pairs
+        candidate_pair_count: wp.array[int],
+        device: Devicelike | None = None,  # Device to launch on
+        filter_pairs: wp.array[wp.vec2i] | None = None,  # Sorted excluded pairs
+        num_filter_pairs: int | None = None,
+        skip_count_zero: bool = False,  # Skip candidate_pair_count.zero_() if already zeroed by the caller
+        *,
+        shape_body: wp.array[int] | None = None,
+        body_flags: wp.array[int] | None = None,
+        include_static_kinematic_pairs: bool = True,
+        body_sleeping: wp.array[wp.int32] | None = None,
+        shape_displacement: wp.array[wp.vec3] | None = None,
+    ) -> None:
+        """Launch the spatial hash broad phase collision detection.
+
+        Args:
+            shape_lower: Array of lower bounds for each shape's AABB
+            shape_upper: Array of upper bounds for each shape's AABB
+            shape_gap: Optional array of per-shape effective gaps. If None or empty array,
+                assumes AABBs are pre-expanded (gaps = 0). If provided, gaps are added during overlap checks.
+            shape_collision_group: Array of collision group IDs for each shape. Positive values indicate
+                groups that only collide with themselves (and with negative groups). Negative values indicate
+                groups that collide with everything except their negative counterpart. Zero indicates no collisions.
+            shape_world: Array of world indices for each shape. Index -1 indicates global entities
+                that collide with all worlds. Indices 0, 1, 2, ... indicate world-specific entities.
+            shape_count: Number of active bounding boxes to check
+            candidate_pair: Output array to store overlapping shape pairs
+            candidate_pair_count: Output array to store number of overlapping pairs found
+            device: Device to launch on. If None, uses the device of the input arrays.
+            filter_pairs: Optional sorted shape pairs to exclude.
+            num_filter_pairs: Number of valid entries in ``filter_pairs``. If None, uses ``filter_pairs.shape[0]``.
+            skip_count_zero: If True, skip the internal ``candidate_pair_count.zero_()``.
+                The caller guarantees ``candidate_pair_count[0] == 0`` on entry.
+            shape_body: Optional array mapping each shape to its body index. Negative body indices are static shapes.
+                Omitting this array disables immovable-pair filtering for expert callers.
+            body_flags: Optional body flag array used to identify kinematic bodies. An empty array is valid for
+                an all-static model when ``shape_body`` is provided.
+            include_static_kinematic_pairs: Whether to include pairs where both shapes are immovable. Set to
+                ``False`` to filter static-static, static-kinematic, and kinematic-kinematic pairs.
+            body_sleeping: Optional per-body sleep flags (nonzero = asleep), typically
+                :attr:`State.body_sleeping <newton.State.body_sleeping>`. Pairs whose bodies are all sleeping or static
+                are skipped. Requires ``shape_body``.
+            shape_displacement: Optional world-space displacement of each shape over the collision-update interval
+                ``dt``, used for speculative-contact swept-AABB tests [m]. Shapes are binned by their swept
+                AABB so no swept overlap is missed.
+
+        The method will populate candidate_pair with the indices of shape pairs (i,j) where i < j whose AABBs overlap
+        (with optional margin expansion), whose collision groups allow interaction, and whose world indices are
+        compatible (same world or at least one is global). Pairs in filter_pairs (if provided) are excluded.
+        The number of pairs found will be written to candidate_pair_count[0].
+        """
+        max_candidate_pair = candidate_pair.shape[0]
+
+        if not skip_count_zero:
+            candidate_pair_count.zero_()
+
+        if device is None:
+            device = shape_lower.device
+
+        if self.num_colliding_shapes == 0:
+            return
+
+        if shape_gap is None:
+            shape_gap = wp.empty(0, dtype=wp.float32, device=device)
+        if shape_body is None:
+            shape_body = wp.empty(0, dtype=wp.int32, device=device)
+        if body_flags is None:
+            body_flags = wp.empty(0, dtype=wp.int32, device=device)
+        if body_sleeping is None:
+            body_sleeping = wp.empty(0, dtype=wp.int32, device=device)
+        if shape_displacement is None:
+            shape_displacement = wp.empty(0, dtype=wp.vec3, device=device)
+        elif shape_displacement.shape[0] != shape_lower.shape[0]:
+            raise ValueError(
+                "shape_displacement length must match the shape bounds "
+                f"({shape_lower.shape[0]}), got {shape_displacement.shape[0]}"
+            )
+
+        if filter_pairs is None or filter_pairs.shape[0] == 0:
+            filter_pairs_arr = wp.empty(0, dtype=wp.vec2i, device=device)
+            n_filter = 0
+        else:
+            filter_pairs_arr = filter_pairs
+            n_filter = num_filter_pairs if num_filter_pairs is not None else filter_pairs.shape[0]
+
+        dim = self.num_colliding_shapes
+
+        if self.auto_cell_size:
+            self.log_extent_sum.zero_()
+            self.extent_count.zero_()
+            wp.launch(
+                kernel=_hash_grid_accumulate_extent_kernel,
+                dim=dim,
+                inputs=[
+                    self.colliding_shapes,
+                    shape_count,
+                    shape_lower,
+                    shape_upper,
+                    shape_gap,
+                    shape_displacement,
+                    shape_world,
+                ],
+                outputs=[self.log_extent_sum, self.extent_count],
+                device=device,
+                record_tape=False,
+            )
+            wp.launch(
+                kernel=_hash_grid_cell_size_kernel,
+                dim=1,
+                inputs=[self.cell_size_scale, self.log_extent_sum, self.extent_count],
+                outputs=[self.cell_size],
+                device=device,
+                record_tape=False,
+            )
+
+        # Rebuild the grid from scratch
+        self.hash_table.clear_active()
+        self.cell_count.zero_()
+        self.cell_fill.zero_()
+        self.large_shape_count.zero_()
+
+        wp.launch(
+            kernel=_hash_grid_insert_kernel,
+            dim=dim,
+            inputs=[
+                self.colliding_shapes,
+                shape_count,
+                shape_lower,
+                shape_upper,
+                shape_gap,
+                shape_displacement,
+                shape_world,
+                self.cell_size,
+                self.max_cells_per_axis,
+            ],
+            outputs=[
+                self.hash_table.keys,
+                self.hash_table.active_slots,
+                self.cell_count,
+                self.shape_cell_lower,
+                self.shape_cell_upper,
+                self.shape_is_large,
+                self.large_shapes,
+                self.large_shape_count,
+            ],
+            device=device,
+            record_tape=False,
+        )
+        wp.utils.array_scan(self.cell_count, self.cell_start, inclusive=False)
+        wp.launch(
+            kernel=_hash_grid_fill_kernel,
+            dim=dim,
+            inputs=[
+                self.colliding_shapes,
+                shape_count,
+                shape_world,
+                self.shape_cell_lower,
+                self.shape_cell_upper,
+                self.shape_is_large,
+                self.hash_table.keys,
+                self.cell_start,
+            ],
+            outputs=[self.cell_fill, self.cell_shapes],
+            device=device,
+            record_tape=False,
+        )
+
+        shared_inputs = [
+            self.colliding_shapes,
+            shape_count,
+            shape_lower,
+            shape_upper,
+            shape_gap,
+            shape_displacement,
+            shape_collision_group,
+            shape_world,
+            shape_body,
+            body_flags,
+            include_static_kinematic_pairs,
+            body_sleeping,
+        ]
+        wp.launch(
+            kernel=_hash_grid_cell_pairs_kernel,
+            dim=dim,
+            inputs=[
+                *shared_inputs,
+                self.shape_cell_lower,
+                self.shape_cell_upper,
+                self.shape_is_large,
+                self.hash_table.keys,
+                self.cell_start,
+                self.cell_fill,
+                self.cell_shapes,
+                filter_pairs_arr,
+                n_filter,
+            ],
+            outputs=[candidate_pair, candidate_pair_count, max_candidate_pair],
+            device=device,
+            record_tape=False,
+        )
+        wp.launch(
+            kernel=_hash_grid_large_pairs_kernel,
+            dim=dim,
+            inputs=[
+                *shared_inputs,
+                self.shape_is_large,
+                self.large_shapes,
+                self.large_shape_count,
+                filter_pairs_arr,
+                n_filter,
+            ],
+            outputs=[candidate_pair, candidate_pair_count, max_candidate_pair],
+            device=device,
+            record_tape=False,
+        )
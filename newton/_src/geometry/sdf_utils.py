@@ -26,6 +26,7 @@ from .types import GeoType, Mesh
 logger = logging.getLogger(__name__)
 
 SignMethod = Literal["auto", "parity", "winding", "normal"]
+SDFCacheFormat = Literal["npz", "mmap"]
 
 if TYPE_CHECKING:
     from .sdf_texture import TextureSDFData
@@ -366,6 +367,7 @@ class SDF:
         sign_method: SignMethod = "auto",
         cache_dir: str | os.PathLike[str] | None = None,
         paired_samples: bool = True,
+        cache_format: SDFCacheFormat = "npz",
     ) -> "SDF":
         """Create an SDF from a mesh in local mesh coordinates.
 
@@ -423,11 +425,19 @@ class SDF:
                 numpy arrays). A subsequent call with the same inputs
                 reloads from disk and skips the expensive mesh-SDF
                 build. ``shape_margin`` is applied at sample time and
-                is *not* part of the cache key. Defaults to ``None``
-                (cache disabled).
+                is *not* part of the cache key. Cooked SDFs loaded or
+                written in this process are also kept in an in-process LRU
+                (see :meth:`cache_stats`), so shapes sharing a mesh reuse
+                one cook. Defaults to ``None`` (cache disabled).
             paired_samples: Store each SDF sample with its positive-X
                 neighbor for faster software interpolation. Disable to halve
                 texture memory at the cost of slower hydroelastic sampling.
+            cache_format: On-disk layout used with ``cache_dir``. ``"npz"``
+                (default) stores one ``{hash}.sdf.npz`` archive per entry;
+                ``"mmap"`` stores a ``{hash}.sdf.mmap`` directory of
+                uncompressed ``.npy`` files that are memory-mapped on load,
+                so worker processes on one host share the data without
+                copying it.
 
         Returns:
             A validated :class:`SDF` runtime handle.
@@ -435,8 +445,8 @@ class SDF:
         Raises:
             RuntimeError: if no CUDA device is available. The texture SDF build
                 pipeline requires CUDA kernels and 3D textures.
-            ValueError: if ``texture_format`` or ``sign_method`` is not one of
-                the supported values.
+            ValueError: if ``texture_format``, ``sign_method``, or
+                ``cache_format`` is not one of the supported values.
         """
         if not wp.is_cuda_available():
             raise RuntimeError(
@@ -448,6 +458,9 @@ class SDF:
         valid_sign_methods: tuple[SignMethod, ...] = ("auto", "parity", "winding", "normal")
         if sign_method not in valid_sign_methods:
             raise ValueError(f"Unknown sign_method {sign_method!r}. Expected one of {list(valid_sign_methods)}.")
+        valid_cache_formats: tuple[SDFCacheFormat, ...] = ("npz", "mmap")
+        if cache_format not in valid_cache_formats:
+            raise ValueError(f"Unknown cache_format {cache_format!r}. Expected one of {list(valid_cache_formats)}.")
 
         effective_max_resolution = 64 if max_resolution is None and target_voxel_size is None else max_resolution
         bake_scale = scale is not None
@@ -488,25 +501,17 @@ class SDF:
         if cache_dir is not None:
             from . import _sdf_cache  # noqa: PLC0415
 
-            verts_for_hash = np.asarray(mesh.vertices, dtype=np.float32) * np.array(effective_scale, dtype=np.float32)
-            indices_for_hash = np.asarray(mesh.indices, dtype=np.int32).reshape(-1)
-            cache_hash = _sdf_cache.hash_inputs(
-                vertices=verts_for_hash,
-                indices=indices_for_hash,
-                is_solid=bool(getattr(mesh, "is_solid", True)),
+            cache_hash = _mesh_sdf_cache_key(
+                mesh,
                 narrow_band_range=narrow_band_range,
                 target_voxel_size=target_voxel_size,
-                max_resolution=effective_max_resolution,
+                max_resolution=max_resolution,
                 margin=margin,
-                texture_format=texture_format,
-                sign_method_resolved=sign_method_resolved,
-                # winding_threshold's actual value is set post-cook, but
-                # the cooked output's equivalence class only depends on
-                # its sign. +0.5 is the canonical positive case.
-                winding_threshold=0.5,
                 scale=scale,
+                texture_format=texture_format,
+                sign_method=sign_method,
             )
-            loaded_sparse_data = _sdf_cache.try_load_sparse_data(cache_dir, cache_hash)
+            loaded_sparse_data = _sdf_cache.try_load_sparse_data(cache_dir, cache_hash, cache_format=cache_format)
 
         with wp.ScopedDevice(device):
             if loaded_sparse_data is not None:
@@ -549,7 +554,7 @@ class SDF:
                 if want_sparse:
                     texture_data, coarse_texture, subgrid_texture, sparse_data = result
                     if sparse_data is not None:
-                        _sdf_cache.write(cache_dir, cache_hash, sparse_data)
+                        _sdf_cache.write(cache_dir, cache_hash, sparse_data, cache_format=cache_format)
                 else:
                     texture_data, coarse_texture, subgrid_texture = result
 
@@ -568,6 +573,32 @@ class SDF:
         sdf.validate()
         return sdf
 
+    @staticmethod
+    def cache_stats() -> dict[str, int]:
+        """Return the counters of the cooked-SDF cache used by :meth:`create_from_mesh`.
+
+        Returns:
+            A dictionary with ``memory_hits`` (cooks served by the in-process
+            LRU), ``disk_hits`` (cooks served from ``cache_dir``), ``misses``
+            (cooks that ran), ``bytes_loaded`` / ``bytes_mapped`` (array bytes
+            read from ``.npz`` entries / memory-mapped from ``.sdf.mmap``
+            entries), and ``memory_entries`` / ``memory_bytes`` currently held
+            by the LRU.
+        """
+        from . import _sdf_cache  # noqa: PLC0415
+
+        return _sdf_cache.cache_stats()
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop the in-process cooked-SDF cache and reset :meth:`cache_stats`.
+
+        Entries already persisted to a ``cache_dir`` are left untouched.
+        """
+        from . import _sdf_cache  # noqa: PLC0415
+
+        _sdf_cache.clear_memory_cache()
+
     @staticmethod
     def create_from_data(
         *,
@@ -648,6 +679,50 @@ class SDF:
 SDF_BACKGROUND_VALUE = MAXVAL
 
 
+def _mesh_sdf_cache_key(
+    mesh: Mesh,
+    *,
+    narrow_band_range: tuple[float, float],
+    target_voxel_size: float | None,
+    max_resolution: int | None,
+    margin: float,
+    scale: tuple[float, float, float] | None,
+    texture_format: str,
+    sign_method: SignMethod,
+) -> str:
+    """Return the :mod:`._sdf_cache` key of a :meth:`SDF.create_from_mesh` cook.
+
+    Resolves the effective resolution and sign method exactly as
+    :meth:`SDF.create_from_mesh` does, so equal keys produce identical cooked data.
+    """
+    from . import _sdf_cache  # noqa: PLC0415
+
+    effective_max_resolution = 64 if max_resolution is None and target_voxel_size is None else max_resolution
+    effective_scale = scale if scale is not None else (1.0, 1.0, 1.0)
+    if sign_method == "auto":
+        sign_method_resolved = "parity" if mesh.is_watertight else "winding"
+    else:
+        sign_method_resolved = sign_method
+    verts_for_hash = np.asarray(mesh.vertices, dtype=np.float32) * np.array(effective_scale, dtype=np.float32)
+    indices_for_hash = np.asarray(mesh.indices, dtype=np.int32).reshape(-1)
+    return _sdf_cache.hash_inputs(
+        vertices=verts_for_hash,
+        indices=indices_for_hash,
+        is_solid=bool(getattr(mesh, "is_solid", True)),
+        narrow_band_range=narrow_band_range,
+        target_voxel_size=target_voxel_size,
+        max_resolution=effective_max_resolution,
+        margin=margin,
+        texture_format=texture_format,
+        sign_method_resolved=sign_method_resolved,
+        # winding_threshold's actual value is set post-cook, but
+        # the cooked output's equivalence class only depends on
+        # its sign. +0.5 is the canonical positive case.
+        winding_threshold=0.5,
+        scale=scale,
+    )
+
+
 def create_empty_sdf_data() -> SDFData:
     """Create an empty SDFData struct for shapes that don't need SDF collision.
 
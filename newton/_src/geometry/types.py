@@ -3,11 +3,13 @@
 
 import enum
 import hashlib
+import inspect
 import math
 import os
 import warnings
 from collections.abc import Sequence
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import warp as wp
@@ -18,7 +20,7 @@ from ..utils.texture import compute_texture_hash
 
 if TYPE_CHECKING:
     from ..sim.model import Model
-    from .sdf_utils import SDF, SignMethod
+    from .sdf_utils import SDF, SDFCacheFormat, SignMethod
 
 
 def _resolve_relative_or_absolute(
@@ -50,6 +52,21 @@ def _resolve_relative_or_absolute(
     return rel * diagonal
 
 
+_DEFAULT_SDF_NARROW_BAND_RANGE = (-0.1, 0.1)
+_DEFAULT_SDF_MARGIN = 0.05
+
+
+def _resolve_sdf_band(
+    narrow_band_range: tuple[float, float] | None, margin: float | None
+) -> tuple[tuple[float, float], float]:
+    """Apply the :meth:`Mesh.build_sdf` defaults for an unset narrow band or margin."""
+    if narrow_band_range is None:
+        narrow_band_range = _DEFAULT_SDF_NARROW_BAND_RANGE
+    if margin is None:
+        margin = _DEFAULT_SDF_MARGIN
+    return narrow_band_range, margin
+
+
 def _normalize_texture_input(texture: str | os.PathLike[str] | np.ndarray | None) -> str | np.ndarray | None:
     """Normalize texture input for lazy storage.
 
@@ -67,6 +84,80 @@ def _normalize_texture_input(texture: str | os.PathLike[str] | np.ndarray | None
     return np.ascontiguousarray(np.asarray(texture))
 
 
+def _sdf_job_key(mesh: "Mesh", kwargs: dict[str, Any]) -> tuple:
+    """Key under which two :meth:`Mesh.build_sdf` calls produce interchangeable results.
+
+    Combines the :mod:`._sdf_cache` key of the cook with the remaining
+    arguments (device, edge simplification, cache options, ...).
+    """
+    from .sdf_utils import _mesh_sdf_cache_key  # noqa: PLC0415
+
+    bound = inspect.signature(Mesh.build_sdf).bind(mesh, **kwargs)
+    bound.apply_defaults()
+    args = dict(bound.arguments)
+    del args["self"]
+    narrow_band_range, margin = _resolve_sdf_band(args.pop("narrow_band_range"), args.pop("margin"))
+    cache_key = _mesh_sdf_cache_key(
+        mesh,
+        narrow_band_range=narrow_band_range,
+        target_voxel_size=args.pop("target_voxel_size"),
+        max_resolution=args.pop("max_resolution"),
+        margin=margin,
+        scale=args.pop("scale"),
+        texture_format=args.pop("texture_format"),
+        sign_method=args.pop("sign_method"),
+    )
+    return (cache_key, *sorted((name, repr(value)) for name, value in args.items()))
+
+
+def _build_mesh_sdfs(jobs: Sequence[tuple["Mesh", dict[str, Any]]], *, max_workers: int | None = None) -> list["SDF"]:
+    """Run :meth:`Mesh.build_sdf` for ``(mesh, kwargs)`` jobs, cooking distinct jobs concurrently.
+
+    Jobs with equal :func:`_sdf_job_key` are cooked once and the SDF and
+    simplified collision edges are attached to every mesh of the group.
+    Warp's default device and stream are process-wide, so all workers issue
+    work to the same device under one outer :class:`wp.ScopedDevice`; jobs
+    targeting different devices are cooked sequentially. The first cook runs
+    before the pool starts so kernel modules are compiled and loaded once.
+    """
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"max_workers must be positive, got {max_workers}")
+
+    groups: dict[tuple, tuple[dict[str, Any], list[Mesh]]] = {}
+    mesh_keys: dict[int, tuple] = {}
+    for mesh, kwargs in jobs:
+        if mesh.sdf is not None:
+            raise RuntimeError("Mesh already has an SDF. Call clear_sdf() before rebuilding.")
+        key = _sdf_job_key(mesh, kwargs)
+        if mesh_keys.setdefault(id(mesh), key) != key:
+            raise ValueError("A mesh was listed more than once with different SDF parameters.")
+        group_meshes = groups.setdefault(key, (kwargs, []))[1]
+        if all(other is not mesh for other in group_meshes):
+            group_meshes.append(mesh)
+
+    def cook(kwargs: dict[str, Any], meshes: list[Mesh]) -> None:
+        source = meshes[0]
+        sdf = source.build_sdf(**kwargs)
+        for mesh in meshes[1:]:
+            mesh.sdf = sdf
+            mesh._collision_edges = source._collision_edges
+
+    cooks = list(groups.values())
+    workers = min(max_workers if max_workers is not None else os.cpu_count() or 1, len(cooks))
+    devices = {wp.get_device(kwargs.get("device")).alias for kwargs, _ in cooks}
+    if workers <= 1 or len(devices) > 1:
+        for kwargs, meshes in cooks:
+            cook(kwargs, meshes)
+    else:
+        cook(*cooks[0])
+        with wp.ScopedDevice(devices.pop()), ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(cook, kwargs, meshes) for kwargs, meshes in cooks[1:]]
+            for future in futures:
+                future.result()
+
+    return [mesh.sdf for mesh, _ in jobs]
+
+
 class GeoType(enum.IntEnum):
     """
     Enumeration of geometric shape types supported in Newton.
@@ -831,6 +922,7 @@ class Mesh:
         sign_method: "SignMethod" = "auto",
         cache_dir: str | os.PathLike[str] | None = None,
         paired_samples: bool = True,
+        cache_format: "SDFCacheFormat" = "npz",
         edge_lower_angle_threshold_rad: float = math.radians(0.1),
         edge_upper_angle_threshold_rad: float = math.radians(10.0),
         edge_inward_filter: bool = True,
@@ -880,6 +972,10 @@ class Mesh:
                 texture memory at the cost of slower hydroelastic sampling.
                 When the mesh is added to a :class:`ModelBuilder`, this value
                 must match :attr:`ModelBuilder.sdf_texture_paired_samples`.
+            cache_format: On-disk layout of ``cache_dir`` entries:
+                ``"npz"`` (default, one archive per entry) or ``"mmap"``
+                (uncompressed ``.npy`` files memory-mapped on load, shared
+                by worker processes on one host).
             edge_lower_angle_threshold_rad: Drop internal edges whose
                 dihedral angle is below this value [rad]. Set to 0 to keep
                 every manifold edge. A negative value opts out of edge
@@ -939,19 +1035,21 @@ class Mesh:
 
         from .sdf_utils import SDF  # noqa: PLC0415
 
+        narrow_band_range, margin = _resolve_sdf_band(narrow_band_range, margin)
         self.sdf = SDF.create_from_mesh(
             self,
             device=device,
-            narrow_band_range=narrow_band_range if narrow_band_range is not None else (-0.1, 0.1),
+            narrow_band_range=narrow_band_range,
             target_voxel_size=target_voxel_size,
             max_resolution=max_resolution,
-            margin=margin if margin is not None else 0.05,
+            margin=margin,
             shape_margin=shape_margin,
             scale=scale,
             texture_format=texture_format,
             sign_method=sign_method,
             cache_dir=cache_dir,
             paired_samples=paired_samples,
+            cache_format=cache_format,
         )
 
         try:
@@ -973,6 +1071,38 @@ class Mesh:
 
         return self.sdf
 
+    @staticmethod
+    def build_sdfs(
+        meshes: Sequence["Mesh"],
+        *,
+        max_workers: int | None = None,
+        **kwargs,
+    ) -> list["SDF"]:
+        """Build and attach SDFs for several meshes, cooking them concurrently.
+
+        Equivalent to calling :meth:`build_sdf` with ``kwargs`` on every mesh,
+        but distinct cooks run on a thread pool so one mesh's host-side stages
+        (BVH construction, NumPy passes, device readbacks, ``cache_dir`` IO)
+        overlap with the kernels of others. Meshes whose content and SDF
+        parameters map to the same ``cache_dir`` key are cooked once and
+        share the resulting :class:`SDF`.
+
+        Args:
+            meshes: Meshes to build SDFs for. A mesh may be listed more than once.
+            max_workers: Maximum number of concurrent cooks. ``None`` uses one
+                worker per CPU core; ``1`` cooks sequentially.
+            **kwargs: Keyword arguments forwarded to :meth:`build_sdf`.
+
+        Returns:
+            The attached SDF of each mesh, in input order.
+
+        Raises:
+            RuntimeError: If any mesh already has an SDF attached. No SDF is
+                built in that case.
+            ValueError: If ``max_workers`` is not positive.
+        """
+        return _build_mesh_sdfs([(mesh, kwargs) for mesh in meshes], max_workers=max_workers)
+
     def _aabb_diagonal(self) -> float:
         """World-space AABB diagonal length [m] of the mesh vertices."""
         if self._vertices.size == 0:
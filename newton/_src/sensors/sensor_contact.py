@@ -12,6 +12,7 @@ import warp as wp
 
 from ..sim import Contacts, Model, State
 from ..sim.contacts import contact_surface_point
+from ..utils.benchmark import profile_scope
 from ..utils.selection import match_labels
 
 _UNSET = object()
@@ -168,6 +169,160 @@ def normalize_contact_positions_kernel(
         position_matrix[row, col] /= weight
 
 
+@wp.kernel(enable_backward=False)
+def build_contact_segment_keys_kernel(
+    num_contacts: wp.array[wp.int32],
+    contact_shape0: wp.array[wp.int32],
+    contact_shape1: wp.array[wp.int32],
+    sensing_shape_to_row: wp.array[wp.int32],
+    counterpart_shape_to_col: wp.array[wp.int32],
+    n_cols: int,
+    n_cells: int,
+    include_unmatched: int,
+    # output
+    segment_keys: wp.array[wp.int32],
+    segment_entries: wp.array[wp.int32],
+):
+    """Emit one sort entry per contact side. Parallelizes over contacts.
+
+    Entry ``2 * contact + side`` is keyed by the output cell ``row * (n_cols + 1) + col`` it contributes to, where
+    ``col == n_cols`` collects contacts without a matching counterpart. Entries that do not reach any output get the
+    sentinel key ``n_cells`` so they sort to the end.
+    """
+    contact_index = wp.tid()
+    entry0 = 2 * contact_index
+    entry1 = entry0 + 1
+    segment_entries[entry0] = entry0
+    segment_entries[entry1] = entry1
+    segment_keys[entry0] = n_cells
+    segment_keys[entry1] = n_cells
+    if contact_index >= num_contacts[0]:
+        return
+
+    shape0 = contact_shape0[contact_index]
+    shape1 = contact_shape1[contact_index]
+    stride = n_cols + 1
+
+    # side 0: force on shape0's sensing object from shape1, side 1: the reaction on shape1's sensing object
+    row0 = sensing_shape_to_row[shape0]
+    if row0 >= 0:
+        col1 = counterpart_shape_to_col[shape1]
+        if col1 >= 0:
+            segment_keys[entry0] = row0 * stride + col1
+        elif include_unmatched != 0:
+            segment_keys[entry0] = row0 * stride + n_cols
+    row1 = sensing_shape_to_row[shape1]
+    if row1 >= 0:
+        col0 = counterpart_shape_to_col[shape0]
+        if col0 >= 0:
+            segment_keys[entry1] = row1 * stride + col0
+        elif include_unmatched != 0:
+            segment_keys[entry1] = row1 * stride + n_cols
+
+
+@wp.kernel(enable_backward=False)
+def find_contact_segment_starts_kernel(
+    sorted_keys: wp.array[wp.int32],
+    entry_count: int,
+    n_cells: int,
+    # output
+    segment_start: wp.array[wp.int32],
+):
+    """Write the first sorted entry of every output cell (``segment_start[n_cells]`` ends the last one)."""
+    i = wp.tid()
+    key = sorted_keys[i]
+    prev_key = -1
+    if i > 0:
+        prev_key = sorted_keys[i - 1]
+    for cell in range(prev_key + 1, key + 1):
+        segment_start[cell] = i
+    if i == entry_count - 1:
+        for cell in range(key + 1, n_cells + 1):
+            segment_start[cell] = entry_count
+
+
+@wp.kernel(enable_backward=False)
+def reduce_contact_segments_kernel(
+    segment_start: wp.array[wp.int32],
+    sorted_entries: wp.array[wp.int32],
+    n_cols: int,
+    contact_shape0: wp.array[wp.int32],
+    contact_shape1: wp.array[wp.int32],
+    contact_point0: wp.array[wp.vec3],
+    contact_point1: wp.array[wp.vec3],
+    contact_offset0: wp.array[wp.vec3],
+    contact_offset1: wp.array[wp.vec3],
+    contact_force: wp.array[wp.spatial_vector],
+    contact_normal: wp.array[wp.vec3],
+    shape_body: wp.array[wp.int32],
+    body_q: wp.array[wp.transform],
+    # output
+    force_matrix: wp.array2d[wp.vec3],
+    total_force: wp.array[wp.vec3],
+    force_matrix_friction: wp.array2d[wp.vec3],
+    total_force_friction: wp.array[wp.vec3],
+    position_matrix: wp.array2d[wp.vec3],
+):
+    """Sum the sorted contact segments of one sensing object in a fixed order. Parallelizes over sensing objects."""
+    row = wp.tid()
+    stride = n_cols + 1
+    total = wp.vec3(0.0)
+    total_friction = wp.vec3(0.0)
+
+    for col in range(stride):
+        cell = row * stride + col
+        cell_force = wp.vec3(0.0)
+        cell_friction = wp.vec3(0.0)
+        weighted_position = wp.vec3(0.0)
+        weight_sum = float(0.0)
+        for i in range(segment_start[cell], segment_start[cell + 1]):
+            entry = sorted_entries[i]
+            contact_index = entry // 2
+            force = wp.spatial_top(contact_force[contact_index])
+
+            n = contact_normal[contact_index]
+            len_sq = wp.dot(n, n)
+            if wp.abs(len_sq - 1.0) > 1.0e-4:
+                n = wp.normalize(n)
+            friction = force - wp.dot(force, n) * n
+
+            if entry - 2 * contact_index == 1:
+                force = -force
+                friction = -friction
+            cell_force += force
+            cell_friction += friction
+
+            if col < n_cols and body_q:
+                weight = wp.length(force)
+                if weight > 0.0:
+                    body0 = shape_body[contact_shape0[contact_index]]
+                    body1 = shape_body[contact_shape1[contact_index]]
+                    transform0 = wp.where(body0 >= 0, body_q[wp.max(body0, 0)], wp.transform_identity())
+                    transform1 = wp.where(body1 >= 0, body_q[wp.max(body1, 0)], wp.transform_identity())
+                    point0_world = contact_surface_point(
+                        transform0, contact_point0[contact_index], contact_offset0[contact_index]
+                    )
+                    point1_world = contact_surface_point(
+                        transform1, contact_point1[contact_index], contact_offset1[contact_index]
+                    )
+                    weighted_position += weight * 0.5 * (point0_world + point1_world)
+                    weight_sum += weight
+
+        total += cell_force
+        total_friction += cell_friction
+        if col < n_cols:
+            force_matrix[row, col] = cell_force
+            force_matrix_friction[row, col] = cell_friction
+            if weight_sum > 0.0:
+                position_matrix[row, col] = weighted_position / weight_sum
+            else:
+                position_matrix[row, col] = wp.vec3(0.0)
+
+    if total_force:
+        total_force[row] = total
+        total_force_friction[row] = total_friction
+
+
 @wp.kernel(enable_backward=False)
 def expand_body_to_shape_kernel(
     body_to_row: wp.array[wp.int32],
@@ -458,6 +613,7 @@ class SensorContact:
         counterpart_bodies: str | list[str] | re.Pattern[str] | list[int] | None = None,
         counterpart_shapes: str | list[str] | re.Pattern[str] | list[int] | None = None,
         measure_total: bool = True,
+        deterministic: bool = False,
         verbose: bool | None = None,
         request_contact_attributes: bool = True,
         **kwargs: Any,
@@ -481,6 +637,11 @@ class SensorContact:
                 against shape labels, or list of shape indices. Regular expressions use full matching.
             measure_total: If True (default), :attr:`total_force` and :attr:`total_force_friction` are allocated.
                 If False, both are None.
+            deterministic: If True, :meth:`update` sorts the contacts into per-sensing-object segments and sums each
+                segment in a fixed order instead of accumulating with atomics. Readings are then bitwise reproducible
+                for identical contact buffers, and the reduction cost scales with the number of sensing objects and
+                their contacts rather than with the contact capacity. Scratch buffers are sized on the first
+                :meth:`update` for a given contact capacity, so run one update before capturing a CUDA graph.
             verbose: If True, print details. If False, suppress details. If None, print details when
                 ``wp.config.log_level`` is configured for debug logging.
             request_contact_attributes: If True (default), transparently request the extended contact attribute
@@ -681,6 +842,14 @@ class SensorContact:
         self._sensing_kinds = wp.full(n_rows, sensing_kind, dtype=wp.int32, device=self.device)
         self.sensing_transforms = wp.zeros(n_rows, dtype=wp.transform, device=self.device)
 
+        self.deterministic = deterministic
+        self._n_cols = max_readings
+        self._segment_capacity = -1
+        self._segment_keys = None
+        self._segment_entries = None
+        self._segment_start = None
+
+    @profile_scope
     def update(self, state: State | None, contacts: Contacts):
         """Update the contact sensor readings based on the provided state and contacts.
 
@@ -726,6 +895,9 @@ class SensorContact:
 
     def _eval_forces(self, state: State | None, contacts: Contacts):
         """Recompute force outputs and, when ``state.body_q`` is available, contact positions."""
+        if self.deterministic:
+            self._eval_forces_segmented(state, contacts)
+            return
         if self.total_force is not None:
             self.total_force.zero_()
             self.total_force_friction.zero_()
@@ -773,3 +945,75 @@ class SensorContact:
                 inputs=[self.position_matrix, self._position_weight],
                 device=self.device,
             )
+
+    def _eval_forces_segmented(self, state: State | None, contacts: Contacts):
+        """Deterministic variant of :meth:`_eval_forces` that reduces sorted per-cell contact segments."""
+        capacity = contacts.rigid_contact_max
+        n_rows = len(self.sensing_indices)
+        n_cells = n_rows * (self._n_cols + 1)
+        entry_count = 2 * capacity
+        if self._segment_capacity != capacity:
+            # radix_sort_pairs uses the second half as scratch, so allocate 2x.
+            self._segment_keys = wp.zeros(2 * entry_count, dtype=wp.int32, device=self.device)
+            self._segment_entries = wp.zeros(2 * entry_count, dtype=wp.int32, device=self.device)
+            self._segment_start = wp.zeros(n_cells + 1, dtype=wp.int32, device=self.device)
+            self._segment_capacity = capacity
+        if capacity == 0:
+            self._segment_start.zero_()
+        else:
+            wp.launch(
+                build_contact_segment_keys_kernel,
+                dim=capacity,
+                inputs=[
+                    contacts.rigid_contact_count,
+                    contacts.rigid_contact_shape0,
+                    contacts.rigid_contact_shape1,
+                    self._sensing_shape_to_row,
+                    self._counterpart_shape_to_col,
+                    self._n_cols,
+                    n_cells,
+                    int(self.total_force is not None),
+                ],
+                outputs=[self._segment_keys, self._segment_entries],
+                device=self.device,
+            )
+            # the radix sort is stable, so entries of a cell stay in contact order; keys never exceed n_cells
+            wp.utils.radix_sort_pairs(
+                self._segment_keys, self._segment_entries, entry_count, end_bit=max(n_cells.bit_length(), 1)
+            )
+            wp.launch(
+                find_contact_segment_starts_kernel,
+                dim=entry_count,
+                inputs=[self._segment_keys, entry_count, n_cells],
+                outputs=[self._segment_start],
+                device=self.device,
+            )
+
+        update_contact_positions = self.position_matrix is not None and state is not None and state.body_q is not None
+        wp.launch(
+            reduce_contact_segments_kernel,
+            dim=n_rows,
+            inputs=[
+                self._segment_start,
+                self._segment_entries,
+                self._n_cols,
+                contacts.rigid_contact_shape0,
+                contacts.rigid_contact_shape1,
+                contacts.rigid_contact_point0,
+                contacts.rigid_contact_point1,
+                contacts.rigid_contact_offset0,
+                contacts.rigid_contact_offset1,
+                contacts.force,
+                contacts.rigid_contact_normal,
+                self._model.shape_body,
+                state.body_q if update_contact_positions else None,
+            ],
+            outputs=[
+                self.force_matrix,
+                self.total_force,
+                self.force_matrix_friction,
+                self.total_force_friction,
+                self.position_matrix,
+            ],
+            device=self.device,
+        )
@@ -10,6 +10,7 @@ import warp as wp
 from ..geometry import ShapeFlags
 from ..sim.model import Model
 from ..sim.state import State
+from ..utils.benchmark import profile_scope
 from ..utils.selection import match_labels
 
 
@@ -218,6 +219,7 @@ class SensorFrameTransform:
                 f"  Unique shapes to compute: {len(self._unique_shape_indices)} (optimized from {len(shapes) + len(reference_sites_matched)})"
             )
 
+    @profile_scope
     def update(self, state: State):
         """Update sensor measurements based on current state.
 
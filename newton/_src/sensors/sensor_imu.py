@@ -10,6 +10,7 @@ import warp as wp
 from ..geometry.flags import ShapeFlags
 from ..sim.model import Model
 from ..sim.state import State
+from ..utils.benchmark import profile_scope
 from ..utils.selection import match_labels
 
 
@@ -177,6 +178,7 @@ class SensorIMU:
             if not (shape_flags[site_idx] & ShapeFlags.SITE):
                 raise ValueError(f"sensor site index {site_idx} is not a site")
 
+    @profile_scope
     def update(self, state: State):
         """Update the IMU sensor.
 
@@ -0,0 +1,388 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import inspect
+from collections import Counter
+from typing import Any
+
+import numpy as np
+import warp as wp
+
+from ..sim import Contacts, Model, State
+from ..utils.benchmark import profile_scope
+from .sensor_contact import SensorContact
+from .sensor_frame_transform import (
+    SensorFrameTransform,
+    compute_relative_transforms_kernel,
+    compute_shape_transforms_kernel,
+)
+from .sensor_imu import SensorIMU, compute_sensor_imu_kernel
+
+
+@wp.kernel(enable_backward=False)
+def _evaluate_sensor_schedule_kernel(
+    step_count: wp.array[wp.int32],
+    periods: wp.array[wp.int32],
+    offsets: wp.array[wp.int32],
+    staggered: wp.array[wp.int32],
+    world_count: int,
+    # output
+    due: wp.array[wp.int32],
+    world_mask: wp.array2d[wp.bool],
+):
+    """Decide which schedule groups are due on the current step. Parallelizes over groups."""
+    group = wp.tid()
+    step = step_count[0] + offsets[group]
+    period = periods[group]
+    if staggered[group] == 0:
+        due[group] = wp.where(step % period == 0, 1, 0)
+        return
+
+    # spread the worlds evenly over the period so that each step renders a slice of them
+    any_due = wp.int32(0)
+    for world in range(world_count):
+        world_due = (step + (world * period) // world_count) % period == 0
+        world_mask[group, world] = world_due
+        if world_due:
+            any_due = 1
+    due[group] = any_due
+
+
+@wp.kernel(enable_backward=False)
+def _advance_sensor_schedule_kernel(step_count: wp.array[wp.int32]):
+    step_count[0] = step_count[0] + 1
+
+
+class _SensorIMUBatch:
+    """Updates several :class:`~newton.sensors.SensorIMU` instances with one kernel launch.
+
+    The sites of all sensors are concatenated, and each sensor's ``accelerometer`` and ``gyroscope`` are rebound to
+    views into the shared output buffers.
+    """
+
+    def __init__(self, model: Model, sensors: list[SensorIMU]):
+        self.model = model
+        sites = np.concatenate([sensor.sensor_sites_arr.numpy() for sensor in sensors])
+        with wp.ScopedDevice(model.device):
+            self.sensor_sites = wp.array(sites, dtype=int)
+            self.accelerometer = wp.empty(len(sites), dtype=wp.vec3)
+            self.gyroscope = wp.empty(len(sites), dtype=wp.vec3)
+
+        offset = 0
+        for sensor in sensors:
+            end = offset + sensor.n_sensors
+            # keep the current readings, then alias the sensor outputs to the shared buffers
+            wp.copy(self.accelerometer, sensor.accelerometer, dest_offset=offset)
+            wp.copy(self.gyroscope, sensor.gyroscope, dest_offset=offset)
+            sensor.accelerometer = self.accelerometer[offset:end]
+            sensor.gyroscope = self.gyroscope[offset:end]
+            offset = end
+
+    @profile_scope
+    def update(self, state: State):
+        if state.body_qdd is None:
+            raise ValueError("SensorIMU requires a State with body_qdd allocated. Create SensorIMU before State.")
+
+        wp.launch(
+            compute_sensor_imu_kernel,
+            dim=len(self.sensor_sites),
+            inputs=[
+                self.model.gravity,
+                self.model.body_world,
+                self.model.body_com,
+                self.model.shape_body,
+                self.model.shape_world,
+                self.model.shape_transform,
+                self.sensor_sites,
+                state.body_q,
+                state.body_qd,
+                state.body_qdd,
+            ],
+            outputs=[self.accelerometer, self.gyroscope],
+            device=self.model.device,
+        )
+
+
+class _SensorFrameTransformBatch:
+    """Updates several :class:`~newton.sensors.SensorFrameTransform` instances with two kernel launches.
+
+    The world transforms of the shapes referenced by any sensor are computed once, and the shape and reference site
+    indices of all sensors are concatenated. Each sensor's ``transforms`` is rebound to a view into the shared output
+    buffer.
+    """
+
+    def __init__(self, model: Model, sensors: list[SensorFrameTransform]):
+        self.model = model
+        unique_shape_indices = sorted(set().union(*(sensor._unique_shape_indices for sensor in sensors)))
+        shapes = np.concatenate([sensor._shape_indices_arr.numpy() for sensor in sensors])
+        reference_sites = np.concatenate([sensor._reference_indices_arr.numpy() for sensor in sensors])
+        with wp.ScopedDevice(model.device):
+            self.unique_indices = wp.array(unique_shape_indices, dtype=int)
+            self.shape_indices = wp.array(shapes, dtype=int)
+            self.reference_indices = wp.array(reference_sites, dtype=int)
+            self.all_shape_transforms = wp.zeros(model.shape_count, dtype=wp.transform)
+            self.transforms = wp.empty(len(shapes), dtype=wp.transform)
+
+        offset = 0
+        for sensor in sensors:
+            end = offset + len(sensor.transforms)
+            wp.copy(self.transforms, sensor.transforms, dest_offset=offset)
+            sensor.transforms = self.transforms[offset:end]
+            offset = end
+
+    @profile_scope
+    def update(self, state: State):
+        wp.launch(
+            compute_shape_transforms_kernel,
+            dim=len(self.unique_indices),
+            inputs=[self.unique_indices, self.model.shape_body, self.model.shape_transform, state.body_q],
+            outputs=[self.all_shape_transforms],
+            device=self.model.device,
+        )
+        wp.launch(
+            compute_relative_transforms_kernel,
+            dim=len(self.shape_indices),
+            inputs=[self.all_shape_transforms, self.shape_indices, self.reference_indices],
+            outputs=[self.transforms],
+            device=self.model.device,
+        )
+
+
+# sensor types whose instances in a schedule group are updated by a single fused launch
+_SENSOR_BATCH_TYPES = {
+    SensorIMU: _SensorIMUBatch,
+    SensorFrameTransform: _SensorFrameTransformBatch,
+}
+
+
+class SensorScheduler:
+    """Updates sensors at individual rates from a single per-step call.
+
+    Sensors are registered once with :meth:`add` together with their update period (or rate) and the extra
+    arguments their ``update()`` method needs. Each call to :meth:`update` advances the scheduler by one simulation
+    step and updates exactly those sensors that are due, so expensive sensors such as
+    :class:`~newton.sensors.SensorTiledCamera` can run at 10--30 Hz while the physics runs at several hundred Hz.
+
+    Sensors registered with the same period, offset, and staggering share a schedule group. All groups are evaluated
+    by one kernel launch per step, and every group is gated by a single :func:`warp.capture_if` branch in which its
+    sensors are updated. Within a group, :class:`~newton.sensors.SensorIMU` and
+    :class:`~newton.sensors.SensorFrameTransform` instances are batched per type: their site and shape indices are
+    concatenated so that all of them are updated by the same kernel launches, and their output arrays
+    (``accelerometer``, ``gyroscope``, ``transforms``) are rebound to views into a shared buffer on the first
+    :meth:`update`. Read these outputs through the sensor attributes rather than keeping references from before that
+    call. Other sensors are updated one by one in registration order. The step counter lives on the device, so the
+    whole :meth:`update` call can be captured into a CUDA graph together with the solver step and replayed without
+    host synchronization. Without graph capture, evaluating the branches reads one flag per group back to the host.
+
+    With ``stagger_worlds=True``, the worlds are spread evenly over the sensor period: on each due step only a
+    slice of the worlds is refreshed, which smooths the per-step cost of rendering many worlds. Staggering requires a
+    sensor whose ``update()`` accepts a ``world_mask`` argument, such as :class:`~newton.sensors.SensorTiledCamera`.
+
+    Example:
+
+    .. code-block:: python
+
+        scheduler = newton.sensors.SensorScheduler(model, dt=1.0 / 500.0)
+        scheduler.add(imu)  # every step
+        scheduler.add(contact_sensor, period=2)
+        scheduler.add(
+            camera,
+            rate=30.0,
+            stagger_worlds=True,
+            camera_transforms=camera_transforms,
+            camera_rays=camera_rays,
+            color_image=color_image,
+        )
+
+        for _ in range(num_steps):
+            solver.step(state_0, state_1, control, contacts, dt)
+            state_0, state_1 = state_1, state_0
+            scheduler.update(state_0, contacts)
+
+    Register all sensors and run :meth:`update` once before capturing it into a graph: the schedule tables and some
+    sensor scratch buffers are allocated on first use.
+
+    Args:
+        model: The model the sensors were created for.
+        dt: Simulation time step [s]. Required to register sensors by ``rate``.
+    """
+
+    def __init__(self, model: Model, *, dt: float | None = None):
+        self.model = model
+        self.device = model.device
+        self.dt = dt
+
+        self.step_count = wp.zeros(1, dtype=wp.int32, device=self.device)
+        """Number of :meth:`update` calls since construction or the last :meth:`reset`, shape ``(1,)``."""
+
+        self._groups: list[tuple[tuple[int, int, bool], list[tuple[Any, dict[str, Any]]]]] = []
+        self._group_plans: list[list[Any]] = []
+        self._group_ids: dict[tuple[int, int, bool], int] = {}
+        self._schedule_dirty = True
+        self._needs_contacts = False
+        self._periods = None
+        self._offsets = None
+        self._staggered = None
+        self._due = None
+        self._world_mask = None
+
+    @property
+    def sensors(self) -> list[Any]:
+        """Registered sensors, grouped by schedule and in registration order within a group."""
+        return [sensor for _, entries in self._groups for sensor, _ in entries]
+
+    def add(
+        self,
+        sensor: Any,
+        *,
+        period: int | None = None,
+        rate: float | None = None,
+        offset: int = 0,
+        stagger_worlds: bool = False,
+        **update_kwargs: Any,
+    ) -> None:
+        """Register a sensor.
+
+        The sensor is updated on steps ``k`` with ``(k + offset) % period == 0``. It is called as
+        ``sensor.update(state, **update_kwargs)``, or ``sensor.update(state, contacts, **update_kwargs)`` for
+        :class:`~newton.sensors.SensorContact`.
+
+        Args:
+            sensor: The sensor to update, e.g. :class:`~newton.sensors.SensorIMU` or
+                :class:`~newton.sensors.SensorTiledCamera`.
+            period: Update period [steps]. Mutually exclusive with ``rate``. Defaults to every step.
+            rate: Update rate [Hz], rounded to the nearest whole period of :attr:`dt`. Mutually exclusive with
+                ``period``.
+            offset: Phase offset [steps] used to spread sensors with the same period over different steps.
+            stagger_worlds: If True, refresh a different slice of the worlds on each due step (see class docs).
+            **update_kwargs: Additional keyword arguments forwarded to ``sensor.update()``, e.g. camera transforms,
+                rays, and output images.
+
+        Raises:
+            ValueError: If both ``period`` and ``rate`` are given, the resulting period or the offset is invalid, or
+                ``stagger_worlds`` is set for a sensor whose ``update()`` does not accept a ``world_mask``.
+            TypeError: If ``sensor`` has no ``update()`` method.
+        """
+        if period is not None and rate is not None:
+            raise ValueError("Specify at most one of `period` and `rate`")
+        if rate is not None:
+            if self.dt is None:
+                raise ValueError("SensorScheduler requires `dt` to register sensors by `rate`")
+            if rate <= 0.0:
+                raise ValueError(f"Sensor rate must be positive, got {rate}")
+            period = max(round(1.0 / (rate * self.dt)), 1)
+        elif period is None:
+            period = 1
+        if period < 1:
+            raise ValueError(f"Sensor period must be at least one step, got {period}")
+        if offset < 0:
+            raise ValueError(f"Sensor offset must be non-negative, got {offset}")
+        if not callable(getattr(sensor, "update", None)):
+            raise TypeError(f"{type(sensor).__name__} has no update() method")
+        if stagger_worlds and "world_mask" not in inspect.signature(sensor.update).parameters:
+            raise ValueError(f"{type(sensor).__name__}.update() does not accept a world_mask; cannot stagger worlds")
+
+        key = (period, offset % period, stagger_worlds)
+        group_id = self._group_ids.get(key)
+        if group_id is None:
+            group_id = len(self._groups)
+            self._group_ids[key] = group_id
+            self._groups.append((key, []))
+        entries = self._groups[group_id][1]
+        entries.append((sensor, update_kwargs))
+        self._schedule_dirty = True
+        self._needs_contacts |= isinstance(sensor, SensorContact)
+
+    def reset(self) -> None:
+        """Reset the step counter so that the next :meth:`update` is step zero."""
+        self.step_count.zero_()
+
+    def _build_schedule(self):
+        keys = [key for key, _ in self._groups]
+        group_count = max(len(keys), 1)
+        with wp.ScopedDevice(self.device):
+            self._periods = wp.array([key[0] for key in keys] or [1], dtype=wp.int32)
+            self._offsets = wp.array([key[1] for key in keys] or [0], dtype=wp.int32)
+            self._staggered = wp.array([int(key[2]) for key in keys] or [0], dtype=wp.int32)
+            self._due = wp.zeros(group_count, dtype=wp.int32)
+            self._world_mask = wp.ones((group_count, self.model.world_count), dtype=wp.bool)
+        # a sensor registered more than once keeps its own outputs so that no batch aliases them
+        registrations = Counter(id(sensor) for sensor in self.sensors)
+        self._group_plans = [self._plan_group(entries, registrations) for _, entries in self._groups]
+        self._schedule_dirty = False
+
+    def _plan_group(self, entries: list[tuple[Any, dict[str, Any]]], registrations: Counter) -> list[Any]:
+        """Return the update steps of a group: fused sensor batches and ``(sensor, update_kwargs)`` entries."""
+        batched: dict[type, list[Any]] = {}
+        for sensor, update_kwargs in entries:
+            if (
+                type(sensor) in _SENSOR_BATCH_TYPES
+                and not update_kwargs
+                and sensor.model is self.model
+                and registrations[id(sensor)] == 1
+            ):
+                batched.setdefault(type(sensor), []).append(sensor)
+        batched = {sensor_type: sensors for sensor_type, sensors in batched.items() if len(sensors) > 1}
+
+        plan = []
+        for sensor, update_kwargs in entries:
+            sensors = batched.get(type(sensor))
+            if sensors is None or sensor not in sensors:
+                plan.append((sensor, update_kwargs))
+            elif sensor is sensors[0]:
+                # the batch takes the place of its first sensor
+                plan.append(_SENSOR_BATCH_TYPES[type(sensor)](self.model, sensors))
+        return plan
+
+    def _update_group(self, group_id: int, state: State, contacts: Contacts | None):
+        staggered = self._groups[group_id][0][2]
+        world_mask = self._world_mask[group_id] if staggered else None
+        for step in self._group_plans[group_id]:
+            if not isinstance(step, tuple):
+                step.update(state)
+                continue
+            sensor, update_kwargs = step
+            kwargs = update_kwargs if world_mask is None else {**update_kwargs, "world_mask": world_mask}
+            if isinstance(sensor, SensorContact):
+                sensor.update(state, contacts, **kwargs)
+            else:
+                sensor.update(state, **kwargs)
+
+    def update(self, state: State, contacts: Contacts | None = None) -> None:
+        """Advance the schedule by one step and update the sensors that are due.
+
+        Args:
+            state: The simulation state passed to every sensor.
+            contacts: The contacts passed to :class:`~newton.sensors.SensorContact` instances.
+
+        Raises:
+            ValueError: If ``contacts`` is None while a :class:`~newton.sensors.SensorContact` is registered.
+        """
+        if contacts is None and self._needs_contacts:
+            raise ValueError("SensorScheduler.update() requires `contacts` to update a SensorContact")
+        if self._schedule_dirty:
+            self._build_schedule()
+
+        if self._groups:
+            wp.launch(
+                _evaluate_sensor_schedule_kernel,
+                dim=len(self._groups),
+                inputs=[self.step_count, self._periods, self._offsets, self._staggered, self.model.world_count],
+                outputs=[self._due, self._world_mask],
+                device=self.device,
+            )
+            for group_id, (key, _) in enumerate(self._groups):
+                if key[0] == 1 and not key[2]:
+                    # due on every step, no branch needed
+                    self._update_group(group_id, state, contacts)
+                else:
+                    wp.capture_if(
+                        self._due[group_id : group_id + 1],
+                        on_true=self._update_group,
+                        group_id=group_id,
+                        state=state,
+                        contacts=contacts,
+                    )
+        wp.launch(_advance_sensor_schedule_kernel, dim=1, inputs=[self.step_count], device=self.device)
@@ -10,6 +10,7 @@ from typing import Any
 import warp as wp
 
 from ..sim import Model, State
+from ..utils.benchmark import profile_scope
 from .warp_raytrace import (
     ClearData,
     GaussianRenderMode,
@@ -173,12 +174,14 @@ class SensorTiledCamera:
         """
         self.__render_context.update(self.model, state)
 
+    @profile_scope
     def update(
         self,
         state: State,
         camera_transforms: wp.array2d[wp.transformf] | None = None,
         camera_rays: wp.array4d[wp.vec3f] | None = None,
         *,
+        world_mask: wp.array[wp.bool] | None = None,
         color_image: wp.array4d[wp.uint32] | None = None,
         hdr_color_image: wp.array4d[wp.vec3f] | None = None,
         depth_image: wp.array4d[wp.float32] | None = None,
@@ -207,6 +210,8 @@ class SensorTiledCamera:
             camera_transforms: Camera-to-world transforms, shape ``(camera_count, world_count)``.
             camera_rays: Camera-space rays from ``SensorTiledCamera.utils`` ray helpers, shape
                 ``(camera_count, height, width, 2)``.
+            world_mask: Per-world Boolean mask, shape ``(world_count,)``. Worlds with a ``False`` entry are not
+                rendered and keep their previous images. None renders all worlds.
             color_image: Output for packed RGBA color. The bytes are
                 display/sRGB by default, or linear when
                 ``self.default_render_config.output_color_space`` is
@@ -239,6 +244,7 @@ class SensorTiledCamera:
                 state,
                 camera_transforms=camera_transforms,
                 camera_rays=camera_rays,
+                world_mask=world_mask,
                 color_image=color_image,
                 hdr_color_image=hdr_color_image,
                 depth_image=depth_image,
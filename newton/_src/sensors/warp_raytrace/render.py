@@ -94,6 +94,7 @@ def create_kernel(
         # Camera
         camera_rays: wp.array4d[wp.vec3f],
         camera_transforms: wp.array2d[wp.transformf],
+        world_mask: wp.array[wp.bool],
         # Shapes BVH
         bvh_shapes_size: wp.int32,
         bvh_shapes_id: wp.uint64,
@@ -159,6 +160,11 @@ def create_kernel(
         if px >= img_width or py >= img_height:
             return
 
+        # masked-out worlds keep their previous images
+        if world_mask:
+            if not world_mask[world_index]:
+                return
+
         pixels_per_camera = img_width * img_height
         pixels_per_world = camera_count * pixels_per_camera
         out_index = world_index * pixels_per_world + camera_index * pixels_per_camera + py * img_width + px
@@ -179,6 +179,7 @@ class RenderContext:
         *,
         camera_transforms: wp.array2d[wp.transformf],
         camera_rays: wp.array4d[wp.vec3f],
+        world_mask: wp.array[wp.bool] | None = None,
         color_image: wp.array4d[wp.uint32] | None = None,
         hdr_color_image: wp.array4d[wp.vec3f] | None = None,
         depth_image: wp.array4d[wp.float32] | None = None,
@@ -210,6 +211,9 @@ class RenderContext:
                 ``(camera_count, world_count)``.
             camera_rays: Ray origins and directions, shape
                 ``(camera_count, height, width, 2)``.
+            world_mask: Optional per-world Boolean mask, shape
+                ``(world_count,)``. Worlds with a ``False`` entry are skipped
+                and keep their previous output images.
             color_image: Output RGBA color buffer (packed ``uint32``).
             depth_image: Output depth buffer [m].
             forward_depth_image: Output forward-depth buffer [m].
@@ -274,6 +278,9 @@ class RenderContext:
                 f"camera_rays size must match {camera_count} x {height} x {width} x 2"
             )
 
+            if world_mask is not None:
+                assert world_mask.shape == (self.world_count,), f"world_mask size must match {self.world_count}"
+
             if color_image is not None:
                 assert color_image.shape == (self.world_count, camera_count, height, width), (
                     f"color_image size must match {self.world_count} x {camera_count} x {height} x {width}"
@@ -351,6 +358,7 @@ class RenderContext:
                     # Camera
                     camera_rays,
                     camera_transforms,
+                    world_mask,
                     # Shape BVH
                     model.bvh_shape_count_enabled,
                     model.bvh_shapes.id if model.bvh_shapes is not None else 0,
@@ -5,6 +5,7 @@ from .articulation import eval_fk, eval_ik, eval_inverse_dynamics_force, eval_ja
 from .builder import ModelBuilder
 from .collide import CollisionPipeline
 from .contact_kinematics import eval_rigid_contact_kinematics
+from .contact_stream import ContactStream
 from .contacts import Contacts
 from .control import Control
 from .enums import (
@@ -17,11 +18,13 @@ from .enums import (
 )
 from .inverse_dynamics import eval_inverse_dynamics_passive
 from .model import Model
+from .sleep import SleepManager
 from .state import State
 
 __all__ = [
     "BodyFlags",
     "CollisionPipeline",
+    "ContactStream",
     "Contacts",
     "Control",
     "EqType",
@@ -30,6 +33,7 @@ __all__ = [
     "Model",
     "ModelBuilder",
     "ModelFlags",
+    "SleepManager",
     "State",
     "StateFlags",
     "eval_fk",
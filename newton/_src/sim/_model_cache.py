@@ -0,0 +1,758 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""On-disk cache for finalized models.
+
+Parsing an asset and running :meth:`ModelBuilder.finalize` is repeated
+verbatim by every process of a distributed job.  This cache snapshots a
+finalized :class:`~newton.Model` into a single ``.npz`` file so later runs
+and sibling workers can load it directly.  It follows the layout and
+failure policy of :mod:`newton._src.geometry._sdf_cache`.
+
+Cache layout
+------------
+
+For each cached model, a single ``{hash}.model.npz`` file is written under
+the user-supplied ``cache_dir``.  The basename is a content hash of the
+caller-supplied key (see :func:`hash_inputs`).  The file is published via
+``os.replace`` from a per-writer ``{hash}.model.npz.{pid}.{token}.tmp.npz``
+companion, so concurrent workers building the same key never observe a
+partial file.
+
+Array layout (``.npz`` contents)
+--------------------------------
+
+* ``a{n}`` — one member per :class:`warp.array` or ``numpy.ndarray`` held by
+  the model, stored with its natural numpy dtype.  Warp struct arrays are
+  stored as structured numpy arrays.
+* ``mesh_points_{n}`` / ``mesh_indices_{n}`` — vertices and flat triangle
+  indices of each finalized collision mesh referenced by
+  :attr:`Model.shape_source_ptr`.
+* ``__model__`` — 0-d ``str`` holding a JSON document that describes every
+  other model attribute (scalars, labels, enums, dictionaries, attribute
+  specs, custom attribute namespaces, and the ``shape_source`` meshes) and
+  references the array members above by name.
+* ``__shape_collision_filter__`` — ``int64 (pair_count,)``: sorted packed
+  shape filter pair codes.
+* ``__cache_format_version__``, ``__kind__`` (``"newton.model"``),
+  ``__newton_version__``, and ``__created_utc__`` — same meaning as in the
+  SDF cache.
+
+Runtime objects (Warp meshes, BVHs, the particle hash grid, and the soft
+mesh adjacency) are not stored; they are rebuilt from the cached arrays on
+load.  Models holding content that cannot be rebuilt this way — texture
+SDFs, heightfields, Gaussians, actuators, or custom attribute values of
+unsupported types — are rejected by :func:`save_model` with a
+:class:`ValueError`, and :func:`write` leaves them uncached.
+
+Cache key
+---------
+
+The key is supplied by the caller because only the caller knows which
+inputs produced the builder (asset files, import options, world count).
+:func:`hash_inputs` hashes it together with the Newton version, so
+upgrading Newton never loads a model finalized by an older release.
+
+Schema versioning
+-----------------
+
+Bump :data:`CACHE_FORMAT_VERSION` whenever the encoding below changes.
+Existing on-disk caches are then transparently invalidated and rebuilt.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import enum
+import hashlib
+import importlib
+import json
+import logging
+import os
+import secrets
+import zipfile
+from collections.abc import Callable, Mapping
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import warp as wp
+
+from ..core.types import Devicelike
+from ..geometry.flags import ShapeFlags
+from ..geometry.types import Mesh
+from ..utils.mesh import MeshAdjacency
+from .model import Model, _pack_shape_pair_codes
+
+if TYPE_CHECKING:
+    from .builder import ModelBuilder
+
+logger = logging.getLogger(__name__)
+
+
+CACHE_FORMAT_VERSION: int = 1
+"""Version of the on-disk model cache format.
+
+Bump when the encoding of model attributes changes.  Existing cache files
+become invalid and are transparently rebuilt.
+"""
+
+
+_VERSION_KEY = "__cache_format_version__"
+_KIND_KEY = "__kind__"
+_NEWTON_VERSION_KEY = "__newton_version__"
+_CREATED_UTC_KEY = "__created_utc__"
+_MODEL_KEY = "__model__"
+_FILTER_KEY = "__shape_collision_filter__"
+_NPZ_SUFFIX = ".model.npz"
+_KIND = "newton.model"
+
+# Model attributes that hold runtime objects rebuilt by :func:`_rebuild_runtime`
+# (or by :class:`Model` itself) instead of being serialized.
+_RUNTIME_ATTRIBUTES = frozenset(
+    {
+        "device",
+        "particle_grid",
+        "shape_source_ptr",
+        "shape_collision_filter_pairs",
+        "soft_mesh_adjacency",
+        "soft_mesh_adjacency_device",
+        "heightfield_meshes",
+        "_mesh_keep_alive",
+        "_generated_sdf_edge_meshes",
+        "_collision_pipeline",
+    }
+)
+_RUNTIME_PREFIXES = ("bvh_",)
+
+# Model attributes that must be empty for a model to be cacheable.
+_EMPTY_ATTRIBUTES = (
+    "actuators",
+    "heightfield_meshes",
+    "_generated_sdf_edge_meshes",
+    "_texture_sdf_coarse_textures",
+    "_texture_sdf_subgrid_textures",
+    "gaussians_data",
+    "_texture_sdf_data",
+)
+
+
+def _resolve_newton_version() -> str:
+    # See ``_sdf_cache._resolve_newton_version`` for why ``newton._version``
+    # is imported directly.
+    try:
+        from newton._version import __version__  # noqa: PLC0415
+
+        return str(__version__)
+    except ImportError:
+        return "unknown"
+
+
+def _key_default(value: Any) -> Any:
+    """Canonical JSON encoding for non-JSON cache key values."""
+
+    if isinstance(value, os.PathLike):
+        path = Path(value)
+        return {"path": str(path), "sha256": hashlib.sha256(path.read_bytes()).hexdigest()}
+    if isinstance(value, bytes | bytearray | memoryview):
+        return {"bytes_sha256": hashlib.sha256(bytes(value)).hexdigest()}
+    if isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value)
+        return {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "sha256": hashlib.sha256(array.tobytes()).hexdigest(),
+        }
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, set | frozenset):
+        return sorted(value, key=repr)
+    raise TypeError(f"Model cache key values must be JSON-serializable, got {type(value).__name__}")
+
+
+def hash_inputs(key: Mapping[str, Any], *, requires_grad: bool = False) -> str:
+    """Compute the cache key for a finalized model.
+
+    Args:
+        key: Caller-supplied description of everything that determines the
+            builder contents, e.g. asset paths and import options.  Values
+            must be JSON-serializable, or :class:`os.PathLike` (hashed by
+            file contents), ``bytes``, or ``numpy.ndarray`` (hashed by
+            contents).
+        requires_grad: Whether the model is finalized with gradients.
+
+    Returns:
+        A 32-character BLAKE2b digest used as the cache filename basename.
+
+    Raises:
+        TypeError: If ``key`` contains a value that cannot be encoded.
+        OSError: If a path in ``key`` cannot be read.
+    """
+
+    payload = {
+        "kind": _KIND,
+        "cache_format_version": CACHE_FORMAT_VERSION,
+        "newton_version": _resolve_newton_version(),
+        "requires_grad": bool(requires_grad),
+        "key": dict(key),
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=_key_default).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def cache_path(cache_dir: str | os.PathLike[str], hash_hex: str) -> Path:
+    """Return the ``.npz`` path for a given cache key."""
+
+    return Path(cache_dir) / f"{hash_hex}{_NPZ_SUFFIX}"
+
+
+def _qualified_name(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _resolve_qualified_name(name: str) -> Any:
+    """Resolve ``module:qualname``; only Newton classes may be referenced."""
+
+    module_name, _, qualname = name.partition(":")
+    if module_name != "newton" and not module_name.startswith("newton."):
+        raise ValueError(f"invalid class reference {name!r}: only Newton classes can be cached")
+    obj: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _is_struct_dtype(dtype: Any) -> bool:
+    return type(dtype).__name__ == "Struct"
+
+
+def _encode_dtype(dtype: Any) -> Any:
+    if _is_struct_dtype(dtype):
+        return "struct:" + _qualified_name(dtype.cls)
+    name = dtype.__name__
+    if getattr(wp, name, None) is dtype:
+        return name
+    if name in ("vec_t", "mat_t"):
+        # Custom-length vectors and matrices created via ``wp.types.vector`` / ``wp.types.matrix``
+        scalar = dtype._wp_scalar_type_
+        if getattr(wp, scalar.__name__, None) is scalar:
+            return {"scalar": scalar.__name__, "shape": list(dtype._shape_)}
+    raise ValueError(f"unsupported array dtype {dtype!r}")
+
+
+def _decode_dtype(node: Any) -> Any:
+    if isinstance(node, dict):
+        scalar = _decode_dtype(node["scalar"])
+        shape = tuple(int(n) for n in node["shape"])
+        if len(shape) == 1:
+            return wp.types.vector(shape[0], scalar)
+        if len(shape) == 2:
+            return wp.types.matrix(shape, scalar)
+        raise ValueError(f"invalid array dtype shape {shape}")
+    if node.startswith("struct:"):
+        struct = _resolve_qualified_name(node[len("struct:") :])
+        if not _is_struct_dtype(struct):
+            raise ValueError(f"invalid struct dtype {node!r}")
+        return struct
+    dtype = getattr(wp, node, None)
+    if not isinstance(dtype, type):
+        raise ValueError(f"invalid array dtype {node!r}")
+    return dtype
+
+
+class _Encoder:
+    """Encode model attribute values into JSON nodes plus ``.npz`` arrays."""
+
+    def __init__(self):
+        self.arrays: dict[str, np.ndarray] = {}
+        self.meshes: list[dict[str, Any]] = []
+        self._array_ids: dict[int, str] = {}
+        self._mesh_ids: dict[int, int] = {}
+
+    def _add_array(self, array: np.ndarray) -> str:
+        key = f"a{len(self.arrays)}"
+        self.arrays[key] = array
+        return key
+
+    def encode(self, value: Any, path: str) -> Any:
+        if value is None or isinstance(value, bool | str):
+            return value
+        if isinstance(value, enum.Enum):
+            return {"enum": _qualified_name(type(value)), "value": value.value}
+        if isinstance(value, int | float):
+            return value
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, wp.array):
+            key = self._array_ids.get(id(value))
+            if key is None:
+                if _is_struct_dtype(value.dtype) and value.shape[0] > 0:
+                    for field_name, field_var in value.dtype.vars.items():
+                        if isinstance(field_var.type, wp.array):
+                            raise ValueError(f"{path}: struct field {field_name!r} holds a Warp array")
+                key = self._add_array(value.numpy())
+                self._array_ids[id(value)] = key
+            return {
+                "array": key,
+                "dtype": _encode_dtype(value.dtype),
+                "requires_grad": bool(value.requires_grad),
+            }
+        if isinstance(value, np.ndarray):
+            if value.dtype.hasobject:
+                raise ValueError(f"{path}: object arrays are not supported")
+            return {"ndarray": self._add_array(value)}
+        if isinstance(value, Mesh):
+            return {"mesh": self._encode_mesh(value, path)}
+        if isinstance(value, Model.AttributeNamespace):
+            if value._deprecated_aliases:
+                raise ValueError(f"{path}: namespaces with deprecated aliases are not supported")
+            attributes = {
+                name: self.encode(attr, f"{path}.{name}") for name, attr in vars(value).items() if name[0] != "_"
+            }
+            return {"namespace": value._name, "class": _qualified_name(type(value)), "attributes": attributes}
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            fields = {
+                field.name: self.encode(getattr(value, field.name), f"{path}.{field.name}")
+                for field in dataclasses.fields(value)
+            }
+            return {"dataclass": _qualified_name(type(value)), "fields": fields}
+        if isinstance(value, list):
+            return {"list": [self.encode(item, f"{path}[{i}]") for i, item in enumerate(value)]}
+        if isinstance(value, tuple):
+            return {"tuple": [self.encode(item, f"{path}[{i}]") for i, item in enumerate(value)]}
+        if isinstance(value, set | frozenset):
+            return {"set": [self.encode(item, f"{path}[]") for item in value]}
+        if isinstance(value, dict):
+            return {
+                "dict": [[self.encode(k, f"{path}{{}}"), self.encode(v, f"{path}[{k!r}]")] for k, v in value.items()]
+            }
+        raise ValueError(f"{path}: unsupported value of type {type(value).__name__}")
+
+    def _encode_mesh(self, mesh: Any, path: str) -> int:
+        index = self._mesh_ids.get(id(mesh))
+        if index is not None:
+            return index
+        if mesh.sdf is not None:
+            raise ValueError(f"{path}: meshes with an SDF are not supported")
+        texture = mesh.texture
+        self.meshes.append(
+            {
+                "vertices": self._add_array(mesh.vertices),
+                "indices": self._add_array(mesh.indices),
+                "normals": None if mesh.normals is None else self._add_array(mesh.normals),
+                "uvs": None if mesh.uvs is None else self._add_array(mesh.uvs),
+                "is_solid": bool(mesh.is_solid),
+                "maxhullvert": int(mesh.maxhullvert),
+                "color": None if mesh.color is None else [float(c) for c in mesh.color],
+                "roughness": mesh.roughness,
+                "metallic": mesh.metallic,
+                "texture": self.encode(texture, f"{path}.texture"),
+                "has_inertia": bool(mesh.has_inertia),
+                "mass": float(mesh.mass),
+                "com": [float(c) for c in mesh.com],
+                "inertia": self._add_array(np.array(mesh.inertia, dtype=np.float32).reshape(3, 3)),
+            }
+        )
+        index = len(self.meshes) - 1
+        self._mesh_ids[id(mesh)] = index
+        return index
+
+
+class _Decoder:
+    """Inverse of :class:`_Encoder`."""
+
+    def __init__(self, npz: Any, meshes: list[dict[str, Any]]):
+        self._npz = npz
+        self._mesh_nodes = meshes
+        self._arrays: dict[str, wp.array] = {}
+        self._meshes: dict[int, Any] = {}
+
+    def decode(self, node: Any) -> Any:
+        if not isinstance(node, dict):
+            if isinstance(node, list):
+                raise ValueError("invalid model cache node: bare list")
+            return node
+        if "enum" in node:
+            return _resolve_qualified_name(node["enum"])(node["value"])
+        if "array" in node:
+            key = node["array"]
+            array = self._arrays.get(key)
+            if array is None:
+                array = wp.array(
+                    np.asarray(self._npz[key]),
+                    dtype=_decode_dtype(node["dtype"]),
+                    requires_grad=bool(node["requires_grad"]),
+                )
+                self._arrays[key] = array
+            return array
+        if "ndarray" in node:
+            return np.asarray(self._npz[node["ndarray"]])
+        if "mesh" in node:
+            return self._decode_mesh(int(node["mesh"]))
+        if "namespace" in node:
+            cls = _resolve_qualified_name(node["class"])
+            if not (isinstance(cls, type) and issubclass(cls, Model.AttributeNamespace)):
+                raise ValueError(f"invalid namespace class {node['class']!r}")
+            namespace = cls(node["namespace"])
+            for name, attr in node["attributes"].items():
+                setattr(namespace, name, self.decode(attr))
+            return namespace
+        if "dataclass" in node:
+            cls = _resolve_qualified_name(node["dataclass"])
+            if not dataclasses.is_dataclass(cls):
+                raise ValueError(f"invalid dataclass reference {node['dataclass']!r}")
+            return cls(**{name: self.decode(value) for name, value in node["fields"].items()})
+        if "list" in node:
+            return [self.decode(item) for item in node["list"]]
+        if "tuple" in node:
+            return tuple(self.decode(item) for item in node["tuple"])
+        if "set" in node:
+            return {self.decode(item) for item in node["set"]}
+        if "dict" in node:
+            return {self.decode(k): self.decode(v) for k, v in node["dict"]}
+        raise ValueError(f"invalid model cache node with keys {sorted(node)}")
+
+    def _decode_mesh(self, index: int) -> Any:
+
+        mesh = self._meshes.get(index)
+        if mesh is not None:
+            return mesh
+        node = self._mesh_nodes[index]
+
+        def optional(key: str) -> np.ndarray | None:
+            return None if node[key] is None else np.asarray(self._npz[node[key]])
+
+        mesh = Mesh(
+            np.asarray(self._npz[node["vertices"]]),
+            np.asarray(self._npz[node["indices"]]),
+            normals=optional("normals"),
+            uvs=optional("uvs"),
+            compute_inertia=False,
+            is_solid=node["is_solid"],
+            maxhullvert=node["maxhullvert"],
+            color=node["color"],
+            roughness=node["roughness"],
+            metallic=node["metallic"],
+            texture=self.decode(node["texture"]),
+        )
+        mesh.has_inertia = node["has_inertia"]
+        mesh.mass = node["mass"]
+        mesh.com = wp.vec3(*node["com"])
+        mesh.inertia = wp.mat33(np.asarray(self._npz[node["inertia"]]))
+        self._meshes[index] = mesh
+        return mesh
+
+
+def _check_cacheable(model: Model) -> None:
+    for name in _EMPTY_ATTRIBUTES:
+        value = getattr(model, name, None)
+        if value is not None and len(value) > 0:
+            raise ValueError(f"models with non-empty {name!r} cannot be cached")
+
+
+def _collision_filter_codes(model: Model) -> np.ndarray:
+
+    store = model._shape_collision_filter_store()
+    if store is None:
+        return np.empty(0, dtype=np.int64)
+    packed = store.packed_pairs()
+    if packed is not None:
+        return np.asarray(packed, dtype=np.int64)
+    pairs = store.pairs_array()
+    return np.unique(_pack_shape_pair_codes(pairs[:, 0], pairs[:, 1]))
+
+
+def _finalized_meshes(model: Model, arrays: dict[str, np.ndarray]) -> list[int]:
+    """Record the finalized collision meshes; returns the per-shape mesh slot."""
+
+    keep_alive = {mesh.id: mesh for mesh in getattr(model, "_mesh_keep_alive", [])}
+    source_ptr = model.shape_source_ptr.numpy() if model.shape_source_ptr is not None else np.empty(0, np.uint64)
+    slots: dict[int, int] = {}
+    shape_slots = []
+    for shape, ptr in enumerate(source_ptr.tolist()):
+        if ptr == 0:
+            shape_slots.append(-1)
+            continue
+        slot = slots.get(ptr)
+        if slot is None:
+            mesh = keep_alive.get(ptr)
+            if mesh is None:
+                raise ValueError(f"shape {shape} references non-mesh geometry, which cannot be cached")
+            slot = len(slots)
+            slots[ptr] = slot
+            arrays[f"mesh_points_{slot}"] = mesh.points.numpy()
+            arrays[f"mesh_indices_{slot}"] = mesh.indices.numpy()
+        shape_slots.append(slot)
+    return shape_slots
+
+
+def save_model(
+    cache_dir: str | os.PathLike[str],
+    hash_hex: str,
+    model: Model,
+    *,
+    newton_version: str | None = None,
+) -> Path:
+    """Persist a finalized model to the cache.
+
+    Args:
+        cache_dir: Destination directory.  Created if missing.
+        hash_hex: Cache key from :func:`hash_inputs`.
+        model: Model returned by :meth:`ModelBuilder.finalize`.
+        newton_version: Newton package version string for provenance.
+            Resolved from ``newton.__version__`` when ``None``.
+
+    Returns:
+        Path to the ``.npz`` file written.
+
+    Raises:
+        ValueError: If the model holds content that cannot be cached.
+        OSError: On filesystem errors.  Callers should treat any failure
+            as non-fatal and keep using the live model.
+    """
+
+    _check_cacheable(model)
+    encoder = _Encoder()
+    attributes = {}
+    for name, value in vars(model).items():
+        if name in _RUNTIME_ATTRIBUTES or name.startswith(_RUNTIME_PREFIXES):
+            continue
+        attributes[name] = encoder.encode(value, name)
+    shape_mesh_slots = _finalized_meshes(model, encoder.arrays)
+    document = {
+        "attributes": attributes,
+        "meshes": encoder.meshes,
+        "shape_mesh_slots": shape_mesh_slots,
+        "mesh_requires_grad": bool(model.requires_grad),
+    }
+
+    cache_dir_path = Path(cache_dir)
+    cache_dir_path.mkdir(parents=True, exist_ok=True)
+    npz_path = cache_path(cache_dir_path, hash_hex)
+
+    arrays = encoder.arrays
+    arrays[_VERSION_KEY] = np.asarray(CACHE_FORMAT_VERSION, dtype=np.int32)
+    arrays[_MODEL_KEY] = np.asarray(json.dumps(document, separators=(",", ":")), dtype=np.str_)
+    arrays[_FILTER_KEY] = _collision_filter_codes(model)
+    arrays[_KIND_KEY] = np.asarray(_KIND, dtype=np.str_)
+    arrays[_NEWTON_VERSION_KEY] = np.asarray(
+        newton_version if newton_version is not None else _resolve_newton_version(),
+        dtype=np.str_,
+    )
+    arrays[_CREATED_UTC_KEY] = np.asarray(datetime.now(timezone.utc).isoformat(), dtype=np.str_)
+
+    # Same atomic publish protocol as the SDF cache: a per-writer tmp file
+    # followed by ``os.replace``; losing a replace race to a peer that
+    # published the same content hash is benign.
+    tmp_npz = npz_path.parent / f"{npz_path.name}.{os.getpid()}.{secrets.token_hex(8)}.tmp.npz"
+    try:
+        np.savez(tmp_npz, **arrays)
+        try:
+            os.replace(tmp_npz, npz_path)
+        except OSError as exc:
+            if npz_path.exists():
+                logger.debug(
+                    "Model cache: concurrent publish of %s won by peer (%s); discarding tmp file",
+                    npz_path.name,
+                    exc,
+                )
+                with contextlib.suppress(OSError):
+                    tmp_npz.unlink()
+            else:
+                raise
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp_npz.unlink()
+        raise
+    return npz_path
+
+
+def _rebuild_runtime(model: Model, npz: Any, document: Mapping[str, Any], filter_codes: np.ndarray) -> None:
+    """Recreate the runtime objects that :func:`save_model` does not store."""
+
+    model._set_shape_collision_filter_packed(filter_codes)
+
+    requires_grad = bool(document["mesh_requires_grad"])
+    shape_mesh_slots = document["shape_mesh_slots"]
+    mesh_ids: dict[int, int] = {}
+    keep_alive = []
+    for slot in sorted({s for s in shape_mesh_slots if s >= 0}):
+        points = wp.array(np.asarray(npz[f"mesh_points_{slot}"]), dtype=wp.vec3, requires_grad=requires_grad)
+        mesh = wp.Mesh(
+            points=points,
+            velocities=wp.zeros_like(points),
+            indices=wp.array(np.asarray(npz[f"mesh_indices_{slot}"]), dtype=wp.int32),
+        )
+        keep_alive.append(mesh)
+        mesh_ids[slot] = mesh.id
+    model.shape_source_ptr = wp.array([mesh_ids.get(slot, 0) for slot in shape_mesh_slots], dtype=wp.uint64)
+    model._mesh_keep_alive = keep_alive
+    model.heightfield_meshes = []
+    model._generated_sdf_edge_meshes = []
+
+    if model.particle_count > 1 and model.particle_max_radius > 0.0:
+        model.particle_grid = wp.HashGrid(128, 128, 128)
+    else:
+        model.particle_grid = None
+
+    def topology(array: wp.array | None, width: int) -> np.ndarray:
+        if array is None:
+            return np.empty((0, width), dtype=np.int32)
+        return array.numpy().reshape(-1, width)
+
+    model.soft_mesh_adjacency = MeshAdjacency(
+        tri_indices=topology(model.tri_indices, 3),
+        edge_indices=topology(model.edge_indices, 4),
+        spring_indices=topology(model.spring_indices, 1).reshape(-1),
+        tet_indices=topology(model.tet_indices, 4),
+    )
+    model.soft_mesh_adjacency.init_vertex_adjacency(model.particle_count)
+    model.soft_mesh_adjacency_device = model.soft_mesh_adjacency.to(model.device)
+
+    model.bvh_build_shapes(model, shape_flags=ShapeFlags.VISIBLE)
+    model.bvh_build_particles(model)
+
+
+def try_load_model(
+    cache_dir: str | os.PathLike[str],
+    hash_hex: str,
+    device: Devicelike = None,
+) -> Model | None:
+    """Load a finalized model from the cache, or ``None`` on miss.
+
+    Verifies the embedded ``__cache_format_version__`` and ``__kind__``; a
+    mismatch, missing file, or any IO/parse error is logged and treated as
+    a miss.
+
+    Args:
+        cache_dir: Directory holding the cache files.
+        hash_hex: Cache key from :func:`hash_inputs`.
+        device: Device on which to allocate the model arrays.
+
+    Returns:
+        The reconstructed :class:`~newton.Model`, or ``None`` if the entry
+        is missing or invalid.
+    """
+
+    npz_path = cache_path(cache_dir, hash_hex)
+
+    if not npz_path.exists():
+        return None
+
+    try:
+        with npz_path.open("rb") as cache_file, np.load(cache_file, allow_pickle=False) as npz:
+            embedded = np.asarray(npz[_VERSION_KEY])
+            if embedded.shape != () or int(embedded.item()) != CACHE_FORMAT_VERSION:
+                logger.info(
+                    "Model cache: embedded version %s != %d, treating as miss (%s)",
+                    embedded,
+                    CACHE_FORMAT_VERSION,
+                    npz_path,
+                )
+                return None
+
+            kind = np.asarray(npz[_KIND_KEY])
+            if kind.shape != () or kind.dtype.kind != "U" or str(kind.item()) != _KIND:
+                raise ValueError(f"invalid {_KIND_KEY}: expected {_KIND!r}")
+
+            document = json.loads(str(np.asarray(npz[_MODEL_KEY]).item()))
+            filter_codes = np.asarray(npz[_FILTER_KEY])
+            if filter_codes.dtype != np.int64 or filter_codes.ndim != 1:
+                raise ValueError(f"invalid {_FILTER_KEY}: expected a 1-D int64 array")
+
+            device = wp.get_device(device)
+            with wp.ScopedDevice(device):
+                model = Model(device)
+                decoder = _Decoder(npz, document["meshes"])
+                for name, node in document["attributes"].items():
+                    setattr(model, name, decoder.decode(node))
+                _rebuild_runtime(model, npz, document, filter_codes)
+            return model
+    except (OSError, ValueError, KeyError, TypeError, AttributeError, zipfile.BadZipFile) as exc:
+        logger.warning("Model cache: failed to load %s: %s", npz_path, exc)
+        return None
+
+
+def write(
+    cache_dir: str | os.PathLike[str],
+    hash_hex: str,
+    model: Model,
+) -> None:
+    """Best-effort persist; logs and swallows ``OSError`` and ``ValueError``.
+
+    Models that cannot be cached are skipped so callers always keep the
+    live model.
+    """
+
+    try:
+        save_model(cache_dir, hash_hex, model)
+    except ValueError as exc:
+        logger.info("Model cache: not caching model: %s", exc)
+    except OSError as exc:
+        logger.warning("Model cache: failed to write %s: %s", cache_dir, exc)
+
+
+def load_or_build_model(
+    build: Callable[[], ModelBuilder],
+    *,
+    cache_dir: str | os.PathLike[str],
+    key: Mapping[str, Any],
+    device: Devicelike = None,
+    requires_grad: bool = False,
+) -> Model:
+    """Load a finalized model from an on-disk cache, building it on a miss.
+
+    On a cache hit, ``build`` is not called: asset parsing and
+    :meth:`~newton.ModelBuilder.finalize` are skipped entirely.  On a miss,
+    the builder returned by ``build`` is finalized and the resulting model
+    is written to ``cache_dir`` for later runs and sibling processes.
+
+    The cache is keyed on ``key`` and the Newton version only, so ``key``
+    must capture every input that affects the builder.  Path values are
+    hashed by file contents, so editing an asset invalidates its entries.
+    Warp meshes, BVHs, and the particle hash grid are rebuilt on load with
+    default construction settings.  Models with texture SDFs, heightfields,
+    Gaussians, or actuators are always rebuilt and never cached.
+
+    Example:
+
+    .. code-block:: python
+
+        model = newton.utils.load_or_build_model(
+            build_robot_scene,
+            cache_dir="./model_cache",
+            key={"asset": pathlib.Path("robot.xml"), "world_count": 4096},
+        )
+
+    Args:
+        build: Callable returning the populated :class:`~newton.ModelBuilder`.
+        cache_dir: Directory holding cached models.  Created if missing.
+        key: Description of the builder inputs, see :func:`hash_inputs`.
+            :class:`os.PathLike` values are hashed by file contents.
+        device: Device on which to allocate the model.
+        requires_grad: Whether to finalize the model with gradients.
+
+    Returns:
+        The finalized model.
+    """
+
+    hash_hex = hash_inputs(key, requires_grad=requires_grad)
+    model = try_load_model(cache_dir, hash_hex, device=device)
+    if model is not None and model.requires_grad == requires_grad:
+        return model
+    model = build().finalize(device=device, requires_grad=requires_grad)
+    write(cache_dir, hash_hex, model)
+    return model
+
+
+__all__ = [
+    "CACHE_FORMAT_VERSION",
+    "cache_path",
+    "hash_inputs",
+    "load_or_build_model",
+    "save_model",
+    "try_load_model",
+    "write",
+]
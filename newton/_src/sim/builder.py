@@ -10,6 +10,7 @@ import ctypes
 import functools
 import inspect
 import math
+import operator
 import os
 import warnings
 import weakref
@@ -48,7 +49,7 @@ from ..geometry import (
 )
 from ..geometry.flags import MeshProperties
 from ..geometry.inertia import validate_and_correct_inertia_kernel, verify_and_correct_inertia
-from ..geometry.types import Heightfield
+from ..geometry.types import Heightfield, _build_mesh_sdfs
 from ..geometry.utils import RemeshingMethod, compute_inertia_obb, remesh_mesh
 from ..math import quat_between_vectors_robust
 from ..usd.schema_resolver import SchemaResolver
@@ -218,6 +219,121 @@ class _BuilderShapeCollisionFilterPairs:
         self._template_cache = None
 
 
+class _BuilderColumn:
+    """Private growable NumPy storage for a per-entity builder attribute.
+
+    Behaves like the ``list`` it replaces for the operations the builder performs
+    (``append``, ``extend``, indexing, slicing, iteration), while keeping the
+    values in one contiguous array that :meth:`ModelBuilder.finalize` can upload
+    without a per-element conversion. Elements are returned as Python scalars or
+    Warp vector/transform values.
+    """
+
+    __slots__ = ("_data", "_dtype", "_size")
+
+    _MIN_CAPACITY = 16
+
+    def __init__(self, dtype: type, values: Iterable[Any] | np.ndarray | None = None):
+        self._dtype = dtype
+        if dtype in (float, wp.float32):
+            np_dtype, shape = np.float32, ()
+        elif dtype in (int, wp.int32):
+            np_dtype, shape = np.int32, ()
+        else:
+            np_dtype, shape = np.float32, (dtype._length_,)
+        self._data = np.empty((0, *shape), dtype=np_dtype)
+        self._size = 0
+        if values is not None:
+            self.extend(values)
+
+    def _reserve(self, count: int) -> None:
+        capacity = len(self._data)
+        if count <= capacity:
+            return
+        capacity = max(count, 2 * capacity, self._MIN_CAPACITY)
+        data = np.empty((capacity, *self._data.shape[1:]), dtype=self._data.dtype)
+        data[: self._size] = self._data[: self._size]
+        self._data = data
+
+    def _element(self, value: Any) -> Any:
+        if self._data.ndim == 1:
+            return value.item()
+        return self._dtype(*value.tolist())
+
+    def _coerce(self, values: Any) -> np.ndarray:
+        if isinstance(values, _BuilderColumn):
+            return values.numpy()
+        if not isinstance(values, (np.ndarray, list, tuple)):
+            values = list(values)
+        array = np.asarray(values, dtype=self._data.dtype)
+        return array.reshape((-1, *self._data.shape[1:]))
+
+    def numpy(self) -> np.ndarray:
+        """Return a view of the stored values; valid until the column next grows."""
+        return self._data[: self._size]
+
+    def append(self, value: Any) -> None:
+        self._reserve(self._size + 1)
+        self._data[self._size] = value
+        self._size += 1
+
+    def extend(self, values: Iterable[Any] | np.ndarray) -> None:
+        array = self._coerce(values)
+        count = len(array)
+        self._reserve(self._size + count)
+        self._data[self._size : self._size + count] = array
+        self._size += count
+
+    def clear(self) -> None:
+        self._size = 0
+
+    def __iadd__(self, values: Iterable[Any]) -> _BuilderColumn:
+        self.extend(values)
+        return self
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        values = self.numpy().tolist()
+        if self._data.ndim == 1:
+            return iter(values)
+        return (self._dtype(*value) for value in values)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self._element(value) for value in self.numpy()[index]]
+        return self._element(self.numpy()[operator.index(index)])
+
+    def __setitem__(self, index: int | slice, value: Any) -> None:
+        if isinstance(index, slice):
+            self.numpy()[index] = self._coerce(value)
+        else:
+            self.numpy()[operator.index(index)] = value
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (_BuilderColumn, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __copy__(self) -> _BuilderColumn:
+        return _BuilderColumn(self._dtype, self.numpy())
+
+    def __deepcopy__(self, memo: dict) -> _BuilderColumn:
+        return self.__copy__()
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        array = self.numpy()
+        if dtype is not None:
+            array = array.astype(dtype, copy=False)
+        return array.copy() if copy else array
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+
 class ModelBuilder:
     """A helper class for building simulation models at runtime.
 
@@ -387,6 +503,23 @@ class ModelBuilder:
         },
     }
 
+    # Per-entity attributes stored as growable NumPy columns when ``columnar=True``.
+    _COLUMNAR_ATTRIBUTES: ClassVar[dict[str, type]] = {
+        "particle_q": wp.vec3,
+        "particle_qd": wp.vec3,
+        "particle_mass": float,
+        "particle_radius": float,
+        "particle_flags": int,
+        "particle_world": int,
+        "shape_transform": wp.transform,
+        "shape_body": int,
+        "shape_scale": wp.vec3,
+        "shape_margin": float,
+        "shape_gap": float,
+        "shape_collision_radius": float,
+        "shape_world": int,
+    }
+
     # Lazy snapshots of a plain ModelBuilder's attribute names; see _base_builder_attributes().
     _BASE_ATTRIBUTES: ClassVar[frozenset[str] | None] = None
     _BASE_LIST_ATTRIBUTES: ClassVar[frozenset[str] | None] = None
@@ -1145,6 +1278,7 @@ class ModelBuilder:
         up_axis: AxisType = Axis.Z,
         gravity: float | Vec3 | None = None,
         sdf_texture_paired_samples: bool = True,
+        columnar: bool = False,
     ):
         """
         Initializes a new ModelBuilder instance for constructing simulation models.
@@ -1161,6 +1295,14 @@ class ModelBuilder:
                 sampling. Every prebuilt mesh SDF added to this builder must
                 use the same layout, selected by the ``paired_samples``
                 argument to :meth:`Mesh.build_sdf`.
+            columnar: Store per-particle and per-shape numeric attributes
+                (e.g. :attr:`particle_q`, :attr:`shape_transform`,
+                :attr:`shape_body`) in growable NumPy arrays instead of Python
+                lists. The attributes keep supporting list-style appends,
+                indexing and iteration, but bulk insertion through
+                :meth:`add_particles_batch` and :meth:`finalize` avoid
+                per-element conversions, which reduces build time and peak
+                memory for scenes with millions of particles or shapes.
         """
         self.world_count: int = 0
         """Number of worlds accumulated for :attr:`Model.world_count`."""
@@ -1168,6 +1310,11 @@ class ModelBuilder:
         self.sdf_texture_paired_samples = bool(sdf_texture_paired_samples)
         """Whether generated SDF textures store adjacent X samples together."""
 
+        self.sdf_build_max_workers: int | None = 1
+        """Maximum number of mesh SDFs :meth:`finalize` cooks concurrently for shapes with an
+        SDF resolution but no prebuilt SDF. ``1`` (default) cooks sequentially and ``None``
+        uses one worker per CPU core; see :meth:`Mesh.build_sdfs <newton.Mesh.build_sdfs>`."""
+
         # region defaults
         self.default_bvh_cfg = ModelBuilder.BvhConfig()
         """Default BVH construction configuration used during model finalization."""
@@ -1661,6 +1808,12 @@ class ModelBuilder:
 
         _register_equality_constraint_attributes(self)
 
+        self.columnar = bool(columnar)
+        """Whether per-entity numeric attributes use columnar NumPy storage, see ``ModelBuilder(columnar=...)``."""
+        if self.columnar:
+            for name, dtype in self._COLUMNAR_ATTRIBUTES.items():
+                setattr(self, name, _BuilderColumn(dtype, getattr(self, name)))
+
     def _eq_attr(self, name: str) -> ModelBuilder.CustomAttribute:
         """Return the per-equality-constraint :class:`CustomAttribute` for the bare ``name`` (no ``mujoco:`` prefix)."""
         return self.custom_attributes[f"mujoco:{name}"]
@@ -2694,8 +2847,21 @@ class ModelBuilder:
             values = getattr(builder, attr)
             # Tolerate array-valued fields assigned in place of lists (list-repeat and
             # extend would silently misbehave on ndarrays).
+            if isinstance(values, _BuilderColumn):
+                return values.numpy().tolist()
             return values if isinstance(values, list) else list(values)
 
+        def extend_tiled(dst: list | _BuilderColumn, attr: str) -> None:
+            if isinstance(dst, _BuilderColumn):
+                values = getattr(builder, attr)
+                if len(values):
+                    dst.extend(np.tile(dst._coerce(values), (world_count,) + (1,) * (dst._data.ndim - 1)))
+            else:
+                dst.extend(source_list(attr) * world_count)
+
+        def extend_array(dst: list | _BuilderColumn, values: np.ndarray) -> None:
+            dst.extend(values if isinstance(dst, _BuilderColumn) else values.tolist())
+
         transform_mul_cfunc = wp._src.context.runtime.core.wp_builtin_mul_transformf_transformf
 
         def transform_mul(a: wp.transform, b: wp.transform) -> wp.transform:
@@ -2721,13 +2887,13 @@ class ModelBuilder:
             source = np.asarray(values, dtype=np.int64)
             if world_count == 1:
                 start = int(start_arrays[kind][0])
-                dst.extend(np.where(source >= 0, source + start, source).tolist())
+                extend_array(dst, np.where(source >= 0, source + start, source))
                 return
             tiled = np.tile(source, (world_count,) + (1,) * (source.ndim - 1))
             offset_shape = (world_count * len(source),) + (1,) * (source.ndim - 1)
             offsets = np.repeat(starts(kind), len(source)).reshape(offset_shape)
             translated = np.where(tiled >= 0, tiled + offsets, tiled)
-            dst.extend(translated.tolist())
+            extend_array(dst, translated)
 
         self._requested_contact_attributes.update(builder._requested_contact_attributes)
         self._requested_state_attributes.update(builder._requested_state_attributes)
@@ -2737,14 +2903,14 @@ class ModelBuilder:
             self.particle_max_velocity = builder.particle_max_velocity
             particle_q = np.tile(np.asarray(builder.particle_q, dtype=np.float32), (world_count, 1))
             particle_q += np.repeat(offsets, counts["particle"], axis=0)
-            self.particle_q.extend(particle_q.tolist())
+            extend_array(self.particle_q, particle_q)
 
         shape_starts = starts("shape")
         body_starts = starts("body")
 
         attribute_specs.pop("shape_transform")
         shape_transform_start = len(self.shape_transform)
-        self.shape_transform.extend(source_list("shape_transform") * world_count)
+        extend_tiled(self.shape_transform, "shape_transform")
         if counts["shape"]:
             static_shapes = np.flatnonzero(np.asarray(builder.shape_body, dtype=np.int64) == -1)
             for world_index, xform in enumerate(xforms):
@@ -2849,10 +3015,13 @@ class ModelBuilder:
         for attr, spec in attribute_specs.items():
             if spec.compaction_policy in {"world_start", "passthrough"}:
                 continue
+            destination = getattr(self, attr)
+            if isinstance(destination, _BuilderColumn) and spec.references is None:
+                extend_tiled(destination, attr)
+                continue
             source = source_list(attr)
             if not source:
                 continue
-            destination = getattr(self, attr)
             if spec.compaction_policy == "color_groups":
                 kind = self._builder_frequency_key(spec.frequency)
                 source_groups = [np.asarray(group, dtype=np.int64) for group in source]
@@ -2877,7 +3046,7 @@ class ModelBuilder:
                         destination.extend(source)
             elif spec.references in {Model.AttributeFrequency.WORLD, "world"}:
                 source_count = counts.get(self._builder_frequency_key(spec.frequency), len(source))
-                destination.extend(np.repeat(worlds, source_count).tolist())
+                extend_array(destination, np.repeat(worlds, source_count))
             elif spec.references is not None:
                 extend_referenced(destination, source, self._builder_frequency_key(spec.references))
             else:
@@ -2923,7 +3092,7 @@ class ModelBuilder:
         or subclass extras cannot change the merge schema.
         """
         if ModelBuilder._BASE_ATTRIBUTES is None:
-            base = vars(ModelBuilder())
+            base = vars(ModelBuilder(columnar=False))
             ModelBuilder._BASE_ATTRIBUTES = frozenset(base)
             ModelBuilder._BASE_LIST_ATTRIBUTES = frozenset(
                 name for name, value in base.items() if isinstance(value, list)
@@ -8563,6 +8732,78 @@ class ModelBuilder:
                 expected_frequency=Model.AttributeFrequency.PARTICLE,
             )
 
+    def add_particles_batch(
+        self,
+        pos: np.ndarray | Sequence[Vec3],
+        vel: np.ndarray | Sequence[Vec3] | Vec3 | None = None,
+        mass: np.ndarray | Sequence[float] | float = 1.0,
+        radius: np.ndarray | Sequence[float] | float | None = None,
+        flags: np.ndarray | Sequence[int] | int = ParticleFlags.ACTIVE,
+        custom_attributes: dict[str, Any] | None = None,
+    ) -> range:
+        """Adds a group of particles from array data without per-particle Python overhead.
+
+        Unlike :meth:`add_particles`, every argument may be a NumPy array or a
+        single value that is broadcast to all particles. The data is appended to
+        the particle attributes in one vectorized operation per attribute, which
+        is most effective on a builder created with ``ModelBuilder(columnar=True)``.
+
+        Args:
+            pos: The initial positions of the particles [m], shape ``(N, 3)``.
+            vel: The initial velocities of the particles [m/s], shape ``(N, 3)`` or ``(3,)``.
+                If None, the particles start at rest.
+            mass: The masses of the particles [kg], shape ``(N,)`` or a scalar.
+            radius: The radii of the particles [m] used in collision handling, shape ``(N,)``
+                or a scalar. If None, :attr:`default_particle_radius` is used.
+            flags: The flags that control the dynamical behavior of the particles, see
+                :class:`newton.ParticleFlags`, shape ``(N,)`` or a scalar.
+            custom_attributes: Dictionary of custom attribute names to lists of values (one value for each particle).
+
+        Returns:
+            The indices of the added particles.
+
+        Raises:
+            ValueError: If an input cannot be broadcast to the number of particles in ``pos``.
+        """
+        pos = np.asarray(pos, dtype=np.float32).reshape(-1, 3)
+        particle_count = len(pos)
+
+        def broadcast(name: str, values: Any, shape: tuple[int, ...], dtype: type) -> np.ndarray:
+            array = np.asarray(values, dtype=dtype)
+            try:
+                return np.broadcast_to(array, (particle_count, *shape))
+            except ValueError:
+                raise ValueError(
+                    f"{name} shape mismatch: expected {particle_count} values to match pos, got shape {array.shape}"
+                ) from None
+
+        vel = broadcast("vel", 0.0 if vel is None else vel, (3,), np.float32)
+        mass = broadcast("mass", mass, (), np.float32)
+        radius = broadcast("radius", self.default_particle_radius if radius is None else radius, (), np.float32)
+        flags = broadcast("flags", flags, (), np.int32)
+        world = np.full(particle_count, self.current_world, dtype=np.int32)
+
+        particle_start = self.particle_count
+        for name, values in (
+            ("particle_q", pos),
+            ("particle_qd", vel),
+            ("particle_mass", mass),
+            ("particle_radius", radius),
+            ("particle_flags", flags),
+            ("particle_world", world),
+        ):
+            destination = getattr(self, name)
+            destination.extend(values if isinstance(destination, _BuilderColumn) else values.tolist())
+
+        if custom_attributes and particle_count:
+            self._process_custom_attributes(
+                entity_index=list(range(particle_start, particle_start + particle_count)),
+                custom_attrs=custom_attributes,
+                expected_frequency=Model.AttributeFrequency.PARTICLE,
+            )
+
+        return range(particle_start, particle_start + particle_count)
+
     def add_spring(
         self,
         i: int,
@@ -9090,19 +9331,26 @@ class ModelBuilder:
         bending edges (with material). The edge/triangle adjacency maps are rebuilt
         from the accumulated tables in :meth:`finalize`.
 
+        The edges are derived from the triangles relative to their lowest vertex id,
+        so repeated instances of the same mesh hit :class:`MeshAdjacency`'s
+        content-hash cache regardless of where their particles start.
+
         Returns:
             The range of global edge indices added.
         """
         edge_start = len(self.edge_indices)
         if end_tri > start_tri:
-            local = MeshAdjacency(self.tri_indices[start_tri:end_tri])
-            edge_count = local.edge_indices.shape[0]
+            tris = np.asarray(self.tri_indices[start_tri:end_tri], dtype=np.int32)
+            vertex_start = int(tris.min())
+            local_edges = MeshAdjacency(tris - vertex_start).edge_indices
+            edge_count = local_edges.shape[0]
             if edge_count:
+                edge_indices = np.where(local_edges >= 0, local_edges + vertex_start, -1)
                 self.add_edges(
-                    local.edge_indices[:, 0],
-                    local.edge_indices[:, 1],
-                    local.edge_indices[:, 2],
-                    local.edge_indices[:, 3],
+                    edge_indices[:, 0],
+                    edge_indices[:, 1],
+                    edge_indices[:, 2],
+                    edge_indices[:, 3],
                     edge_ke=self._expand_edge_parameter(edge_ke, edge_count),
                     edge_kd=self._expand_edge_parameter(edge_kd, edge_count),
                     custom_attributes=custom_attributes,
@@ -9317,7 +9565,6 @@ class ModelBuilder:
             if inds_np.size > 0 and inds_np.size % 3 != 0:
                 return
 
-        num_verts = int(len(vertices))
         num_tris = int(len(indices) / 3)
 
         start_vertex = len(self.particle_q)
@@ -9330,11 +9577,11 @@ class ModelBuilder:
         vertices_np = np.array(vertices) * scale
         rot_mat_np = np.array(wp.quat_to_matrix(rot), dtype=np.float32).reshape(3, 3)
         verts_3d_np = np.dot(vertices_np, rot_mat_np.T) + pos
-        self.add_particles(
-            verts_3d_np.tolist(),
-            [vel] * num_verts,
-            mass=[0.0] * num_verts,
-            radius=[particle_radius] * num_verts,
+        self.add_particles_batch(
+            verts_3d_np,
+            vel,
+            mass=0.0,
+            radius=particle_radius,
             custom_attributes=custom_attributes_particles,
         )
 
@@ -9456,10 +9703,6 @@ class ModelBuilder:
         if radius_std > 0.0:
             radii += rng.standard_normal(radii.shape) * radius_std
 
-        masses = [mass] * points.shape[0]
-        if flags is not None:
-            flags = [flags] * points.shape[0]
-
         # Broadcast scalar custom attribute values to all particles
         num_particles = points.shape[0]
         broadcast_custom_attrs = None
@@ -9481,12 +9724,12 @@ class ModelBuilder:
                     # Scalar value - broadcast to all particles
                     broadcast_custom_attrs[key] = [value] * num_particles
 
-        self.add_particles(
-            pos=points.tolist(),
-            vel=velocity.tolist(),
-            mass=masses,
-            radius=radii.tolist(),
-            flags=flags,
+        self.add_particles_batch(
+            pos=points,
+            vel=velocity,
+            mass=mass,
+            radius=radii,
+            flags=ParticleFlags.ACTIVE if flags is None else flags,
             custom_attributes=broadcast_custom_attrs,
         )
 
@@ -11329,7 +11572,10 @@ class ModelBuilder:
             m.particle_mass = wp.array(self.particle_mass, dtype=wp.float32, requires_grad=requires_grad)
             m.particle_inv_mass = wp.array(particle_inv_mass, dtype=wp.float32, requires_grad=requires_grad)
             m.particle_radius = wp.array(self.particle_radius, dtype=wp.float32, requires_grad=requires_grad)
-            m.particle_flags = wp.array([flag_to_int(f) for f in self.particle_flags], dtype=wp.int32)
+            particle_flags = self.particle_flags
+            if not isinstance(particle_flags, _BuilderColumn):
+                particle_flags = [flag_to_int(f) for f in particle_flags]
+            m.particle_flags = wp.array(particle_flags, dtype=wp.int32)
             m.particle_world = wp.array(self.particle_world, dtype=wp.int32)
             m.particle_max_radius = np.max(self.particle_radius) if len(self.particle_radius) > 0 else 0.0
             m.particle_max_velocity = self.particle_max_velocity
@@ -11756,6 +12002,67 @@ class ModelBuilder:
             deferred_collision_edges_cache: dict[tuple, Any] = {}
             deferred_collision_edges: dict[int, Any] = {}
 
+            def deferred_mesh_sdf_request(i: int) -> tuple[tuple, Mesh, dict[str, Any]] | None:
+                """Return ``(deferred_key, sdf_source, build_sdf kwargs)`` if shape ``i`` needs a deferred SDF."""
+                shape_type = self.shape_type[i]
+                shape_src = self.shape_source[i]
+                shape_flags = self.shape_flags[i]
+                sdf_max_resolution = self.shape_sdf_max_resolution[i]
+                sdf_target_voxel_size = self.shape_sdf_target_voxel_size[i]
+                if (
+                    shape_type not in (GeoType.MESH, GeoType.CONVEX_MESH)
+                    or not shape_flags & ShapeFlags.COLLIDE_SHAPES
+                    or shape_src is None
+                    or getattr(shape_src, "sdf", None) is not None
+                    or (sdf_max_resolution is None and sdf_target_voxel_size is None)
+                ):
+                    return None
+                shape_scale = self.shape_scale[i]
+                sdf_narrow_band_range = self.shape_sdf_narrow_band_range[i]
+                sdf_tex_fmt = self.shape_sdf_texture_format[i]
+                sdf_padding = self.shape_sdf_padding[i]
+                is_hydroelastic = bool(shape_flags & ShapeFlags.HYDROELASTIC)
+                shape_gap = self.shape_gap[i]
+                required_sdf_padding = shape_gap + self.shape_margin[i] if is_hydroelastic else shape_gap
+                sdf_gen_margin = sdf_padding if sdf_padding is not None else required_sdf_padding
+                sdf_kwargs = {"narrow_band_range": tuple(sdf_narrow_band_range)}
+                if sdf_max_resolution is not None:
+                    sdf_kwargs["max_resolution"] = sdf_max_resolution
+                if sdf_target_voxel_size is not None:
+                    sdf_kwargs["target_voxel_size"] = sdf_target_voxel_size
+                sdf_kwargs["margin"] = sdf_gen_margin
+                sdf_kwargs["scale"] = tuple(shape_scale)
+                sdf_kwargs["texture_format"] = sdf_tex_fmt
+                sdf_kwargs["paired_samples"] = self.sdf_texture_paired_samples
+                # Convex collision geometry is deduplicated before finalization,
+                # so build and cache its deferred SDF against that same topology.
+                sdf_source = generated_shape_sources[i] if shape_type == GeoType.CONVEX_MESH else shape_src
+                deferred_key = (
+                    id(sdf_source),
+                    tuple(shape_scale),
+                    tuple(sdf_narrow_band_range),
+                    sdf_target_voxel_size,
+                    sdf_max_resolution,
+                    sdf_tex_fmt,
+                    sdf_gen_margin,
+                )
+                return deferred_key, sdf_source, sdf_kwargs
+
+            # Cook every distinct deferred SDF up front so independent meshes can be
+            # cooked concurrently (see sdf_build_max_workers).
+            deferred_jobs: dict[tuple, tuple[Mesh, dict[str, Any]]] = {}
+            for i in range(len(self.shape_type)):
+                request = deferred_mesh_sdf_request(i)
+                if request is not None and request[0] not in deferred_jobs:
+                    deferred_key, sdf_source, sdf_kwargs = request
+                    deferred_jobs[deferred_key] = (sdf_source.copy(), sdf_kwargs)
+            if deferred_jobs:
+                deferred_sdfs = _build_mesh_sdfs(list(deferred_jobs.values()), max_workers=self.sdf_build_max_workers)
+                for (deferred_key, (mesh_copy, _)), mesh_sdf in zip(deferred_jobs.items(), deferred_sdfs, strict=True):
+                    deferred_mesh_sdf_cache[deferred_key] = mesh_sdf
+                    if getattr(mesh_copy, "_collision_edges", None) is not None:
+                        deferred_collision_edges_cache[deferred_key] = mesh_copy._collision_edges
+
             for i in range(len(self.shape_type)):
                 shape_type = self.shape_type[i]
                 shape_src = self.shape_source[i]
@@ -11779,38 +12086,12 @@ class ModelBuilder:
 
                 if shape_type in (GeoType.MESH, GeoType.CONVEX_MESH) and has_shape_collision and shape_src is not None:
                     mesh_sdf = getattr(shape_src, "sdf", None)
-                    # Build on a Mesh clone so shapes sharing one Mesh at different
-                    # scale/margin/resolution end up with distinct SDFs.
-                    if mesh_sdf is None and (sdf_max_resolution is not None or sdf_target_voxel_size is not None):
-                        sdf_kwargs = {"narrow_band_range": tuple(sdf_narrow_band_range)}
-                        if sdf_max_resolution is not None:
-                            sdf_kwargs["max_resolution"] = sdf_max_resolution
-                        if sdf_target_voxel_size is not None:
-                            sdf_kwargs["target_voxel_size"] = sdf_target_voxel_size
-                        sdf_kwargs["margin"] = sdf_gen_margin
-                        sdf_kwargs["scale"] = tuple(shape_scale)
-                        sdf_kwargs["texture_format"] = sdf_tex_fmt
-                        sdf_kwargs["paired_samples"] = self.sdf_texture_paired_samples
-                        # Convex collision geometry is deduplicated before finalization,
-                        # so build and cache its deferred SDF against that same topology.
-                        sdf_source = generated_shape_sources[i] if shape_type == GeoType.CONVEX_MESH else shape_src
-                        deferred_key = (
-                            id(sdf_source),
-                            tuple(shape_scale),
-                            tuple(sdf_narrow_band_range),
-                            sdf_target_voxel_size,
-                            sdf_max_resolution,
-                            sdf_tex_fmt,
-                            sdf_gen_margin,
-                        )
-                        mesh_sdf = deferred_mesh_sdf_cache.get(deferred_key)
-                        if mesh_sdf is None:
-                            mesh_copy = sdf_source.copy()
-                            mesh_copy.build_sdf(**sdf_kwargs)
-                            mesh_sdf = mesh_copy.sdf
-                            deferred_mesh_sdf_cache[deferred_key] = mesh_sdf
-                            if getattr(mesh_copy, "_collision_edges", None) is not None:
-                                deferred_collision_edges_cache[deferred_key] = mesh_copy._collision_edges
+                    # Deferred SDFs were built above on Mesh clones so shapes sharing one
+                    # Mesh at different scale/margin/resolution end up with distinct SDFs.
+                    request = deferred_mesh_sdf_request(i)
+                    if request is not None:
+                        deferred_key = request[0]
+                        mesh_sdf = deferred_mesh_sdf_cache[deferred_key]
                         if deferred_key in deferred_collision_edges_cache:
                             deferred_collision_edges[i] = deferred_collision_edges_cache[deferred_key]
                     if mesh_sdf is not None:
@@ -13,6 +13,7 @@ import warp as wp
 from ..core.reset import normalize_reset_world_mask
 from ..geometry.broad_phase_nxn import BroadPhaseAllPairs, BroadPhaseExplicit
 from ..geometry.broad_phase_sap import BroadPhaseSAP
+from ..geometry.broad_phase_spatial_hash import BroadPhaseSpatialHash
 from ..geometry.collision_core import compute_tight_aabb_from_support
 from ..geometry.contact_data import (
     ContactData,
@@ -37,6 +38,7 @@ from ..geometry.types import GeoType
 from ..sim.contacts import Contacts
 from ..sim.model import Model
 from ..sim.state import State
+from ..utils.benchmark import profile_scope
 
 
 def _shape_collide_mask(model: Model, shape_count: int | None = None) -> np.ndarray:
@@ -293,6 +295,7 @@ def compute_shape_aabbs(
     shape_gap: wp.array[float],
     shape_collision_aabb_lower: wp.array[wp.vec3],
     shape_collision_aabb_upper: wp.array[wp.vec3],
+    body_sleeping: wp.array[wp.int32],  # Optional per-body sleep flags (empty = all awake)
     # Fused counter arrays — zeroed by thread 0 to avoid separate kernel launches.
     contact_counters: wp.array[wp.int32],
     contact_generation: wp.array[wp.int32],
@@ -307,7 +310,8 @@ def compute_shape_aabbs(
     """Compute AABBs, narrow-phase geometry data, and zero collision counters.
 
     Fuses AABB computation, narrow-phase data preparation, contact counter
-    zeroing, and generation bumping into a single kernel launch.
+    zeroing, and generation bumping into a single kernel launch. Shapes of
+    sleeping bodies keep the AABB and geometry data of the previous launch.
     """
     shape_id = wp.tid()
 
@@ -325,6 +329,10 @@ def compute_shape_aabbs(
         broad_phase_pair_count[0] = 0
 
     rigid_id = shape_body[shape_id]
+    if rigid_id >= 0 and body_sleeping.shape[0] > 0:
+        if body_sleeping[rigid_id] != 0:
+            return
+
     geo_type = shape_type[shape_id]
 
     # Compute world transform
@@ -483,6 +491,7 @@ def compute_shape_velocities(
     shape_collision_aabb_upper: wp.array[wp.vec3],
     shape_collision_radius: wp.array[float],
     shape_gap: wp.array[float],
+    body_sleeping: wp.array[wp.int32],  # Optional per-body sleep flags (empty = all awake)
     collision_update_dt: float,
     max_speculative_extension: float,
     # outputs
@@ -499,11 +508,15 @@ def compute_shape_velocities(
     the ``angular_velocity x COM_offset`` contribution, multiplied by
     ``collision_update_dt``. Angular travel expands the AABB separately.
     ``angular_speed_bound`` is the resulting conservative linear speed [m/s]
-    at the shape bound, not an angular speed [rad/s].
+    at the shape bound, not an angular speed [rad/s]. Shapes of sleeping
+    bodies are treated as static.
     """
     shape_id = wp.tid()
     body_id = shape_body[shape_id]
-    if body_id == -1:
+    asleep = False
+    if body_id >= 0 and body_sleeping.shape[0] > 0:
+        asleep = body_sleeping[body_id] != 0
+    if body_id == -1 or asleep:
         shape_linear_velocity[shape_id] = wp.vec3(0.0)
         shape_angular_velocity[shape_id] = wp.vec3(0.0)
         shape_search_gap[shape_id] = shape_gap[shape_id]
@@ -746,7 +759,7 @@ def _resolve_shape_pairs_max(model: Model, override: int | None) -> int:
     return int(override)
 
 
-BROAD_PHASE_MODES = ("nxn", "sap", "explicit")
+BROAD_PHASE_MODES = ("nxn", "sap", "spatial_hash", "explicit")
 _SPLIT_GJK_MPR_LEAN_PAIR_COUNT_THRESHOLD = 27_776
 _SPLIT_GJK_MPR_FULL_PAIR_COUNT_THRESHOLD = 65_536
 
@@ -797,15 +810,20 @@ def _normalize_broad_phase_mode(mode: str) -> str:
     return mode_str
 
 
-def _infer_broad_phase_mode_from_instance(broad_phase: BroadPhaseAllPairs | BroadPhaseSAP | BroadPhaseExplicit) -> str:
+def _infer_broad_phase_mode_from_instance(
+    broad_phase: BroadPhaseAllPairs | BroadPhaseSAP | BroadPhaseSpatialHash | BroadPhaseExplicit,
+) -> str:
     if isinstance(broad_phase, BroadPhaseAllPairs):
         return "nxn"
     if isinstance(broad_phase, BroadPhaseSAP):
         return "sap"
+    if isinstance(broad_phase, BroadPhaseSpatialHash):
+        return "spatial_hash"
     if isinstance(broad_phase, BroadPhaseExplicit):
         return "explicit"
     raise TypeError(
-        "broad_phase must be a BroadPhaseAllPairs, BroadPhaseSAP, or BroadPhaseExplicit instance "
+        "broad_phase must be a BroadPhaseAllPairs, BroadPhaseSAP, BroadPhaseSpatialHash, or BroadPhaseExplicit "
+        "instance "
         f"(got {type(broad_phase)!r})"
     )
 
@@ -1114,9 +1132,10 @@ class CollisionPipeline:
         soft_contact_margin: float = 0.01,
         enable_rigid_soft_full_surface_contact: bool = False,
         requires_grad: bool | None = None,
-        broad_phase: Literal["nxn", "sap", "explicit"]
+        broad_phase: Literal["nxn", "sap", "spatial_hash", "explicit"]
         | BroadPhaseAllPairs
         | BroadPhaseSAP
+        | BroadPhaseSpatialHash
         | BroadPhaseExplicit
         | None = None,
         narrow_phase: NarrowPhase | None = None,
@@ -1173,13 +1192,15 @@ class CollisionPipeline:
                 :func:`newton.eval_rigid_contact_kinematics` do not
                 depend on this flag.
             broad_phase:
-                Either a broad phase mode string ("explicit", "nxn", "sap") or
-                a prebuilt broad phase instance for expert usage.
+                Either a broad phase mode string ("explicit", "nxn", "sap",
+                "spatial_hash") or a prebuilt broad phase instance for expert usage.
+                ``"spatial_hash"`` bins shapes into a uniform grid and suits scenes
+                with many similarly sized shapes per world.
             narrow_phase: Optional prebuilt narrow phase instance. Must be
                 provided together with a broad phase instance for expert usage.
             shape_pairs_filtered: Precomputed shape pairs for EXPLICIT mode.
                 When broad_phase is "explicit", uses model.shape_contact_pairs if not provided. For
-                "nxn"/"sap" modes, ignored. The pair count and shape-type routing are used to size
+                "nxn"/"sap"/"spatial_hash" modes, ignored. The pair count and shape-type routing are used to size
                 and specialize internal buffers at construction, so do not modify or resize the
                 array while the pipeline is in use. Rebuild the pipeline after changing the pairs.
             include_static_kinematic_pairs: Whether to generate contacts for
@@ -1190,7 +1211,7 @@ class CollisionPipeline:
             sdf_hydroelastic_config: Configuration for hydroelastic collision
                 handling. Defaults to None.
             shape_pairs_max: Override for the broad-phase candidate-pair
-                buffer capacity used by the ``"nxn"`` and ``"sap"`` modes.
+                buffer capacity used by the ``"nxn"``, ``"sap"``, and ``"spatial_hash"`` modes.
                 Defaults to the worst-case ``N*(N-1)/2`` per-world bound,
                 which is rarely hit by either ``"nxn"`` or ``"sap"`` in
                 practice -- ``"nxn"`` still applies AABB overlap, group,
@@ -1272,7 +1293,9 @@ class CollisionPipeline:
             deterministic = True
 
         mode_from_broad_phase: str | None = None
-        broad_phase_instance: BroadPhaseAllPairs | BroadPhaseSAP | BroadPhaseExplicit | None = None
+        broad_phase_instance: BroadPhaseAllPairs | BroadPhaseSAP | BroadPhaseSpatialHash | BroadPhaseExplicit | None = (
+            None
+        )
         if broad_phase is not None:
             if isinstance(broad_phase, str):
                 mode_from_broad_phase = _normalize_broad_phase_mode(broad_phase)
@@ -1312,6 +1335,7 @@ class CollisionPipeline:
         self.requires_grad = requires_grad
         self.soft_contact_margin = soft_contact_margin
         self.include_static_kinematic_pairs = include_static_kinematic_pairs
+        self._shape_aabbs_initialized = False
         self.speculative_config = speculative_config
         self._speculative_enabled = speculative_config is not None
         contact_writer = write_contact_speculative if self._speculative_enabled else write_contact
@@ -1403,6 +1427,16 @@ class CollisionPipeline:
                 self.shape_pairs_excluded_count = (
                     self.shape_pairs_excluded.shape[0] if self.shape_pairs_excluded is not None else 0
                 )
+            elif self.broad_phase_mode == "spatial_hash":
+                if shape_world is None:
+                    raise ValueError("model.shape_world is required for broad_phase=SPATIAL_HASH")
+                self.broad_phase = BroadPhaseSpatialHash(shape_world, shape_flags=shape_flags, device=device)
+                self.shape_pairs_filtered = None
+                self.shape_pairs_max = _resolve_shape_pairs_max(model, shape_pairs_max)
+                self.shape_pairs_excluded = self._build_excluded_pairs(model)
+                self.shape_pairs_excluded_count = (
+                    self.shape_pairs_excluded.shape[0] if self.shape_pairs_excluded is not None else 0
+                )
             else:
                 raise ValueError(f"Unsupported broad phase mode: {self.broad_phase_mode}")
 
@@ -1580,6 +1614,7 @@ class CollisionPipeline:
             self.broad_phase_shape_pairs = wp.zeros(self.shape_pairs_max, dtype=wp.vec2i, device=device)
             self.geom_data = wp.zeros(shape_count, dtype=wp.vec4, device=device)
             self.geom_transform = wp.zeros(shape_count, dtype=wp.transform, device=device)
+            self._body_sleeping_empty = wp.empty(0, dtype=wp.int32, device=device)
             if self._speculative_enabled:
                 self._shape_linear_velocity = wp.zeros(shape_count, dtype=wp.vec3, device=device)
                 self._shape_angular_velocity = wp.zeros(shape_count, dtype=wp.vec3, device=device)
@@ -1762,6 +1797,7 @@ class CollisionPipeline:
             device=model.device,
         )
 
+    @profile_scope
     def collide(
         self,
         state: State,
@@ -1842,6 +1878,14 @@ class CollisionPipeline:
         # augmentation and soft-contact kernels that follow are tape-safe
         # and recorded normally.
 
+        # Sleeping bodies reuse the AABBs of the previous call, so the first
+        # call always computes every shape.
+        body_sleeping = getattr(state, "body_sleeping", None)
+        if body_sleeping is None:
+            body_sleeping = self._body_sleeping_empty
+        aabb_body_sleeping = body_sleeping if self._shape_aabbs_initialized else self._body_sleeping_empty
+        self._shape_aabbs_initialized = True
+
         # Compute AABBs for all shapes, zero counters, bump generation.
         # Fuses contacts.clear() + broad_phase_pair_count.zero_() + AABB update.
         wp.launch(
@@ -1859,6 +1903,7 @@ class CollisionPipeline:
                 model.shape_gap,
                 model.shape_collision_aabb_lower,
                 model.shape_collision_aabb_upper,
+                aabb_body_sleeping,
                 contacts.contact_counters,
                 contacts.contact_generation,
                 self.broad_phase_pair_count,
@@ -1888,6 +1933,7 @@ class CollisionPipeline:
                     model.shape_collision_aabb_upper,
                     model.shape_collision_radius,
                     model.shape_gap,
+                    aabb_body_sleeping,
                     collision_update_dt,
                     max_speculative_extension,
                 ],
@@ -1904,7 +1950,7 @@ class CollisionPipeline:
             )
 
         # Run broad phase (AABBs are already expanded by effective gaps, so pass None)
-        if isinstance(self.broad_phase, BroadPhaseAllPairs):
+        if isinstance(self.broad_phase, (BroadPhaseAllPairs, BroadPhaseSpatialHash)):
             self.broad_phase.launch(
                 self.narrow_phase.shape_aabb_lower,
                 self.narrow_phase.shape_aabb_upper,
@@ -1917,6 +1963,7 @@ class CollisionPipeline:
                 shape_body=model.shape_body,
                 body_flags=model.body_flags,
                 include_static_kinematic_pairs=self.include_static_kinematic_pairs,
+                body_sleeping=body_sleeping,
                 device=self.device,
                 filter_pairs=self.shape_pairs_excluded,
                 num_filter_pairs=self.shape_pairs_excluded_count,
@@ -1936,6 +1983,7 @@ class CollisionPipeline:
                 shape_body=model.shape_body,
                 body_flags=model.body_flags,
                 include_static_kinematic_pairs=self.include_static_kinematic_pairs,
+                body_sleeping=body_sleeping,
                 device=self.device,
                 filter_pairs=self.shape_pairs_excluded,
                 num_filter_pairs=self.shape_pairs_excluded_count,
@@ -1955,6 +2003,7 @@ class CollisionPipeline:
                 shape_body=model.shape_body,
                 body_flags=model.body_flags,
                 include_static_kinematic_pairs=self.include_static_kinematic_pairs,
+                body_sleeping=body_sleeping,
                 device=self.device,
                 skip_count_zero=True,  # Already zeroed by compute_shape_aabbs
                 shape_displacement=self._shape_displacement if speculative_active else None,
@@ -0,0 +1,371 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Asynchronous host export of rigid contacts for data pipelines."""
+
+from __future__ import annotations
+
+import dataclasses
+from collections import deque
+from collections.abc import Iterator
+
+import numpy as np
+import warp as wp
+
+from .contacts import Contacts, contact_surface_point
+from .model import Model
+from .state import State
+
+__all__ = ["ContactStream"]
+
+
+@wp.kernel(enable_backward=False)
+def _contact_stream_world_keys(
+    contact_count: wp.array[wp.int32],
+    shape0: wp.array[wp.int32],
+    shape1: wp.array[wp.int32],
+    shape_world: wp.array[wp.int32],
+    world_count: int,
+    # outputs
+    keys: wp.array[wp.int32],
+    values: wp.array[wp.int32],
+    world_counts: wp.array[wp.int32],
+):
+    tid = wp.tid()
+    values[tid] = tid
+    if tid >= contact_count[0]:
+        # inactive slots sort behind the global bucket
+        keys[tid] = world_count + 1
+        return
+
+    world = shape_world[shape0[tid]]
+    if world < 0:
+        world = shape_world[shape1[tid]]
+    if world < 0:
+        world = world_count
+    keys[tid] = world
+    wp.atomic_add(world_counts, world, 1)
+
+
+@wp.kernel(enable_backward=False)
+def _contact_stream_gather(
+    contact_count: wp.array[wp.int32],
+    order: wp.array[wp.int32],
+    shape0: wp.array[wp.int32],
+    shape1: wp.array[wp.int32],
+    point0: wp.array[wp.vec3],
+    point1: wp.array[wp.vec3],
+    offset0: wp.array[wp.vec3],
+    offset1: wp.array[wp.vec3],
+    normal: wp.array[wp.vec3],
+    force: wp.array[wp.spatial_vector],
+    shape_body: wp.array[wp.int32],
+    body_q: wp.array[wp.transform],
+    # outputs
+    out_shape_pair: wp.array[wp.vec2i],
+    out_point0: wp.array[wp.vec3],
+    out_point1: wp.array[wp.vec3],
+    out_normal: wp.array[wp.vec3],
+    out_force: wp.array[wp.spatial_vector],
+):
+    tid = wp.tid()
+    if tid >= contact_count[0]:
+        return
+
+    src = order[tid]
+    s0 = shape0[src]
+    s1 = shape1[src]
+    X_w0 = wp.transform_identity()
+    X_w1 = wp.transform_identity()
+    if body_q:
+        b0 = shape_body[s0]
+        b1 = shape_body[s1]
+        if b0 >= 0:
+            X_w0 = body_q[b0]
+        if b1 >= 0:
+            X_w1 = body_q[b1]
+
+    out_shape_pair[tid] = wp.vec2i(s0, s1)
+    out_point0[tid] = contact_surface_point(X_w0, point0[src], offset0[src])
+    out_point1[tid] = contact_surface_point(X_w1, point1[src], offset1[src])
+    out_normal[tid] = normal[src]
+    if out_force:
+        out_force[tid] = force[src]
+
+
+class _ContactBuffers:
+    """One set of compacted contact arrays (device staging or a host ring slot)."""
+
+    def __init__(self, capacity: int, world_count: int, with_force: bool, device, pinned: bool):
+        self.count = wp.zeros(1, dtype=wp.int32, device=device, pinned=pinned)
+        self.world_start = wp.zeros(world_count + 2, dtype=wp.int32, device=device, pinned=pinned)
+        self.shape_pair = wp.zeros(capacity, dtype=wp.vec2i, device=device, pinned=pinned)
+        self.point0 = wp.zeros(capacity, dtype=wp.vec3, device=device, pinned=pinned)
+        self.point1 = wp.zeros(capacity, dtype=wp.vec3, device=device, pinned=pinned)
+        self.normal = wp.zeros(capacity, dtype=wp.vec3, device=device, pinned=pinned)
+        self.force = wp.zeros(capacity, dtype=wp.spatial_vector, device=device, pinned=pinned) if with_force else None
+
+    def arrays(self) -> list[wp.array]:
+        arrays = [self.count, self.world_start, self.shape_pair, self.point0, self.point1, self.normal]
+        if self.force is not None:
+            arrays.append(self.force)
+        return arrays
+
+
+class ContactStream:
+    """Stream compacted rigid contacts to the host without stalling the simulation loop.
+
+    Every :meth:`push` sorts the active rigid contacts of a :class:`~newton.Contacts`
+    buffer by world, evaluates their world-space contact points, and enqueues an
+    asynchronous copy into one slot of a ring of preallocated host buffers (pinned
+    memory on CUDA devices). :meth:`batches` is a generator that yields the
+    finished steps as :class:`ContactStream.Batch` objects in push order, skipping
+    any copy that is still in flight unless ``block=True``.
+
+    Batch arrays are NumPy views of the ring slot and stay valid until the ring
+    wraps around to that slot again, i.e. for the next ``ring_size - 1`` pushes.
+    Copy them if they need to live longer. When every slot still holds a batch
+    that has not been yielded yet, :meth:`push` waits for the oldest copy and
+    moves it into host-owned arrays, so no step is lost even if the consumer
+    falls behind.
+
+    Only rigid contacts are streamed. Contact forces are included when the
+    ``"force"`` extended attribute is allocated on the contacts (see
+    :ref:`extended_contact_attributes`); soft contact entries of that array are
+    not exported.
+
+    Example:
+
+        .. code-block:: python
+
+            stream = newton.ContactStream(model, contacts)
+            for _ in range(num_steps):
+                pipeline.collide(state, contacts)
+                solver.step(state, state_next, control, contacts, dt)
+                stream.push(state_next)
+                for batch in stream.batches():
+                    writer.write(batch.step, batch.shape_pairs, batch.point0, batch.normal)
+                state, state_next = state_next, state
+            for batch in stream.batches(block=True):
+                writer.write(batch.step, batch.shape_pairs, batch.point0, batch.normal)
+    """
+
+    @dataclasses.dataclass
+    class Batch:
+        """Rigid contacts of one pushed step, sorted by world."""
+
+        step: int
+        """Step index passed to :meth:`ContactStream.push`."""
+
+        world_start: np.ndarray
+        """Start index of the contacts of each world, shape [world_count + 2], int32.
+
+        Follows the layout of :attr:`newton.Model.particle_world_start`: the entries
+        ``0`` to ``world_count - 1`` belong to the worlds, the second-last entry
+        is the start of the contacts between global shapes only, and the last entry
+        is the total contact count."""
+
+        shape_pairs: np.ndarray
+        """Shape indices of each contact, shape [count, 2], int32."""
+
+        point0: np.ndarray
+        """World-space effective-surface contact point on shape 0 [m], shape [count, 3], float32."""
+
+        point1: np.ndarray
+        """World-space effective-surface contact point on shape 1 [m], shape [count, 3], float32."""
+
+        normal: np.ndarray
+        """Contact normal pointing from shape 0 toward shape 1, shape [count, 3], float32."""
+
+        force: np.ndarray | None
+        """Spatial contact force [N, N·m], shape [count, 6], float32, or ``None`` if not allocated."""
+
+        @property
+        def count(self) -> int:
+            """Number of contacts in the batch."""
+            return int(self.shape_pairs.shape[0])
+
+        def world(self, world: int) -> slice:
+            """Return the slice selecting the contacts of ``world`` (``-1`` for global contacts)."""
+            if world == -1:
+                world = len(self.world_start) - 2
+            return slice(int(self.world_start[world]), int(self.world_start[world + 1]))
+
+        def copy(self) -> ContactStream.Batch:
+            """Return a copy of the batch that owns its arrays."""
+            return dataclasses.replace(
+                self,
+                world_start=self.world_start.copy(),
+                shape_pairs=self.shape_pairs.copy(),
+                point0=self.point0.copy(),
+                point1=self.point1.copy(),
+                normal=self.normal.copy(),
+                force=None if self.force is None else self.force.copy(),
+            )
+
+    def __init__(self, model: Model, contacts: Contacts, *, ring_size: int = 3):
+        """
+        Args:
+            model: Model providing the shape-to-world and shape-to-body mappings.
+            contacts: Contacts buffer to stream. Its arrays are read on every :meth:`push`.
+            ring_size: Number of host buffer slots, which bounds how many pushed
+                steps can be in flight before :meth:`push` has to wait for a copy.
+        """
+        if ring_size < 1:
+            raise ValueError(f"ring_size must be at least 1, got {ring_size}")
+        self.model = model
+        self.contacts = contacts
+        self.ring_size = ring_size
+        self.device = contacts.device
+        self.world_count = max(model.world_count, 1)
+
+        capacity = contacts.rigid_contact_max
+        with_force = contacts.force is not None
+        self._capacity = capacity
+        # radix sort scratch: keys and values need twice the sorted length
+        self._keys = wp.zeros(2 * max(capacity, 1), dtype=wp.int32, device=self.device)
+        self._values = wp.zeros(2 * max(capacity, 1), dtype=wp.int32, device=self.device)
+        self._world_counts = wp.zeros(self.world_count + 2, dtype=wp.int32, device=self.device)
+        self._key_bits = int(self.world_count + 1).bit_length()
+
+        # on the CPU the gather writes straight into the ring slots
+        pinned = self.device.is_cuda
+        self._staging = _ContactBuffers(capacity, self.world_count, with_force, self.device, False) if pinned else None
+        self._slots = [_ContactBuffers(capacity, self.world_count, with_force, "cpu", pinned) for _ in range(ring_size)]
+        self._slot_events: list[wp.Event | None] = [None] * ring_size
+        # pending entries in push order: (step, slot index) or an already materialized Batch
+        self._pending: deque[tuple[int, int] | ContactStream.Batch] = deque()
+        self._next_slot = 0
+        self._step = 0
+
+    def push(self, state: State | None = None, *, step: int | None = None) -> None:
+        """Enqueue the compaction and host copy of the current rigid contacts.
+
+        The call only launches work on the current stream and returns without
+        synchronizing, except when the ring is full of batches that have not been
+        yielded yet (see the class documentation).
+
+        Args:
+            state: State providing the body transforms used for the world-space
+                contact points. If ``None``, shapes are treated as static and
+                the body-frame points are reported as world-space points.
+            step: Step index stored on the batch. Defaults to a counter that
+                starts at 0 and increments with every push.
+        """
+        if step is None:
+            step = self._step
+        self._step = step + 1
+
+        slot_index = self._next_slot
+        self._next_slot = (slot_index + 1) % self.ring_size
+        self._release_slot(slot_index)
+
+        contacts = self.contacts
+        model = self.model
+        slot = self._slots[slot_index]
+        target = self._staging if self._staging is not None else slot
+        capacity = self._capacity
+
+        with wp.ScopedDevice(self.device):
+            self._world_counts.zero_()
+            if capacity > 0:
+                wp.launch(
+                    _contact_stream_world_keys,
+                    dim=capacity,
+                    inputs=[
+                        contacts.rigid_contact_count,
+                        contacts.rigid_contact_shape0,
+                        contacts.rigid_contact_shape1,
+                        model.shape_world,
+                        self.world_count,
+                    ],
+                    outputs=[self._keys, self._values, self._world_counts],
+                    record_tape=False,
+                )
+                # stable sort keeps the collision pipeline's order within each world
+                wp.utils.radix_sort_pairs(self._keys, self._values, capacity, end_bit=self._key_bits)
+                body_q = state.body_q if state is not None else None
+                wp.launch(
+                    _contact_stream_gather,
+                    dim=capacity,
+                    inputs=[
+                        contacts.rigid_contact_count,
+                        self._values,
+                        contacts.rigid_contact_shape0,
+                        contacts.rigid_contact_shape1,
+                        contacts.rigid_contact_point0,
+                        contacts.rigid_contact_point1,
+                        contacts.rigid_contact_offset0,
+                        contacts.rigid_contact_offset1,
+                        contacts.rigid_contact_normal,
+                        contacts.force,
+                        model.shape_body,
+                        body_q,
+                    ],
+                    outputs=[target.shape_pair, target.point0, target.point1, target.normal, target.force],
+                    record_tape=False,
+                )
+            wp.utils.array_scan(self._world_counts, target.world_start, inclusive=False)
+            wp.copy(target.count, contacts.rigid_contact_count)
+
+            if self._staging is not None:
+                for dst, src in zip(slot.arrays(), target.arrays(), strict=True):
+                    wp.copy(dst, src)
+                self._slot_events[slot_index] = wp.record_event()
+
+        self._pending.append((step, slot_index))
+
+    def batches(self, *, block: bool = False) -> Iterator[ContactStream.Batch]:
+        """Yield the pushed steps whose host copy has finished, oldest first.
+
+        Args:
+            block: If ``True``, wait for in-flight copies and drain every pushed
+                step. If ``False`` (default), stop at the first step whose copy
+                has not finished yet.
+
+        Yields:
+            One :class:`ContactStream.Batch` per pushed step.
+        """
+        while self._pending:
+            entry = self._pending[0]
+            if isinstance(entry, ContactStream.Batch):
+                self._pending.popleft()
+                yield entry
+                continue
+            step, slot_index = entry
+            event = self._slot_events[slot_index]
+            if event is not None:
+                if not block and not event.is_complete:
+                    return
+                wp.synchronize_event(event)
+                self._slot_events[slot_index] = None
+            self._pending.popleft()
+            yield self._make_batch(step, self._slots[slot_index])
+
+    @property
+    def pending_count(self) -> int:
+        """Number of pushed steps that have not been yielded yet."""
+        return len(self._pending)
+
+    def _release_slot(self, slot_index: int) -> None:
+        """Move a not-yet-yielded batch out of ``slot_index`` before it is overwritten."""
+        for i, entry in enumerate(self._pending):
+            if isinstance(entry, tuple) and entry[1] == slot_index:
+                event = self._slot_events[slot_index]
+                if event is not None:
+                    wp.synchronize_event(event)
+                    self._slot_events[slot_index] = None
+                self._pending[i] = self._make_batch(entry[0], self._slots[slot_index]).copy()
+                return
+
+    def _make_batch(self, step: int, slot: _ContactBuffers) -> ContactStream.Batch:
+        count = min(int(slot.count.numpy()[0]), self._capacity)
+        return ContactStream.Batch(
+            step=step,
+            world_start=slot.world_start.numpy(),
+            shape_pairs=slot.shape_pair.numpy()[:count],
+            point0=slot.point0.numpy()[:count],
+            point1=slot.point1.numpy()[:count],
+            normal=slot.normal.numpy()[:count],
+            force=None if slot.force is None else slot.force.numpy()[:count],
+        )
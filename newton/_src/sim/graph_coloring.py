@@ -487,3 +487,193 @@ def color_rigid_bodies(
     color_groups = color_graph(num_bodies, edge_indices_wp, balance_colors, target_max_min_color_ratio, algorithm)
 
     return color_groups
+
+
+class IncrementalGraphColoring:
+    """
+    Maintains a graph coloring under edge insertions and removals without recoloring the whole graph.
+
+    Removing an edge never invalidates a coloring, so removals only update the adjacency. When an inserted edge
+    connects two nodes of the same color, one endpoint is moved to the least populated existing color that none of its
+    neighbors use, and a new color is opened only when every existing color is taken. All other nodes keep their
+    colors, so color group indices stay stable and only the touched groups have to be re-uploaded, which lets
+    :class:`newton.solvers.SolverVBD` keep running on the updated :attr:`newton.Model.particle_color_groups` or
+    :attr:`newton.Model.body_color_groups` after :meth:`update_model`.
+
+    Edges are reference counted: an edge listed several times (e.g. an edge shared by two triangles) stays in the
+    graph until it has been removed as many times as it was added. Pass each element's edges, duplicates included,
+    when the graph changes element by element, as in cloth tearing.
+
+    Groups that become empty are kept so color indices remain stable; a full :func:`color_graph` call compacts them.
+
+    Args:
+        num_nodes: The number of nodes in the graph.
+        graph_edge_indices: A `wp.array` or `np.ndarray` of shape (number_edges, 2).
+        color_groups: Initial coloring in the format returned by :func:`color_graph`. If ``None``, the graph is
+            colored with :func:`color_graph` using ``balance_colors``, ``target_max_min_color_ratio`` and
+            ``algorithm``.
+        balance_colors: Forwarded to :func:`color_graph` when ``color_groups`` is ``None``.
+        target_max_min_color_ratio: Forwarded to :func:`color_graph` when ``color_groups`` is ``None``.
+        algorithm: Forwarded to :func:`color_graph` when ``color_groups`` is ``None``.
+    """
+
+    def __init__(
+        self,
+        num_nodes: int,
+        graph_edge_indices: wp.array2d[int] | np.ndarray,
+        color_groups: list | None = None,
+        balance_colors: bool = True,
+        target_max_min_color_ratio: float = 1.1,
+        algorithm: ColoringAlgorithm = ColoringAlgorithm.MCS,
+    ):
+        edges = self._edges_to_numpy(graph_edge_indices, num_nodes)
+        if color_groups is None:
+            color_groups = color_graph(
+                num_nodes,
+                wp.array(_canonicalize_edges_np(edges), dtype=int, device="cpu"),
+                balance_colors,
+                target_max_min_color_ratio,
+                algorithm,
+            )
+            if num_nodes > 0 and not color_groups:
+                color_groups = [np.arange(num_nodes, dtype=int)]
+
+        self.num_nodes = num_nodes
+        self._colors = np.full(num_nodes, -1, dtype=np.int32)
+        for color, group in enumerate(color_groups):
+            self._colors[np.asarray(group, dtype=int)] = color
+        if num_nodes > 0 and np.any(self._colors < 0):
+            raise ValueError("color_groups must assign a color to every node")
+        if len(edges) and np.any(self._colors[edges[:, 0]] == self._colors[edges[:, 1]]):
+            raise ValueError("color_groups is not a valid coloring of graph_edge_indices")
+
+        self._group_sizes = np.bincount(self._colors, minlength=len(color_groups)).tolist() if num_nodes else []
+        self._adjacency: list[dict[int, int]] = [{} for _ in range(num_nodes)]
+        for u, v in edges.tolist():
+            self._link(u, v, 1)
+        self._dirty_colors: set[int] = set()
+
+    @staticmethod
+    def _edges_to_numpy(edges: wp.array2d[int] | np.ndarray, num_nodes: int) -> np.ndarray:
+        if isinstance(edges, wp.array):
+            edges = edges.numpy()
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        if len(edges) and (edges.min() < 0 or edges.max() >= num_nodes):
+            raise ValueError(f"Edge indices must lie in [0, {num_nodes}), got range [{edges.min()}, {edges.max()}]")
+        return edges[edges[:, 0] != edges[:, 1]]
+
+    def _link(self, u: int, v: int, count: int) -> None:
+        for a, b in ((u, v), (v, u)):
+            neighbors = self._adjacency[a]
+            multiplicity = neighbors.get(b, 0) + count
+            if multiplicity > 0:
+                neighbors[b] = multiplicity
+            else:
+                neighbors.pop(b, None)
+
+    @property
+    def num_colors(self) -> int:
+        """Number of color groups, including groups emptied by recoloring."""
+        return len(self._group_sizes)
+
+    @property
+    def colors(self) -> np.ndarray:
+        """Color index of every node, shape (num_nodes,)."""
+        return self._colors.copy()
+
+    @property
+    def color_groups(self) -> list[np.ndarray]:
+        """Node indices per color in the format returned by :func:`color_graph`."""
+        return [self.color_group(color) for color in range(self.num_colors)]
+
+    def color_group(self, color: int) -> np.ndarray:
+        """Return the node indices of one color."""
+        return np.flatnonzero(self._colors == color).astype(int)
+
+    def neighbors(self, node: int) -> list[int]:
+        """Return the nodes currently adjacent to *node*."""
+        return list(self._adjacency[node])
+
+    def add_edges(self, edges: wp.array2d[int] | np.ndarray) -> np.ndarray:
+        """
+        Insert edges and repair the coloring around them.
+
+        Args:
+            edges: Edges to insert, shape (number_edges, 2).
+
+        Returns:
+            The indices of the nodes whose color changed.
+        """
+        edges = self._edges_to_numpy(edges, self.num_nodes)
+        for u, v in edges.tolist():
+            self._link(u, v, 1)
+
+        recolored = []
+        for u, v in edges.tolist():
+            if self._colors[u] != self._colors[v]:
+                continue
+            # Move the endpoint with fewer neighbors: it is the cheapest to place and least likely to need a new color.
+            node = u if len(self._adjacency[u]) <= len(self._adjacency[v]) else v
+            self._recolor(node)
+            recolored.append(node)
+        return np.array(recolored, dtype=int)
+
+    def remove_edges(self, edges: wp.array2d[int] | np.ndarray) -> None:
+        """
+        Remove edges. The existing coloring remains valid, so no node changes color.
+
+        Args:
+            edges: Edges to remove, shape (number_edges, 2). Edges not in the graph are ignored.
+        """
+        edges = self._edges_to_numpy(edges, self.num_nodes)
+        for u, v in edges.tolist():
+            if v in self._adjacency[u]:
+                self._link(u, v, -1)
+
+    def _recolor(self, node: int) -> None:
+        old_color = int(self._colors[node])
+        used = {int(self._colors[neighbor]) for neighbor in self._adjacency[node]}
+        free = [color for color in range(self.num_colors) if color not in used and color != old_color]
+        if free:
+            new_color = min(free, key=lambda color: self._group_sizes[color])
+        else:
+            new_color = self.num_colors
+            self._group_sizes.append(0)
+        self._colors[node] = new_color
+        self._group_sizes[old_color] -= 1
+        self._group_sizes[new_color] += 1
+        self._dirty_colors.update((old_color, new_color))
+
+    def update_model(self, model, kind: Literal["particle", "body"] = "particle") -> list[int]:
+        """
+        Write the colors changed since the last update into a model's coloring attributes.
+
+        Only the touched entries of ``model.<kind>_color_groups`` are replaced and new colors are appended, so the
+        list object and all unchanged group arrays stay in place. ``model.<kind>_colors`` is updated as well.
+
+        Args:
+            model: The :class:`newton.Model` whose coloring is updated.
+            kind: ``"particle"`` to update :attr:`newton.Model.particle_color_groups` or ``"body"`` to update
+                :attr:`newton.Model.body_color_groups`.
+
+        Returns:
+            The sorted indices of the color groups that were written.
+        """
+        if kind not in ("particle", "body"):
+            raise ValueError(f"kind must be 'particle' or 'body', got {kind!r}")
+        groups = getattr(model, f"{kind}_color_groups")
+        colors = getattr(model, f"{kind}_colors")
+        if colors is not None and colors.shape[0] != self.num_nodes:
+            raise ValueError(f"model.{kind}_colors has {colors.shape[0]} entries, expected {self.num_nodes}")
+
+        dirty = sorted(self._dirty_colors | set(range(len(groups), self.num_colors)))
+        for color in dirty:
+            group = wp.array(self.color_group(color), dtype=int, device=model.device)
+            if color < len(groups):
+                groups[color] = group
+            else:
+                groups.append(group)
+        if dirty and colors is not None:
+            colors.assign(self._colors)
+        self._dirty_colors.clear()
+        return dirty
@@ -46,10 +46,14 @@ def _eval_fk_articulation_batched(
     joint_dof_dim: wp.array2d[wp.int32],
     body_com: wp.array[wp.vec3],
     body_flags: wp.array[wp.int32],
+    active: wp.array[wp.int32],
     body_q: wp.array2d[wp.transform],
     body_qd: wp.array2d[wp.spatial_vector],
 ):
     problem_idx, articulation_idx = wp.tid()
+    if active:
+        if active[problem_idx] == 0:
+            return
 
     joint_start = articulation_start[articulation_idx]
     joint_end = articulation_end[articulation_idx]
@@ -77,8 +81,12 @@ def _eval_fk_articulation_batched(
     )
 
 
-def eval_fk_batched(model, joint_q, joint_qd, body_q, body_qd):
-    """Compute batched forward kinematics for a set of articulations."""
+def eval_fk_batched(model, joint_q, joint_qd, body_q, body_qd, active=None):
+    """Compute batched forward kinematics for a set of articulations.
+
+    Rows whose ``active`` flag is zero are skipped and keep their previous
+    body transforms.
+    """
     n_problems = joint_q.shape[0]
     wp.launch(
         kernel=_eval_fk_articulation_batched,
@@ -100,6 +108,7 @@ def eval_fk_batched(model, joint_q, joint_qd, body_q, body_qd):
             model.joint_dof_dim,
             model.body_com,
             model.body_flags,
+            active,
         ],
         outputs=[body_q, body_qd],
         device=model.device,
@@ -110,9 +119,13 @@ def eval_fk_batched(model, joint_q, joint_qd, body_q, body_qd):
 def fk_accum(
     joint_parent: wp.array[wp.int32],
     X_local: wp.array2d[wp.transform],
+    active: wp.array[wp.int32],
     body_q: wp.array2d[wp.transform],
 ):
     problem_idx, local_joint_idx = wp.tid()
+    if active:
+        if active[problem_idx] == 0:
+            return
     Xw = X_local[problem_idx, local_joint_idx]
     parent = joint_parent[local_joint_idx]
     while parent >= 0:
@@ -125,9 +138,13 @@ def fk_accum(
 def compute_costs(
     residuals: wp.array2d[wp.float32],
     num_residuals: int,
+    active: wp.array[wp.int32],
     costs: wp.array[wp.float32],
 ):
     problem_idx = wp.tid()
+    if active:
+        if active[problem_idx] == 0:
+            return
     cost = float(0.0)
     for i in range(num_residuals):
         r = residuals[problem_idx, i]
@@ -30,12 +30,23 @@ def _scale_negate(
 
 
 @wp.kernel
-def _fan_out_problem_idx(
-    batch_problem_idx: wp.array[wp.int32],
-    out_indices: wp.array2d[wp.int32],
+def _freeze_inactive_rows(
+    active: wp.array[wp.int32],  # (n_batch)
+    # outputs
+    dq: wp.array2d[wp.float32],  # (n_batch, n_dofs)
+):
+    row, dof_idx = wp.tid()
+    if active[row] == 0:
+        dq[row, dof_idx] = 0.0
+
+
+@wp.kernel
+def _fan_out_rows(
+    row_values: wp.array[wp.int32],
+    out_values: wp.array2d[wp.int32],
 ):
     row_idx, candidate_idx = wp.tid()
-    out_indices[row_idx, candidate_idx] = batch_problem_idx[row_idx]
+    out_values[row_idx, candidate_idx] = row_values[row_idx]
 
 
 @wp.kernel
@@ -84,6 +95,7 @@ class BatchCtx:
     residuals: wp.array2d[wp.float32]
     fk_body_q: wp.array2d[wp.transform]
     problem_idx: wp.array[wp.int32]
+    active: wp.array[wp.int32] | None = None
 
     # AUTODIFF and MIXED
     fk_body_qd: wp.array2d[wp.spatial_vector] | None = None
@@ -205,6 +217,7 @@ class IKOptimizerLBFGS:
         self._alloc_solver_buffers(grad)
         self.problem_idx = problem_idx if problem_idx is not None else self.problem_idx_identity
         self._alloc_line_search_buffers(grad, line_search_alphas)
+        self._active: wp.array[wp.int32] | None = None
 
         self.tape = wp.Tape() if grad else None
 
@@ -280,14 +293,16 @@ class IKOptimizerLBFGS:
         if self.n_line_search > 0:
             self.candidate_problem_idx = wp.zeros((self.n_batch, self.n_line_search), dtype=wp.int32, device=device)
             wp.launch(
-                _fan_out_problem_idx,
+                _fan_out_rows,
                 dim=[self.n_batch, self.n_line_search],
                 inputs=[self.problem_idx],
                 outputs=[self.candidate_problem_idx],
                 device=device,
             )
+            self.candidate_active = wp.zeros((self.n_batch, self.n_line_search), dtype=wp.int32, device=device)
         else:
             self.candidate_problem_idx = None
+            self.candidate_active = None
         self.candidate_costs = wp.zeros((self.n_batch, self.n_line_search), dtype=wp.float32, device=device)
         self.best_step_idx = wp.zeros(self.n_batch, dtype=wp.int32, device=device)
         self.initial_slope = wp.zeros(self.n_batch, dtype=wp.float32, device=device)
@@ -434,6 +449,7 @@ class IKOptimizerLBFGS:
             residuals=residuals if residuals is not None else self.residuals,
             fk_body_q=self.body_q,
             problem_idx=self.problem_idx,
+            active=self._active,
             fk_body_qd=self.body_qd,
             dq_dof=self.dq_dof,
             joint_q_proposed=self.joint_q_proposed,
@@ -490,6 +506,7 @@ class IKOptimizerLBFGS:
             residuals=_reshape2(self.candidate_residuals),
             fk_body_q=_reshape2(self.cand_body_q),
             problem_idx=problem_idx_flat,
+            active=self.candidate_active.flatten() if self._active is not None else None,
             fk_body_qd=_reshape2(cand_body_qd) if cand_body_qd is not None else None,
             dq_dof=_reshape2(cand_dq_dof) if cand_dq_dof is not None else None,
             joint_q_proposed=_reshape2(cand_joint_q_proposed) if cand_joint_q_proposed is not None else None,
@@ -587,6 +604,7 @@ class IKOptimizerLBFGS:
                 dq_in=ctx.dq_dof,
                 joint_q_out=ctx.joint_q_proposed,
                 joint_qd_out=ctx.joint_qd,
+                active=ctx.active,
             )
 
             res_ctx = BatchCtx(
@@ -594,6 +612,7 @@ class IKOptimizerLBFGS:
                 residuals=ctx.residuals,
                 fk_body_q=ctx.fk_body_q,
                 problem_idx=ctx.problem_idx,
+                active=ctx.active,
                 fk_body_qd=ctx.fk_body_qd,
                 joint_qd=ctx.joint_qd,
             )
@@ -634,6 +653,7 @@ class IKOptimizerLBFGS:
             joint_q_in=ctx.joint_q,
             body_q=ctx.fk_body_q,
             joint_S_s_out=ctx.motion_subspace,
+            active=ctx.active,
         )
 
         def _emit_jac(obj, off, body_q_view, q_view, model, J_view, S_view):
@@ -658,7 +678,7 @@ class IKOptimizerLBFGS:
         wp.launch_tiled(
             self._compute_gradient_jtr_tiled,
             dim=ctx.joint_q.shape[0],
-            inputs=[ctx.jacobian_out, ctx.residuals],
+            inputs=[ctx.jacobian_out, ctx.residuals, ctx.active],
             outputs=[target],
             block_dim=self.TILE_THREADS,
             device=self.device,
@@ -699,6 +719,7 @@ class IKOptimizerLBFGS:
             ctx.joint_qd,
             ctx.fk_body_q,
             ctx.fk_body_qd,
+            ctx.active,
         )
 
         ctx.residuals.zero_()
@@ -711,6 +732,7 @@ class IKOptimizerLBFGS:
             ctx.fk_body_q,
             ctx.fk_X_local,
             ctx.joint_q.shape[0],
+            ctx.active,
         )
 
         ctx.residuals.zero_()
@@ -765,6 +787,10 @@ class IKOptimizerLBFGS:
         joint_q_in: wp.array2d[wp.float32],
         joint_q_out: wp.array2d[wp.float32],
         iterations: int = 50,
+        *,
+        active: wp.array[wp.int32] | None = None,
+        resume: bool = False,
+        targets_changed: bool = False,
     ) -> None:
         """Run several L-BFGS iterations on a batch of joint configurations.
 
@@ -774,6 +800,15 @@ class IKOptimizerLBFGS:
                 [n_batch, joint_coord_count]. It may alias ``joint_q_in`` for
                 in-place updates.
             iterations: Number of L-BFGS iterations to execute.
+            active: Optional per-row flags, shape [n_batch]. Rows with a zero
+                flag skip the per-row kernels, take zero steps, and keep their
+                coordinates.
+            resume: If ``True``, continue the previous solve with its
+                correction history instead of starting with a gradient step.
+            targets_changed: Set together with ``resume`` when the objective
+                targets changed since the previous call. The stored gradient
+                then belongs to the old targets, so the first iteration skips
+                the correction-pair update and keeps the existing history.
         """
         if joint_q_in.shape != (self.n_batch, self.n_coords):
             raise ValueError("joint_q_in has incompatible shape")
@@ -785,8 +820,19 @@ class IKOptimizerLBFGS:
 
         joint_q = joint_q_out
 
-        for i in range(iterations):
-            self._step(joint_q, iteration=i)
+        self._active = active
+        if active is not None and self.n_line_search > 0:
+            wp.launch(
+                _fan_out_rows,
+                dim=[self.n_batch, self.n_line_search],
+                inputs=[active],
+                outputs=[self.candidate_active],
+                device=self.device,
+            )
+        start = 1 if resume else 0
+        for i in range(start, start + iterations):
+            self._step(joint_q, iteration=i, update_history=not (targets_changed and i == start))
+        self._active = None
 
     def reset(self) -> None:
         """Clear L-BFGS history and cached line-search state."""
@@ -818,7 +864,7 @@ class IKOptimizerLBFGS:
         wp.launch(
             compute_costs,
             dim=self.n_batch,
-            inputs=[self.residuals, self.n_residuals],
+            inputs=[self.residuals, self.n_residuals, self._active],
             outputs=[self.costs],
             device=self.device,
         )
@@ -845,6 +891,7 @@ class IKOptimizerLBFGS:
         joint_q_in: wp.array2d[wp.float32],
         body_q: wp.array2d[wp.transform],
         joint_S_s_out: wp.array2d[wp.spatial_vector],
+        active: wp.array[wp.int32] | None = None,
     ) -> None:
         n_joints = self.model.joint_count
         batch = body_q.shape[0]
@@ -863,6 +910,7 @@ class IKOptimizerLBFGS:
                 body_q,
                 self.model.body_com,
                 self.model.joint_X_p,
+                active,
             ],
             outputs=[
                 joint_S_s_out,
@@ -878,6 +926,7 @@ class IKOptimizerLBFGS:
         joint_q_out: wp.array2d[wp.float32],
         joint_qd_out: wp.array2d[wp.float32],
         step_size: float = 1.0,
+        active: wp.array[wp.int32] | None = None,
     ) -> None:
         batch = joint_q.shape[0]
 
@@ -897,6 +946,7 @@ class IKOptimizerLBFGS:
                 dq_in,
                 joint_qd_out,
                 step_size,
+                active,
             ],
             outputs=[
                 joint_q_out,
@@ -906,7 +956,7 @@ class IKOptimizerLBFGS:
         )
         joint_qd_out.zero_()
 
-    def _step(self, joint_q: wp.array2d[wp.float32], iteration: int = 0) -> None:
+    def _step(self, joint_q: wp.array2d[wp.float32], iteration: int = 0, update_history: bool = True) -> None:
         """Execute one L-BFGS iteration."""
         self.compute_costs(joint_q)
 
@@ -922,6 +972,7 @@ class IKOptimizerLBFGS:
                 outputs=[self.last_step_dq],
                 device=self.device,
             )
+            self._freeze_inactive_steps()
             self._integrate_dq(
                 joint_q,
                 dq_in=self.last_step_dq,
@@ -932,7 +983,8 @@ class IKOptimizerLBFGS:
             wp.copy(joint_q, self.joint_q_proposed)
             return
 
-        self._update_history()
+        if update_history:
+            self._update_history()
         self._compute_search_direction()
         self._compute_initial_slope()
 
@@ -941,12 +993,24 @@ class IKOptimizerLBFGS:
         self._line_search(joint_q)
         self._line_search_select_best(joint_q)
 
+    def _freeze_inactive_steps(self) -> None:
+        """Zero the pending step of rows excluded by the ``active`` flags of :meth:`step`."""
+        if self._active is None:
+            return
+        wp.launch(
+            _freeze_inactive_rows,
+            dim=[self.n_batch, self.n_dofs],
+            inputs=[self._active],
+            outputs=[self.last_step_dq],
+            device=self.device,
+        )
+
     def _compute_initial_slope(self) -> None:
         """Compute and store dot(gradient, search_direction) for the current state."""
         wp.launch_tiled(
             self._compute_slope_tiled,
             dim=[self.n_batch],
-            inputs=[self.gradient, self.search_direction],
+            inputs=[self.gradient, self.search_direction, self._active],
             outputs=[self.initial_slope],
             block_dim=self.TILE_THREADS,
             device=self.device,
@@ -966,6 +1030,7 @@ class IKOptimizerLBFGS:
                 self.history_count,
                 self.history_start,
                 self.h0_scale,
+                self._active,
             ],
             outputs=[
                 self.search_direction,
@@ -985,6 +1050,7 @@ class IKOptimizerLBFGS:
                 self.gradient,
                 self.gradient_prev,
                 self.history_len,
+                self._active,
             ],
             outputs=[
                 self.s_history,
@@ -1028,6 +1094,7 @@ class IKOptimizerLBFGS:
             joint_q_out=cand_ctx.joint_q_proposed,
             joint_qd_out=cand_ctx.joint_qd,
             step_size=1.0,
+            active=cand_ctx.active,
         )
         wp.copy(cand_ctx.joint_q, cand_ctx.joint_q_proposed)
 
@@ -1040,7 +1107,7 @@ class IKOptimizerLBFGS:
         wp.launch(
             compute_costs,
             dim=B,
-            inputs=[cand_ctx.residuals, self.n_residuals],
+            inputs=[cand_ctx.residuals, self.n_residuals, cand_ctx.active],
             outputs=[self.candidate_costs.flatten()],
             device=self.device,
         )
@@ -1051,6 +1118,7 @@ class IKOptimizerLBFGS:
             inputs=[
                 self.candidate_gradients,
                 self.search_direction,
+                self._active,
             ],
             outputs=[
                 self.candidate_slopes,
@@ -1078,6 +1146,7 @@ class IKOptimizerLBFGS:
                 self.line_search_alphas,
                 self.wolfe_c1,
                 self.wolfe_c2,
+                self._active,
             ],
             outputs=[
                 self.best_step_idx,
@@ -1086,6 +1155,7 @@ class IKOptimizerLBFGS:
             block_dim=self.TILE_THREADS,
             device=self.device,
         )
+        self._freeze_inactive_steps()
 
         self._integrate_dq(
             self.joint_q_proposed,
@@ -1093,6 +1163,7 @@ class IKOptimizerLBFGS:
             joint_q_out=joint_q,
             joint_qd_out=self.qd_zero,
             step_size=1.0,
+            active=self._active,
         )
 
     @classmethod
@@ -1104,10 +1175,14 @@ class IKOptimizerLBFGS:
             # inputs
             gradient: wp.array2d[wp.float32],  # (n_batch, n_dofs)
             search_direction: wp.array2d[wp.float32],  # (n_batch, n_dofs)
+            active: wp.array[wp.int32],  # (n_batch)
             # outputs
             slope_out: wp.array[wp.float32],  # (n_batch,)
         ):
             row = wp.tid()
+            if active:
+                if active[row] == 0:
+                    return
             DOF = _Specialized.TILE_N_DOFS
 
             g = wp.tile_load(gradient[row], shape=(DOF,))
@@ -1121,10 +1196,14 @@ class IKOptimizerLBFGS:
             # inputs
             candidate_gradient: wp.array3d[wp.float32],  # (n_batch, n_line_steps, n_dofs)
             search_direction: wp.array2d[wp.float32],  # (n_batch, n_dofs)
+            active: wp.array[wp.int32],  # (n_batch)
             # outputs
             slope_out: wp.array2d[wp.float32],  # (n_batch, n_line_steps)
         ):
             row, step_idx = wp.tid()
+            if active:
+                if active[row] == 0:
+                    return
             DOF = _Specialized.TILE_N_DOFS
 
             g = wp.tile_load(candidate_gradient[row, step_idx], shape=(DOF,))
@@ -1138,10 +1217,14 @@ class IKOptimizerLBFGS:
             # inputs
             jacobian: wp.array3d[wp.float32],  # (n_batch, n_residuals, n_dofs)
             residuals: wp.array2d[wp.float32],  # (n_batch, n_residuals)
+            active: wp.array[wp.int32],  # (n_batch)
             # outputs
             gradient: wp.array2d[wp.float32],  # (n_batch, n_dofs)
         ):
             row = wp.tid()
+            if active:
+                if active[row] == 0:
+                    return
 
             RES = _Specialized.TILE_N_RESIDUALS
             DOF = _Specialized.TILE_N_DOFS
@@ -1166,10 +1249,14 @@ class IKOptimizerLBFGS:
             history_count: wp.array[wp.int32],  # (n_batch)
             history_start: wp.array[wp.int32],  # (n_batch)
             h0_scale: float,  # scalar
+            active: wp.array[wp.int32],  # (n_batch)
             # outputs
             search_direction: wp.array2d[wp.float32],  # (n_batch, n_dofs)
         ):
             row = wp.tid()
+            if active:
+                if active[row] == 0:
+                    return
             DOF = _Specialized.TILE_N_DOFS
             M_HIST = _Specialized.TILE_HISTORY_LEN
 
@@ -1223,6 +1310,7 @@ class IKOptimizerLBFGS:
             gradient: wp.array2d[wp.float32],  # (n_batch, n_dofs)
             gradient_prev: wp.array2d[wp.float32],  # (n_batch, n_dofs)
             history_len: int,
+            active: wp.array[wp.int32],  # (n_batch)
             # outputs
             s_history: wp.array3d[wp.float32],
             y_history: wp.array3d[wp.float32],
@@ -1231,6 +1319,9 @@ class IKOptimizerLBFGS:
             history_start: wp.array[wp.int32],
         ):
             row = wp.tid()
+            if active:
+                if active[row] == 0:
+                    return
             DOF = _Specialized.TILE_N_DOFS
 
             s_k = wp.tile_load(last_step[row], shape=(DOF,))
@@ -1269,11 +1360,15 @@ class IKOptimizerLBFGS:
             line_search_alphas: wp.array[wp.float32],  # (n_line_steps)
             wolfe_c1: float,  # scalar
             wolfe_c2: float,  # scalar
+            active: wp.array[wp.int32],  # (n_batch)
             # outputs
             best_step_idx_out: wp.array[wp.int32],  # (n_batch)
             last_step_out: wp.array2d[wp.float32],  # (n_batch, n_dofs)
         ):
             row = wp.tid()
+            if active:
+                if active[row] == 0:
+                    return
             N_STEPS = _Specialized.TILE_N_LINE_STEPS
             DOF = _Specialized.TILE_N_DOFS
 
@@ -1370,6 +1465,7 @@ class IKOptimizerLBFGS:
             joint_qd_curr: wp.array2d[wp.float32],  # (n_batch, n_dofs)  (typically all-zero)
             dq_dof: wp.array2d[wp.float32],  # (n_batch, n_dofs)  ← update direction (q̇)
             dt: float,  # step scale (usually 1.0)
+            active: wp.array[wp.int32],  # (n_batch)
             # outputs
             joint_q_out: wp.array2d[wp.float32],  # (n_batch, n_coords)
             joint_qd_out: wp.array2d[wp.float32],  # (n_batch, n_dofs)
@@ -1385,6 +1481,9 @@ class IKOptimizerLBFGS:
             free, D6, ...) work out of the box.
             """
             row, joint_idx = wp.tid()
+            if active:
+                if active[row] == 0:
+                    return
 
             # Static joint metadata
             t = joint_type[joint_idx]
@@ -1436,10 +1535,14 @@ class IKOptimizerLBFGS:
             body_q: wp.array2d[wp.transform],  # (n_batch, n_bodies)
             body_com: wp.array[wp.vec3],  # (n_bodies)
             joint_X_p: wp.array[wp.transform],  # (n_joints)
+            active: wp.array[wp.int32],  # (n_batch)
             # outputs
             joint_S_s: wp.array2d[wp.spatial_vector],  # (n_batch, n_joint_dof_count)
         ):
             row, joint_idx = wp.tid()
+            if active:
+                if active[row] == 0:
+                    return
 
             type = joint_type[joint_idx]
             parent = joint_parent[joint_idx]
@@ -1497,10 +1600,14 @@ class IKOptimizerLBFGS:
             joint_dof_dim: wp.array2d[wp.int32],  # (n_joints, 2)  → (lin, ang)
             joint_X_p: wp.array[wp.transform],  # (n_joints)
             joint_X_c: wp.array[wp.transform],  # (n_joints)
+            active: wp.array[wp.int32],  # (n_batch)
             # outputs
             X_local_out: wp.array2d[wp.transform],  # (n_batch, n_joints)
         ):
             row, local_joint_idx = wp.tid()
+            if active:
+                if active[row] == 0:
+                    return
 
             t = joint_type[local_joint_idx]
             q_start = joint_q_start[local_joint_idx]
@@ -1521,7 +1628,7 @@ class IKOptimizerLBFGS:
             X_rel = joint_X_p[local_joint_idx] * X_j * wp.transform_inverse(joint_X_c[local_joint_idx])
             X_local_out[row, local_joint_idx] = X_rel
 
-        def _fk_two_pass(model, joint_q, body_q, X_local, n_batch):
+        def _fk_two_pass(model, joint_q, body_q, X_local, n_batch, active=None):
             """Compute forward kinematics using two-pass algorithm.
 
             Args:
@@ -1530,6 +1637,7 @@ class IKOptimizerLBFGS:
                 body_q: 2D array [n_batch, body_count] (output)
                 X_local: 2D array [n_batch, joint_count] (workspace)
                 n_batch: Number of rows to process
+                active: Optional per-row flags [n_batch]; rows with a zero flag are skipped
             """
             wp.launch(
                 _fk_local,
@@ -1543,6 +1651,7 @@ class IKOptimizerLBFGS:
                     model.joint_dof_dim,
                     model.joint_X_p,
                     model.joint_X_c,
+                    active,
                 ],
                 outputs=[
                     X_local,
@@ -1556,6 +1665,7 @@ class IKOptimizerLBFGS:
                 inputs=[
                     model.joint_parent,
                     X_local,
+                    active,
                 ],
                 outputs=[
                     body_q,
@@ -24,6 +24,7 @@ class BatchCtx:
     residuals: wp.array2d[wp.float32]
     fk_body_q: wp.array2d[wp.transform]
     problem_idx: wp.array[wp.int32]
+    active: wp.array[wp.int32] | None = None
 
     # AUTODIFF and MIXED
     fk_body_qd: wp.array2d[wp.spatial_vector] | None = None
@@ -43,11 +44,16 @@ def _accept_reject(
     cost_prop: wp.array[wp.float32],
     pred_red: wp.array[wp.float32],
     rho_min: float,
+    active: wp.array[wp.int32],
     accept: wp.array[wp.int32],
 ):
     row = wp.tid()
     rho = (cost_curr[row] - cost_prop[row]) / (pred_red[row] + 1.0e-8)
     accept[row] = wp.int32(1) if rho >= rho_min else wp.int32(0)
+    # frozen rows reject every step so their coordinates stay unchanged
+    if active:
+        if active[row] == 0:
+            accept[row] = wp.int32(0)
 
 
 @wp.kernel
@@ -219,6 +225,7 @@ class IKOptimizerLM:
 
         self._alloc_solver_buffers(grad)
         self.problem_idx = problem_idx if problem_idx is not None else self.problem_idx_identity
+        self._active: wp.array[wp.int32] | None = None
         self.tape = wp.Tape() if grad else None
 
         self._build_residual_offsets()
@@ -328,6 +335,7 @@ class IKOptimizerLM:
             residuals=residuals if residuals is not None else self.residuals,
             fk_body_q=self.body_q,
             problem_idx=self.problem_idx,
+            active=self._active,
             fk_body_qd=getattr(self, "body_qd", None),
             dq_dof=self.dq_dof,
             joint_q_proposed=self.joint_q_proposed,
@@ -392,6 +400,7 @@ class IKOptimizerLM:
             ctx.joint_qd,
             ctx.fk_body_q,
             ctx.fk_body_qd,
+            ctx.active,
         )
 
         ctx.residuals.zero_()
@@ -404,6 +413,7 @@ class IKOptimizerLM:
             ctx.fk_body_q,
             ctx.fk_X_local,
             ctx.joint_q.shape[0],
+            ctx.active,
         )
 
         ctx.residuals.zero_()
@@ -460,6 +470,7 @@ class IKOptimizerLM:
                 dq_in=ctx.dq_dof,
                 joint_q_out=ctx.joint_q_proposed,
                 joint_qd_out=ctx.joint_qd,
+                active=ctx.active,
             )
 
             res_ctx = BatchCtx(
@@ -467,6 +478,7 @@ class IKOptimizerLM:
                 residuals=ctx.residuals,
                 fk_body_q=ctx.fk_body_q,
                 problem_idx=ctx.problem_idx,
+                active=ctx.active,
                 fk_body_qd=ctx.fk_body_qd,
                 joint_qd=ctx.joint_qd,
             )
@@ -489,6 +501,7 @@ class IKOptimizerLM:
             joint_q_in=ctx.joint_q,
             body_q=ctx.fk_body_q,
             joint_S_s_out=ctx.motion_subspace,
+            active=ctx.active,
         )
 
         def _emit(obj, off, body_q_view, joint_q_view, model, jac_view, motion_subspace_view):
@@ -512,6 +525,9 @@ class IKOptimizerLM:
         joint_q_out: wp.array2d[wp.float32],
         iterations: int = 10,
         step_size: float = 1.0,
+        *,
+        active: wp.array[wp.int32] | None = None,
+        resume: bool = False,
     ) -> None:
         """Run several LM iterations on a batch of joint configurations.
 
@@ -523,6 +539,12 @@ class IKOptimizerLM:
             iterations: Number of LM iterations to execute.
             step_size: Scalar applied to each computed update before
                 integration.
+            active: Optional per-row flags, shape [n_batch]. Rows with a zero
+                flag skip the per-row kernels, reject every step, and keep
+                their coordinates.
+            resume: If ``True``, keep the per-row damping of the previous call
+                and continue that solve instead of restarting from
+                ``lambda_initial``.
         """
         if joint_q_in.shape != (self.n_batch, self.n_coords):
             raise ValueError("joint_q_in has incompatible shape")
@@ -534,9 +556,12 @@ class IKOptimizerLM:
 
         joint_q = joint_q_out
 
-        self.lambda_values.fill_(self.lambda_initial)
+        if not resume:
+            self.lambda_values.fill_(self.lambda_initial)
+        self._active = active
         for i in range(iterations):
             self._step(joint_q, step_size=step_size, iteration=i)
+        self._active = None
 
     def _compute_residuals(
         self,
@@ -559,6 +584,7 @@ class IKOptimizerLM:
         joint_q_in: wp.array2d[wp.float32],
         body_q: wp.array2d[wp.transform],
         joint_S_s_out: wp.array2d[wp.spatial_vector],
+        active: wp.array[wp.int32] | None = None,
     ) -> None:
         n_joints = self.model.joint_count
         batch = body_q.shape[0]
@@ -577,6 +603,7 @@ class IKOptimizerLM:
                 body_q,
                 self.model.body_com,
                 self.model.joint_X_p,
+                active,
             ],
             outputs=[
                 joint_S_s_out,
@@ -592,6 +619,7 @@ class IKOptimizerLM:
         joint_q_out: wp.array2d[wp.float32],
         joint_qd_out: wp.array2d[wp.float32],
         step_size: float = 1.0,
+        active: wp.array[wp.int32] | None = None,
     ) -> None:
         batch = joint_q.shape[0]
 
@@ -611,6 +639,7 @@ class IKOptimizerLM:
                 dq_in,
                 joint_qd_out,
                 step_size,
+                active,
             ],
             outputs=[
                 joint_q_out,
@@ -639,7 +668,7 @@ class IKOptimizerLM:
         wp.launch(
             compute_costs,
             dim=self.n_batch,
-            inputs=[ctx_curr.residuals, self.n_residuals],
+            inputs=[ctx_curr.residuals, self.n_residuals, self._active],
             outputs=[self.costs],
             device=self.device,
         )
@@ -652,7 +681,12 @@ class IKOptimizerLM:
 
         self.dq_dof.zero_()
         self._solve_tiled(
-            ctx_curr.jacobian_out, self.residuals_3d, self.lambda_values, self.dq_dof, self.pred_reduction
+            ctx_curr.jacobian_out,
+            self.residuals_3d,
+            self.lambda_values,
+            self._active,
+            self.dq_dof,
+            self.pred_reduction,
         )
 
         self._integrate_dq(
@@ -661,6 +695,7 @@ class IKOptimizerLM:
             joint_q_out=self.joint_q_proposed,
             joint_qd_out=self.qd_zero,
             step_size=step_size,
+            active=self._active,
         )
 
         ctx_prop = self._ctx_solver(self.joint_q_proposed, residuals=self.residuals_proposed)
@@ -672,7 +707,7 @@ class IKOptimizerLM:
         wp.launch(
             compute_costs,
             dim=self.n_batch,
-            inputs=[self.residuals_proposed, self.n_residuals],
+            inputs=[self.residuals_proposed, self.n_residuals, self._active],
             outputs=[self.costs_proposed],
             device=self.device,
         )
@@ -680,7 +715,7 @@ class IKOptimizerLM:
         wp.launch(
             _accept_reject,
             dim=self.n_batch,
-            inputs=[self.costs, self.costs_proposed, self.pred_reduction, self.rho_min],
+            inputs=[self.costs, self.costs_proposed, self.pred_reduction, self.rho_min, self._active],
             outputs=[self.accept_flags],
             device=self.device,
         )
@@ -721,7 +756,7 @@ class IKOptimizerLM:
         wp.launch(
             compute_costs,
             dim=self.n_batch,
-            inputs=[self.residuals, self.n_residuals],
+            inputs=[self.residuals, self.n_residuals, self._active],
             outputs=[self.costs],
             device=self.device,
         )
@@ -732,6 +767,7 @@ class IKOptimizerLM:
         jacobian: wp.array3d[wp.float32],
         residuals: wp.array3d[wp.float32],
         lambda_values: wp.array[wp.float32],
+        active: wp.array[wp.int32] | None,
         dq_dof: wp.array2d[wp.float32],
         pred_reduction: wp.array[wp.float32],
     ) -> None:
@@ -746,11 +782,15 @@ class IKOptimizerLM:
             jacobians: wp.array3d[wp.float32],  # (n_batch, n_residuals, n_dofs)
             residuals: wp.array3d[wp.float32],  # (n_batch, n_residuals, 1)
             lambda_values: wp.array[wp.float32],  # (n_batch)
+            active: wp.array[wp.int32],  # (n_batch)
             # outputs
             dq_dof: wp.array2d[wp.float32],  # (n_batch, n_dofs)
             pred_reduction_out: wp.array[wp.float32],  # (n_batch)
         ):
             row = wp.tid()
+            if active:
+                if active[row] == 0:
+                    return
 
             RES = _Specialized.TILE_N_RESIDUALS
             DOF = _Specialized.TILE_N_DOFS
@@ -812,6 +852,7 @@ class IKOptimizerLM:
             joint_qd_curr: wp.array2d[wp.float32],  # (n_batch, n_dofs)  (typically all-zero)
             dq_dof: wp.array2d[wp.float32],  # (n_batch, n_dofs)  ← update direction (q̇)
             dt: float,  # step scale (usually 1.0)
+            active: wp.array[wp.int32],  # (n_batch)
             # outputs
             joint_q_out: wp.array2d[wp.float32],  # (n_batch, n_coords)
             joint_qd_out: wp.array2d[wp.float32],  # (n_batch, n_dofs)
@@ -827,6 +868,9 @@ class IKOptimizerLM:
             free, D6, ...) work out of the box.
             """
             row, joint_idx = wp.tid()
+            if active:
+                if active[row] == 0:
+                    return
 
             # Static joint metadata
             t = joint_type[joint_idx]
@@ -878,10 +922,14 @@ class IKOptimizerLM:
             body_q: wp.array2d[wp.transform],  # (n_batch, n_bodies)
             body_com: wp.array[wp.vec3],  # (n_bodies)
             joint_X_p: wp.array[wp.transform],  # (n_joints)
+            active: wp.array[wp.int32],  # (n_batch)
             # outputs
             joint_S_s: wp.array2d[wp.spatial_vector],  # (n_batch, n_joint_dof_count)
         ):
             row, joint_idx = wp.tid()
+            if active:
+                if active[row] == 0:
+                    return
 
             type = joint_type[joint_idx]
             parent = joint_parent[joint_idx]
@@ -939,10 +987,14 @@ class IKOptimizerLM:
             joint_dof_dim: wp.array2d[wp.int32],  # (n_joints, 2)  → (lin, ang)
             joint_X_p: wp.array[wp.transform],  # (n_joints)
             joint_X_c: wp.array[wp.transform],  # (n_joints)
+            active: wp.array[wp.int32],  # (n_batch)
             # outputs
             X_local_out: wp.array2d[wp.transform],  # (n_batch, n_joints)
         ):
             row, local_joint_idx = wp.tid()
+            if active:
+                if active[row] == 0:
+                    return
 
             t = joint_type[local_joint_idx]
             q_start = joint_q_start[local_joint_idx]
@@ -963,7 +1015,7 @@ class IKOptimizerLM:
             X_rel = joint_X_p[local_joint_idx] * X_j * wp.transform_inverse(joint_X_c[local_joint_idx])
             X_local_out[row, local_joint_idx] = X_rel
 
-        def _fk_two_pass(model, joint_q, body_q, X_local, n_batch):
+        def _fk_two_pass(model, joint_q, body_q, X_local, n_batch, active=None):
             """Compute forward kinematics using two-pass algorithm.
 
             Args:
@@ -972,6 +1024,7 @@ class IKOptimizerLM:
                 body_q: 2D array [n_batch, body_count] (output)
                 X_local: 2D array [n_batch, joint_count] (workspace)
                 n_batch: Number of rows to process
+                active: Optional per-row flags [n_batch]; rows with a zero flag are skipped
             """
             wp.launch(
                 _fk_local,
@@ -985,6 +1038,7 @@ class IKOptimizerLM:
                     model.joint_dof_dim,
                     model.joint_X_p,
                     model.joint_X_c,
+                    active,
                 ],
                 outputs=[
                     X_local,
@@ -998,6 +1052,7 @@ class IKOptimizerLM:
                 inputs=[
                     model.joint_parent,
                     X_local,
+                    active,
                 ],
                 outputs=[
                     body_q,
@@ -1015,13 +1070,14 @@ class IKOptimizerLM:
                 jac: wp.array3d[wp.float32],
                 res: wp.array3d[wp.float32],
                 lam: wp.array[wp.float32],
+                active: wp.array[wp.int32] | None,
                 dq: wp.array2d[wp.float32],
                 pred: wp.array[wp.float32],
             ) -> None:
                 wp.launch_tiled(
                     _lm_solve_tiled,
                     dim=[self.n_batch],
-                    inputs=[jac, res, lam, dq, pred],
+                    inputs=[jac, res, lam, active, dq, pred],
                     block_dim=self.TILE_THREADS,
                     device=self.device,
                 )
@@ -116,6 +116,21 @@ class IKObjective:
         """Return ``True`` when this objective implements an analytic Jacobian."""
         return False
 
+    def set_targets(self, targets: wp.array) -> None:
+        """Replace the per-problem targets of this objective.
+
+        Used by :meth:`~newton.ik.IKSolver.solve_trajectory` to advance
+        objectives from one frame to the next. Objectives without per-problem
+        targets do not need to override this method.
+
+        Args:
+            targets: Targets for all base IK problems, shape [problem_count].
+
+        Raises:
+            NotImplementedError: If the objective has no per-problem targets.
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no per-problem targets")
+
     def bind_device(self, device: wp.DeviceLike) -> None:
         """Bind this objective to the Warp device used by the solver."""
         self.device = device
@@ -360,6 +375,16 @@ class IKObjectivePosition(IKObjective):
             device=self.device,
         )
 
+    def set_targets(self, targets: wp.array[wp.vec3]) -> None:
+        """Replace the target positions for all base IK problems.
+
+        Equivalent to :meth:`set_target_positions`.
+
+        Args:
+            targets: Target positions [m], shape [problem_count].
+        """
+        self.set_target_positions(targets)
+
     def residual_dim(self) -> int:
         """Return the three translational residual rows for this objective."""
         return 3
@@ -985,6 +1010,17 @@ class IKObjectiveRotation(IKObjective):
             device=self.device,
         )
 
+    def set_targets(self, targets: wp.array[wp.vec4]) -> None:
+        """Replace the target orientations for all base IK problems.
+
+        Equivalent to :meth:`set_target_rotations`.
+
+        Args:
+            targets: Target quaternions, shape [problem_count], in
+                ``(x, y, z, w)`` order.
+        """
+        self.set_target_rotations(targets)
+
     def residual_dim(self) -> int:
         """Return the three rotational residual rows for this objective."""
         return 3
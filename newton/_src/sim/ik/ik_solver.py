@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from enum import Enum
 from typing import Any
 
@@ -176,6 +176,72 @@ def _gather_best_seed(
     joint_q_out[problem_idx, coord_idx] = joint_q_expanded[expanded_idx, coord_idx]
 
 
+@wp.kernel
+def _mark_converged_problems(
+    costs: wp.array[wp.float32],
+    n_seeds: int,
+    tolerance: float,
+    converged: wp.array[wp.int32],
+    seed_active: wp.array[wp.int32],
+    active_count: wp.array[wp.int32],
+):
+    problem_idx = wp.tid()
+    if converged[problem_idx] != 0:
+        return
+    base = problem_idx * n_seeds
+
+    done = wp.int32(0)
+    for seed_idx in range(n_seeds):
+        if costs[base + seed_idx] <= tolerance:
+            done = 1
+
+    if done != 0:
+        converged[problem_idx] = 1
+        for seed_idx in range(n_seeds):
+            seed_active[base + seed_idx] = 0
+    else:
+        wp.atomic_add(active_count, 0, 1)
+
+
+@wp.kernel
+def _prune_seeds(
+    costs: wp.array[wp.float32],
+    n_seeds: int,
+    converged: wp.array[wp.int32],
+    seed_active: wp.array[wp.int32],
+):
+    problem_idx = wp.tid()
+    if converged[problem_idx] != 0:
+        return
+    base = problem_idx * n_seeds
+
+    n_active = wp.int32(0)
+    for seed_idx in range(n_seeds):
+        n_active += seed_active[base + seed_idx]
+    keep = (n_active + 1) // 2
+
+    # rank the surviving seeds by cost (ties broken by seed index) before
+    # clearing any flag so that every seed is ranked against the same set
+    for seed_idx in range(n_seeds):
+        if seed_active[base + seed_idx] == 0:
+            continue
+        cost = costs[base + seed_idx]
+        rank = wp.int32(0)
+        for other_idx in range(n_seeds):
+            if other_idx == seed_idx or seed_active[base + other_idx] == 0:
+                continue
+            other_cost = costs[base + other_idx]
+            if other_cost < cost or (other_cost == cost and other_idx < seed_idx):
+                rank += 1
+        if rank >= keep:
+            # mark for removal; resolved below
+            seed_active[base + seed_idx] = 2
+
+    for seed_idx in range(n_seeds):
+        if seed_active[base + seed_idx] == 2:
+            seed_active[base + seed_idx] = 0
+
+
 @wp.kernel
 def _pull_seed(
     seed_state: wp.array[wp.uint32],
@@ -290,6 +356,15 @@ class IKSolver:
 
         self.joint_q_expanded = wp.zeros((self.n_expanded, self.n_coords), dtype=wp.float32, device=self.device)
         self.best_indices = wp.zeros(self.n_problems, dtype=wp.int32, device=self.device)
+        self.seed_active = wp.ones(self.n_expanded, dtype=wp.int32, device=self.device)
+        """Per-seed flags of the most recent early-terminating solve, shape [n_problems * n_seeds], int32.
+
+        Seeds of converged problems and seeds dropped by pruning are cleared to ``0``."""
+        self.problem_converged = wp.zeros(self.n_problems, dtype=wp.int32, device=self.device)
+        """Per-problem flags set to ``1`` once a seed reached ``tolerance`` in the most recent solve, shape [n_problems], int32."""
+        self.iterations_run = 0
+        """Number of optimizer iterations executed by the most recent :meth:`step`."""
+        self._active_count = wp.zeros(1, dtype=wp.int32, device=self.device)
         self._seed_state = wp.array(np.array([self._rng_seed], dtype=np.uint32), dtype=wp.uint32, device=self.device)
         self._seed_tmp = wp.zeros(1, dtype=wp.uint32, device=self.device)
 
@@ -351,37 +426,145 @@ class IKSolver:
         joint_q_out: wp.array2d[wp.float32],
         iterations: int = 50,
         step_size: float = 1.0,
+        *,
+        tolerance: float | None = None,
+        check_interval: int = 10,
+        prune_interval: int | None = None,
     ) -> None:
         """Solve all base problems and write the best result for each one.
 
+        By default every seed runs for the full ``iterations`` count. Passing
+        ``tolerance`` and/or ``prune_interval`` switches to an early-terminating
+        solve that freezes finished candidates:
+
+        - A problem converges once any of its seeds has a cost at or below
+          ``tolerance``; all of its seeds are then frozen. Convergence is
+          checked every ``check_interval`` iterations, and the solve returns as
+          soon as every problem has converged.
+        - Every ``prune_interval`` iterations, the worse half of the surviving
+          seeds of each unconverged problem is frozen (successive halving), so
+          the iteration budget concentrates on the most promising seeds.
+
+        Frozen rows keep their coordinates and cost and skip the optimizer's
+        forward-kinematics, Jacobian, solve, and line-search kernels; only the
+        objective kernels still run over the full batch. The final selection
+        still picks the lowest-cost seed of each problem. The convergence check reads
+        one counter back to the host, so early-terminating solves cannot be
+        captured in a CUDA graph. :attr:`seed_active`,
+        :attr:`problem_converged`, and :attr:`iterations_run` report the outcome.
+
         Args:
             joint_q_in: Input joint coordinates [m or rad] for the base
                 problems, shape [n_problems, joint_coord_count].
             joint_q_out: Output joint coordinates [m or rad] for the selected
                 solution of each base problem, shape [n_problems, joint_coord_count].
                 It may alias ``joint_q_in``.
-            iterations: Number of optimizer iterations to run for each sampled
-                seed.
+            iterations: Maximum number of optimizer iterations to run for each
+                sampled seed.
             step_size: Unitless LM step scale. Ignored by the L-BFGS backend.
+            tolerance: Optional per-problem cost threshold for early
+                termination, in units of the summed squared residuals.
+            check_interval: Number of iterations between convergence checks
+                when ``tolerance`` is set.
+            prune_interval: Optional number of iterations between seed-pruning
+                rounds.
         """
         if joint_q_in.shape != (self.n_problems, self.n_coords):
             raise ValueError("joint_q_in has incompatible shape")
         if joint_q_out.shape != (self.n_problems, self.n_coords):
             raise ValueError("joint_q_out has incompatible shape")
+        if check_interval < 1:
+            raise ValueError("check_interval must be >= 1")
+        if prune_interval is not None and prune_interval < 1:
+            raise ValueError("prune_interval must be >= 1")
 
         self._sample(joint_q_in)
 
         self._impl.reset()
 
-        if self.optimizer_type is IKOptimizer.LM:
-            self._impl.step(self.joint_q_expanded, self.joint_q_expanded, iterations=iterations, step_size=step_size)
-        elif self.optimizer_type is IKOptimizer.LBFGS:
-            self._impl.step(self.joint_q_expanded, self.joint_q_expanded, iterations=iterations)
+        if tolerance is None and prune_interval is None:
+            self._optimize(iterations, step_size, active=None, resume=False)
+            self.iterations_run = iterations
         else:
-            raise RuntimeError(f"Unsupported optimizer: {self.optimizer_type}")
+            self._optimize_early_terminating(iterations, step_size, tolerance, check_interval, prune_interval)
 
         self._impl.compute_costs(self.joint_q_expanded)
+        self._write_best_seeds(joint_q_out)
 
+    def solve_trajectory(
+        self,
+        joint_q_in: wp.array2d[wp.float32],
+        joint_q_out: wp.array3d[wp.float32],
+        targets: Mapping[IKObjective, wp.array2d],
+        iterations: int = 10,
+        step_size: float = 1.0,
+        *,
+        initial_iterations: int | None = None,
+    ) -> None:
+        """Solve a clip of consecutive frames, warm-starting each frame from the previous one.
+
+        Frame 0 is seeded from ``joint_q_in`` through the configured sampler
+        exactly like :meth:`step`. Every later frame updates the objective
+        targets and continues optimizing each seed from its solution of the
+        previous frame without resampling. The L-BFGS correction history
+        carries over from frame to frame, but no correction pair is formed
+        across a frame boundary, since the previous gradient belongs to the
+        old targets. The LM damping restarts from ``lambda_initial`` every
+        frame, since a converged frame drives it to its upper bound. The
+        lowest-cost seed of each problem is written to ``joint_q_out`` for
+        every frame.
+
+        The call performs no host synchronization, so on CUDA devices the
+        whole clip can be recorded once with :class:`wp.ScopedCapture` and
+        replayed for further clips of the same length after updating the
+        target arrays in place.
+
+        Args:
+            joint_q_in: Joint coordinates [m or rad] seeding frame 0, shape
+                [n_problems, joint_coord_count].
+            joint_q_out: Output joint coordinates [m or rad] for every frame,
+                shape [n_frames, n_problems, joint_coord_count].
+            targets: Per-frame targets for each objective whose targets change
+                over the clip, shape [n_frames, n_problems] with the dtype of
+                the objective's targets. Each objective must implement
+                :meth:`~newton.ik.IKObjective.set_targets`; objectives not
+                listed keep their current targets.
+            iterations: Number of optimizer iterations per warm-started frame.
+            step_size: Unitless LM step scale. Ignored by the L-BFGS backend.
+            initial_iterations: Number of optimizer iterations for frame 0.
+                Defaults to ``iterations``.
+        """
+        n_frames = joint_q_out.shape[0]
+        if joint_q_in.shape != (self.n_problems, self.n_coords):
+            raise ValueError("joint_q_in has incompatible shape")
+        if joint_q_out.shape != (n_frames, self.n_problems, self.n_coords):
+            raise ValueError("joint_q_out has incompatible shape")
+        for objective, sequence in targets.items():
+            if sequence.ndim != 2 or sequence.shape != (n_frames, self.n_problems):
+                raise ValueError(
+                    f"targets for {type(objective).__name__} must have shape ({n_frames}, {self.n_problems}), "
+                    f"got {sequence.shape}"
+                )
+        if initial_iterations is None:
+            initial_iterations = iterations
+
+        for frame in range(n_frames):
+            for objective, sequence in targets.items():
+                objective.set_targets(sequence[frame])
+            if frame == 0:
+                self._sample(joint_q_in)
+                self._impl.reset()
+                self._optimize(initial_iterations, step_size, active=None, resume=False)
+            else:
+                # LM damping is restarted because converged rows drive it to lambda_max
+                resume = self.optimizer_type is IKOptimizer.LBFGS
+                self._optimize(iterations, step_size, active=None, resume=resume, targets_changed=resume)
+            if self.n_seeds > 1 or frame == n_frames - 1:
+                self._impl.compute_costs(self.joint_q_expanded)
+            self._write_best_seeds(joint_q_out[frame])
+        self.iterations_run = initial_iterations + max(n_frames - 1, 0) * iterations
+
+    def _write_best_seeds(self, joint_q_out: wp.array2d[wp.float32]) -> None:
         if self.n_seeds == 1:
             if joint_q_out.ptr != self.joint_q_expanded.ptr:
                 wp.copy(joint_q_out, self.joint_q_expanded)
@@ -402,10 +585,101 @@ class IKSolver:
             device=self.device,
         )
 
+    def _optimize(
+        self,
+        iterations: int,
+        step_size: float,
+        *,
+        active: wp.array | None,
+        resume: bool,
+        targets_changed: bool = False,
+    ) -> None:
+        if self.optimizer_type is IKOptimizer.LM:
+            self._impl.step(
+                self.joint_q_expanded,
+                self.joint_q_expanded,
+                iterations=iterations,
+                step_size=step_size,
+                active=active,
+                resume=resume,
+            )
+        elif self.optimizer_type is IKOptimizer.LBFGS:
+            self._impl.step(
+                self.joint_q_expanded,
+                self.joint_q_expanded,
+                iterations=iterations,
+                active=active,
+                resume=resume,
+                targets_changed=targets_changed,
+            )
+        else:
+            raise RuntimeError(f"Unsupported optimizer: {self.optimizer_type}")
+
+    def _optimize_early_terminating(
+        self,
+        iterations: int,
+        step_size: float,
+        tolerance: float | None,
+        check_interval: int,
+        prune_interval: int | None,
+    ) -> None:
+        self.seed_active.fill_(1)
+        self.problem_converged.zero_()
+        if self.n_seeds == 1:
+            prune_interval = None
+
+        done = 0
+        while done < iterations:
+            chunk = iterations - done
+            if tolerance is not None:
+                chunk = min(chunk, check_interval - done % check_interval)
+            if prune_interval is not None:
+                chunk = min(chunk, prune_interval - done % prune_interval)
+            self._optimize(chunk, step_size, active=self.seed_active, resume=done > 0)
+            done += chunk
+            if done == iterations:
+                break
+
+            costs = self._impl.compute_costs(self.joint_q_expanded)
+            if tolerance is not None and done % check_interval == 0:
+                self._active_count.zero_()
+                wp.launch(
+                    _mark_converged_problems,
+                    dim=self.n_problems,
+                    inputs=[costs, self.n_seeds, float(tolerance)],
+                    outputs=[self.problem_converged, self.seed_active, self._active_count],
+                    device=self.device,
+                )
+                if int(self._active_count.numpy()[0]) == 0:
+                    break
+            if prune_interval is not None and done % prune_interval == 0:
+                wp.launch(
+                    _prune_seeds,
+                    dim=self.n_problems,
+                    inputs=[costs, self.n_seeds, self.problem_converged],
+                    outputs=[self.seed_active],
+                    device=self.device,
+                )
+
+        if tolerance is not None:
+            # final check so problem_converged also reflects the last iterations
+            costs = self._impl.compute_costs(self.joint_q_expanded)
+            self._active_count.zero_()
+            wp.launch(
+                _mark_converged_problems,
+                dim=self.n_problems,
+                inputs=[costs, self.n_seeds, float(tolerance)],
+                outputs=[self.problem_converged, self.seed_active, self._active_count],
+                device=self.device,
+            )
+        self.iterations_run = done
+
     def reset(self) -> None:
         """Reset optimizer state, selected seeds, and the sampler RNG."""
         self._impl.reset()
         self.best_indices.zero_()
+        self.seed_active.fill_(1)
+        self.problem_converged.zero_()
         wp.launch(
             _set_seed,
             dim=1,
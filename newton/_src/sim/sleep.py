@@ -0,0 +1,522 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Island-based sleeping for resting rigid bodies."""
+
+from __future__ import annotations
+
+import numpy as np
+import warp as wp
+
+from .contacts import Contacts
+from .enums import BodyFlags
+from .model import Model
+from .state import State
+
+_TIMER_UNSET = wp.constant(1.0e30)
+
+
+@wp.func
+def _island_find(island_parent: wp.array[wp.int32], body: int) -> int:
+    root = body
+    while island_parent[root] != root:
+        root = island_parent[root]
+    return root
+
+
+@wp.func
+def _island_union(island_parent: wp.array[wp.int32], body_a: int, body_b: int):
+    # Lock-free union: hook the higher root under the lower one and retry if
+    # another thread re-rooted it in the meantime. Parents only ever decrease,
+    # so the forest stays acyclic.
+    done = bool(False)
+    while not done:
+        root_a = _island_find(island_parent, body_a)
+        root_b = _island_find(island_parent, body_b)
+        if root_a == root_b:
+            done = True
+        else:
+            lo = wp.min(root_a, root_b)
+            hi = wp.max(root_a, root_b)
+            if wp.atomic_cas(island_parent, hi, hi, lo) == hi:
+                done = True
+
+
+@wp.func
+def _is_kinematic(body_flags: wp.array[wp.int32], body: int) -> bool:
+    return (body_flags[body] & int(BodyFlags.KINEMATIC)) != 0
+
+
+@wp.kernel(enable_backward=False)
+def _sleep_timer_kernel(
+    body_qd: wp.array[wp.spatial_vector],
+    linear_velocity_threshold: wp.array[float],
+    angular_velocity_threshold: wp.array[float],
+    dt: float,
+    # outputs
+    sleep_timer: wp.array[float],
+    island_parent: wp.array[wp.int32],
+    island_timer: wp.array[float],
+):
+    tid = wp.tid()
+    qd = body_qd[tid]
+    moving = wp.length(wp.spatial_top(qd)) > linear_velocity_threshold[tid] or (
+        wp.length(wp.spatial_bottom(qd)) > angular_velocity_threshold[tid]
+    )
+    if moving:
+        sleep_timer[tid] = 0.0
+    else:
+        sleep_timer[tid] = sleep_timer[tid] + dt
+    island_parent[tid] = tid
+    island_timer[tid] = _TIMER_UNSET
+
+
+@wp.kernel(enable_backward=False)
+def _sleep_union_sleeping_kernel(
+    body_sleeping: wp.array[wp.int32],
+    sleep_root: wp.array[wp.int32],
+    island_parent: wp.array[wp.int32],
+):
+    # Sleeping bodies have no contacts among themselves, so reconnect each
+    # sleeping island through the root recorded when it fell asleep.
+    tid = wp.tid()
+    if body_sleeping[tid] != 0:
+        _island_union(island_parent, tid, sleep_root[tid])
+
+
+@wp.kernel(enable_backward=False)
+def _sleep_union_joints_kernel(
+    joint_parent: wp.array[wp.int32],
+    joint_child: wp.array[wp.int32],
+    joint_enabled: wp.array[wp.bool],
+    body_flags: wp.array[wp.int32],
+    island_parent: wp.array[wp.int32],
+):
+    tid = wp.tid()
+    parent = joint_parent[tid]
+    child = joint_child[tid]
+    if parent < 0 or child < 0 or not joint_enabled[tid]:
+        return
+    if _is_kinematic(body_flags, parent) or _is_kinematic(body_flags, child):
+        return
+    _island_union(island_parent, parent, child)
+
+
+@wp.kernel(enable_backward=False)
+def _sleep_union_contacts_kernel(
+    contact_count: wp.array[wp.int32],
+    contact_shape0: wp.array[wp.int32],
+    contact_shape1: wp.array[wp.int32],
+    shape_body: wp.array[wp.int32],
+    body_flags: wp.array[wp.int32],
+    island_parent: wp.array[wp.int32],
+):
+    tid = wp.tid()
+    if tid >= contact_count[0]:
+        return
+    shape_a = contact_shape0[tid]
+    shape_b = contact_shape1[tid]
+    if shape_a < 0 or shape_b < 0:
+        return
+    body_a = shape_body[shape_a]
+    body_b = shape_body[shape_b]
+    if body_a < 0 or body_b < 0 or body_a == body_b:
+        return
+    if _is_kinematic(body_flags, body_a) or _is_kinematic(body_flags, body_b):
+        return
+    _island_union(island_parent, body_a, body_b)
+
+
+@wp.kernel(enable_backward=False)
+def _sleep_island_min_kernel(
+    body_flags: wp.array[wp.int32],
+    island_parent: wp.array[wp.int32],
+    sleep_timer: wp.array[float],
+    # outputs
+    body_island: wp.array[wp.int32],
+    island_timer: wp.array[float],
+):
+    tid = wp.tid()
+    root = _island_find(island_parent, tid)
+    body_island[tid] = root
+    if not _is_kinematic(body_flags, tid):
+        wp.atomic_min(island_timer, root, sleep_timer[tid])
+
+
+@wp.func
+def _wake_from_kinematic(
+    body_a: int,
+    body_b: int,
+    body_flags: wp.array[wp.int32],
+    sleep_timer: wp.array[float],
+    body_island: wp.array[wp.int32],
+    island_timer: wp.array[float],
+):
+    # A kinematic body that moved during this update wakes the island it touches.
+    if body_a < 0 or body_b < 0:
+        return
+    if _is_kinematic(body_flags, body_a) and sleep_timer[body_a] == 0.0 and not _is_kinematic(body_flags, body_b):
+        wp.atomic_min(island_timer, body_island[body_b], 0.0)
+    if _is_kinematic(body_flags, body_b) and sleep_timer[body_b] == 0.0 and not _is_kinematic(body_flags, body_a):
+        wp.atomic_min(island_timer, body_island[body_a], 0.0)
+
+
+@wp.kernel(enable_backward=False)
+def _sleep_wake_joints_kernel(
+    joint_parent: wp.array[wp.int32],
+    joint_child: wp.array[wp.int32],
+    joint_enabled: wp.array[wp.bool],
+    body_flags: wp.array[wp.int32],
+    sleep_timer: wp.array[float],
+    body_island: wp.array[wp.int32],
+    island_timer: wp.array[float],
+):
+    tid = wp.tid()
+    if not joint_enabled[tid]:
+        return
+    _wake_from_kinematic(joint_parent[tid], joint_child[tid], body_flags, sleep_timer, body_island, island_timer)
+
+
+@wp.kernel(enable_backward=False)
+def _sleep_wake_contacts_kernel(
+    contact_count: wp.array[wp.int32],
+    contact_shape0: wp.array[wp.int32],
+    contact_shape1: wp.array[wp.int32],
+    shape_body: wp.array[wp.int32],
+    body_flags: wp.array[wp.int32],
+    sleep_timer: wp.array[float],
+    body_island: wp.array[wp.int32],
+    island_timer: wp.array[float],
+):
+    tid = wp.tid()
+    if tid >= contact_count[0]:
+        return
+    shape_a = contact_shape0[tid]
+    shape_b = contact_shape1[tid]
+    if shape_a < 0 or shape_b < 0:
+        return
+    _wake_from_kinematic(shape_body[shape_a], shape_body[shape_b], body_flags, sleep_timer, body_island, island_timer)
+
+
+@wp.kernel(enable_backward=False)
+def _sleep_apply_kernel(
+    body_flags: wp.array[wp.int32],
+    body_island: wp.array[wp.int32],
+    island_timer: wp.array[float],
+    time_to_sleep: float,
+    # outputs
+    sleep_timer: wp.array[float],
+    sleep_root: wp.array[wp.int32],
+    body_sleeping: wp.array[wp.int32],
+    body_qd: wp.array[wp.spatial_vector],
+):
+    tid = wp.tid()
+    if _is_kinematic(body_flags, tid):
+        sleep_root[tid] = tid
+        body_sleeping[tid] = 0
+        return
+
+    root = body_island[tid]
+    island_rest_time = island_timer[root]
+    # An island is only as rested as its most recently moving body; waking an
+    # island restarts the timers of all its members.
+    sleep_timer[tid] = island_rest_time
+    if island_rest_time >= time_to_sleep:
+        if body_sleeping[tid] == 0:
+            sleep_root[tid] = root
+            body_qd[tid] = wp.spatial_vector()
+        body_sleeping[tid] = 1
+    else:
+        sleep_root[tid] = tid
+        body_sleeping[tid] = 0
+
+
+@wp.kernel(enable_backward=False)
+def _sleep_wake_kernel(
+    body_mask: wp.array[wp.bool],
+    # outputs
+    sleep_timer: wp.array[float],
+    sleep_root: wp.array[wp.int32],
+    body_sleeping: wp.array[wp.int32],
+):
+    tid = wp.tid()
+    if body_mask:
+        if not body_mask[tid]:
+            return
+    sleep_timer[tid] = 0.0
+    sleep_root[tid] = tid
+    body_sleeping[tid] = 0
+
+
+def copy_body_sleeping(state_in: State, state_out: State) -> None:
+    """Carry :attr:`State.body_sleeping` from ``state_in`` over to ``state_out`` if both have it."""
+    src = state_in.body_sleeping
+    dst = state_out.body_sleeping
+    if src is None or dst is None or src.ptr == dst.ptr:
+        return
+    wp.copy(dst, src)
+
+
+class SleepManager:
+    """Put resting rigid-body islands to sleep and wake them on contact.
+
+    Bodies are grouped into islands connected by enabled joints and by the
+    rigid contacts of the last collision pass; static and kinematic bodies do
+    not join islands. Each dynamic body accumulates how long its linear and
+    angular speeds have stayed below its per-body thresholds. Once every body
+    of an island has rested for :attr:`time_to_sleep`, the whole island is
+    flagged in :attr:`State.body_sleeping <newton.State.body_sleeping>` and its
+    velocities are zeroed.
+
+    Sleeping bodies are skipped by :meth:`CollisionPipeline.collide
+    <newton.CollisionPipeline.collide>` (their AABBs are reused and pairs
+    between sleeping or static shapes are not generated), are held in place
+    by :meth:`SolverBase.integrate_bodies
+    <newton.solvers.SolverBase.integrate_bodies>`, and act as infinite-mass
+    obstacles in :class:`~newton.solvers.SolverXPBD`. An island wakes as
+    soon as a moving body touches it, either through a contact with an awake
+    body or through a moving kinematic body. Call :meth:`wake` after editing
+    body state directly, e.g. on resets, teleports, or when applying external
+    forces.
+
+    Constructing the manager requests the extended state attribute
+    ``body_sleeping`` from the model, so create it before calling
+    :meth:`Model.state <newton.Model.state>`.
+
+    Example:
+
+        .. testcode::
+
+            import warp as wp
+            import newton
+
+            builder = newton.ModelBuilder()
+            builder.add_ground_plane()
+            body = builder.add_body(xform=wp.transform((0.0, 0.0, 0.1), wp.quat_identity()))
+            builder.add_shape_box(body, hx=0.1, hy=0.1, hz=0.1)
+            model = builder.finalize()
+
+            sleep = newton.SleepManager(model, time_to_sleep=0.5)
+            solver = newton.solvers.SolverXPBD(model)
+            pipeline = newton.CollisionPipeline(model)
+            state_0, state_1 = model.state(), model.state()
+            contacts = pipeline.contacts()
+
+            for _ in range(10):
+                pipeline.collide(state_0, contacts)
+                solver.step(state_0, state_1, None, contacts, 1.0 / 60.0)
+                state_0, state_1 = state_1, state_0
+                sleep.update(state_0, contacts, 1.0 / 60.0)
+
+            sleeping = state_0.body_sleeping.numpy()
+    """
+
+    linear_velocity_threshold: wp.array[float]
+    """Per-body linear speed [m/s] below which a body counts as resting, shape ``(body_count,)``."""
+
+    angular_velocity_threshold: wp.array[float]
+    """Per-body angular speed [rad/s] below which a body counts as resting, shape ``(body_count,)``."""
+
+    sleep_timer: wp.array[float]
+    """Time [s] each body's island has been resting, shape ``(body_count,)``."""
+
+    body_island: wp.array[wp.int32]
+    """Island representative (lowest body index) of each body from the last :meth:`update`, shape ``(body_count,)``."""
+
+    def __init__(
+        self,
+        model: Model,
+        *,
+        linear_velocity_threshold: float = 0.05,
+        angular_velocity_threshold: float = 0.05,
+        time_to_sleep: float = 0.5,
+        request_state_attributes: bool = True,
+    ):
+        """Initialize the sleep manager.
+
+        Args:
+            model: The model whose bodies are managed.
+            linear_velocity_threshold: Initial value of :attr:`linear_velocity_threshold` for all bodies [m/s].
+            angular_velocity_threshold: Initial value of :attr:`angular_velocity_threshold` for all bodies [rad/s].
+            time_to_sleep: Time [s] an island must rest before it falls asleep.
+            request_state_attributes: If True (default), transparently request the extended state attribute
+                ``body_sleeping`` from the model. If False, ``model`` is not modified and the attribute must be
+                requested elsewhere before calling ``model.state()``.
+
+        Raises:
+            ValueError: If a threshold is negative or not finite, or ``time_to_sleep`` is not positive and finite.
+        """
+        for name, value in (
+            ("linear_velocity_threshold", linear_velocity_threshold),
+            ("angular_velocity_threshold", angular_velocity_threshold),
+        ):
+            if not np.isfinite(value) or value < 0.0:
+                raise ValueError(f"{name} must be a non-negative finite number, got {value!r}")
+        if not np.isfinite(time_to_sleep) or time_to_sleep <= 0.0:
+            raise ValueError(f"time_to_sleep must be a positive finite number, got {time_to_sleep!r}")
+
+        self.model = model
+        self.time_to_sleep = float(time_to_sleep)
+
+        if request_state_attributes:
+            model.request_state_attributes("body_sleeping")
+
+        body_count = model.body_count
+        device = model.device
+        with wp.ScopedDevice(device):
+            self.linear_velocity_threshold = wp.full(body_count, linear_velocity_threshold, dtype=float)
+            self.angular_velocity_threshold = wp.full(body_count, angular_velocity_threshold, dtype=float)
+            self.sleep_timer = wp.zeros(body_count, dtype=float)
+            self.body_island = wp.array(np.arange(body_count, dtype=np.int32), dtype=wp.int32)
+            self._sleep_root = wp.array(np.arange(body_count, dtype=np.int32), dtype=wp.int32)
+            self._island_parent = wp.zeros(body_count, dtype=wp.int32)
+            self._island_timer = wp.zeros(body_count, dtype=float)
+
+    def _require_sleep_flags(self, state: State) -> wp.array[wp.int32]:
+        if state.body_sleeping is None:
+            raise ValueError(
+                "state.body_sleeping is not allocated; create the SleepManager before calling model.state() "
+                "or request the 'body_sleeping' state attribute"
+            )
+        return state.body_sleeping
+
+    def update(self, state: State, contacts: Contacts | None, dt: float) -> None:
+        """Advance the rest timers and update the sleep flags of ``state``.
+
+        Call once per step after the solver, with the contacts that were used
+        for that step. Bodies entering sleep have :attr:`State.body_qd
+        <newton.State.body_qd>` zeroed. All work is launched on the device and
+        is safe to capture in a CUDA graph.
+
+        Args:
+            state: State whose ``body_qd`` is evaluated and whose ``body_sleeping`` flags are written.
+            contacts: Rigid contacts connecting bodies into islands. If ``None``, islands only follow joints.
+            dt: Time [s] elapsed since the previous update.
+
+        Raises:
+            ValueError: If ``state.body_sleeping`` is not allocated or ``dt`` is negative or not finite.
+        """
+        body_sleeping = self._require_sleep_flags(state)
+        if not np.isfinite(dt) or dt < 0.0:
+            raise ValueError(f"dt must be a non-negative finite number, got {dt!r}")
+
+        model = self.model
+        body_count = model.body_count
+        if body_count == 0:
+            return
+        device = model.device
+
+        wp.launch(
+            _sleep_timer_kernel,
+            dim=body_count,
+            inputs=[state.body_qd, self.linear_velocity_threshold, self.angular_velocity_threshold, float(dt)],
+            outputs=[self.sleep_timer, self._island_parent, self._island_timer],
+            device=device,
+        )
+        wp.launch(
+            _sleep_union_sleeping_kernel,
+            dim=body_count,
+            inputs=[body_sleeping, self._sleep_root, self._island_parent],
+            device=device,
+        )
+        if model.joint_count:
+            wp.launch(
+                _sleep_union_joints_kernel,
+                dim=model.joint_count,
+                inputs=[
+                    model.joint_parent,
+                    model.joint_child,
+                    model.joint_enabled,
+                    model.body_flags,
+                    self._island_parent,
+                ],
+                device=device,
+            )
+        has_contacts = contacts is not None and contacts.rigid_contact_max > 0
+        if has_contacts:
+            wp.launch(
+                _sleep_union_contacts_kernel,
+                dim=contacts.rigid_contact_max,
+                inputs=[
+                    contacts.rigid_contact_count,
+                    contacts.rigid_contact_shape0,
+                    contacts.rigid_contact_shape1,
+                    model.shape_body,
+                    model.body_flags,
+                    self._island_parent,
+                ],
+                device=device,
+            )
+        wp.launch(
+            _sleep_island_min_kernel,
+            dim=body_count,
+            inputs=[model.body_flags, self._island_parent, self.sleep_timer],
+            outputs=[self.body_island, self._island_timer],
+            device=device,
+        )
+        if model.joint_count:
+            wp.launch(
+                _sleep_wake_joints_kernel,
+                dim=model.joint_count,
+                inputs=[
+                    model.joint_parent,
+                    model.joint_child,
+                    model.joint_enabled,
+                    model.body_flags,
+                    self.sleep_timer,
+                    self.body_island,
+                    self._island_timer,
+                ],
+                device=device,
+            )
+        if has_contacts:
+            wp.launch(
+                _sleep_wake_contacts_kernel,
+                dim=contacts.rigid_contact_max,
+                inputs=[
+                    contacts.rigid_contact_count,
+                    contacts.rigid_contact_shape0,
+                    contacts.rigid_contact_shape1,
+                    model.shape_body,
+                    model.body_flags,
+                    self.sleep_timer,
+                    self.body_island,
+                    self._island_timer,
+                ],
+                device=device,
+            )
+        wp.launch(
+            _sleep_apply_kernel,
+            dim=body_count,
+            inputs=[model.body_flags, self.body_island, self._island_timer, self.time_to_sleep],
+            outputs=[self.sleep_timer, self._sleep_root, body_sleeping, state.body_qd],
+            device=device,
+        )
+
+    def wake(self, state: State, body_mask: wp.array[wp.bool] | None = None) -> None:
+        """Wake bodies and restart their rest timers.
+
+        A woken body that touches or is jointed to sleeping bodies wakes their
+        island on the next :meth:`update`.
+
+        Args:
+            state: State whose ``body_sleeping`` flags are cleared.
+            body_mask: Optional per-body mask of shape ``(body_count,)`` selecting the bodies to wake.
+                If ``None``, all bodies are woken.
+
+        Raises:
+            ValueError: If ``state.body_sleeping`` is not allocated or ``body_mask`` has the wrong shape.
+        """
+        body_sleeping = self._require_sleep_flags(state)
+        body_count = self.model.body_count
+        if body_mask is not None and body_mask.shape != (body_count,):
+            raise ValueError(f"body_mask must have shape ({body_count},), got {body_mask.shape}")
+        if body_count == 0:
+            return
+        wp.launch(
+            _sleep_wake_kernel,
+            dim=body_count,
+            inputs=[body_mask],
+            outputs=[self.sleep_timer, self._sleep_root, body_sleeping],
+            device=self.model.device,
+        )
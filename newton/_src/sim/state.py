@@ -75,6 +75,7 @@ class State:
     EXTENDED_ATTRIBUTE_TEMPLATES: ClassVar[dict[str, ExtendedAttributeTemplate]] = {
         "body_qdd": ExtendedAttributeTemplate("BODY", wp.spatial_vector),
         "body_parent_f": ExtendedAttributeTemplate("BODY", wp.spatial_vector),
+        "body_sleeping": ExtendedAttributeTemplate("BODY", wp.int32),
         "mujoco:qfrc_actuator": ExtendedAttributeTemplate("JOINT_DOF", wp.float32),
     }
     """Optional extended state attributes and their allocation metadata."""
@@ -163,6 +164,15 @@ class State:
             :attr:`body_parent_f` represents incoming joint wrenches in world frame, referenced to the body's center of mass (COM).
         """
 
+        self.body_sleeping: wp.array | None = None
+        """Rigid body sleep flags, shape (body_count,), dtype int32. Nonzero marks a sleeping body.
+
+        Written by :class:`~newton.SleepManager`. Sleeping bodies are skipped by collision detection and held in
+        place by :class:`~newton.solvers.SolverXPBD` and :class:`~newton.solvers.SolverSemiImplicit`.
+
+        This is an extended state attribute; see :ref:`extended_state_attributes` for more information.
+        """
+
         self.joint_q: wp.array | None = None
         """Generalized joint position coordinates [m or rad, depending on joint type], shape (joint_coord_count,), dtype float."""
 
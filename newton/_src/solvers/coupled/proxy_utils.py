@@ -226,6 +226,29 @@ def blend_proxy_forces_kernel(
     )
 
 
+@wp.kernel(enable_backward=False)
+def accumulate_proxy_forces_kernel(
+    proxy_ids_global: wp.array[int],
+    coupling_forces: wp.array[Any],
+    window_forces: wp.array[Any],
+):
+    """Add the current proxy feedback to a multirate window sum."""
+    i = wp.tid()
+    window_forces[i] = window_forces[i] + coupling_forces[proxy_ids_global[i]]
+
+
+@wp.kernel(enable_backward=False)
+def average_proxy_forces_kernel(
+    inv_count: float,
+    proxy_ids_global: wp.array[int],
+    window_forces: wp.array[Any],
+    coupling_forces: wp.array[Any],
+):
+    """Replace the proxy feedback with the mean harvested over a multirate window."""
+    i = wp.tid()
+    coupling_forces[proxy_ids_global[i]] = inv_count * window_forces[i]
+
+
 @wp.kernel(enable_backward=False)
 def filter_proxy_rigid_contacts_kernel(
     rigid_contact_count: wp.array[int],
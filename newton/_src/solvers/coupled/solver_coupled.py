@@ -16,6 +16,7 @@ import warp as wp
 from ...core.reset import reset_world_selected as _reset_world_selected
 from ...geometry import ParticleFlags, ShapeFlags
 from ...sim import JointType, Model, ModelFlags, StateFlags
+from ...utils.benchmark import profile_scope
 from ..solver import SolverBase
 from .interface import (
     CouplingEndpointKind,
@@ -267,6 +268,9 @@ class SolverEntry:
     state_0: State | None = None
     state_1: State | None = None
     state_tmp: State | None = None
+    interval: int = 1
+    state_start: State | None = None
+    state_interp: State | None = None
     control: Control | None = None
     has_body_force_input: bool = False
     has_particle_force_input: bool = False
@@ -348,6 +352,16 @@ class SolverCoupled(SolverBase, CouplingInterface):
                 entry-local view overrides.
             substeps: Number of substeps to run per coupled step.
             in_place: Whether the sub-solver may step in-place.
+            interval: Number of coupled steps covered by one step of this
+                entry. Entries with ``interval > 1`` advance by
+                ``interval * dt`` on the first coupled step of each window
+                and are skipped on the remaining steps; their owned body,
+                particle, and joint states are interpolated between the
+                window's start and end states in between, linearly except
+                for body and joint rotations, which are slerped. The
+                window phase is tracked on the host, so CUDA graphs must
+                capture a multiple of ``interval`` coupled steps. In-place
+                entries must use ``interval=1``.
         """
 
         name: str
@@ -359,6 +373,7 @@ class SolverCoupled(SolverBase, CouplingInterface):
         configure_view: Callable[[ModelView], None] | None = None
         substeps: int = 1
         in_place: bool = False
+        interval: int = 1
 
     @staticmethod
     def _positive_integer(value: int, label: str) -> int:
@@ -399,6 +414,7 @@ class SolverCoupled(SolverBase, CouplingInterface):
         self._entry_rigid_contact_src_to_dst: dict[str, wp.array] = {}
         self._entry_soft_contact_src_to_dst: dict[str, wp.array] = {}
         self._entry_output_state_valid = False
+        self._coupled_step_index = 0
 
         self._validate_entry_names()
         self._body_owner = self._build_owner_map(model.body_count, [e.bodies for e in self._entry_configs])
@@ -569,6 +585,9 @@ class SolverCoupled(SolverBase, CouplingInterface):
             substeps = int(cfg.substeps)
             if substeps < 1:
                 raise ValueError(f"SolverCoupled.Entry {cfg.name!r} substeps must be >= 1")
+            interval = self._positive_integer(cfg.interval, f"SolverCoupled.Entry {cfg.name!r} interval")
+            if interval > 1 and cfg.in_place:
+                raise ValueError(f"SolverCoupled.Entry {cfg.name!r} cannot combine in_place=True with interval > 1")
 
             body_indices = wp.array([int(i) for i in cfg.bodies], dtype=int, device=device)
             particle_indices = wp.array([int(i) for i in cfg.particles], dtype=int, device=device)
@@ -709,6 +728,7 @@ class SolverCoupled(SolverBase, CouplingInterface):
                 attribute_local_to_global=attribute_local_to_global,
                 attribute_owned_rows=attribute_owned_rows,
                 in_place=bool(cfg.in_place),
+                interval=interval,
             )
 
         self._after_entries_constructed()
@@ -721,6 +741,9 @@ class SolverCoupled(SolverBase, CouplingInterface):
             entry.has_particle_force_input = entry.state_0.particle_f is not None
             if entry.substeps > 1 and not entry.in_place:
                 entry.state_tmp = entry.view.state()
+            if entry.interval > 1:
+                entry.state_start = entry.view.state()
+                entry.state_interp = entry.view.state()
 
         self._after_entry_states_created()
 
@@ -2102,11 +2125,11 @@ class SolverCoupled(SolverBase, CouplingInterface):
         if phase == "input":
             return entry.state_0
         if phase == "output":
-            return entry.state_1
+            return self._entry_output_state(entry)
         if phase != "current":
             raise ValueError(f"Unsupported coupled entry state phase {phase!r}")
         if self._entry_output_state_valid:
-            return entry.state_1
+            return self._entry_output_state(entry)
         return entry.state_0
 
     def entry_contacts(self, name: str, contacts: Contacts | None) -> Contacts | None:
@@ -2187,11 +2210,14 @@ class SolverCoupled(SolverBase, CouplingInterface):
             self._clear_entry_contact_buffers()
         self._rebuild_entry_solver_state_caches()
         self._entry_output_state_valid = False if world_mask is None else output_state_was_valid
+        # Multirate entries restart their windows from the reset state.
+        self._coupled_step_index = 0
 
     # ------------------------------------------------------------------
     # SolverBase interface
     # ------------------------------------------------------------------
 
+    @profile_scope
     def step(
         self,
         state_in: State,
@@ -2212,6 +2238,7 @@ class SolverCoupled(SolverBase, CouplingInterface):
         _copy_state(state_in, state_out)
         self._reconcile_state(state_out)
         self._entry_output_state_valid = True
+        self._coupled_step_index += 1
 
     def prepare_contacts(self, contacts: Contacts | None) -> None:
         """Preallocate entry-local filtered contact buffers for graph capture."""
@@ -2410,26 +2437,33 @@ class SolverCoupled(SolverBase, CouplingInterface):
         dt: float = 0.0,
         iteration_restart: bool = False,
     ) -> None:
-        """Copy ``state_in`` into each sub-solver's ``state_0``."""
+        """Copy ``state_in`` into each sub-solver's ``state_0``.
+
+        Multirate entries only receive the parent state at the start of their
+        window, with ``dt`` scaled to the window length.
+        """
         for entry in self._entries.values():
+            if not self._entry_steps_this_step(entry):
+                continue
             flags = self._input_state_copy_flags(state_in, entry.state_0)
             _copy_state_to_entry(state_in, entry.state_0, entry)
-            self._notify_input_state_update(entry, flags, dt=dt, iteration_restart=iteration_restart)
+            self._notify_input_state_update(entry, flags, dt=dt * entry.interval, iteration_restart=iteration_restart)
 
     def _reconcile_state(self, state_out: State) -> None:
         """Merge owned sub-solver state into ``state_out``."""
         for entry in self._entries.values():
             if entry.state_1 is None:
                 continue
-            if entry.body_indices.shape[0] > 0 and entry.state_1.body_q is not None and state_out.body_q is not None:
+            entry_out = self._entry_output_state(entry)
+            if entry.body_indices.shape[0] > 0 and entry_out.body_q is not None and state_out.body_q is not None:
                 wp.launch(
                     _scatter_body_state_mapped,
                     dim=entry.body_indices.shape[0],
                     inputs=[
                         entry.body_indices,
                         entry.body_global_to_local,
-                        entry.state_1.body_q,
-                        entry.state_1.body_qd,
+                        entry_out.body_q,
+                        entry_out.body_qd,
                         state_out.body_q,
                         state_out.body_qd,
                     ],
@@ -2437,7 +2471,7 @@ class SolverCoupled(SolverBase, CouplingInterface):
                 )
             if (
                 entry.particle_indices.shape[0] > 0
-                and entry.state_1.particle_q is not None
+                and entry_out.particle_q is not None
                 and state_out.particle_q is not None
             ):
                 wp.launch(
@@ -2446,32 +2480,28 @@ class SolverCoupled(SolverBase, CouplingInterface):
                     inputs=[
                         entry.particle_indices,
                         entry.particle_global_to_local,
-                        entry.state_1.particle_q,
-                        entry.state_1.particle_qd,
+                        entry_out.particle_q,
+                        entry_out.particle_qd,
                         state_out.particle_q,
                         state_out.particle_qd,
                     ],
                     device=self.model.device,
                 )
-            if (
-                entry.joint_q_indices.shape[0] > 0
-                and entry.state_1.joint_q is not None
-                and state_out.joint_q is not None
-            ):
+            if entry.joint_q_indices.shape[0] > 0 and entry_out.joint_q is not None and state_out.joint_q is not None:
                 wp.launch(
                     _scatter_scalar_state_mapped,
                     dim=entry.joint_q_indices.shape[0],
                     inputs=[
                         entry.joint_q_indices,
                         entry.joint_coord_global_to_local,
-                        entry.state_1.joint_q,
+                        entry_out.joint_q,
                         state_out.joint_q,
                     ],
                     device=self.model.device,
                 )
             if (
                 entry.joint_qd_indices.shape[0] > 0
-                and entry.state_1.joint_qd is not None
+                and entry_out.joint_qd is not None
                 and state_out.joint_qd is not None
             ):
                 wp.launch(
@@ -2480,7 +2510,7 @@ class SolverCoupled(SolverBase, CouplingInterface):
                     inputs=[
                         entry.joint_qd_indices,
                         entry.joint_dof_global_to_local,
-                        entry.state_1.joint_qd,
+                        entry_out.joint_qd,
                         state_out.joint_qd,
                     ],
                     device=self.model.device,
@@ -2661,7 +2691,47 @@ class SolverCoupled(SolverBase, CouplingInterface):
         filter_contacts: bool = True,
         control_callback: Callable[[Control | None], None] | None = None,
     ) -> Contacts | None:
-        """Step one sub-solver entry, honoring its local substep count."""
+        """Step one sub-solver entry, honoring its local substep count and interval.
+
+        Multirate entries advance by ``interval * dt`` at the start of their
+        window and only refresh their interpolated begin/end states on the
+        remaining coupled steps, in which case ``None`` is returned.
+        """
+        if entry.interval == 1:
+            return self._advance_entry(
+                entry, control, contacts, dt, filter_contacts=filter_contacts, control_callback=control_callback
+            )
+
+        phase = self._coupled_step_index % entry.interval
+        if phase != 0:
+            # state_0 holds the interpolated begin state so proxy transfers see a consistent interval.
+            self._interpolate_entry_state(entry, phase / entry.interval, entry.state_0)
+            self._interpolate_entry_state(entry, (phase + 1) / entry.interval, entry.state_interp)
+            return None
+
+        _copy_same_view_state(entry.state_0, entry.state_start)
+        contacts = self._advance_entry(
+            entry,
+            control,
+            contacts,
+            dt * entry.interval,
+            filter_contacts=filter_contacts,
+            control_callback=control_callback,
+        )
+        self._interpolate_entry_state(entry, 1.0 / entry.interval, entry.state_interp)
+        return contacts
+
+    def _advance_entry(
+        self,
+        entry: SolverEntry,
+        control: Control | None,
+        contacts: Contacts | None,
+        dt: float,
+        *,
+        filter_contacts: bool = True,
+        control_callback: Callable[[Control | None], None] | None = None,
+    ) -> Contacts | None:
+        """Run one sub-solver step of length ``dt`` split into the entry's substeps."""
         if filter_contacts:
             contacts = self._contacts_for_entry(entry, contacts)
         control = _copy_control_to_entry(control, entry)
@@ -2692,6 +2762,57 @@ class SolverCoupled(SolverBase, CouplingInterface):
             _copy_same_view_state(entry.state_tmp, entry.state_1)
         return contacts
 
+    def _entry_steps_this_step(self, entry: SolverEntry) -> bool:
+        """Return whether *entry* runs its solver during the current coupled step."""
+        return self._coupled_step_index % entry.interval == 0
+
+    def _entry_output_state(self, entry: SolverEntry) -> State:
+        """Return the entry-local state that represents the end of the current coupled step."""
+        if entry.interval > 1:
+            return entry.state_interp
+        return entry.state_1
+
+    def _interpolate_entry_state(self, entry: SolverEntry, alpha: float, dst: State) -> None:
+        """Blend an entry's window start and end states into *dst* at fraction *alpha* of the window."""
+        start = entry.state_start
+        end = entry.state_1
+        device = self.model.device
+        if end.body_q is not None and end.body_q.shape[0] > 0:
+            wp.launch(
+                _interpolate_body_state_kernel,
+                dim=end.body_q.shape[0],
+                inputs=[alpha, start.body_q, start.body_qd, end.body_q, end.body_qd],
+                outputs=[dst.body_q, dst.body_qd],
+                device=device,
+            )
+        for name in ("particle_q", "particle_qd"):
+            end_array = getattr(end, name)
+            if end_array is not None and end_array.shape[0] > 0:
+                wp.launch(
+                    _interpolate_vec3_kernel,
+                    dim=end_array.shape[0],
+                    inputs=[alpha, getattr(start, name), end_array],
+                    outputs=[getattr(dst, name)],
+                    device=device,
+                )
+        if end.joint_q is not None and end.joint_q.shape[0] > 0:
+            # free, distance, and ball joints store rotations that must stay unit quaternions
+            wp.launch(
+                _interpolate_joint_q_kernel,
+                dim=entry.view.joint_count,
+                inputs=[alpha, entry.view.joint_type, entry.view.joint_q_start, start.joint_q, end.joint_q],
+                outputs=[dst.joint_q],
+                device=device,
+            )
+        if end.joint_qd is not None and end.joint_qd.shape[0] > 0:
+            wp.launch(
+                _interpolate_float_kernel,
+                dim=end.joint_qd.shape[0],
+                inputs=[alpha, start.joint_qd, end.joint_qd],
+                outputs=[dst.joint_qd],
+                device=device,
+            )
+
     def _contacts_for_entry(self, entry: SolverEntry, contacts: Contacts | None) -> Contacts | None:
         if contacts is None:
             return contacts
@@ -3388,6 +3509,77 @@ def _scatter_scalar_state(
     dst[idx] = src[idx]
 
 
+@wp.kernel(enable_backward=False)
+def _interpolate_body_state_kernel(
+    alpha: float,
+    start_body_q: wp.array[wp.transform],
+    start_body_qd: wp.array[wp.spatial_vector],
+    end_body_q: wp.array[wp.transform],
+    end_body_qd: wp.array[wp.spatial_vector],
+    out_body_q: wp.array[wp.transform],
+    out_body_qd: wp.array[wp.spatial_vector],
+):
+    i = wp.tid()
+    q0 = start_body_q[i]
+    q1 = end_body_q[i]
+    p = wp.lerp(wp.transform_get_translation(q0), wp.transform_get_translation(q1), alpha)
+    r = wp.quat_slerp(wp.transform_get_rotation(q0), wp.transform_get_rotation(q1), alpha)
+    out_body_q[i] = wp.transform(p, r)
+    out_body_qd[i] = wp.lerp(start_body_qd[i], end_body_qd[i], alpha)
+
+
+@wp.kernel(enable_backward=False)
+def _interpolate_vec3_kernel(
+    alpha: float,
+    start: wp.array[wp.vec3],
+    end: wp.array[wp.vec3],
+    out: wp.array[wp.vec3],
+):
+    i = wp.tid()
+    out[i] = wp.lerp(start[i], end[i], alpha)
+
+
+@wp.kernel(enable_backward=False)
+def _interpolate_float_kernel(
+    alpha: float,
+    start: wp.array[float],
+    end: wp.array[float],
+    out: wp.array[float],
+):
+    i = wp.tid()
+    out[i] = wp.lerp(start[i], end[i], alpha)
+
+
+@wp.kernel(enable_backward=False)
+def _interpolate_joint_q_kernel(
+    alpha: float,
+    joint_type: wp.array[wp.int32],
+    joint_q_start: wp.array[wp.int32],
+    start: wp.array[float],
+    end: wp.array[float],
+    out: wp.array[float],
+):
+    joint = wp.tid()
+    coord_start = joint_q_start[joint]
+    coord_end = joint_q_start[joint + 1]
+    for i in range(coord_start, coord_end):
+        out[i] = wp.lerp(start[i], end[i], alpha)
+
+    type = joint_type[joint]
+    rot_start = -1
+    if type == JointType.FREE or type == JointType.DISTANCE:
+        rot_start = coord_start + 3
+    elif type == JointType.BALL:
+        rot_start = coord_start
+    if rot_start < 0:
+        return
+    r0 = wp.quat(start[rot_start], start[rot_start + 1], start[rot_start + 2], start[rot_start + 3])
+    r1 = wp.quat(end[rot_start], end[rot_start + 1], end[rot_start + 2], end[rot_start + 3])
+    r = wp.quat_slerp(r0, r1, alpha)
+    for k in range(4):
+        out[rot_start + k] = r[k]
+
+
 @wp.kernel(enable_backward=False)
 def _scatter_body_state_mapped(
     indices: wp.array[int],
@@ -674,6 +674,12 @@ class SolverCoupledADMM(SolverCoupled):
         self._admm_joint_proxy_mappings: list[_AdmmJointProxyMapping] = []
 
         self._validate_config(coupling)
+        for entry in entries:
+            if entry.interval != 1:
+                raise ValueError(
+                    f"SolverCoupledADMM entry {entry.name!r} must use interval=1; "
+                    "ADMM iterations synchronize every entry each step"
+                )
         if coupling.joint_proximal_bodies:
             self._init_admm_joint_proxy_visibility(model, entries, coupling.joint_proximal_destination_entries)
 
@@ -19,6 +19,8 @@ from .interface import (
     CouplingEndpointKind,
 )
 from .proxy_utils import (
+    accumulate_proxy_forces_kernel,
+    average_proxy_forces_kernel,
     blend_proxy_forces_kernel,
     restore_filtered_proxy_rigid_contacts_kernel,
     stash_proxy_forces_kernel,
@@ -63,6 +65,8 @@ class _ProxyEntityMapping:
     aitken_stats: wp.array = field(default=None)
     aitken_relaxation: wp.array = field(default=None)
     aitken_has_previous: wp.array = field(default=None)
+    window_forces: wp.array = field(default=None)
+    window_count: int = 0
 
 
 @dataclass
@@ -1050,6 +1054,8 @@ class SolverCoupledProxy(SolverCoupled):
             mapping.aitken_relaxation = wp.array([mapping.proxy_relaxation], dtype=float, device=device)
             mapping.aitken_has_previous = wp.zeros(1, dtype=int, device=device)
         mapping.proxy_qd_before = wp.zeros(entity_count, dtype=force_dtype, device=device)
+        if self._entries[mapping.src_name].interval > 1:
+            mapping.window_forces = wp.zeros(proxy_count, dtype=force_dtype, device=device)
 
     def _entry_needs_gravity_acceleration(self, entry) -> bool:
         return any(mapping.dst_name == entry.name for mapping in self._proxy_mappings) or any(
@@ -1111,6 +1117,12 @@ class SolverCoupledProxy(SolverCoupled):
                         device=self.model.device,
                     )
 
+        # Every reset restarts the multirate windows, so partially harvested feedback is discarded.
+        for mapping in mappings:
+            if mapping.window_forces is not None:
+                mapping.window_forces.zero_()
+            mapping.window_count = 0
+
         for config in self._proxy_collision_configs.values():
             if world_mask is None:
                 config.collide_counter = 0
@@ -1333,6 +1345,38 @@ class SolverCoupledProxy(SolverCoupled):
             if k > 0:
                 self._distribute_state(state_in, dt=dt, iteration_restart=True)
             self._step_proxy(state_in, control, contacts, dt, iteration_restart=k > 0)
+        self._accumulate_window_feedback()
+
+    def _accumulate_window_feedback(self) -> None:
+        """Sum the feedback harvested this step for sources that run at a coarser interval."""
+        for proxy in [*self._proxy_mappings, *self._proxy_particle_mappings]:
+            if proxy.window_forces is None or not self._entry_steps_this_step(self._entries[proxy.dst_name]):
+                continue
+            wp.launch(
+                accumulate_proxy_forces_kernel,
+                dim=proxy.proxy_ids_global.shape[0],
+                inputs=[proxy.proxy_ids_global, proxy.coupling_forces, proxy.window_forces],
+                device=self.model.device,
+            )
+            proxy.window_count += 1
+
+    def _apply_window_feedback(self, proxy: _ProxyEntityMapping) -> None:
+        """Feed a multirate source the mean of the feedback harvested during its last window."""
+        if proxy.window_forces is None or proxy.window_count == 0:
+            return
+        wp.launch(
+            average_proxy_forces_kernel,
+            dim=proxy.proxy_ids_global.shape[0],
+            inputs=[
+                1.0 / float(proxy.window_count),
+                proxy.proxy_ids_global,
+                proxy.window_forces,
+                proxy.coupling_forces,
+            ],
+            device=self.model.device,
+        )
+        proxy.window_forces.zero_()
+        proxy.window_count = 0
 
     def _reset_aitken_iteration_state(self) -> None:
         for proxy in [*self._proxy_mappings, *self._proxy_particle_mappings]:
@@ -1381,13 +1425,25 @@ class SolverCoupledProxy(SolverCoupled):
             joint_proxies = group["joints"]
             src = self._entries[src_name]
             dst = self._entries[dst_name]
+            # Multirate entries only run at the start of their window, with dt scaled to the window length.
+            src_steps = self._entry_steps_this_step(src)
+            dst_steps = self._entry_steps_this_step(dst)
+            src_dt = dt * src.interval
+            dst_dt = dt * dst.interval
 
-            for proxy in body_proxies:
-                self._stash_proxy_feedback(proxy)
-            for proxy in particle_proxies:
-                self._stash_proxy_feedback(proxy)
+            if src_steps and not iteration_restart:
+                for proxy in body_proxies:
+                    self._apply_window_feedback(proxy)
+                for proxy in particle_proxies:
+                    self._apply_window_feedback(proxy)
+
+            if dst_steps:
+                for proxy in body_proxies:
+                    self._stash_proxy_feedback(proxy)
+                for proxy in particle_proxies:
+                    self._stash_proxy_feedback(proxy)
 
-            if src.has_body_force_input and (src.body_indices.shape[0] > 0 or body_proxies):
+            if src_steps and src.has_body_force_input and (src.body_indices.shape[0] > 0 or body_proxies):
                 self._clear_body_force_input(src)
                 self._add_body_force_input(src, src.body_local_to_global, state_in.body_f)
                 for proxy in body_proxies:
@@ -1396,9 +1452,9 @@ class SolverCoupledProxy(SolverCoupled):
                         proxy.source_local_to_proxy_global,
                         proxy.coupling_forces,
                     )
-                self._notify_input_state_update(src, StateFlags.BODY_F, dt=dt)
+                self._notify_input_state_update(src, StateFlags.BODY_F, dt=src_dt)
 
-            if src.has_particle_force_input and (src.particle_indices.shape[0] > 0 or particle_proxies):
+            if src_steps and src.has_particle_force_input and (src.particle_indices.shape[0] > 0 or particle_proxies):
                 self._clear_particle_force_input(src)
                 self._add_particle_force_input(src, src.particle_local_to_global, state_in.particle_f)
                 for proxy in particle_proxies:
@@ -1407,20 +1463,23 @@ class SolverCoupledProxy(SolverCoupled):
                         proxy.source_local_to_proxy_global,
                         proxy.coupling_forces,
                     )
-                self._notify_input_state_update(src, StateFlags.PARTICLE_F, dt=dt)
+                self._notify_input_state_update(src, StateFlags.PARTICLE_F, dt=src_dt)
 
             self._step_entry(src, control, contacts, dt)
+            src_out = self._entry_output_state(src)
+            if not dst_steps:
+                continue
 
             for proxy in body_proxies:
                 is_staggered = int(proxy.mode) == int(_ProxyMode.STAGGERED)
-                sync_body_q = src.state_1.body_q if is_staggered else src.state_0.body_q
+                sync_body_q = src_out.body_q if is_staggered else src.state_0.body_q
 
                 wp.launch(
                     sync_proxy_states_kernel,
                     dim=proxy.source_local_to_proxy_local.shape[0],
                     inputs=[
                         sync_body_q,
-                        src.state_1.body_qd,
+                        src_out.body_qd,
                         proxy.source_local_to_proxy_local,
                         dst.state_0.body_q,
                         dst.state_0.body_qd,
@@ -1431,7 +1490,7 @@ class SolverCoupledProxy(SolverCoupled):
                 self._notify_input_state_update(
                     dst,
                     StateFlags.BODY_Q | StateFlags.BODY_QD,
-                    dt=dt,
+                    dt=dst_dt,
                 )
 
                 wp.copy(proxy.proxy_qd_before, dst.state_0.body_qd)
@@ -1444,20 +1503,20 @@ class SolverCoupledProxy(SolverCoupled):
                     dst.state_0,
                     proxy.coupling_forces,
                     dst.body_gravity_acceleration,
-                    dt,
+                    dst_dt,
                 )
-                self._notify_input_state_update(dst, StateFlags.BODY_QD | StateFlags.BODY_F, dt=dt)
+                self._notify_input_state_update(dst, StateFlags.BODY_QD | StateFlags.BODY_F, dt=dst_dt)
 
             for proxy in particle_proxies:
                 is_staggered = int(proxy.mode) == int(_ProxyMode.STAGGERED)
-                sync_particle_q = src.state_1.particle_q if is_staggered else src.state_0.particle_q
+                sync_particle_q = src_out.particle_q if is_staggered else src.state_0.particle_q
 
                 wp.launch(
                     sync_proxy_particles_kernel,
                     dim=proxy.source_local_to_proxy_local.shape[0],
                     inputs=[
                         sync_particle_q,
-                        src.state_1.particle_qd,
+                        src_out.particle_qd,
                         proxy.source_local_to_proxy_local,
                         dst.state_0.particle_q,
                         dst.state_0.particle_qd,
@@ -1468,7 +1527,7 @@ class SolverCoupledProxy(SolverCoupled):
                 self._notify_input_state_update(
                     dst,
                     StateFlags.PARTICLE_Q | StateFlags.PARTICLE_QD,
-                    dt=dt,
+                    dt=dst_dt,
                 )
 
                 wp.copy(proxy.proxy_qd_before, dst.state_0.particle_qd)
@@ -1481,9 +1540,9 @@ class SolverCoupledProxy(SolverCoupled):
                     dst.state_0,
                     proxy.coupling_forces,
                     dst.particle_gravity_acceleration,
-                    dt,
+                    dst_dt,
                 )
-                self._notify_input_state_update(dst, StateFlags.PARTICLE_QD, dt=dt)
+                self._notify_input_state_update(dst, StateFlags.PARTICLE_QD, dt=dst_dt)
 
             dst_contacts = contacts
             # Without a proxy-local collision pipeline, the caller-provided
@@ -1552,7 +1611,7 @@ class SolverCoupledProxy(SolverCoupled):
                     state=dst.state_0,
                     state_out=dst.state_1,
                     contacts=dst_contacts_used,
-                    dt=dt,
+                    dt=dst_dt,
                 )
                 self._blend_proxy_feedback(proxy)
 
@@ -1564,6 +1623,6 @@ class SolverCoupledProxy(SolverCoupled):
                     state=dst.state_0,
                     state_out=dst.state_1,
                     contacts=dst_contacts_used,
-                    dt=dt,
+                    dt=dst_dt,
                 )
                 self._blend_proxy_feedback(proxy)
@@ -6,6 +6,7 @@ import warp as wp
 
 from ...core.types import override
 from ...sim import BodyFlags, Contacts, Control, JointType, Model, ModelFlags, State
+from ...utils.benchmark import profile_scope
 from ...utils.deprecation import deprecate_nonkeyword_arguments
 from ..coupled.interface import CouplingInterface
 from ..semi_implicit import kernels_contact, kernels_muscle, kernels_particle
@@ -458,6 +459,7 @@ class SolverFeatherstone(SolverBase, CouplingInterface):
 
             target._featherstone_augmented = True
 
+    @profile_scope
     @override
     def step(
         self,
@@ -22,6 +22,7 @@ import newton
 
 from ...core.types import override
 from ...sim import ModelFlags, StateFlags
+from ...utils.benchmark import profile_scope
 from ...utils.deprecation import deprecate_nonkeyword_arguments
 from ..coupled.interface import CouplingInterface
 from ..solver import SolverBase
@@ -1897,6 +1898,7 @@ class SolverImplicitMPM(SolverBase, CouplingInterface):
                 world_count=self._initial_world_count,
             )
 
+    @profile_scope
     @override
     def step(
         self,
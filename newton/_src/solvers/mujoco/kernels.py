@@ -3206,6 +3206,72 @@ def reset_world_buffers_kernel(
         xfrc_applied[worldid, i] = wp.spatial_vector(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
 
 
+@wp.kernel(enable_backward=False)
+def restore_warm_start_kernel(
+    world_mask: wp.array[wp.bool],
+    world_keys: wp.array[wp.int32],
+    cache_keys: wp.array[wp.int32],
+    cache_qacc: wp.array2d[wp.float32],
+    # outputs
+    qacc_warmstart: wp.array2d[wp.float32],
+    pending_keys: wp.array[wp.int32],
+    stats: wp.array[wp.int32],
+):
+    """Restore cached ``qacc_warmstart`` rows for the worlds selected by ``world_mask``.
+
+    Worlds with a negative key, or all worlds when ``world_keys`` is ``None``,
+    only drop their pending entry. On a hit the cached row is
+    copied into the world's warm start; on a miss the key is recorded in
+    ``pending_keys`` so :func:`store_warm_start_kernel` caches the converged
+    acceleration of the next step. ``stats[0]`` / ``stats[1]`` count hits and
+    misses.
+    """
+    worldid = wp.tid()
+    if world_mask and not world_mask[worldid]:
+        return
+    pending_keys[worldid] = -1
+    if not world_keys:
+        return
+    key = world_keys[worldid]
+    if key < 0:
+        return
+    for slot in range(cache_keys.shape[0]):
+        if cache_keys[slot] == key:
+            for i in range(qacc_warmstart.shape[1]):
+                qacc_warmstart[worldid, i] = cache_qacc[slot, i]
+            wp.atomic_add(stats, 0, 1)
+            return
+    pending_keys[worldid] = key
+    wp.atomic_add(stats, 1, 1)
+
+
+@wp.kernel(enable_backward=False)
+def store_warm_start_kernel(
+    qacc_warmstart: wp.array2d[wp.float32],
+    # outputs
+    pending_keys: wp.array[wp.int32],
+    cache_keys: wp.array[wp.int32],
+    cache_qacc: wp.array2d[wp.float32],
+):
+    """Cache the converged warm start of worlds whose key missed on reset.
+
+    Slots are claimed with an atomic compare-and-swap on ``cache_keys``, so
+    worlds missing on the same key share one slot. When all slots hold other
+    keys the entry is dropped.
+    """
+    worldid = wp.tid()
+    key = pending_keys[worldid]
+    if key < 0:
+        return
+    pending_keys[worldid] = -1
+    for slot in range(cache_keys.shape[0]):
+        prev = wp.atomic_cas(cache_keys, slot, -1, key)
+        if prev == -1 or prev == key:
+            for i in range(qacc_warmstart.shape[1]):
+                cache_qacc[slot, i] = qacc_warmstart[worldid, i]
+            return
+
+
 @wp.kernel(enable_backward=False)
 def reset_sleeping_state_kernel(
     world_mask: wp.array[wp.bool],
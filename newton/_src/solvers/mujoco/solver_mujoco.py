@@ -87,6 +87,8 @@ from .kernels import (
     reset_sleeping_state_kernel,
     reset_world_buffers_kernel,
     restore_sleeping_state_kernel,
+    restore_warm_start_kernel,
+    store_warm_start_kernel,
     sync_qpos0_kernel,
     sync_site_xposes_kernel,
     sync_worldbody_geom_xposes_kernel,
@@ -3411,6 +3413,7 @@ class SolverMuJoCo(SolverBase, CouplingInterface):
         include_sites: bool = True,
         skip_visual_only_geoms: bool = True,
         deterministic: wp.DeterministicMode | None = None,
+        warm_start_cache_size: int = 0,
     ):
         """
         Solver options (e.g., ``impratio``) follow this resolution priority:
@@ -3456,6 +3459,10 @@ class SolverMuJoCo(SolverBase, CouplingInterface):
             deterministic: Deterministic mode for MuJoCo Warp solver kernels. Pass a
                 :class:`warp.DeterministicMode`, or ``None`` to inherit
                 ``wp.config.deterministic``.
+            warm_start_cache_size: Number of canonical initial states whose converged
+                acceleration warm start is cached across :meth:`reset` calls (see the
+                ``warm_start_keys`` argument of :meth:`reset`). ``0`` disables the cache.
+                Requires the MuJoCo Warp GPU backend.
         """
         super().__init__(model)
 
@@ -3486,6 +3493,18 @@ class SolverMuJoCo(SolverBase, CouplingInterface):
             if use_mujoco_cpu:
                 raise ValueError("nvmax is only supported by the MuJoCo Warp GPU backend.")
             nvmax = int(nvmax)
+        if isinstance(warm_start_cache_size, bool) or not isinstance(warm_start_cache_size, (int, np.integer)):
+            raise TypeError(f"warm_start_cache_size must be an integer, got {type(warm_start_cache_size).__name__}.")
+        if warm_start_cache_size < 0:
+            raise ValueError(f"warm_start_cache_size must be non-negative, got {warm_start_cache_size}.")
+        if warm_start_cache_size > 0 and use_mujoco_cpu:
+            raise ValueError("warm_start_cache_size is only supported by the MuJoCo Warp GPU backend.")
+        self.warm_start_cache_size = int(warm_start_cache_size)
+        """Number of warm-start cache slots; ``0`` when the cache is disabled."""
+        self._warm_start_keys: wp.array[wp.int32] | None = None
+        self._warm_start_qacc: wp.array2d[wp.float32] | None = None
+        self._warm_start_pending: wp.array[wp.int32] | None = None
+        self._warm_start_stats: wp.array[wp.int32] | None = None
         if sleep_tolerance is not None and (not math.isfinite(sleep_tolerance) or sleep_tolerance < 0.0):
             raise ValueError(f"sleep_tolerance must be finite and non-negative, got {sleep_tolerance}.")
         self.enable_sleeping = enable_sleeping
@@ -3811,6 +3830,13 @@ class SolverMuJoCo(SolverBase, CouplingInterface):
                 if not self.mjw_model.opt.run_collision_detection:
                     self._convert_contacts_to_mjwarp(self.model, state_in, contacts)
                 self._mujoco_warp_step()
+                if self._warm_start_pending is not None:
+                    wp.launch(
+                        store_warm_start_kernel,
+                        dim=self.mjw_data.nworld,
+                        inputs=[self.mjw_data.qacc_warmstart],
+                        outputs=[self._warm_start_pending, self._warm_start_keys, self._warm_start_qacc],
+                    )
                 self._update_newton_state(self.model, state_out, self.mjw_data, state_prev=state_in)
         self._step += 1
 
@@ -3820,6 +3846,7 @@ class SolverMuJoCo(SolverBase, CouplingInterface):
         state: State,
         world_mask: wp.array[wp.bool] | None = None,
         flags: StateFlags | int | None = None,
+        warm_start_keys: wp.array[wp.int32] | None = None,
     ) -> None:
         """Reset joint state to model defaults and clear MuJoCo's internal buffers.
 
@@ -3868,9 +3895,24 @@ class SolverMuJoCo(SolverBase, CouplingInterface):
             flags: Optional :class:`~newton.StateFlags` bitmask controlling which
                 joint-state quantities are reset. If ``None``, all are reset.
                 The internal MuJoCo buffers are always cleared regardless.
+            warm_start_keys: Optional per-world ``int32`` keys of shape
+                ``(world_count,)`` identifying the canonical initial state each
+                selected world restarts from. Requires ``warm_start_cache_size > 0``.
+                On a cache hit the stored warm start replaces the cleared
+                ``qacc_warmstart``; on a miss the converged warm start of the next
+                :meth:`step` is stored under the key. Negative keys are not cached.
+                See :attr:`warm_start_hits` and :attr:`warm_start_misses`.
         """
         if state is None:
             raise ValueError("'state' argument is required.")
+        if warm_start_keys is not None:
+            if self.warm_start_cache_size == 0:
+                raise ValueError("warm_start_keys requires SolverMuJoCo(warm_start_cache_size > 0).")
+            if warm_start_keys.shape != (self.model.world_count,) or warm_start_keys.dtype != wp.int32:
+                raise ValueError(
+                    f"warm_start_keys must be an int32 array of shape ({self.model.world_count},), "
+                    f"got {warm_start_keys.dtype.__name__} array of shape {warm_start_keys.shape}."
+                )
 
         world_mask = self._normalize_reset_world_mask(world_mask)
         world_count = self.model.world_count
@@ -3939,6 +3981,16 @@ class SolverMuJoCo(SolverBase, CouplingInterface):
             inputs=[world_mask, *buffers],
             device=self.model.device,
         )
+        if warm_start_keys is not None or self._warm_start_keys is not None:
+            # Also runs without keys so that plain resets drop pending stores.
+            self._ensure_warm_start_cache()
+            wp.launch(
+                restore_warm_start_kernel,
+                dim=d.nworld,
+                inputs=[world_mask, warm_start_keys, self._warm_start_keys, self._warm_start_qacc],
+                outputs=[d.qacc_warmstart, self._warm_start_pending, self._warm_start_stats],
+                device=self.model.device,
+            )
         if self.enable_sleeping:
             self._update_mjc_data(d, self.model, state, world_mask=world_mask)
             self._wake_sleeping_worlds(world_mask, clear_overflow=True)
@@ -3949,6 +4001,46 @@ class SolverMuJoCo(SolverBase, CouplingInterface):
                 self._mujoco_warp.fwd_velocity(self.mjw_model, d)
             self._restore_initial_sleeping_state(world_mask, clear_overflow=True)
 
+    def _ensure_warm_start_cache(self) -> None:
+        """Allocate the warm-start cache buffers on first use."""
+        if self._warm_start_keys is not None:
+            return
+        d = self.mjw_data
+        device = self.model.device
+        self._warm_start_keys = wp.full(self.warm_start_cache_size, -1, dtype=wp.int32, device=device)
+        self._warm_start_qacc = wp.zeros(
+            (self.warm_start_cache_size, d.qacc_warmstart.shape[1]), dtype=wp.float32, device=device
+        )
+        self._warm_start_pending = wp.full(d.nworld, -1, dtype=wp.int32, device=device)
+        self._warm_start_stats = wp.zeros(2, dtype=wp.int32, device=device)
+
+    @property
+    def warm_start_hits(self) -> int:
+        """Number of per-world resets that restored a cached warm start."""
+        if self._warm_start_stats is None:
+            return 0
+        return int(self._warm_start_stats.numpy()[0])
+
+    @property
+    def warm_start_misses(self) -> int:
+        """Number of per-world resets whose key was not in the warm-start cache."""
+        if self._warm_start_stats is None:
+            return 0
+        return int(self._warm_start_stats.numpy()[1])
+
+    def clear_warm_start_cache(self) -> None:
+        """Drop all cached warm starts and reset the hit/miss counters.
+
+        Call this after model changes that alter the dynamics of the canonical
+        states substantially; stale entries remain valid initial guesses but
+        lose their benefit.
+        """
+        if self._warm_start_keys is None:
+            return
+        self._warm_start_keys.fill_(-1)
+        self._warm_start_pending.fill_(-1)
+        self._warm_start_stats.zero_()
+
     def _capture_initial_sleeping_state(self) -> None:
         """Capture the template world's initial sleep bookkeeping."""
         if not self.enable_sleeping or self.mjw_data is None:
@@ -5,6 +5,7 @@ import warp as wp
 
 from ...core.types import override
 from ...sim import Contacts, Control, Model, State
+from ...utils.benchmark import profile_scope
 from ...utils.deprecation import deprecate_nonkeyword_arguments
 from ..coupled.interface import CouplingInterface
 from ..solver import SolverBase
@@ -120,6 +121,7 @@ class SolverSemiImplicit(SolverBase, CouplingInterface):
             with wp.ScopedDevice(model.device):
                 model.particle_grid.reserve(model.particle_count)
 
+    @profile_scope
     @override
     def step(
         self,
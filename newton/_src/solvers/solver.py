@@ -10,6 +10,7 @@ import warp as wp
 from ..core.reset import normalize_reset_world_mask
 from ..geometry import ParticleFlags
 from ..sim import BodyFlags, Contacts, Control, Model, ModelBuilder, ModelFlags, State, StateFlags
+from ..sim.sleep import copy_body_sleeping
 
 
 def _set_module_options_if_changed(options: dict[str, Any], module: Any) -> bool:
@@ -120,6 +121,7 @@ def integrate_bodies(
     inv_I: wp.array[wp.mat33],
     body_flags: wp.array[wp.int32],
     body_world: wp.array[wp.int32],
+    body_sleeping: wp.array[wp.int32],
     gravity: wp.array[wp.vec3],
     angular_damping: float,
     dt: float,
@@ -129,6 +131,13 @@ def integrate_bodies(
 ):
     tid = wp.tid()
 
+    if body_sleeping:
+        if body_sleeping[tid] != 0:
+            # Sleeping bodies are frozen until the sleep manager wakes them.
+            body_q_new[tid] = body_q[tid]
+            body_qd_new[tid] = wp.spatial_vector()
+            return
+
     if (body_flags[tid] & BodyFlags.KINEMATIC) != 0:
         # Kinematic bodies are user-prescribed and pass through unchanged.
         # NOTE: SemiImplicit does not zero inv_mass/inv_inertia for kinematic
@@ -175,11 +184,15 @@ def _update_effective_inv_mass_inertia(
     body_flags: wp.array[wp.int32],
     model_inv_mass: wp.array[float],
     model_inv_inertia: wp.array[wp.mat33],
+    body_sleeping: wp.array[wp.int32],
     eff_inv_mass: wp.array[float],
     eff_inv_inertia: wp.array[wp.mat33],
 ):
     tid = wp.tid()
-    if (body_flags[tid] & BodyFlags.KINEMATIC) != 0:
+    asleep = False
+    if body_sleeping:
+        asleep = body_sleeping[tid] != 0
+    if (body_flags[tid] & BodyFlags.KINEMATIC) != 0 or asleep:
         eff_inv_mass[tid] = 0.0
         eff_inv_inertia[tid] = wp.mat33(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
     else:
@@ -247,8 +260,8 @@ class SolverBase:
         if model.body_count:
             self._refresh_kinematic_state()
 
-    def _refresh_kinematic_state(self):
-        """Update effective arrays from model, zeroing kinematic bodies."""
+    def _refresh_kinematic_state(self, body_sleeping: wp.array[wp.int32] | None = None):
+        """Update effective arrays from model, zeroing kinematic and sleeping bodies."""
         model = self.model
         if model.body_count:
             wp.launch(
@@ -258,6 +271,7 @@ class SolverBase:
                     model.body_flags,
                     model.body_inv_mass,
                     model.body_inv_inertia,
+                    body_sleeping,
                     self.body_inv_mass_effective,
                     self.body_inv_inertia_effective,
                 ],
@@ -275,6 +289,9 @@ class SolverBase:
         """
         Integrate the rigid bodies of the model.
 
+        Bodies flagged in :attr:`State.body_sleeping <newton.State.body_sleeping>` keep their pose, have their
+        velocity zeroed, and carry their sleep flag over to ``state_out``.
+
         Args:
             model: The model to integrate.
             state_in: The input state.
@@ -298,6 +315,7 @@ class SolverBase:
                     model.body_inv_inertia,
                     model.body_flags,
                     model.body_world,
+                    state_in.body_sleeping,
                     model.gravity,
                     angular_damping,
                     dt,
@@ -305,6 +323,7 @@ class SolverBase:
                 outputs=[state_out.body_q, state_out.body_qd],
                 device=model.device,
             )
+            copy_body_sleeping(state_in, state_out)
 
     def integrate_particles(
         self,
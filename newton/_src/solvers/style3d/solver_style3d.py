@@ -7,6 +7,7 @@ import warp as wp
 
 from ...core.types import override
 from ...sim import Contacts, Control, Model, ModelBuilder, State
+from ...utils.benchmark import profile_scope
 from ...utils.deprecation import deprecate_nonkeyword_arguments
 from ..solver import SolverBase
 from .builder import PDMatrixBuilder
@@ -165,6 +166,7 @@ class SolverStyle3D(SolverBase):
         self.drag_index = wp.array([-1], dtype=int, device=self.device)
         self.drag_bary_coord = wp.zeros(1, dtype=wp.vec3, device=self.device)
 
+    @profile_scope
     @override
     def step(self, state_in: State, state_out: State, control: Control, contacts: Contacts, dt: float) -> None:
         """Advance the Style3D solver by one time step.
@@ -19,6 +19,7 @@ from newton._src.solvers.vbd.rigid_vbd_kernels import (
     _eval_body_particle_contact,
     _eval_soft_ef_contact,
     _reset_world_selected,
+    _world_iterating,
     evaluate_body_particle_contact,
 )
 
@@ -2455,8 +2456,12 @@ def solve_elasticity_tile(
     particle_adjacency: MeshAdjacencyData,
     particle_forces: wp.array[wp.vec3],
     particle_hessians: wp.array[wp.mat33],
+    # adaptive iterations (null world_active disables masking)
+    particle_world: wp.array[wp.int32],
+    world_active: wp.array[wp.int32],
     # output
     particle_displacements: wp.array[wp.vec3],
+    world_residual: wp.array[float],
 ):
     tid = wp.tid()
     block_idx = tid // TILE_SIZE_TRI_MESH_ELASTICITY_SOLVE
@@ -2468,6 +2473,11 @@ def solve_elasticity_tile(
             particle_displacements[particle_index] = wp.vec3(0.0)
         return
 
+    # particles of converged worlds keep their accumulated displacement
+    world = particle_world[particle_index]
+    if not _world_iterating(world, world_active):
+        return
+
     dt_sqr_reciprocal = 1.0 / (dt * dt)
 
     # elastic force and hessian
@@ -2593,7 +2603,11 @@ def solve_elasticity_tile(
                 + mass[particle_index] * (inertia[particle_index] - pos[particle_index]) * (dt_sqr_reciprocal)
                 + particle_forces[particle_index]
             )
-            particle_displacements[particle_index] = particle_displacements[particle_index] + h_inv * f_total
+            dx = h_inv * f_total
+            particle_displacements[particle_index] = particle_displacements[particle_index] + dx
+            if world_residual:
+                if world >= 0:
+                    wp.atomic_max(world_residual, world, wp.length(dx))
 
 
 @wp.kernel
@@ -2619,8 +2633,12 @@ def solve_elasticity(
     particle_adjacency: MeshAdjacencyData,
     particle_forces: wp.array[wp.vec3],
     particle_hessians: wp.array[wp.mat33],
+    # adaptive iterations (null world_active disables masking)
+    particle_world: wp.array[wp.int32],
+    world_active: wp.array[wp.int32],
     # output
     particle_displacements: wp.array[wp.vec3],
+    world_residual: wp.array[float],
 ):
     t_id = wp.tid()
 
@@ -2630,6 +2648,11 @@ def solve_elasticity(
         particle_displacements[particle_index] = wp.vec3(0.0)
         return
 
+    # particles of converged worlds keep their accumulated displacement
+    world = particle_world[particle_index]
+    if not _world_iterating(world, world_active):
+        return
+
     dt_sqr_reciprocal = 1.0 / (dt * dt)
 
     # inertia force and hessian
@@ -2734,7 +2757,11 @@ def solve_elasticity(
 
     if abs(wp.determinant(h)) > 1e-8:
         h_inv = wp.inverse(h)
-        particle_displacements[particle_index] = particle_displacements[particle_index] + h_inv * f
+        dx = h_inv * f
+        particle_displacements[particle_index] = particle_displacements[particle_index] + dx
+        if world_residual:
+            if world >= 0:
+                wp.atomic_max(world_residual, world, wp.length(dx))
 
 
 @wp.kernel
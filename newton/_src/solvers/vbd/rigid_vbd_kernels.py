@@ -283,6 +283,18 @@ def _contact_world_selected(
     return _shape_world_selected(shape1, shape_world, shape_body, body_world, mask)
 
 
+@wp.func
+def _world_iterating(world: int, world_active: wp.array[wp.int32]):
+    """Return whether ``world`` still runs solver iterations.
+
+    Always true without adaptive iterations (``world_active`` is null) and for global entities.
+    """
+    if world_active:
+        if world >= 0:
+            return world_active[world] != 0
+    return True
+
+
 @wp.func
 def ldlt6_solve(h_ll: wp.mat33, h_aa: wp.mat33, h_al: wp.mat33, rhs_lin: wp.vec3, rhs_ang: wp.vec3):
     """Solve the 6x6 SPD block system via direct LDL^T factorization.
@@ -5048,6 +5060,8 @@ def accumulate_body_body_contacts_per_body(
     body_contact_buffer_pre_alloc: int,
     body_contact_counts: wp.array[wp.int32],
     body_contact_indices: wp.array[wp.int32],
+    body_world: wp.array[wp.int32],
+    world_active: wp.array[wp.int32],
     body_forces: wp.array[wp.vec3],
     body_torques: wp.array[wp.vec3],
     body_hessian_ll: wp.array[wp.mat33],
@@ -5066,7 +5080,7 @@ def accumulate_body_body_contacts_per_body(
         return
 
     body_id = color_group[body_idx_in_group]
-    if body_inv_mass[body_id] <= 0.0:
+    if body_inv_mass[body_id] <= 0.0 or not _world_iterating(body_world[body_id], world_active):
         return
 
     num_contacts = body_contact_counts[body_id]
@@ -5390,6 +5404,9 @@ def accumulate_body_particle_contacts_per_body(
     body_particle_contact_buffer_pre_alloc: int,
     body_particle_contact_counts: wp.array[wp.int32],
     body_particle_contact_indices: wp.array[wp.int32],
+    # Adaptive iterations (null world_active disables masking)
+    body_world: wp.array[wp.int32],
+    world_active: wp.array[wp.int32],
     # Outputs
     body_forces: wp.array[wp.vec3],
     body_torques: wp.array[wp.vec3],
@@ -5420,7 +5437,7 @@ def accumulate_body_particle_contacts_per_body(
         return
 
     body_id = color_group[body_idx_in_group]
-    if body_inv_mass[body_id] <= 0.0:
+    if body_inv_mass[body_id] <= 0.0 or not _world_iterating(body_world[body_id], world_active):
         return
 
     num_contacts = body_particle_contact_counts[body_id]
@@ -5594,8 +5611,12 @@ def solve_rigid_body(
     external_hessian_ll: wp.array[wp.mat33],
     external_hessian_al: wp.array[wp.mat33],
     external_hessian_aa: wp.array[wp.mat33],
+    # Adaptive iterations (null world_active disables masking)
+    body_world: wp.array[wp.int32],
+    world_active: wp.array[wp.int32],
     # Output
     body_q_new: wp.array[wp.transform],
+    world_residual: wp.array[float],
 ):
     """
     AVBD solve step for rigid bodies.
@@ -5628,8 +5649,12 @@ def solve_rigid_body(
         external_hessian_ll: Preaccumulated rigid-contact linear block.
         external_hessian_al: Preaccumulated rigid-contact angular-linear block.
         external_hessian_aa: Preaccumulated rigid-contact angular block.
+        body_world: World index of each body.
+        world_active: Per-world flag; bodies of worlds flagged 0 keep their pose. Null disables masking.
         body_q: Current body transforms (input).
         body_q_new: Updated body transforms (output) for the current solve sweep.
+        world_residual: Per-world maximum of the linear [m] and angular [rad] pose increments (output,
+            atomic max). Null skips the residual.
 
     Note:
       - All forces, torques, and Hessian blocks are expressed in the world frame.
@@ -5639,8 +5664,9 @@ def solve_rigid_body(
 
     q_current = body_q[body_index]
 
-    # Early exit for kinematic bodies
-    if body_inv_mass[body_index] == 0.0:
+    # Early exit for kinematic bodies and bodies of converged worlds
+    world = body_world[body_index]
+    if body_inv_mass[body_index] == 0.0 or not _world_iterating(world, world_active):
         body_q_new[body_index] = q_current
         return
 
@@ -5806,6 +5832,9 @@ def solve_rigid_body(
     pos_new = com_new - wp.quat_rotate(rot_new, body_com_local)
 
     body_q_new[body_index] = wp.transform(pos_new, rot_new)
+    if world_residual:
+        if world >= 0:
+            wp.atomic_max(world_residual, world, wp.max(wp.length(x_inc), wp.length(w_world)))
 
 
 @wp.kernel
@@ -5847,6 +5876,8 @@ def update_duals_joint(
     joint_rest_angle: wp.array[float],
     joint_drive_limit_support: wp.array[float],
     dt: float,
+    joint_world: wp.array[wp.int32],
+    world_active: wp.array[wp.int32],
     # Input/output
     joint_penalty_k: wp.array[float],
     joint_lambda_lin: wp.array[wp.vec3],
@@ -5862,7 +5893,7 @@ def update_duals_joint(
     """
     j = wp.tid()
 
-    if not joint_enabled[j]:
+    if not joint_enabled[j] or not _world_iterating(joint_world[j], world_active):
         return
 
     parent = joint_parent[j]
@@ -6428,6 +6459,8 @@ def update_duals_body_body_contacts(
     contact_tangent_rho: wp.array[float],
     contact_normal_rho: wp.array[float],
     beta: float,
+    body_world: wp.array[wp.int32],
+    world_active: wp.array[wp.int32],
     # Input/output
     contact_penalty_k: wp.array[float],
     contact_lambda: wp.array[wp.vec3],
@@ -6446,6 +6479,8 @@ def update_duals_body_body_contacts(
 
     if body_id_0 < 0 and body_id_1 < 0:
         return
+    if not _world_iterating(body_world[wp.where(body_id_0 >= 0, body_id_0, body_id_1)], world_active):
+        return
 
     cp0_local = rigid_contact_point0[idx]
     cp1_local = rigid_contact_point1[idx]
@@ -6534,6 +6569,8 @@ def update_duals_body_particle_contacts(
     body_q: wp.array[wp.transform],
     body_particle_contact_material_ke: wp.array[float],
     beta: float,
+    particle_world: wp.array[wp.int32],
+    world_active: wp.array[wp.int32],
     body_particle_contact_penalty_k: wp.array[float],
 ):
     """
@@ -6549,6 +6586,8 @@ def update_duals_body_particle_contacts(
         return
 
     corners = soft_contact_indices[idx]
+    if not _world_iterating(particle_world[corners[0]], world_active):
+        return
     shape_idx = body_particle_contact_shape[idx]
     body_idx = shape_body[shape_idx] if shape_idx >= 0 else -1
 
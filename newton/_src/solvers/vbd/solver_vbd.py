@@ -24,6 +24,7 @@ from ...sim import (
 )
 from ...sim.collide import _count_soft_particle_rigid_contact_pairs
 from ...utils import is_graph_capture_allocation_enabled
+from ...utils.benchmark import profile_scope
 from ...utils.deprecation import deprecate_nonkeyword_arguments
 from ..coupled.interface import CouplingInterface
 from ..solver import SolverBase
@@ -277,6 +278,7 @@ class SolverVBD(SolverBase, CouplingInterface):
         iterations: int = 10,
         friction_epsilon: float = 1e-2,
         integrate_with_external_rigid_solver: bool = False,
+        convergence_tolerance: float | None = None,
         # Particle parameters
         particle_enable_self_contact: bool = False,
         particle_self_contact_radius: float = 0.2,
@@ -330,6 +332,12 @@ class SolverVBD(SolverBase, CouplingInterface):
                 and rigid body contacts).
             integrate_with_external_rigid_solver: Indicator for coupled rigid body-cloth simulation. When set to `True`,
                 the solver assumes rigid bodies are integrated by an external solver (one-way coupling).
+            convergence_tolerance: Enables adaptive per-world iteration budgets when set. A world stops iterating
+                once the largest particle displacement [m] or rigid-body pose increment [m or rad] of one iteration
+                is at most this value: its bodies and particles keep their poses and its joint and contact duals are
+                no longer updated. ``iterations`` then acts as the maximum budget, and the number of iterations each
+                world used is reported by :attr:`world_iterations`. Defaults to ``None`` (every world runs all
+                ``iterations``).
 
             Particle parameters:
 
@@ -594,6 +602,18 @@ class SolverVBD(SolverBase, CouplingInterface):
         # Common parameters
         self.iterations = iterations
         self.friction_epsilon = friction_epsilon
+
+        if convergence_tolerance is not None and convergence_tolerance < 0.0:
+            raise ValueError(f"convergence_tolerance must be non-negative, got {convergence_tolerance}")
+        self.convergence_tolerance = convergence_tolerance
+        self._world_active = None
+        self._world_residual = None
+        self._world_iterations = None
+        if convergence_tolerance is not None:
+            world_count = max(model.world_count, 1)
+            self._world_active = wp.ones(world_count, dtype=wp.int32, device=model.device)
+            self._world_residual = wp.zeros(world_count, dtype=float, device=model.device)
+            self._world_iterations = wp.zeros(world_count, dtype=wp.int32, device=model.device)
         self._joint_mode_deprecation_warned = False
 
         # Rigid integration mode: when True, rigid bodies are integrated by an external
@@ -1033,6 +1053,15 @@ class SolverVBD(SolverBase, CouplingInterface):
         if flags & (ModelFlags.JOINT_PROPERTIES | ModelFlags.BODY_PROPERTIES):
             self._refresh_rod_rest_bend_twist_cache()
 
+    @property
+    def world_iterations(self) -> wp.array | None:
+        """Number of iterations each world ran during the last :meth:`step`, shape ``[world_count]``, int.
+
+        Only available when the solver was created with ``convergence_tolerance``; ``None`` otherwise.
+        Worlds that did not converge report the full ``iterations`` budget.
+        """
+        return self._world_iterations
+
     @override
     def coupling_supports_inertial_property_refresh(self) -> bool:
         return True
@@ -2024,6 +2053,7 @@ class SolverVBD(SolverBase, CouplingInterface):
             # in existing CUDA graphs, silently ignoring the mode change on replay.
             self.joint_is_hard.assign(is_hard_np)
 
+    @profile_scope
     @override
     def step(
         self,
@@ -2069,9 +2099,24 @@ class SolverVBD(SolverBase, CouplingInterface):
         self._initialize_rigid_bodies(state_in, control, contacts, dt, update_rigid)
         self._initialize_particles(state_in, state_out, dt)
 
+        # Converged worlds are masked out of later iterations instead of ending the loop early, which keeps the
+        # launch sequence fixed and the step graph-capturable.
+        if self._world_iterations is not None:
+            self._world_active.fill_(1)
+            self._world_residual.zero_()
+            self._world_iterations.zero_()
+
         for iter_num in range(self.iterations):
             self._solve_rigid_body_iteration(state_in, state_out, control, contacts, dt)
             self._solve_particle_iteration(state_in, state_out, contacts, dt, iter_num)
+            if self._world_iterations is not None:
+                wp.launch(
+                    kernel=xpbd_kernels.update_world_convergence,
+                    dim=self._world_active.shape[0],
+                    inputs=[self.convergence_tolerance],
+                    outputs=[self._world_residual, self._world_active, self._world_iterations],
+                    device=self.device,
+                )
 
         # Snapshot solved rigid contact state for next-frame warm-start.
         self._snapshot_rigid_contact_history(contacts)
@@ -2990,9 +3035,12 @@ class SolverVBD(SolverBase, CouplingInterface):
                         self.particle_adjacency,
                         self.particle_forces,
                         self.particle_hessians,
+                        self.model.particle_world,
+                        self._world_active,
                     ],
                     outputs=[
                         self.particle_displacements,
+                        self._world_residual,
                     ],
                     device=self.device,
                 )
@@ -3022,9 +3070,12 @@ class SolverVBD(SolverBase, CouplingInterface):
                         self.particle_adjacency,
                         self.particle_forces,
                         self.particle_hessians,
+                        self.model.particle_world,
+                        self._world_active,
                     ],
                     outputs=[
                         self.particle_displacements,
+                        self._world_residual,
                     ],
                     device=self.device,
                 )
@@ -3072,6 +3123,8 @@ class SolverVBD(SolverBase, CouplingInterface):
                         body_q,
                         self.body_particle_contact_material_ke,
                         self.rigid_linear_beta,
+                        model.particle_world,
+                        self._world_active,
                         self.body_particle_contact_penalty_k,  # input/output
                     ],
                     device=self.device,
@@ -3124,6 +3177,8 @@ class SolverVBD(SolverBase, CouplingInterface):
                         self.body_particle_contact_buffer_pre_alloc,
                         self.body_particle_contact_counts,
                         self.body_particle_contact_indices,
+                        model.body_world,
+                        self._world_active,
                     ],
                     outputs=[
                         self.body_forces,
@@ -3173,6 +3228,8 @@ class SolverVBD(SolverBase, CouplingInterface):
                         self.body_body_contact_buffer_pre_alloc,
                         self.body_body_contact_counts,
                         self.body_body_contact_indices,
+                        model.body_world,
+                        self._world_active,
                     ],
                     outputs=[
                         self.body_forces,
@@ -3241,9 +3298,12 @@ class SolverVBD(SolverBase, CouplingInterface):
                     self.body_hessian_ll,
                     self.body_hessian_al,
                     self.body_hessian_aa,
+                    model.body_world,
+                    self._world_active,
                 ],
                 outputs=[
                     state_in.body_q,
+                    self._world_residual,
                 ],
                 dim=color_group.size,
                 device=self.device,
@@ -3276,6 +3336,8 @@ class SolverVBD(SolverBase, CouplingInterface):
                     self.body_body_contact_tangent_rho,
                     self.body_body_contact_normal_rho,
                     self.rigid_linear_beta,
+                    model.body_world,
+                    self._world_active,
                     self.body_body_contact_penalty_k,  # input/output
                     self.body_body_contact_lambda,  # input/output
                 ],
@@ -3299,6 +3361,8 @@ class SolverVBD(SolverBase, CouplingInterface):
                     state_in.body_q,
                     self.body_particle_contact_material_ke,
                     self.rigid_linear_beta,
+                    model.particle_world,
+                    self._world_active,
                     self.body_particle_contact_penalty_k,  # input/output
                 ],
                 device=self.device,
@@ -3345,6 +3409,8 @@ class SolverVBD(SolverBase, CouplingInterface):
                     self.joint_rest_angle,
                     self.joint_drive_limit_support,
                     dt,
+                    model.joint_world,
+                    self._world_active,
                     self.joint_penalty_k,  # input/output
                     self.joint_lambda_lin,  # input/output
                     self.joint_lambda_ang,  # input/output
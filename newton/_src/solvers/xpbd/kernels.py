@@ -16,16 +16,34 @@ from ...sim import BodyFlags, JointType
 from ...sim.contacts import contact_surface_point, contact_surface_separation
 
 
+@wp.func
+def world_is_retired(world_active: wp.array[wp.int32], world: wp.int32):
+    """Return whether *world* has converged and is masked out of the remaining iterations.
+
+    ``world_active`` is ``None`` when adaptive iteration budgets are disabled.
+    """
+    if world_active:
+        if world >= 0:
+            return world_active[world] == 0
+    return False
+
+
 @wp.kernel
 def copy_kinematic_body_state_kernel(
     body_flags: wp.array[wp.int32],
+    body_sleeping: wp.array[wp.int32],
     body_q_in: wp.array[wp.transform],
     body_qd_in: wp.array[wp.spatial_vector],
     body_q_out: wp.array[wp.transform],
     body_qd_out: wp.array[wp.spatial_vector],
 ):
-    """Copy prescribed maximal state through the solve for kinematic bodies."""
+    """Copy prescribed maximal state through the solve for kinematic bodies and freeze sleeping ones."""
     tid = wp.tid()
+    if body_sleeping:
+        if body_sleeping[tid] != 0:
+            body_q_out[tid] = body_q_in[tid]
+            body_qd_out[tid] = wp.spatial_vector()
+            return
     if (body_flags[tid] & int(BodyFlags.KINEMATIC)) == 0:
         return
     body_q_out[tid] = body_q_in[tid]
@@ -138,6 +156,8 @@ def solve_particle_shape_contacts(
     contact_max: int,
     dt: float,
     relaxation: float,
+    particle_world: wp.array[wp.int32],
+    world_active: wp.array[wp.int32],
     # outputs
     delta: wp.array[wp.vec3],
     body_delta: wp.array[wp.spatial_vector],
@@ -151,6 +171,8 @@ def solve_particle_shape_contacts(
     shape_index = contact_shape[tid]
     body_index = shape_body[shape_index]
     particle_index = contact_particle[tid]
+    if world_is_retired(world_active, particle_world[particle_index]):
+        return
 
     particle_flag = particle_flags[particle_index]
     if (particle_flag & ParticleFlags.ACTIVE) == 0:
@@ -250,6 +272,8 @@ def solve_particle_particle_contacts(
     max_radius: float,
     dt: float,
     relaxation: float,
+    particle_world: wp.array[wp.int32],
+    world_active: wp.array[wp.int32],
     # outputs
     deltas: wp.array[wp.vec3],
 ):
@@ -260,6 +284,8 @@ def solve_particle_particle_contacts(
     if i == -1:
         # hash grid has not been built yet
         return
+    if world_is_retired(world_active, particle_world[i]):
+        return
     particle_flag = particle_flags[i]
     if (particle_flag & ParticleFlags.ACTIVE) == 0:
         return
@@ -322,12 +348,16 @@ def solve_springs(
     spring_damping: wp.array[float],
     dt: float,
     lambdas: wp.array[float],
+    particle_world: wp.array[wp.int32],
+    world_active: wp.array[wp.int32],
     delta: wp.array[wp.vec3],
 ):
     tid = wp.tid()
 
     i = spring_indices[tid * 2 + 0]
     j = spring_indices[tid * 2 + 1]
+    if world_is_retired(world_active, particle_world[i]):
+        return
 
     ke = spring_stiffness[tid]
     kd = spring_damping[tid]
@@ -387,6 +417,8 @@ def bending_constraint(
     bending_properties: wp.array2d[float],
     dt: float,
     lambdas: wp.array[float],
+    particle_world: wp.array[wp.int32],
+    world_active: wp.array[wp.int32],
     delta: wp.array[wp.vec3],
 ):
     tid = wp.tid()
@@ -402,6 +434,8 @@ def bending_constraint(
 
     if i == -1 or j == -1 or k == -1 or l == -1:
         return
+    if world_is_retired(world_active, particle_world[i]):
+        return
 
     rest_angle = rest[tid]
 
@@ -489,6 +523,8 @@ def solve_tetrahedra(
     materials: wp.array2d[float],
     dt: float,
     relaxation: float,
+    particle_world: wp.array[wp.int32],
+    world_active: wp.array[wp.int32],
     delta: wp.array[wp.vec3],
 ):
     # Tetrahedral XPBD constraint solve.
@@ -529,6 +565,8 @@ def solve_tetrahedra(
     j = indices[tid, 1]
     k = indices[tid, 2]
     l = indices[tid, 3]
+    if world_is_retired(world_active, particle_world[i]):
+        return
 
     act = activation[tid]
 
@@ -933,6 +971,87 @@ def apply_body_deltas(
     qd_out[tid] = wp.spatial_vector(v1, w1)
 
 
+@wp.kernel
+def mask_particle_deltas(
+    particle_world: wp.array[wp.int32],
+    particle_flags: wp.array[wp.int32],
+    world_active: wp.array[wp.int32],
+    # outputs
+    deltas: wp.array[wp.vec3],
+    world_residual: wp.array[float],
+):
+    """Drop the corrections of converged worlds and record the remaining per-world residual."""
+    tid = wp.tid()
+    if (particle_flags[tid] & ParticleFlags.ACTIVE) == 0:
+        return
+    world = particle_world[tid]
+    if world < 0:
+        return
+    if world_active[world] == 0:
+        deltas[tid] = wp.vec3(0.0)
+        return
+    wp.atomic_max(world_residual, world, wp.length(deltas[tid]))
+
+
+@wp.kernel
+def mask_body_deltas(
+    body_q: wp.array[wp.transform],
+    body_world: wp.array[wp.int32],
+    body_inv_m: wp.array[float],
+    body_inv_I: wp.array[wp.mat33],
+    constraint_inv_weights: wp.array[float],
+    world_active: wp.array[wp.int32],
+    dt: float,
+    # outputs
+    deltas: wp.array[wp.spatial_vector],
+    world_residual: wp.array[float],
+):
+    """Drop the corrections of converged worlds and record the remaining per-world residual.
+
+    The residual of a body is the larger of the linear [m] and angular [rad]
+    position corrections that :func:`apply_body_deltas` would apply.
+    """
+    tid = wp.tid()
+    world = body_world[tid]
+    if world < 0:
+        return
+    if world_active[world] == 0:
+        deltas[tid] = wp.spatial_vector()
+        return
+    inv_m = body_inv_m[tid]
+    if inv_m == 0.0:
+        return
+
+    weight = 1.0
+    if constraint_inv_weights:
+        inv_weight = constraint_inv_weights[tid]
+        if inv_weight > 0.0:
+            weight = 1.0 / inv_weight
+
+    delta = deltas[tid]
+    linear = wp.length(wp.spatial_top(delta)) * inv_m * weight * dt
+    dq = wp.quat_rotate_inv(wp.transform_get_rotation(body_q[tid]), wp.spatial_bottom(delta))
+    angular = wp.length(body_inv_I[tid] * dq) * weight * dt
+    wp.atomic_max(world_residual, world, wp.max(linear, angular))
+
+
+@wp.kernel
+def update_world_convergence(
+    tolerance: float,
+    # outputs
+    world_residual: wp.array[float],
+    world_active: wp.array[wp.int32],
+    world_iterations: wp.array[wp.int32],
+):
+    """Count the iteration for every active world and retire the worlds whose residual fell below *tolerance*."""
+    world = wp.tid()
+    if world_active[world] != 0:
+        world_iterations[world] += 1
+        if world_residual[world] <= tolerance:
+            world_active[world] = 0
+    world_residual[world] = 0.0
+
+
 @wp.kernel
 def apply_body_delta_velocities(
     deltas: wp.array[wp.spatial_vector],
@@ -1538,6 +1657,8 @@ def solve_body_joints(
     angular_relaxation: float,
     linear_relaxation: float,
     dt: float,
+    joint_world: wp.array[wp.int32],
+    world_active: wp.array[wp.int32],
     deltas: wp.array[wp.spatial_vector],
     joint_impulse: wp.array[wp.spatial_vector],
 ):
@@ -1546,6 +1667,8 @@ def solve_body_joints(
 
     if not joint_enabled[tid]:
         return
+    if world_is_retired(world_active, joint_world[tid]):
+        return
     if type == JointType.FREE:
         return
     # if type == JointType.FIXED:
@@ -2185,6 +2308,8 @@ def solve_body_contact_positions(
     shape_material_mu_rolling: wp.array[float],
     relaxation: float,
     dt: float,
+    shape_world: wp.array[wp.int32],
+    world_active: wp.array[wp.int32],
     # outputs
     deltas: wp.array[wp.spatial_vector],
     contact_inv_weight: wp.array[float],
@@ -2200,6 +2325,15 @@ def solve_body_contact_positions(
     shape_b = contact_shape1[tid]
     if shape_a == shape_b:
         return
+    if world_active:
+        # global shapes (world -1) collide with every world; use the other shape's world
+        world = -1
+        if shape_a >= 0:
+            world = shape_world[shape_a]
+        if world < 0 and shape_b >= 0:
+            world = shape_world[shape_b]
+        if world_is_retired(world_active, world):
+            return
     body_a = -1
     if shape_a >= 0:
         body_a = shape_body[shape_a]
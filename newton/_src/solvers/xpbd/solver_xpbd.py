@@ -5,6 +5,8 @@ import warp as wp
 
 from ...core.types import override
 from ...sim import Contacts, Control, Model, ModelFlags, State
+from ...sim.sleep import copy_body_sleeping
+from ...utils.benchmark import profile_scope
 from ...utils.deprecation import deprecate_nonkeyword_arguments
 from ..coupled.interface import CouplingInterface
 from ..solver import SolverBase
@@ -21,6 +23,8 @@ from .kernels import (
     convert_contact_impulse_to_force,
     convert_joint_impulse_to_parent_f,
     copy_kinematic_body_state_kernel,
+    mask_body_deltas,
+    mask_particle_deltas,
     solve_body_contact_positions,
     solve_body_joints,
     solve_particle_particle_contacts,
@@ -29,6 +33,7 @@ from .kernels import (
     solve_springs,
     solve_tetrahedra,
     update_body_velocities,
+    update_world_convergence,
 )
 
 
@@ -113,6 +118,7 @@ class SolverXPBD(SolverBase, CouplingInterface):
         angular_damping: float = 0.0,
         enable_restitution: bool = False,
         deterministic: wp.DeterministicMode | None = None,
+        convergence_tolerance: float | None = None,
     ):
         """Initialize the XPBD solver.
 
@@ -140,6 +146,12 @@ class SolverXPBD(SolverBase, CouplingInterface):
                 kernel module. Pass a :class:`warp.DeterministicMode`, or
                 ``None`` (default) to inherit the current
                 ``wp.config.deterministic`` mode.
+            convergence_tolerance: Enables adaptive per-world iteration budgets when set. A world stops
+                receiving constraint corrections once the largest positional correction of one iteration,
+                taken over its particles [m] and bodies [m or rad], is at most this value; ``iterations``
+                then acts as the maximum budget. The number of iterations each world used is reported by
+                :attr:`world_iterations`. Ignored when the input state requires gradients. Defaults to
+                ``None`` (every world runs all ``iterations``).
         """
         super().__init__(model=model)
         effective_deterministic = deterministic if deterministic is not None else wp.config.deterministic
@@ -170,7 +182,20 @@ class SolverXPBD(SolverBase, CouplingInterface):
 
         self.compute_body_velocity_from_position_delta = False
 
+        if convergence_tolerance is not None and convergence_tolerance < 0.0:
+            raise ValueError(f"convergence_tolerance must be non-negative, got {convergence_tolerance}")
+        self.convergence_tolerance = convergence_tolerance
+        self._world_active = None
+        self._world_residual = None
+        self._world_iterations = None
+        if convergence_tolerance is not None:
+            world_count = max(model.world_count, 1)
+            self._world_active = wp.ones(world_count, dtype=wp.int32, device=model.device)
+            self._world_residual = wp.zeros(world_count, dtype=float, device=model.device)
+            self._world_iterations = wp.zeros(world_count, dtype=wp.int32, device=model.device)
+
         self._init_kinematic_state()
+        self._sleep_mask_active = False
 
         # helper variables to track constraint resolution vars
         self._particle_delta_counter = 0
@@ -197,6 +222,15 @@ class SolverXPBD(SolverBase, CouplingInterface):
         if flags & (ModelFlags.BODY_PROPERTIES | ModelFlags.BODY_INERTIAL_PROPERTIES):
             self._refresh_kinematic_state()
 
+    @property
+    def world_iterations(self) -> wp.array | None:
+        """Number of constraint iterations each world ran during the last :meth:`step`, shape ``[world_count]``, int.
+
+        Only available when the solver was created with ``convergence_tolerance``; ``None`` otherwise.
+        Worlds that did not converge report the full ``iterations`` budget.
+        """
+        return self._world_iterations
+
     @override
     def coupling_supports_inertial_property_refresh(self) -> bool:
         """Return whether inertial properties can be refreshed during graph capture.
@@ -209,6 +243,8 @@ class SolverXPBD(SolverBase, CouplingInterface):
     def copy_kinematic_body_state(self, model: Model, state_in: State, state_out: State):
         """Copy kinematic body poses and velocities from an input state to an output state.
 
+        Sleeping bodies keep their input pose with zero velocity, and the sleep flags are carried over.
+
         Args:
             model: Simulation model that owns the body data.
             state_in: State containing the source kinematic body poses and velocities.
@@ -219,10 +255,44 @@ class SolverXPBD(SolverBase, CouplingInterface):
         wp.launch(
             kernel=copy_kinematic_body_state_kernel,
             dim=model.body_count,
-            inputs=[model.body_flags, state_in.body_q, state_in.body_qd],
+            inputs=[model.body_flags, state_in.body_sleeping, state_in.body_q, state_in.body_qd],
             outputs=[state_out.body_q, state_out.body_qd],
             device=model.device,
         )
+        copy_body_sleeping(state_in, state_out)
+
+    def _mask_particle_deltas(self, model: Model, particle_deltas: wp.array):
+        wp.launch(
+            kernel=mask_particle_deltas,
+            dim=model.particle_count,
+            inputs=[model.particle_world, model.particle_flags, self._world_active],
+            outputs=[particle_deltas, self._world_residual],
+            device=model.device,
+        )
+
+    def _mask_body_deltas(
+        self,
+        model: Model,
+        body_q: wp.array,
+        body_deltas: wp.array,
+        dt: float,
+        rigid_contact_inv_weight: wp.array = None,
+    ):
+        wp.launch(
+            kernel=mask_body_deltas,
+            dim=model.body_count,
+            inputs=[
+                body_q,
+                model.body_world,
+                self.body_inv_mass_effective,
+                self.body_inv_inertia_effective,
+                rigid_contact_inv_weight,
+                self._world_active,
+                dt,
+            ],
+            outputs=[body_deltas, self._world_residual],
+            device=model.device,
+        )
 
     def _apply_particle_deltas(
         self,
@@ -326,6 +396,7 @@ class SolverXPBD(SolverBase, CouplingInterface):
 
         return new_body_q, new_body_qd
 
+    @profile_scope
     @override
     def step(
         self,
@@ -353,6 +424,24 @@ class SolverXPBD(SolverBase, CouplingInterface):
 
         model = self.model
 
+        # Converged worlds are masked out of later iterations instead of ending the loop early, which keeps the
+        # launch sequence fixed and the step graph-capturable. The constraint kernels return early for masked worlds.
+        adaptive = self._world_iterations is not None and not requires_grad
+        world_active = None
+        if adaptive:
+            world_active = self._world_active
+            world_active.fill_(1)
+            self._world_residual.zero_()
+            self._world_iterations.zero_()
+
+        # Sleeping bodies act as infinite-mass obstacles for the awake ones.
+        if state_in.body_sleeping is not None:
+            self._refresh_kinematic_state(state_in.body_sleeping)
+            self._sleep_mask_active = True
+        elif self._sleep_mask_active:
+            self._refresh_kinematic_state()
+            self._sleep_mask_active = False
+
         particle_q = None
         particle_qd = None
         particle_deltas = None
@@ -510,6 +599,8 @@ class SolverXPBD(SolverBase, CouplingInterface):
                                     contacts.soft_contact_max,
                                     dt,
                                     self.soft_contact_relaxation,
+                                    model.particle_world,
+                                    world_active,
                                 ],
                                 # outputs
                                 outputs=[particle_deltas, body_deltas],
@@ -534,6 +625,8 @@ class SolverXPBD(SolverBase, CouplingInterface):
                                     model.particle_max_radius,
                                     dt,
                                     self.soft_contact_relaxation,
+                                    model.particle_world,
+                                    world_active,
                                 ],
                                 outputs=[particle_deltas],
                                 device=model.device,
@@ -555,6 +648,8 @@ class SolverXPBD(SolverBase, CouplingInterface):
                                     model.spring_damping,
                                     dt,
                                     spring_constraint_lambdas,
+                                    model.particle_world,
+                                    world_active,
                                 ],
                                 outputs=[particle_deltas],
                                 device=model.device,
@@ -575,6 +670,8 @@ class SolverXPBD(SolverBase, CouplingInterface):
                                     model.edge_bending_properties,
                                     dt,
                                     edge_constraint_lambdas,
+                                    model.particle_world,
+                                    world_active,
                                 ],
                                 outputs=[particle_deltas],
                                 device=model.device,
@@ -595,11 +692,16 @@ class SolverXPBD(SolverBase, CouplingInterface):
                                     model.tet_materials,
                                     dt,
                                     self.soft_body_relaxation,
+                                    model.particle_world,
+                                    world_active,
                                 ],
                                 outputs=[particle_deltas],
                                 device=model.device,
                             )
 
+                        if adaptive:
+                            self._mask_particle_deltas(model, particle_deltas)
+
                         particle_q, particle_qd = self._apply_particle_deltas(
                             model, state_in, state_out, particle_deltas, dt
                         )
@@ -641,6 +743,8 @@ class SolverXPBD(SolverBase, CouplingInterface):
                                 model.shape_material_mu_rolling,
                                 self.rigid_contact_relaxation,
                                 dt,
+                                model.shape_world,
+                                world_active,
                             ],
                             outputs=[
                                 body_deltas,
@@ -682,6 +786,9 @@ class SolverXPBD(SolverBase, CouplingInterface):
                             else:
                                 rigid_contact_inv_weight_init = None
 
+                        if adaptive:
+                            self._mask_body_deltas(model, body_q, body_deltas, dt, rigid_contact_inv_weight)
+
                         body_q, body_qd = self._apply_body_deltas(
                             model, state_in, state_out, body_deltas, dt, rigid_contact_inv_weight
                         )
@@ -722,13 +829,27 @@ class SolverXPBD(SolverBase, CouplingInterface):
                                 self.joint_angular_relaxation,
                                 self.joint_linear_relaxation,
                                 dt,
+                                model.joint_world,
+                                world_active,
                             ],
                             outputs=[body_deltas, joint_impulse],
                             device=model.device,
                         )
 
+                        if adaptive:
+                            self._mask_body_deltas(model, body_q, body_deltas, dt)
+
                         body_q, body_qd = self._apply_body_deltas(model, state_in, state_out, body_deltas, dt)
 
+                    if adaptive:
+                        wp.launch(
+                            kernel=update_world_convergence,
+                            dim=self._world_active.shape[0],
+                            inputs=[self.convergence_tolerance],
+                            outputs=[self._world_residual, self._world_active, self._world_iterations],
+                            device=model.device,
+                        )
+
             self._contact_impulse = contact_impulse
             self._contact_impulse_capacity = contacts.rigid_contact_max if contacts is not None else 0
             self._last_dt = dt
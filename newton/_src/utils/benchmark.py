@@ -1,10 +1,17 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 The Newton Developers
 # SPDX-License-Identifier: Apache-2.0
 
+from __future__ import annotations
+
+import dataclasses
 import functools
 import itertools
+import json
 import time
+from collections.abc import Callable
+from typing import ClassVar
 
+import numpy as np
 import warp as wp
 
 
@@ -120,6 +127,9 @@ def event_scope(fn, name: str = ""):
     """
     Wraps a function and records an event before and after the function invocation.
 
+    The wrapped function is also reported as a scope to every active :class:`Profiler`,
+    named after the function's qualified name unless ``name`` is given.
+
     .. note::
 
         This function has been copied from:
@@ -130,10 +140,10 @@ def event_scope(fn, name: str = ""):
       fn    : Function to be wrapped.
       name  : Custom name associated with the function.
     """
+    profile_name = name or fn.__qualname__
     name = name or fn.__name__
 
-    @functools.wraps(fn)
-    def wrapper(*args, **kwargs):
+    def _traced_call(*args, **kwargs):
         if EventTracer._active_instance is None:
             return fn(*args, **kwargs)
 
@@ -153,9 +163,310 @@ def event_scope(fn, name: str = ""):
         EventTracer._active_instance._STACK[name] = (events, sub_stack)
         return res
 
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if Profiler._active_profilers:
+            with _ProfileScope(profile_name):
+                return _traced_call(*args, **kwargs)
+        return _traced_call(*args, **kwargs)
+
     return wrapper
 
 
+@dataclasses.dataclass(frozen=True)
+class ProfileStats:
+    """Per-step timing statistics of one profiling scope.
+
+    Each sample is the total time spent in the scope during one profiled step.
+    Times are in milliseconds.
+    """
+
+    count: int
+    """Number of steps in which the scope was entered."""
+
+    calls: int
+    """Total number of times the scope was entered."""
+
+    total: float
+    """Sum of the per-step times [ms]."""
+
+    min: float
+    """Minimum per-step time [ms]."""
+
+    mean: float
+    """Mean per-step time [ms]."""
+
+    p95: float
+    """95th percentile of the per-step times [ms]."""
+
+    max: float
+    """Maximum per-step time [ms]."""
+
+
+class Profiler:
+    """
+    Collects host wall-clock and device timings of profiling scopes, aggregated per step.
+
+    Scopes are opened by functions annotated with :func:`profile_scope` or
+    :func:`event_scope` and by ``with profile_scope(name):`` blocks. Newton
+    annotates :meth:`CollisionPipeline.collide <newton.CollisionPipeline.collide>`,
+    every solver's ``step`` and every sensor's ``update``, so these show up without
+    modifying user code. Several profilers can be active at the same time; every
+    scope is reported to all of them.
+
+    Call :meth:`step` once per simulation step to close the current step. Each
+    scope's time within a step is summed into one sample, and :meth:`stats`
+    reports min/mean/p95/max over those samples. Device timings use Warp events
+    and are only gathered on CUDA devices outside of graph capture; scopes entered
+    while a CUDA graph is being captured are skipped.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+      with newton.utils.Profiler() as profiler:
+          for _ in range(100):
+              with newton.utils.profile_scope("simulate"):
+                  pipeline.collide(state, contacts)
+                  solver.step(state_0, state_1, control, contacts, dt)
+              profiler.step()
+
+      print(profiler.report())
+      profiler.export_chrome_trace("trace.json")
+    """
+
+    _active_profilers: ClassVar[list[Profiler]] = []
+
+    def __init__(self, enabled: bool = True, device_timing: bool = True, synchronize: bool = False):
+        """
+        Args:
+            enabled: If False, the profiler does not record anything.
+            device_timing: If True, record Warp events around scopes on CUDA devices to
+                measure device execution time.
+            synchronize: If True, synchronize the device when a scope ends so host
+                wall-clock times include the asynchronous device work launched in it.
+        """
+        self.enabled = enabled
+        self.device_timing = device_timing
+        self.synchronize = synchronize
+        self.step_count = 0
+        self._open: list[list] = []
+        self._records: list[list] = []
+        self._step_ref_events: dict[wp.Device, tuple[wp.Event, float]] = {}
+        self._samples: dict[str, dict[str, list[float]]] = {"host": {}, "device": {}}
+        self._calls: dict[str, int] = {}
+        self._trace_events: list[dict] = []
+        self._origin = time.perf_counter()
+
+    def __enter__(self):
+        if self.enabled:
+            Profiler._active_profilers.append(self)
+        return self
+
+    def __exit__(self, type, value, traceback):
+        if self in Profiler._active_profilers:
+            Profiler._active_profilers.remove(self)
+            if self._records:
+                self.step()
+
+    def _begin(self, name: str) -> list | None:
+        device = wp.get_device()
+        if device.is_cuda and device.is_capturing:
+            return None
+        record = [name, len(self._open), device, time.perf_counter(), 0.0, None, None]
+        if self.device_timing and device.is_cuda:
+            if device not in self._step_ref_events:
+                ref = wp.Event(device, enable_timing=True)
+                wp.record_event(ref)
+                self._step_ref_events[device] = (ref, time.perf_counter())
+            record[5] = wp.Event(device, enable_timing=True)
+            wp.record_event(record[5])
+        self._open.append(record)
+        return record
+
+    def _end(self, record: list | None) -> None:
+        if record is None:
+            return
+        if record[5] is not None:
+            record[6] = wp.Event(record[2], enable_timing=True)
+            wp.record_event(record[6])
+        if self.synchronize:
+            wp.synchronize_device(record[2])
+        record[4] = time.perf_counter()
+        if self._open and self._open[-1] is record:
+            self._open.pop()
+        elif record in self._open:
+            self._open.remove(record)
+        self._records.append(record)
+
+    def step(self) -> None:
+        """Close the current step and aggregate the timings of the scopes it contained.
+
+        Resolving device timings waits for the recorded events to complete.
+        """
+        host_totals: dict[str, float] = {}
+        device_totals: dict[str, float] = {}
+        for name, depth, device, t_begin, t_end, ev_begin, ev_end in self._records:
+            host_ms = 1000.0 * (t_end - t_begin)
+            host_totals[name] = host_totals.get(name, 0.0) + host_ms
+            self._calls[name] = self._calls.get(name, 0) + 1
+            self._trace_events.append(
+                {
+                    "name": name,
+                    "cat": "host",
+                    "ph": "X",
+                    "ts": 1.0e6 * (t_begin - self._origin),
+                    "dur": 1.0e3 * host_ms,
+                    "pid": 0,
+                    "tid": 0,
+                    "args": {"step": self.step_count, "depth": depth},
+                }
+            )
+            if ev_begin is not None and ev_end is not None:
+                device_ms = wp.get_event_elapsed_time(ev_begin, ev_end)
+                device_totals[name] = device_totals.get(name, 0.0) + device_ms
+                ref_event, ref_time = self._step_ref_events[device]
+                self._trace_events.append(
+                    {
+                        "name": name,
+                        "cat": "device",
+                        "ph": "X",
+                        "ts": 1.0e6 * (ref_time - self._origin)
+                        + 1.0e3 * wp.get_event_elapsed_time(ref_event, ev_begin),
+                        "dur": 1.0e3 * device_ms,
+                        "pid": 0,
+                        "tid": 1 + device.ordinal,
+                        "args": {"step": self.step_count, "depth": depth, "device": str(device)},
+                    }
+                )
+        for kind, totals in (("host", host_totals), ("device", device_totals)):
+            samples = self._samples[kind]
+            for name, value in totals.items():
+                samples.setdefault(name, []).append(value)
+
+        self._records = []
+        self._step_ref_events = {}
+        self.step_count += 1
+
+    def stats(self, kind: str = "host") -> dict[str, ProfileStats]:
+        """Return per-step statistics of every scope.
+
+        Args:
+            kind: ``"host"`` for wall-clock times or ``"device"`` for Warp event timings.
+
+        Returns:
+            dict[str, ProfileStats]: Statistics keyed by scope name.
+        """
+        if kind not in self._samples:
+            raise ValueError(f"kind must be 'host' or 'device', got {kind!r}")
+        result = {}
+        for name, values in self._samples[kind].items():
+            arr = np.asarray(values, dtype=np.float64)
+            result[name] = ProfileStats(
+                count=len(values),
+                calls=self._calls.get(name, 0),
+                total=float(arr.sum()),
+                min=float(arr.min()),
+                mean=float(arr.mean()),
+                p95=float(np.percentile(arr, 95.0)),
+                max=float(arr.max()),
+            )
+        return result
+
+    def report(self) -> str:
+        """Format host and device statistics of every scope as a text table."""
+        lines = [f"{'scope':<40} {'kind':<6} {'steps':>6} {'min':>10} {'mean':>10} {'p95':>10} {'max':>10}  [ms]"]
+        for kind in ("host", "device"):
+            for name, st in sorted(self.stats(kind).items()):
+                lines.append(
+                    f"{name:<40} {kind:<6} {st.count:>6} {st.min:>10.4f} {st.mean:>10.4f} {st.p95:>10.4f} {st.max:>10.4f}"
+                )
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict:
+        """Return the recorded scopes in the Chrome trace event format.
+
+        Host scopes are on thread 0 and device scopes on thread ``1 + device ordinal``.
+        """
+        metadata = [{"name": "thread_name", "ph": "M", "pid": 0, "tid": 0, "args": {"name": "host"}}]
+        for tid in sorted({e["tid"] for e in self._trace_events if e["tid"] > 0}):
+            metadata.append(
+                {"name": "thread_name", "ph": "M", "pid": 0, "tid": tid, "args": {"name": f"cuda:{tid - 1}"}}
+            )
+        return {"traceEvents": metadata + self._trace_events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, file_path: str) -> None:
+        """Write the recorded scopes as a Chrome trace JSON file.
+
+        The file can be opened in ``chrome://tracing`` or https://ui.perfetto.dev.
+
+        Args:
+            file_path: Output path of the JSON file.
+        """
+        with open(file_path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def reset(self) -> None:
+        """Discard all recorded steps and statistics."""
+        self.step_count = 0
+        self._records = []
+        self._step_ref_events = {}
+        self._samples = {"host": {}, "device": {}}
+        self._calls = {}
+        self._trace_events = []
+
+
+class _ProfileScope:
+    """Context manager and decorator reporting a named scope to all active profilers."""
+
+    __slots__ = ("_records", "name")
+
+    def __init__(self, name: str | None):
+        self.name = name
+        self._records: list[list | None] = []
+
+    def __enter__(self):
+        profilers = Profiler._active_profilers
+        self._records.append([(p, p._begin(self.name)) for p in profilers] if profilers else None)
+        return self
+
+    def __exit__(self, type, value, traceback):
+        records = self._records.pop()
+        if records:
+            for profiler, record in reversed(records):
+                profiler._end(record)
+
+    def __call__(self, fn: Callable) -> Callable:
+        name = self.name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not Profiler._active_profilers:
+                return fn(*args, **kwargs)
+            with _ProfileScope(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+
+def profile_scope(name: str | Callable | None = None):
+    """
+    Marks a host-side profiling scope reported to every active :class:`Profiler`.
+
+    Can be used as a decorator (``@profile_scope`` or ``@profile_scope("name")``)
+    or as a context manager (``with profile_scope("name"):``). Decorated functions
+    default to their qualified name. When no profiler is active the overhead is a
+    single list check.
+
+    Parameters:
+      name  : Scope name, or the function to decorate when used without arguments.
+    """
+    if callable(name):
+        return _ProfileScope(None)(name)
+    return _ProfileScope(name)
+
+
 def run_benchmark(benchmark_cls, number=1, print_results=True):
     """
     Simple scaffold to run a benchmark class.
@@ -1,9 +1,11 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 The Newton Developers
 # SPDX-License-Identifier: Apache-2.0
 
+import hashlib
 import os
 import warnings
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
 from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import cast, overload
@@ -276,6 +278,12 @@ def split_mesh_components(mesh: Mesh) -> list[tuple[np.ndarray, np.ndarray]]:
 # Default number of segments for mesh generation
 default_num_segments = 32
 
+# Maximum number of triangle meshes whose edge tables are kept by MeshAdjacency's content-hash cache.
+EDGE_ADJACENCY_CACHE_SIZE = 64
+
+# Content hash of a triangle array -> (edge_indices, edge_tri_indices, tri_edge_indices, non_manifold).
+_edge_adjacency_cache: OrderedDict[tuple[int, str], tuple[np.ndarray, np.ndarray, np.ndarray, bool]] = OrderedDict()
+
 
 @wp.struct
 class MeshAdjacencyData:
@@ -558,6 +566,16 @@ class MeshAdjacency:
         data.v_adj_tets_offsets = wp.array(self.v_adj_tets_offsets, dtype=wp.int32, device=device)
         return data
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all edge tables memoized by triangle content.
+
+        Edge tables derived from ``tri_indices`` are cached by a hash of the triangle array
+        (up to :data:`EDGE_ADJACENCY_CACHE_SIZE` meshes, least recently used first out), so
+        replicated garments and worlds reuse their bending-edge tables.
+        """
+        _edge_adjacency_cache.clear()
+
     @staticmethod
     def _compute_edge_adjacency(
         indices: Sequence[Sequence[int]] | np.ndarray,
@@ -571,14 +589,39 @@ class MeshAdjacency:
         endpoints); ``edge_tri_indices`` rows are ``[tri0, tri1]`` (``-1`` for a
         boundary side, triangle ids offset by ``tri_start``); ``tri_edge_indices``
         maps each triangle's three local edge slots to edge rows.
+
+        Results are memoized by triangle content; callers receive fresh copies.
+        """
+        tris = np.ascontiguousarray(np.asarray(indices, dtype=np.int32).reshape(-1, 3))
+        key = (tri_start, hashlib.blake2b(tris.tobytes(), digest_size=16).hexdigest())
+        cached = _edge_adjacency_cache.get(key)
+        if cached is None:
+            cached = MeshAdjacency._compute_edge_tables(tris, tri_start)
+            _edge_adjacency_cache[key] = cached
+            while len(_edge_adjacency_cache) > EDGE_ADJACENCY_CACHE_SIZE:
+                _edge_adjacency_cache.popitem(last=False)
+        else:
+            _edge_adjacency_cache.move_to_end(key)
+
+        edge_indices, edge_tri_indices, tri_edge_indices, non_manifold = cached
+        if non_manifold:
+            warnings.warn("Detected non-manifold edge", stacklevel=2)
+        return edge_indices.copy(), edge_tri_indices.copy(), tri_edge_indices.copy()
+
+    @staticmethod
+    def _compute_edge_tables(tris: np.ndarray, tri_start: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, bool]:
+        """Vectorized edge-table construction behind :meth:`_compute_edge_adjacency`.
+
+        Returns the three tables plus whether any edge is shared by more than two triangles
+        (only the first two are recorded on such an edge).
         """
-        tris = np.asarray(indices, dtype=np.int32).reshape(-1, 3)
         tri_count = tris.shape[0]
         if tri_count == 0:
             return (
                 np.empty((0, 4), dtype=np.int32),
                 np.empty((0, 2), dtype=np.int32),
                 np.empty((0, 3), dtype=np.int32),
+                False,
             )
 
         # Local edge slots are: (v0, v1 | opposite v2), (v1, v2 | opposite v0),
@@ -597,33 +640,37 @@ class MeshAdjacency:
         first_order = np.argsort(first_entries, kind="stable")
         edge_remap = np.empty(len(first_order), dtype=np.int32)
         edge_remap[first_order] = np.arange(len(first_order), dtype=np.int32)
-        entry_edge = edge_remap[inverse]
+        entry_edge = edge_remap[inverse.reshape(-1)]
+
+        # Rank of each entry among the entries of its edge, in triangle traversal order:
+        # rank 0 fills side 0 ([o0, f0]), rank 1 fills side 1, higher ranks are non-manifold.
+        entry_count = entry_edge.shape[0]
+        by_edge = np.argsort(entry_edge, kind="stable")
+        sorted_edge = entry_edge[by_edge]
+        entry_rank = np.empty(entry_count, dtype=np.int32)
+        entry_rank[by_edge] = np.arange(entry_count, dtype=np.int32) - np.searchsorted(
+            sorted_edge, sorted_edge, side="left"
+        )
 
         edge_count = len(first_order)
         edge_indices = np.full((edge_count, 4), -1, dtype=np.int32)
         edge_tri_indices = np.full((edge_count, 2), -1, dtype=np.int32)
         tri_edge_indices = np.full((tri_count, 3), -1, dtype=np.int32)
+        tri_edge_indices[entry_tri, entry_slot] = entry_edge
 
-        fill_counts = np.zeros(edge_count, dtype=np.int32)
-        for entry_id, edge_ref in enumerate(entry_edge):
-            edge_id = int(edge_ref)
-            tri_edge_indices[entry_tri[entry_id], entry_slot[entry_id]] = edge_id
-
-            side = fill_counts[edge_id]
-            if side == 0:
-                edge_indices[edge_id, 0] = entry_opposite[entry_id]
-                edge_indices[edge_id, 2] = entry_v0[entry_id]
-                edge_indices[edge_id, 3] = entry_v1[entry_id]
-                edge_tri_indices[edge_id, 0] = tri_start + entry_tri[entry_id]
-            elif side == 1:
-                edge_indices[edge_id, 1] = entry_opposite[entry_id]
-                edge_tri_indices[edge_id, 1] = tri_start + entry_tri[entry_id]
-            else:
-                warnings.warn("Detected non-manifold edge", stacklevel=2)
+        side0 = entry_rank == 0
+        side0_edges = entry_edge[side0]
+        edge_indices[side0_edges, 0] = entry_opposite[side0]
+        edge_indices[side0_edges, 2] = entry_v0[side0]
+        edge_indices[side0_edges, 3] = entry_v1[side0]
+        edge_tri_indices[side0_edges, 0] = tri_start + entry_tri[side0]
 
-            fill_counts[edge_id] += 1
+        side1 = entry_rank == 1
+        side1_edges = entry_edge[side1]
+        edge_indices[side1_edges, 1] = entry_opposite[side1]
+        edge_tri_indices[side1_edges, 1] = tri_start + entry_tri[side1]
 
-        return edge_indices, edge_tri_indices, tri_edge_indices
+        return edge_indices, edge_tri_indices, tri_edge_indices, bool(np.any(entry_rank > 1))
 
     @staticmethod
     def _build_maps(edge_indices: np.ndarray, tri_indices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
@@ -10,6 +10,7 @@ from fnmatch import fnmatch
 from types import NoneType
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import warp as wp
 from warp.types import is_array
 
@@ -324,6 +325,48 @@ def _scatter_masked_2d_kernel(
             dst[dst_idx] = values[row, col]
 
 
+@wp.kernel(enable_backward=False)
+def _gather_observation_kernel(
+    source_ptrs: wp.array[wp.uint64],
+    source_sizes: wp.array[int],
+    feature_source: wp.array[int],
+    feature_offset: wp.array[int],
+    feature_world_stride: wp.array[int],
+    feature_arti_stride: wp.array[int],
+    out: wp.array3d[float],
+):
+    """Gather one observation feature of one articulation from a flat float32 source array."""
+    world, arti, f = wp.tid()
+    s = feature_source[f]
+    src = wp.array(ptr=source_ptrs[s], shape=(source_sizes[s],), dtype=float)
+    out[world, arti, f] = src[feature_offset[f] + world * feature_world_stride[f] + arti * feature_arti_stride[f]]
+
+
+@wp.kernel(enable_backward=False)
+def _scatter_observation_kernel(
+    values: wp.array3d[float],
+    world_mask: wp.array[bool],
+    arti_mask: wp.array2d[bool],
+    source_ptrs: wp.array[wp.uint64],
+    source_sizes: wp.array[int],
+    feature_source: wp.array[int],
+    feature_offset: wp.array[int],
+    feature_world_stride: wp.array[int],
+    feature_arti_stride: wp.array[int],
+):
+    """Scatter one observation feature of one articulation back into a flat float32 source array."""
+    world, arti, f = wp.tid()
+    if world_mask:
+        if not world_mask[world]:
+            return
+    if arti_mask:
+        if not arti_mask[world, arti]:
+            return
+    s = feature_source[f]
+    dst = wp.array(ptr=source_ptrs[s], shape=(source_sizes[s],), dtype=float)
+    dst[feature_offset[f] + world * feature_world_stride[f] + arti * feature_arti_stride[f]] = values[world, arti, f]
+
+
 # NOTE: Python slice objects are not hashable in Python < 3.12, so we use this instead.
 class Slice:
     def __init__(self, start=None, stop=None):
@@ -1228,8 +1271,8 @@ class ArticulationView:
     # ========================================================================================
     # Generic attribute API
 
-    @functools.lru_cache(maxsize=None)  # noqa
-    def _get_attribute_array(self, name: str, source: Model | State | Control, _slice: Slice | int | None = None):
+    def _resolve_attribute(self, name: str, source: Model | State | Control) -> tuple[wp.array, FrequencyLayout]:
+        """Look up an attribute on ``source`` together with the view's layout of its frequency."""
         # get the attribute (handle namespaced attributes like "mujoco.tendon_stiffness")
         # Note: the user-facing API uses dots (e.g., "mujoco.tendon_stiffness")
         # but internally attributes are stored with colons (e.g., "mujoco:tendon_stiffness")
@@ -1274,6 +1317,12 @@ class ArticulationView:
                     f"Unable to determine the layout of frequency '{frequency.name}' for attribute '{name}'"
                 )
 
+        return attrib, layout
+
+    @functools.lru_cache(maxsize=None)  # noqa
+    def _get_attribute_array(self, name: str, source: Model | State | Control, _slice: Slice | int | None = None):
+        attrib, layout = self._resolve_attribute(name, source)
+
         value_stride = attrib.strides[0]
         is_indexed = layout.indices is not None
 
@@ -1474,6 +1523,23 @@ class ArticulationView:
         """
         self._set_attribute_values(name, target, values, mask=mask)
 
+    def create_observation_spec(self, fields: list[tuple[str, Model | State | Control]]) -> ObservationSpec:
+        """
+        Precompile a fused gather/scatter over several attributes.
+
+        The attribute layouts are resolved once, so each :meth:`ObservationSpec.gather` and
+        :meth:`ObservationSpec.scatter` call is a single kernel launch instead of one view
+        construction and copy per attribute.
+
+        Args:
+            fields: ``(name, source)`` pairs naming the attributes to pack, in feature order.
+                ``source`` is the Model, State, or Control the attribute is read from by default.
+
+        Returns:
+            ObservationSpec: The compiled specification.
+        """
+        return ObservationSpec(self, fields)
+
     # ========================================================================================
     # Convenience wrappers to align with legacy tensor API
 
@@ -2076,3 +2142,237 @@ class ArticulationView:
             outputs=[dst],
             device=self.device,
         )
+
+
+class ObservationSpec:
+    """
+    Fused gather/scatter over a fixed list of :class:`ArticulationView` attributes.
+
+    The selected values of every attribute are flattened to float32 features and packed
+    back to back into a single contiguous buffer with shape
+    ``(world_count, count_per_world, feature_count)``. Vector, quaternion, transform and
+    matrix attributes contribute one feature per scalar component. Attribute layouts are
+    resolved once at construction, so :meth:`gather` and :meth:`scatter` each run a single
+    kernel launch regardless of the number of attributes.
+
+    Sources may be swapped between calls (e.g. double-buffered states) by passing them as
+    keyword arguments; they must have the same layout as the sources the spec was built from.
+
+    Create instances with :meth:`ArticulationView.create_observation_spec`.
+
+    .. note::
+        Only attributes with a float32 scalar type are supported. The gather and scatter
+        kernels are not differentiable.
+
+    Args:
+        view: The articulation view whose selection is packed.
+        fields: ``(name, source)`` pairs naming the attributes to pack, in feature order.
+    """
+
+    _MAX_CACHED_SOURCE_TABLES = 8
+
+    def __init__(self, view: ArticulationView, fields: list[tuple[str, Model | State | Control]]):
+        self.view = view
+        self.device = view.device
+
+        self._sources: dict[str, Model | State | Control] = {}
+        self._attributes: list[tuple[str, str, int]] = []
+        self.feature_slices: dict[str, slice] = {}
+        """Column range of each attribute in the packed feature axis, keyed by attribute name."""
+
+        attribute_ids: dict[tuple[str, str], int] = {}
+        feature_source = []
+        feature_offset = []
+        feature_world_stride = []
+        feature_arti_stride = []
+
+        for name, source in fields:
+            kind = self._source_kind(source)
+            if self._sources.setdefault(kind, source) is not source:
+                raise ValueError(f"All {kind} attributes of an observation spec must use the same {kind} object")
+            if name in self.feature_slices:
+                raise ValueError(f"Duplicate observation field '{name}'")
+
+            attrib, layout = view._resolve_attribute(name, source)
+            scalar_type = getattr(attrib.dtype, "_wp_scalar_type_", attrib.dtype)
+            if scalar_type is not wp.float32:
+                raise TypeError(f"Observation field '{name}' has scalar type {scalar_type.__name__}, expected float32")
+            if not attrib.is_contiguous:
+                raise ValueError(f"Observation field '{name}' must be a contiguous array")
+
+            key = (kind, name)
+            if key not in attribute_ids:
+                attribute_ids[key] = len(self._attributes)
+                self._attributes.append((kind, name, attrib.size))
+
+            components = wp.types.type_size(attrib.dtype) * int(np.prod(attrib.shape[1:], dtype=int))
+            if layout.is_contiguous:
+                value_ids = np.arange(layout.slice.start, layout.slice.stop, dtype=int)
+            else:
+                value_ids = layout.indices.numpy().astype(int)
+            offsets = ((layout.offset + value_ids)[:, None] * components + np.arange(components)[None, :]).ravel()
+
+            start = len(feature_offset)
+            feature_offset.extend(offsets.tolist())
+            feature_source.extend([attribute_ids[key]] * len(offsets))
+            feature_world_stride.extend([layout.stride_between_worlds * components] * len(offsets))
+            feature_arti_stride.extend([layout.stride_within_worlds * components] * len(offsets))
+            self.feature_slices[name] = slice(start, len(feature_offset))
+
+        self.feature_count = len(feature_offset)
+        """Number of packed features per articulation."""
+
+        self._feature_source = wp.array(feature_source, dtype=int, device=self.device)
+        self._feature_offset = wp.array(feature_offset, dtype=int, device=self.device)
+        self._feature_world_stride = wp.array(feature_world_stride, dtype=int, device=self.device)
+        self._feature_arti_stride = wp.array(feature_arti_stride, dtype=int, device=self.device)
+        self._source_tables: dict[tuple[int, ...], tuple[wp.array, wp.array]] = {}
+
+        self.values = wp.zeros(self.shape, dtype=float, device=self.device)
+        """Default output buffer of :meth:`gather`."""
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """Shape ``(world_count, count_per_world, feature_count)`` of the packed buffer."""
+        return (self.view.world_count, self.view.count_per_world, self.feature_count)
+
+    @staticmethod
+    def _source_kind(source) -> str:
+        if isinstance(source, Model):
+            return "model"
+        if isinstance(source, State):
+            return "state"
+        if isinstance(source, Control):
+            return "control"
+        raise TypeError(f"Expected a Model, State, or Control source, got {type(source).__name__}")
+
+    def _source_table(self, overrides: dict[str, Model | State | Control | None]) -> tuple[wp.array, wp.array]:
+        sources = dict(self._sources)
+        for kind, source in overrides.items():
+            if source is not None:
+                sources[kind] = source
+
+        ptrs = []
+        for kind, name, size in self._attributes:
+            attrib = sources[kind]
+            for part in name.split("."):
+                attrib = getattr(attrib, part)
+            if attrib.size != size:
+                raise ValueError(f"Observation field '{name}' has {attrib.size} values, expected {size}")
+            ptrs.append(int(attrib.ptr or 0))
+
+        # the pointer tables only change when the sources do, e.g. when ping-ponging two states
+        key = tuple(ptrs)
+        table = self._source_tables.get(key)
+        if table is None:
+            if len(self._source_tables) >= self._MAX_CACHED_SOURCE_TABLES:
+                self._source_tables.clear()
+            table = (
+                wp.array(ptrs, dtype=wp.uint64, device=self.device),
+                wp.array([size for _, _, size in self._attributes], dtype=int, device=self.device),
+            )
+            self._source_tables[key] = table
+        return table
+
+    def gather(
+        self,
+        *,
+        model: Model | None = None,
+        state: State | None = None,
+        control: Control | None = None,
+        out: wp.array3d[float] | None = None,
+    ) -> wp.array3d[float]:
+        """
+        Gather all fields into the packed buffer with one kernel launch.
+
+        Args:
+            model: Model to read model fields from (defaults to the one given at construction).
+            state: State to read state fields from (defaults to the one given at construction).
+            control: Control to read control fields from (defaults to the one given at construction).
+            out: Output buffer with shape :attr:`shape` (defaults to :attr:`values`).
+
+        Returns:
+            array: The packed features with shape :attr:`shape`.
+        """
+        if out is None:
+            out = self.values
+        elif out.shape != self.shape or out.dtype is not wp.float32:
+            raise ValueError(f"Expected float32 output with shape {self.shape}, got {out.dtype} {out.shape}")
+
+        if self.feature_count == 0:
+            return out
+
+        source_ptrs, source_sizes = self._source_table({"model": model, "state": state, "control": control})
+        wp.launch(
+            _gather_observation_kernel,
+            dim=self.shape,
+            inputs=[
+                source_ptrs,
+                source_sizes,
+                self._feature_source,
+                self._feature_offset,
+                self._feature_world_stride,
+                self._feature_arti_stride,
+            ],
+            outputs=[out],
+            device=self.device,
+        )
+        return out
+
+    def scatter(
+        self,
+        values: wp.array3d[float],
+        *,
+        model: Model | None = None,
+        state: State | None = None,
+        control: Control | None = None,
+        mask: wp.array[bool] | wp.array2d[bool] | None = None,
+    ) -> None:
+        """
+        Scatter packed features back into their source attributes with one kernel launch.
+
+        Args:
+            values: Packed features with shape :attr:`shape`.
+            model: Model to write model fields to (defaults to the one given at construction).
+            state: State to write state fields to (defaults to the one given at construction).
+            control: Control to write control fields to (defaults to the one given at construction).
+            mask: Mask of articulations in the view (all by default).
+
+        .. note::
+            When writing Model attributes, it may be necessary to call
+            :meth:`newton.solvers.SolverBase.notify_model_changed` afterwards.
+        """
+        if not is_array(values) or values.dtype is not wp.float32:
+            values = wp.array(values, dtype=float, shape=self.shape, device=self.device, copy=False)
+        if values.shape != self.shape:
+            raise ValueError(f"Expected values with shape {self.shape}, got {values.shape}")
+
+        if self.feature_count == 0:
+            return
+
+        world_mask = None
+        arti_mask = None
+        if mask is not None:
+            mask = self.view._resolve_mask(mask)
+            if mask.ndim == 1:
+                world_mask = mask
+            else:
+                arti_mask = mask
+
+        source_ptrs, source_sizes = self._source_table({"model": model, "state": state, "control": control})
+        wp.launch(
+            _scatter_observation_kernel,
+            dim=self.shape,
+            inputs=[
+                values,
+                world_mask,
+                arti_mask,
+                source_ptrs,
+                source_sizes,
+                self._feature_source,
+                self._feature_offset,
+                self._feature_world_stride,
+                self._feature_arti_stride,
+            ],
+            device=self.device,
+        )
@@ -40,7 +40,7 @@ Layers:
 """
 
 from .viewer import Layer, ViewerBase
-from .viewer_file import ViewerFile
+from .viewer_file import RecordingCodec, ViewerFile
 from .viewer_gl import ViewerGL
 from .viewer_null import ViewerNull
 from .viewer_rerun import ViewerRerun
@@ -50,6 +50,7 @@ from .viewer_viser import ViewerViser
 
 __all__ = [
     "Layer",
+    "RecordingCodec",
     "ViewerBase",
     "ViewerFile",
     "ViewerGL",
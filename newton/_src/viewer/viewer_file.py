@@ -3,12 +3,17 @@
 
 from __future__ import annotations
 
+import bisect
+import dataclasses
 import json
+import mmap
 import os
+import struct
 import warnings
+from collections import OrderedDict
 from collections.abc import Iterable, Mapping
 from pathlib import Path
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, Literal, TypeVar
 
 import numpy as np
 import warp as wp
@@ -226,7 +231,7 @@ def _get_serialization_format(file_path: str) -> str:
         file_path: Path to the file
 
     Returns:
-        'json' for .json files, 'cbor2' for .bin files
+        'json' for .json files, 'cbor2' for .bin files, 'stream' for .nrec files
 
     Raises:
         ValueError: If file extension is not supported
@@ -234,12 +239,12 @@ def _get_serialization_format(file_path: str) -> str:
     _, ext = os.path.splitext(file_path.lower())
     if ext == ".json":
         return "json"
-    elif ext == ".bin":
+    elif ext in (".bin", ".nrec"):
         if not HAS_CBOR2:
-            raise ImportError("cbor2 library is required for .bin files. Install with: pip install 'cbor2>=5.7.0'")
-        return "cbor2"
+            raise ImportError(f"cbor2 library is required for {ext} files. Install with: pip install 'cbor2>=5.7.0'")
+        return "cbor2" if ext == ".bin" else "stream"
     else:
-        raise ValueError(f"Unsupported file extension '{ext}'. Supported extensions: .json, .bin")
+        raise ValueError(f"Unsupported file extension '{ext}'. Supported extensions: .json, .bin, .nrec")
 
 
 def _ptr_key_from_numpy(arr: np.ndarray) -> int:
@@ -1109,6 +1114,530 @@ def depointer_as_key(data: Mapping[str, Any], format_type: str = "json", cache:
     return _resolve_cache_refs(result)
 
 
+# Chunked, append-only recording format (``.nrec``).
+#
+# Layout::
+#
+#     header   : magic (8 bytes) | version (uint32)
+#     chunk*   : tag (4 bytes) | meta length (uint64) | payload length (uint64) | meta (CBOR) | payload
+#     trailer  : index chunk offset (uint64) | trailer magic (8 bytes)
+#
+# The model is stored once in a ``MODL`` chunk. Every save appends one ``STAT``
+# chunk holding the frames recorded since the previous save: its CBOR meta lists a
+# descriptor per array and frame, and its payload stores the raw, 16-byte aligned
+# array bytes. The file always ends with an ``INDX`` chunk mapping frame ranges to
+# chunk offsets, followed by the fixed-size trailer pointing at it. Appending
+# overwrites the previous index and trailer, so earlier chunks are never rewritten.
+_STREAM_MAGIC = b"NWTNREC\x00"
+_STREAM_TRAILER_MAGIC = b"NWTNIDX\x00"
+_STREAM_VERSION = 1
+_STREAM_HEADER = struct.Struct("<8sI")
+_STREAM_CHUNK_HEADER = struct.Struct("<4sQQ")
+_STREAM_TRAILER = struct.Struct("<Q8s")
+_STREAM_ALIGNMENT = 16
+_CHUNK_MODEL = b"MODL"
+_CHUNK_STATES = b"STAT"
+_CHUNK_INDEX = b"INDX"
+
+
+def _write_stream_chunk(f, tag: bytes, meta: bytes, payload: bytes = b"") -> None:
+    f.write(_STREAM_CHUNK_HEADER.pack(tag, len(meta), len(payload)))
+    f.write(meta)
+    f.write(payload)
+
+
+@dataclasses.dataclass(frozen=True)
+class RecordingCodec:
+    """Configure opt-in compression of state snapshots in ``.nrec`` recordings.
+
+    Every ``keyframe_interval``-th frame of an array is a keyframe. Between
+    keyframes, arrays whose contents equal their keyframe are stored as a
+    reference without payload. With ``quantization`` enabled, transform arrays
+    (positions and quaternions) and the arrays named in ``position_attributes``
+    are stored as quantized values on keyframes and as quantized deltas against
+    the decoded keyframe in between, so errors never accumulate across frames.
+    Quantized values are only kept when their reconstruction error is within
+    ``position_tolerance``/``rotation_tolerance``; otherwise the exact float32
+    payload is written.
+    """
+
+    keyframe_interval: int = 32
+    """Number of frames between keyframes. ``1`` stores every frame as a keyframe."""
+
+    quantization: Literal["float16", "fixed"] | None = None
+    """Lossy encoding of positions and quaternions: ``"float16"`` half-precision values,
+    ``"fixed"`` integers on a uniform grid, or ``None`` to keep them lossless."""
+
+    position_tolerance: float = 1.0e-4
+    """Maximum absolute reconstruction error of quantized position components [m]."""
+
+    rotation_tolerance: float = 1.0e-4
+    """Maximum absolute reconstruction error of quantized quaternion components."""
+
+    position_attributes: tuple[str, ...] = ("particle_q",)
+    """Names of float32 vector state arrays treated as positions. Transform arrays are always eligible."""
+
+    def __post_init__(self):
+        """Validate the codec settings."""
+        if self.keyframe_interval < 1:
+            raise ValueError(f"keyframe_interval must be >= 1, got {self.keyframe_interval!r}")
+        if self.quantization not in (None, "float16", "fixed"):
+            raise ValueError(f"quantization must be None, 'float16', or 'fixed', got {self.quantization!r}")
+        for name in ("position_tolerance", "rotation_tolerance"):
+            value = getattr(self, name)
+            if not np.isfinite(value) or value <= 0.0:
+                raise ValueError(f"{name} must be a positive finite number, got {value!r}")
+
+    def _component_tolerances(self, name: str, value: wp.array) -> np.ndarray | None:
+        """Return per-component error bounds for a quantizable array, or None if it is stored exactly."""
+        if self.quantization is None:
+            return None
+        if value.dtype == wp.transformf:
+            return np.array([self.position_tolerance] * 3 + [self.rotation_tolerance] * 4, dtype=np.float64)
+        if name in self.position_attributes and warp_types.type_scalar_type(value.dtype) == wp.float32:
+            return np.full(warp_types.type_length(value.dtype), self.position_tolerance, dtype=np.float64)
+        return None
+
+
+class _StreamEncoderState:
+    """Keyframe bookkeeping of one array while encoding a ``.nrec`` recording."""
+
+    def __init__(self, frame_id: int, original: np.ndarray, decoded: np.ndarray):
+        self.frame_id = frame_id
+        self.original = original
+        self.decoded = decoded
+
+
+def _quantize(values: np.ndarray, tolerances: np.ndarray, mode: str) -> tuple[np.ndarray, np.ndarray, dict] | None:
+    """Quantize float values for the given per-component error bounds.
+
+    Returns the stored array, its dequantized values, and the descriptor fields
+    needed to decode it, or None if the values cannot be represented.
+    """
+    if mode == "float16":
+        with np.errstate(over="ignore"):
+            stored = values.astype(np.float16)
+        return stored, stored.astype(np.float32), {}
+
+    # A grid step equal to the tolerance keeps the rounding error at half the bound
+    step = tolerances.astype(np.float32)
+    with np.errstate(over="ignore", invalid="ignore"):
+        q = np.rint(values / step)
+    if not np.all(np.isfinite(q)):
+        return None
+    q_max = float(np.abs(q).max()) if q.size else 0.0
+    for int_type in (np.int8, np.int16, np.int32):
+        if q_max <= np.iinfo(int_type).max:
+            break
+    else:
+        return None
+    stored = q.astype(int_type)
+    return stored, stored.astype(np.float32) * step, {"scale": step.tolist()}
+
+
+def _dequantize(stored: np.ndarray, desc: Mapping[str, Any]) -> np.ndarray:
+    values = stored.astype(np.float32)
+    scale = desc.get("scale")
+    if scale is not None:
+        values *= np.asarray(scale, dtype=np.float32)
+    return values
+
+
+def _encode_state_frames(
+    frames: Iterable[Mapping[str, Any]],
+    first_frame: int = 0,
+    codec: RecordingCodec | None = None,
+    keyframes: dict[str, _StreamEncoderState] | None = None,
+) -> tuple[list[dict], bytes]:
+    """Encode state snapshots into per-frame array descriptors and one raw payload.
+
+    Args:
+        frames: State snapshots (name to array mappings) to encode.
+        first_frame: Recording-wide index of the first frame in ``frames``.
+        codec: Optional compression settings. If None, every array is stored as-is.
+        keyframes: Per-array keyframe state carried across calls; updated in place.
+    """
+    if keyframes is None:
+        keyframes = {}
+    descriptors = []
+    parts = []
+    offset = 0
+    for frame_id, frame in enumerate(frames, start=first_frame):
+        frame_desc = {}
+        for name, value in frame.items():
+            if isinstance(value, wp.array):
+                if _is_struct_dtype(value.dtype):
+                    continue
+                arr = np.ascontiguousarray(value.numpy())
+                desc = {"__type__": "warp.array", **_serialize_warp_dtype(value.dtype)}
+            elif isinstance(value, np.ndarray):
+                arr = np.ascontiguousarray(value)
+                desc = {"__type__": "numpy.ndarray"}
+            else:
+                frame_desc[name] = {"__type__": "value", "data": pointer_as_key(value, "cbor2")}
+                continue
+            desc.update({"dtype": arr.dtype.str, "shape": list(arr.shape)})
+            stored = arr if codec is None else _encode_with_codec(name, value, arr, frame_id, codec, keyframes, desc)
+            frame_desc[name] = desc
+            if stored is None:
+                continue
+            data = stored.tobytes(order="C")
+            desc.update({"offset": offset, "nbytes": len(data)})
+            parts.append(data)
+            offset += len(data)
+            pad = -offset % _STREAM_ALIGNMENT
+            if pad:
+                parts.append(b"\x00" * pad)
+                offset += pad
+        descriptors.append(frame_desc)
+    return descriptors, b"".join(parts)
+
+
+def _encode_with_codec(
+    name: str,
+    value: Any,
+    arr: np.ndarray,
+    frame_id: int,
+    codec: RecordingCodec,
+    keyframes: dict[str, _StreamEncoderState],
+    desc: dict,
+) -> np.ndarray | None:
+    """Pick the encoding of one array and record it in ``desc``.
+
+    Returns the array to store in the payload, or None if the array references its keyframe.
+    """
+    key = keyframes.get(name)
+    tolerances = codec._component_tolerances(name, value) if isinstance(value, wp.array) else None
+    is_keyframe = (
+        key is None
+        or frame_id - key.frame_id >= codec.keyframe_interval
+        or key.original.shape != arr.shape
+        or key.original.dtype != arr.dtype
+    )
+
+    if not is_keyframe and np.array_equal(arr, key.original):
+        desc.update({"encoding": "ref", "keyframe": key.frame_id})
+        return None
+
+    base = None if is_keyframe else key.decoded
+    if tolerances is not None:
+        quantized = _quantize(arr if base is None else arr - base, tolerances, codec.quantization)
+        if quantized is not None:
+            stored, values, fields = quantized
+            decoded = values if base is None else base + values
+            if np.all(np.abs(decoded.astype(np.float64) - arr) <= tolerances):
+                desc.update({"encoding": codec.quantization, "stored_dtype": stored.dtype.str, **fields})
+                if base is not None:
+                    desc["keyframe"] = key.frame_id
+                else:
+                    keyframes[name] = _StreamEncoderState(frame_id, arr.copy(), decoded)
+                return stored
+
+    if is_keyframe:
+        original = arr.copy()
+        keyframes[name] = _StreamEncoderState(frame_id, original, original)
+    return arr
+
+
+class RecordingStreamWriter:
+    """
+    Append-only writer for chunked ``.nrec`` recordings.
+
+    The model is serialized once; each call to :meth:`append` writes only the
+    frames passed to it as a new chunk and rewrites the small frame index at the
+    end of the file, so the cost of a save is proportional to the new frames
+    rather than to the length of the recording.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        index: Mapping[str, Any] | None = None,
+        index_offset: int | None = None,
+        codec: RecordingCodec | None = None,
+    ):
+        """
+        Create a new recording file, or resume appending to an existing one.
+
+        Args:
+            file_path: Path to the ``.nrec`` file.
+            index: Decoded frame index of an existing recording to resume. If None,
+                a new, empty recording is created at ``file_path``.
+            index_offset: File offset of the existing index chunk (required with ``index``).
+            codec: Optional compression settings for appended frames. If None,
+                arrays are stored exactly.
+        """
+        self.file_path = str(file_path)
+        self.codec = codec
+        # Keyframes are not carried over when resuming; the first appended frame starts a new one
+        self._keyframes: dict[str, _StreamEncoderState] = {}
+        if index is None:
+            self.model_offset: int | None = None
+            self.chunks: list[list[int]] = []
+            self.frame_count = 0
+            with open(self.file_path, "wb") as f:
+                f.write(_STREAM_HEADER.pack(_STREAM_MAGIC, _STREAM_VERSION))
+                self._index_offset = f.tell()
+                self._write_index(f)
+        else:
+            self.model_offset = index.get("model")
+            self.chunks = [list(c) for c in index.get("chunks", [])]
+            self.frame_count = int(index.get("frame_count", 0))
+            self._index_offset = int(index_offset)
+
+    def append(self, model: Model | None = None, frames: Iterable[Mapping[str, Any]] = ()) -> int:
+        """
+        Append the model (if not written yet) and a batch of state snapshots.
+
+        Args:
+            model: Model to store. Ignored once a model chunk has been written.
+            frames: State snapshots (name to array mappings) to append as one chunk.
+
+        Returns:
+            int: Number of frames appended.
+        """
+        frames = list(frames)
+        write_model = model is not None and self.model_offset is None
+        if not write_model and not frames:
+            return 0
+
+        with open(self.file_path, "r+b") as f:
+            f.seek(self._index_offset)
+            f.truncate()
+            if write_model:
+                self.model_offset = f.tell()
+                serialized = pointer_as_key({"model": model}, "cbor2", cache=ArrayCache())
+                _write_stream_chunk(f, _CHUNK_MODEL, cbor2.dumps(serialized))
+            if frames:
+                chunk_offset = f.tell()
+                descriptors, payload = _encode_state_frames(frames, self.frame_count, self.codec, self._keyframes)
+                _write_stream_chunk(f, _CHUNK_STATES, cbor2.dumps(descriptors), payload)
+                self.chunks.append([chunk_offset, self.frame_count, len(frames)])
+                self.frame_count += len(frames)
+            self._index_offset = f.tell()
+            self._write_index(f)
+        return len(frames)
+
+    def _write_index(self, f) -> None:
+        index = {"model": self.model_offset, "chunks": self.chunks, "frame_count": self.frame_count}
+        _write_stream_chunk(f, _CHUNK_INDEX, cbor2.dumps(index))
+        f.write(_STREAM_TRAILER.pack(self._index_offset, _STREAM_TRAILER_MAGIC))
+
+
+class RecordingStreamReader:
+    """
+    Memory-mapped, random-access reader for chunked ``.nrec`` recordings.
+
+    Behaves like a read-only sequence of state snapshots. The file is memory-mapped
+    and only the frame index is decoded on construction; a frame's arrays are
+    decoded when that frame (or a subset of its arrays) is requested. Recently
+    decoded frames are kept in a small LRU cache so scrubbing back and forth over
+    nearby frames does not decode them again.
+    """
+
+    def __init__(self, file_path: str, cache_size: int = 16):
+        """
+        Map a recording and read its frame index.
+
+        Args:
+            file_path: Path to the ``.nrec`` file.
+            cache_size: Maximum number of decoded frames kept in the LRU cache.
+                Set to 0 to disable caching.
+        """
+        if cache_size < 0:
+            raise ValueError("cache_size must be >= 0")
+        self.file_path = str(file_path)
+        self.cache_size = cache_size
+        with open(self.file_path, "rb") as f:
+            file_size = os.fstat(f.fileno()).st_size
+            if file_size < _STREAM_HEADER.size:
+                raise ValueError(f"'{self.file_path}' is not a Newton stream recording")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version = _STREAM_HEADER.unpack_from(self._mmap, 0)
+            if magic != _STREAM_MAGIC:
+                raise ValueError(f"'{self.file_path}' is not a Newton stream recording")
+            if version > _STREAM_VERSION:
+                raise ValueError(f"Unsupported stream recording version {version} (expected <= {_STREAM_VERSION})")
+            self.index, self.index_offset = self._read_index()
+        except Exception:
+            self._mmap.close()
+            raise
+        self.model_offset: int | None = self.index.get("model")
+        self.chunks: list[list[int]] = [list(c) for c in self.index.get("chunks", [])]
+        self._chunk_first_frames = [c[1] for c in self.chunks]
+        self._chunk_meta: dict[int, tuple[list[dict], int]] = {}
+        self._frame_cache: OrderedDict[int, dict[str, Any]] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _read_chunk_header(self, offset: int) -> tuple[bytes, int, int]:
+        if offset + _STREAM_CHUNK_HEADER.size > len(self._mmap):
+            raise EOFError(f"Truncated chunk at offset {offset}")
+        return _STREAM_CHUNK_HEADER.unpack_from(self._mmap, offset)
+
+    def _read_chunk_meta(self, offset: int, meta_len: int) -> Any:
+        start = offset + _STREAM_CHUNK_HEADER.size
+        return cbor2.loads(self._mmap[start : start + meta_len])
+
+    def _read_index(self) -> tuple[dict, int]:
+        file_size = len(self._mmap)
+        if file_size >= _STREAM_HEADER.size + _STREAM_TRAILER.size:
+            index_offset, trailer_magic = _STREAM_TRAILER.unpack_from(self._mmap, file_size - _STREAM_TRAILER.size)
+            if trailer_magic == _STREAM_TRAILER_MAGIC and index_offset < file_size:
+                tag, meta_len, _ = self._read_chunk_header(index_offset)
+                if tag == _CHUNK_INDEX:
+                    return self._read_chunk_meta(index_offset, meta_len), index_offset
+        # The trailer is missing (e.g. the writer was interrupted): rebuild the index by scanning chunks
+        warnings.warn(f"Recording '{self.file_path}' has no valid index; recovering frames by scanning", stacklevel=3)
+        index = {"model": None, "chunks": [], "frame_count": 0}
+        offset = _STREAM_HEADER.size
+        while offset + _STREAM_CHUNK_HEADER.size <= file_size:
+            tag, meta_len, payload_len = self._read_chunk_header(offset)
+            end = offset + _STREAM_CHUNK_HEADER.size + meta_len + payload_len
+            if end > file_size:
+                break
+            if tag == _CHUNK_MODEL:
+                index["model"] = offset
+            elif tag == _CHUNK_STATES:
+                count = len(self._read_chunk_meta(offset, meta_len))
+                index["chunks"].append([offset, index["frame_count"], count])
+                index["frame_count"] += count
+            elif tag == _CHUNK_INDEX:
+                return index, offset
+            offset = end
+        return index, offset
+
+    def read_model(self) -> dict | None:
+        """Read and deserialize the recorded model, or return None if the recording has none."""
+        if self.model_offset is None:
+            return None
+        _, meta_len, _ = self._read_chunk_header(self.model_offset)
+        serialized = self._read_chunk_meta(self.model_offset, meta_len)
+        return depointer_as_key(serialized, "cbor2", cache=ArrayCache())["model"]
+
+    def _get_chunk_meta(self, chunk_id: int) -> tuple[list[dict], int]:
+        meta = self._chunk_meta.get(chunk_id)
+        if meta is None:
+            offset = self.chunks[chunk_id][0]
+            _, meta_len, _ = self._read_chunk_header(offset)
+            meta = (self._read_chunk_meta(offset, meta_len), offset + _STREAM_CHUNK_HEADER.size + meta_len)
+            self._chunk_meta[chunk_id] = meta
+        return meta
+
+    def _decode_values(self, name: str, desc: Mapping[str, Any], payload_offset: int) -> np.ndarray:
+        """Decode the values of one array, resolving keyframe references and deltas."""
+        encoding = desc.get("encoding", "raw")
+        if encoding == "ref":
+            return self._decode_keyframe_values(name, desc["keyframe"])
+
+        stored_dtype = np.dtype(desc.get("stored_dtype", desc["dtype"]))
+        stored = np.frombuffer(
+            self._mmap,
+            dtype=stored_dtype,
+            count=desc["nbytes"] // stored_dtype.itemsize,
+            offset=payload_offset + desc["offset"],
+        ).reshape(tuple(desc["shape"]))
+        if encoding == "raw":
+            return stored
+        values = _dequantize(stored, desc)
+        if "keyframe" in desc:
+            values += self._decode_keyframe_values(name, desc["keyframe"])
+        return values.astype(np.dtype(desc["dtype"]), copy=False)
+
+    def _decode_keyframe_values(self, name: str, frame_id: int) -> np.ndarray:
+        chunk_id, local_id = self._locate(frame_id)
+        descriptors, payload_offset = self._get_chunk_meta(chunk_id)
+        return self._decode_values(name, descriptors[local_id][name], payload_offset)
+
+    def _decode_array(self, name: str, desc: Mapping[str, Any], payload_offset: int) -> Any:
+        values = self._decode_values(name, desc, payload_offset)
+        # Copy out of the mapping so decoded arrays stay valid after close()
+        if desc["__type__"] == "numpy.ndarray":
+            return np.array(values, copy=True)
+        warp_dtype = _resolve_warp_dtype(extract_last_type_name(desc["__dtype__"]), serialized_data=desc, np_arr=values)
+        return wp.array(values, dtype=warp_dtype, copy=True)
+
+    def frame_attributes(self, frame_id: int) -> list[str]:
+        """Return the names of the attributes stored for ``frame_id`` without decoding them."""
+        chunk_id, local_id = self._locate(frame_id)
+        return list(self._get_chunk_meta(chunk_id)[0][local_id].keys())
+
+    def _locate(self, frame_id: int) -> tuple[int, int]:
+        if not isinstance(frame_id, int):
+            raise TypeError("Index must be an integer")
+        if not (0 <= frame_id < len(self)):
+            raise IndexError(f"Index {frame_id} out of range [0, {len(self)})")
+        chunk_id = bisect.bisect_right(self._chunk_first_frames, frame_id) - 1
+        return chunk_id, frame_id - self.chunks[chunk_id][1]
+
+    def get_frame(self, frame_id: int, attributes: Iterable[str] | None = None) -> dict[str, Any]:
+        """
+        Decode the state snapshot at ``frame_id``.
+
+        Args:
+            frame_id: Frame index in ``[0, len(self))``.
+            attributes: Optional names of the arrays to decode (e.g. ``("body_q",)``).
+                If None, every array stored for the frame is decoded. Unknown names are ignored.
+
+        Returns:
+            dict: Mapping of attribute names to decoded arrays.
+        """
+        chunk_id, local_id = self._locate(frame_id)
+        descriptors, payload_offset = self._get_chunk_meta(chunk_id)
+        frame_desc = descriptors[local_id]
+        names = frame_desc.keys() if attributes is None else [n for n in attributes if n in frame_desc]
+
+        cached = self._frame_cache.get(frame_id)
+        if cached is not None:
+            self._frame_cache.move_to_end(frame_id)
+        missing = [n for n in names if cached is None or n not in cached]
+        if not missing:
+            self.cache_hits += 1
+            return {n: cached[n] for n in names}
+
+        self.cache_misses += 1
+        decoded = {} if cached is None else cached
+        for name in missing:
+            desc = frame_desc[name]
+            if desc["__type__"] == "value":
+                decoded[name] = depointer_as_key(desc["data"], "cbor2")
+            else:
+                decoded[name] = self._decode_array(name, desc, payload_offset)
+
+        if self.cache_size > 0:
+            self._frame_cache[frame_id] = decoded
+            self._frame_cache.move_to_end(frame_id)
+            while len(self._frame_cache) > self.cache_size:
+                self._frame_cache.popitem(last=False)
+        return {n: decoded[n] for n in names}
+
+    def clear_cache(self) -> None:
+        """Drop all decoded frames from the LRU cache."""
+        self._frame_cache.clear()
+
+    def __len__(self) -> int:
+        return int(self.index.get("frame_count", 0))
+
+    def __getitem__(self, frame_id: int) -> dict[str, Any]:
+        """Decode every array of the state snapshot at ``frame_id``."""
+        return self.get_frame(frame_id)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_list(self) -> list[dict[str, Any]]:
+        """Decode every frame of the recording into a list."""
+        return list(self)
+
+    def close(self) -> None:
+        """Unmap the recording and drop the decoded-frame cache."""
+        self._frame_cache.clear()
+        self._chunk_meta.clear()
+        self._mmap.close()
+
+
 class ViewerFile(ViewerBase):
     """
     File-based viewer backend for Newton physics simulations.
@@ -1120,6 +1649,11 @@ class ViewerFile(ViewerBase):
     Format is determined by file extension:
     - .json: Human-readable JSON format
     - .bin: Binary CBOR2 format (more efficient)
+    - .nrec: Chunked, append-only binary format. The model is written once and
+      each save appends only the frames recorded since the previous save. A
+      frame index at the end of the file lets playback read individual frames
+      without loading the whole recording. Loaded recordings are memory-mapped
+      and frames are decoded on demand.
     """
 
     def __init__(
@@ -1128,16 +1662,22 @@ class ViewerFile(ViewerBase):
         auto_save: bool = True,
         save_interval: int = 100,
         max_history_size: int | None = None,
+        playback_cache_size: int = 16,
+        codec: RecordingCodec | None = None,
     ):
         """
         Initialize the File viewer backend for Newton physics simulations.
 
         Args:
-            output_path: Path to the output file (.json or .bin)
+            output_path: Path to the output file (.json, .bin, or .nrec)
             auto_save: If True, automatically save periodically during recording
             save_interval: Number of frames between auto-saves (when auto_save=True)
             max_history_size: Maximum number of states to keep in memory.
                 If None, uses unlimited history. If set, keeps only the last N states.
+            playback_cache_size: Number of decoded frames kept in memory when
+                playing back a memory-mapped .nrec recording.
+            codec: Optional compression settings for .nrec recordings, see
+                :class:`RecordingCodec`. Ignored for .json and .bin files.
         """
         super().__init__()
 
@@ -1146,12 +1686,12 @@ class ViewerFile(ViewerBase):
         self.output_path = Path(output_path)
         self.auto_save = auto_save
         self.save_interval = save_interval
+        self.playback_cache_size = playback_cache_size
+        self.codec = codec
 
         # Recording storage
-        if max_history_size is None:
-            self.history: list[dict] = []
-        else:
-            self.history: RingBuffer[dict] = RingBuffer(max_history_size)
+        self.max_history_size = max_history_size
+        self.history: list[dict] | RingBuffer[dict] | RecordingStreamReader = self._new_history()
         self.raw_model: Model | None = None
         self.deserialized_model: dict | None = None
 
@@ -1159,6 +1699,11 @@ class ViewerFile(ViewerBase):
         self._model_recorded = False
         self._running = True
 
+        # Append-only stream (.nrec) bookkeeping
+        self._record_count = 0
+        self._stream_writer: RecordingStreamWriter | None = None
+        self._stream_record_count = 0
+
     @override
     def set_model(self, model: Model | None):
         """Override set_model to record the model when it is set.
@@ -1220,30 +1765,53 @@ class ViewerFile(ViewerBase):
             if verbose:
                 print(f"Error saving recording: {e}")
 
+    def _new_history(self) -> list[dict] | RingBuffer[dict]:
+        """Create an empty in-memory history honoring ``max_history_size``."""
+        if self.max_history_size is None:
+            return []
+        return RingBuffer(self.max_history_size)
+
     def record(self, state: State):
         """Record a snapshot of the provided simulation state.
 
+        Recording after loading a .nrec file closes the memory-mapped reader and
+        starts a fresh in-memory history; saving to the loaded file appends the
+        new frames after the loaded ones.
+
         Args:
             state: State to snapshot into the recording history.
         """
+        if isinstance(self.history, RecordingStreamReader):
+            self.history.close()
+            self.history = self._new_history()
         state_data = {}
         for name, value in state.__dict__.items():
             if isinstance(value, wp.array):
                 state_data[name] = wp.clone(value)
         self.history.append(state_data)
+        self._record_count += 1
 
-    def playback(self, state: State, frame_id: int):
+    def playback(self, state: State, frame_id: int, attributes: Iterable[str] | None = None):
         """Restore a state snapshot from history into a State object.
 
         Args:
             state: Destination state object to populate.
             frame_id: Frame index to load from history.
+            attributes: Optional names of the state attributes to restore
+                (e.g. ``("body_q", "particle_q")``). If None, all recorded
+                attributes are restored. For .nrec recordings only the selected
+                arrays are decoded.
         """
         if not (0 <= frame_id < len(self.history)):
             print(f"Warning: frame_id {frame_id} is out of bounds. Playback skipped.")
             return
 
-        state_data = self.history[frame_id]
+        if isinstance(self.history, RecordingStreamReader):
+            state_data = self.history.get_frame(frame_id, attributes)
+        else:
+            state_data = self.history[frame_id]
+            if attributes is not None:
+                state_data = {name: state_data[name] for name in attributes if name in state_data}
         for name, value_wp in state_data.items():
             if hasattr(state, name):
                 setattr(state, name, value_wp)
@@ -1283,6 +1851,10 @@ class ViewerFile(ViewerBase):
             else:
                 raise
 
+        if format_type == "stream":
+            self._append_to_stream(file_path)
+            return
+
         states_to_save = self.history.to_list() if isinstance(self.history, RingBuffer) else self.history
         data_to_save = {"model": self.raw_model, "states": states_to_save}
         array_cache = ArrayCache()
@@ -1296,6 +1868,21 @@ class ViewerFile(ViewerBase):
             with open(file_path, "wb") as f:
                 f.write(cbor_data)
 
+    def _append_to_stream(self, file_path: str):
+        """Append the frames recorded since the last save to a ``.nrec`` recording."""
+        writer = self._stream_writer
+        if writer is None or writer.file_path != file_path or not os.path.exists(file_path):
+            writer = RecordingStreamWriter(file_path, codec=self.codec)
+            self._stream_writer = writer
+            pending = len(self.history)
+        else:
+            # Frames that already left a bounded history before this save are lost
+            pending = min(self._record_count - self._stream_record_count, len(self.history))
+
+        start = len(self.history) - pending
+        writer.append(self.raw_model, (self.history[i] for i in range(start, len(self.history))))
+        self._stream_record_count = self._record_count
+
     def _load_from_file(self, file_path: str):
         """Load recording data from disk, replacing current model/history."""
         try:
@@ -1311,6 +1898,10 @@ class ViewerFile(ViewerBase):
             else:
                 raise
 
+        if format_type == "stream":
+            self._load_from_stream(file_path)
+            return
+
         if format_type == "json":
             with open(file_path) as f:
                 serialized_data = json.load(f)
@@ -1329,6 +1920,18 @@ class ViewerFile(ViewerBase):
         else:
             self.history = loaded_states
 
+    def _load_from_stream(self, file_path: str):
+        """Open a ``.nrec`` recording; frames are read on demand during playback."""
+        reader = RecordingStreamReader(file_path, cache_size=self.playback_cache_size)
+        if isinstance(self.history, RecordingStreamReader):
+            self.history.close()
+        self.deserialized_model = reader.read_model()
+        self.history = reader
+
+        # Further saves to the same file append to it instead of rewriting the loaded frames
+        self._stream_writer = RecordingStreamWriter(file_path, reader.index, reader.index_offset, codec=self.codec)
+        self._stream_record_count = self._record_count
+
     # Abstract method implementations (no-ops for file recording)
 
     @override
@@ -1473,6 +2076,8 @@ class ViewerFile(ViewerBase):
         """Save final recording and cleanup."""
         if self._frame_count > 0:
             self._save_recording()
+        if isinstance(self.history, RecordingStreamReader):
+            self.history.close()
         self._running = False
         print(f"ViewerFile closed. Total frames recorded: {self._frame_count}")
 
@@ -1520,7 +2125,7 @@ class ViewerFile(ViewerBase):
         """
         self.playback_model(model)
 
-    def load_state(self, state: State, frame_id: int):
+    def load_state(self, state: State, frame_id: int, attributes: Iterable[str] | None = None):
         """Restore State to a specific frame from the loaded recording.
 
         Must be called after load_recording(). The given state is updated
@@ -1529,5 +2134,7 @@ class ViewerFile(ViewerBase):
         Args:
             state: A Newton State instance to populate.
             frame_id: Frame index in [0, get_frame_count()).
+            attributes: Optional names of the state attributes to restore.
+                If None, all recorded attributes are restored.
         """
-        self.playback(state, frame_id)
+        self.playback(state, frame_id, attributes)
@@ -18,6 +18,7 @@ construction.
 from ._src.actuators import (
     Actuator,
     ActuatorParsed,
+    ActuatorScheduler,
     Clamping,
     ClampingDCMotor,
     ClampingMaxEffort,
@@ -37,6 +38,7 @@ from ._src.actuators import (
 __all__ = [
     "Actuator",
     "ActuatorParsed",
+    "ActuatorScheduler",
     "Clamping",
     "ClampingDCMotor",
     "ClampingMaxEffort",
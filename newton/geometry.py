@@ -7,6 +7,7 @@ from ._src.geometry import (
     BroadPhaseAllPairs,
     BroadPhaseExplicit,
     BroadPhaseSAP,
+    BroadPhaseSpatialHash,
     collide_box_box,
     collide_capsule_box,
     collide_capsule_capsule,
@@ -32,6 +33,7 @@ __all__ = [
     "BroadPhaseAllPairs",
     "BroadPhaseExplicit",
     "BroadPhaseSAP",
+    "BroadPhaseSpatialHash",
     "HydroelasticSDF",
     "NarrowPhase",
     "collide_box_box",
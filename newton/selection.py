@@ -1,8 +1,9 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 The Newton Developers
 # SPDX-License-Identifier: Apache-2.0
 
-from ._src.utils.selection import ArticulationView
+from ._src.utils.selection import ArticulationView, ObservationSpec
 
 __all__ = [
     "ArticulationView",
+    "ObservationSpec",
 ]
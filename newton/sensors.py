@@ -16,6 +16,11 @@ from ._src.sensors.sensor_imu import (
     SensorIMU,
 )
 
+# Sensor scheduling
+from ._src.sensors.sensor_scheduler import (
+    SensorScheduler,
+)
+
 # Tiled camera sensors
 from ._src.sensors.sensor_tiled_camera import (
     SensorTiledCamera,
@@ -25,5 +30,6 @@ __all__ = [
     "SensorContact",
     "SensorFrameTransform",
     "SensorIMU",
+    "SensorScheduler",
     "SensorTiledCamera",
 ]
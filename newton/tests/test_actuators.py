@@ -23,6 +23,7 @@ from newton._src.utils.import_usd import parse_usd
 from newton.actuators import (
     Actuator,
     ActuatorParsed,
+    ActuatorScheduler,
     ClampingDCMotor,
     ClampingMaxEffort,
     ClampingPositionBased,
@@ -1443,6 +1444,200 @@ class TestActuatorStep(unittest.TestCase):
         )
 
 
+class TestFusedActuator(unittest.TestCase):
+    """The fused single-kernel path must match the composed per-component path."""
+
+    def _make(self, controller_kind, clamp_kind, with_delay, fused, n=6):
+        rng = np.random.default_rng(1)
+
+        def arr(values):
+            return wp.array(np.asarray(values, dtype=np.float32), dtype=wp.float32)
+
+        if controller_kind == "pd":
+            controller = ControllerPD(kp=arr(rng.uniform(1, 50, n)), kd=arr(rng.uniform(0, 5, n)))
+        else:
+            controller = ControllerPID(
+                kp=arr(rng.uniform(1, 50, n)),
+                ki=arr(rng.uniform(0, 10, n)),
+                kd=arr(rng.uniform(0, 5, n)),
+                integral_max=arr([0.05] * n),
+                const_effort=arr(rng.uniform(-1, 1, n)),
+            )
+        clamping = []
+        if clamp_kind == "max_effort":
+            clamping = [ClampingMaxEffort(max_effort=arr([20.0] * n))]
+        elif clamp_kind == "dc_motor":
+            clamping = [
+                ClampingDCMotor(
+                    saturation_effort=arr([30.0] * n), velocity_limit=arr([4.0] * n), max_motor_effort=arr([25.0] * n)
+                )
+            ]
+        elif clamp_kind == "position_based":
+            clamping = [ClampingPositionBased(lookup_positions=(-1.0, 0.0, 1.0), lookup_efforts=(5.0, 15.0, 5.0))]
+        delay = None
+        if with_delay:
+            delay = Delay(delay_steps=wp.array([0, 1, 2, 3, 2, 1], dtype=wp.int32), max_delay=3)
+        return Actuator(
+            indices=wp.array(np.arange(n)[::-1].astype(np.uint32), dtype=wp.uint32),
+            controller=controller,
+            delay=delay,
+            clamping=clamping,
+            control_computed_output_attr="joint_act_computed",
+            fused=fused,
+        )
+
+    def _run(self, actuator, steps=5, n=6):
+        rng = np.random.default_rng(2)
+        sim_state = types.SimpleNamespace(
+            joint_q=wp.array(rng.uniform(-1, 1, n), dtype=wp.float32),
+            joint_qd=wp.array(rng.uniform(-3, 3, n), dtype=wp.float32),
+        )
+        sim_control = types.SimpleNamespace(
+            joint_target_q=wp.zeros(n, dtype=wp.float32),
+            joint_target_qd=wp.zeros(n, dtype=wp.float32),
+            joint_act=wp.zeros(n, dtype=wp.float32),
+            joint_f=wp.zeros(n, dtype=wp.float32),
+            joint_act_computed=wp.zeros(n, dtype=wp.float32),
+        )
+        state_a, state_b = actuator.state(), actuator.state()
+        history = []
+        for _ in range(steps):
+            sim_control.joint_target_q.assign(rng.uniform(-2, 2, n))
+            sim_control.joint_target_qd.assign(rng.uniform(-1, 1, n))
+            sim_control.joint_act.assign(rng.uniform(-1, 1, n))
+            sim_control.joint_f.zero_()
+            sim_control.joint_act_computed.zero_()
+            actuator.step(sim_state, sim_control, state_a, state_b, 0.01)
+            state_a, state_b = state_b, state_a
+            history.append((sim_control.joint_f.numpy(), sim_control.joint_act_computed.numpy()))
+        return history
+
+    def test_matches_composed_path(self):
+        for controller_kind in ("pd", "pid"):
+            for clamp_kind in (None, "max_effort", "dc_motor", "position_based"):
+                for with_delay in (False, True):
+                    with self.subTest(controller=controller_kind, clamping=clamp_kind, delay=with_delay):
+                        fused = self._make(controller_kind, clamp_kind, with_delay, fused=True)
+                        composed = self._make(controller_kind, clamp_kind, with_delay, fused=False)
+                        self.assertTrue(fused.is_fused)
+                        self.assertFalse(composed.is_fused)
+                        for (f_out, f_comp), (c_out, c_comp) in zip(self._run(fused), self._run(composed), strict=True):
+                            np.testing.assert_allclose(f_out, c_out, rtol=1e-6, atol=1e-5)
+                            np.testing.assert_allclose(f_comp, c_comp, rtol=1e-6, atol=1e-5)
+
+    def test_unsupported_combinations_are_not_fused(self):
+        n = 2
+        gains = wp.array([1.0] * n, dtype=wp.float32)
+        indices = wp.array([0, 1], dtype=wp.uint32)
+        max_effort = wp.array([1.0] * n, dtype=wp.float32)
+        two_clamps = Actuator(
+            indices=indices,
+            controller=ControllerPD(kp=gains, kd=gains),
+            clamping=[ClampingMaxEffort(max_effort=max_effort), ClampingMaxEffort(max_effort=max_effort)],
+        )
+        self.assertFalse(two_clamps.is_fused)
+        with_grad = Actuator(indices=indices, controller=ControllerPD(kp=gains, kd=gains), requires_grad=True)
+        self.assertFalse(with_grad.is_fused)
+
+
+class TestActuatorScheduler(unittest.TestCase):
+    """ActuatorScheduler: batched stepping must match per-actuator stepping."""
+
+    def setUp(self):
+        self.device = wp.get_device()
+        self._tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp_dir, ignore_errors=True)
+
+    def _sim_arrays(self, n):
+        rng = np.random.default_rng(0)
+        sim_state = types.SimpleNamespace(
+            joint_q=wp.array(rng.uniform(-1.0, 1.0, n), dtype=wp.float32, device=self.device),
+            joint_qd=wp.array(rng.uniform(-1.0, 1.0, n), dtype=wp.float32, device=self.device),
+        )
+        sim_control = types.SimpleNamespace(
+            joint_target_q=wp.array(rng.uniform(-1.0, 1.0, n), dtype=wp.float32, device=self.device),
+            joint_target_qd=wp.zeros(n, dtype=wp.float32, device=self.device),
+            joint_act=None,
+            joint_f=wp.zeros(n, dtype=wp.float32, device=self.device),
+        )
+        return sim_state, sim_control
+
+    def _make_actuators(self, make_controller, max_effort=None):
+        """Two actuator groups over DOFs [0, 2] and [1, 3]; the second is clamped."""
+        idx_a = wp.array([0, 2], dtype=wp.uint32, device=self.device)
+        idx_b = wp.array([1, 3], dtype=wp.uint32, device=self.device)
+        clamping = None
+        if max_effort is not None:
+            clamping = [ClampingMaxEffort(max_effort=wp.array([max_effort] * 2, dtype=wp.float32, device=self.device))]
+        return [
+            Actuator(indices=idx_a, controller=make_controller()),
+            Actuator(indices=idx_b, controller=make_controller(), clamping=clamping),
+        ]
+
+    def _assert_matches_individual(self, make_controller, max_effort=None, steps=3):
+        reference = self._make_actuators(make_controller, max_effort)
+        batched = self._make_actuators(make_controller, max_effort)
+        scheduler = ActuatorScheduler(batched)
+
+        sim_state, sim_control = self._sim_arrays(4)
+        ref_states = [(a.state(), a.state()) for a in reference]
+        sched_a, sched_b = scheduler.state(), scheduler.state()
+        for _ in range(steps):
+            sim_control.joint_f.zero_()
+            for actuator, (cur, nxt) in zip(reference, ref_states, strict=True):
+                actuator.step(sim_state, sim_control, cur, nxt, 0.01)
+            expected = sim_control.joint_f.numpy()
+            ref_states = [(nxt, cur) for cur, nxt in ref_states]
+
+            sim_control.joint_f.zero_()
+            scheduler.step(sim_state, sim_control, sched_a, sched_b, 0.01)
+            sched_a, sched_b = sched_b, sched_a
+            np.testing.assert_allclose(sim_control.joint_f.numpy(), expected, rtol=1e-5, atol=1e-5)
+        return scheduler
+
+    def test_non_neural_actuators_step_individually(self):
+        def make_pd():
+            gains = wp.array([10.0, 20.0], dtype=wp.float32, device=self.device)
+            return ControllerPD(kp=gains, kd=gains)
+
+        scheduler = self._assert_matches_individual(make_pd, max_effort=5.0)
+        self.assertEqual(scheduler.num_groups, 0)
+        self.assertTrue(scheduler.is_graphable())
+
+    def test_reset_mask_count(self):
+        gains = wp.array([1.0, 1.0], dtype=wp.float32, device=self.device)
+        actuator = Actuator(
+            indices=wp.array([0, 1], dtype=wp.uint32, device=self.device),
+            controller=ControllerPD(kp=gains, kd=gains),
+        )
+        state = ActuatorScheduler([actuator]).state()
+        state.reset()
+        with self.assertRaises(ValueError):
+            state.reset([None, None])
+
+    @unittest.skipUnless(_HAS_ONNX and _HAS_WARP_NN, "onnx or warp-nn not installed")
+    def test_mlp_groups_share_one_network(self):
+        path = os.path.join(self._tmp_dir, "mlp.onnx")
+        weights = np.array([[1.5, -0.5, 0.25, 2.0]], dtype=np.float32)
+        _build_mlp_onnx(
+            path,
+            weights,
+            np.array([0.1], dtype=np.float32),
+            metadata={"input_idx": [0, 1], "pos_scale": 2.0, "effort_scale": 3.0},
+        )
+        scheduler = self._assert_matches_individual(lambda: ControllerNeuralMLP(model_path=path), max_effort=0.5)
+        self.assertEqual(scheduler.num_groups, 1)
+
+    @unittest.skipUnless(_HAS_ONNX and _HAS_WARP_NN, "onnx or warp-nn not installed")
+    def test_lstm_groups_share_one_network(self):
+        path = os.path.join(self._tmp_dir, "lstm.onnx")
+        _build_lstm_onnx(path, hidden_size=4, metadata={"vel_scale": 0.5})
+        scheduler = self._assert_matches_individual(lambda: ControllerNeuralLSTM(model_path=path))
+        self.assertEqual(scheduler.num_groups, 1)
+
+
 # ---------------------------------------------------------------------------
 # 5. Builder — from USD, programmatic, and free-joint replication
 # ---------------------------------------------------------------------------
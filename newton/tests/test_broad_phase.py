@@ -9,7 +9,7 @@ import warp as wp
 
 from newton._src.geometry.broad_phase_sap import _advance_sap_chunk_base
 from newton._src.geometry.flags import ShapeFlags
-from newton.geometry import BroadPhaseAllPairs, BroadPhaseExplicit, BroadPhaseSAP
+from newton.geometry import BroadPhaseAllPairs, BroadPhaseExplicit, BroadPhaseSAP, BroadPhaseSpatialHash
 
 # NOTE: The test_group_pair and test_world_and_group_pair functions below are copied
 # from newton._src.geometry.broad_phase_common because they need to be available as
@@ -1158,6 +1158,10 @@ class TestBroadPhase(unittest.TestCase):
         """Test SAP broad phase with tile sort."""
         self._test_sap_broadphase_impl("tile")
 
+    def test_sap_broadphase_incremental(self):
+        """Test SAP broad phase with incremental sort."""
+        self._test_sap_broadphase_impl("incremental")
+
     def _test_sap_broadphase_multiple_worlds_impl(self, sort_type):
         """Test SAP broad phase with objects in different worlds and mixed collision groups."""
         verbose = False
@@ -1305,6 +1309,10 @@ class TestBroadPhase(unittest.TestCase):
         """Test SAP broad phase with multiple worlds using tile sort."""
         self._test_sap_broadphase_multiple_worlds_impl("tile")
 
+    def test_sap_broadphase_multiple_worlds_incremental(self):
+        """Test SAP broad phase with multiple worlds using incremental sort."""
+        self._test_sap_broadphase_multiple_worlds_impl("incremental")
+
     def _test_sap_broadphase_with_shape_flags_impl(self, sort_type):
         """Test SAP broad phase with ShapeFlags filtering.
 
@@ -1466,6 +1474,10 @@ class TestBroadPhase(unittest.TestCase):
         """Test SAP broad phase with ShapeFlags using tile sort."""
         self._test_sap_broadphase_with_shape_flags_impl("tile")
 
+    def test_sap_broadphase_with_shape_flags_incremental(self):
+        """Test SAP broad phase with ShapeFlags filtering using incremental sort."""
+        self._test_sap_broadphase_with_shape_flags_impl("incremental")
+
     def test_nxn_edge_cases(self):
         """Test NxN broad phase with tricky edge cases to verify GPU code correctness.
 
@@ -2269,6 +2281,245 @@ class TestBroadPhase(unittest.TestCase):
         """Test SAP edge cases with tile sort."""
         self._test_sap_edge_cases_impl("tile")
 
+    def test_sap_edge_cases_incremental(self):
+        """Test SAP broad phase edge cases with incremental sort."""
+        self._test_sap_edge_cases_impl("incremental")
+
+    def test_sap_incremental_temporal_coherence(self):
+        """Repeated incremental launches match the reference under small and large motions."""
+        rng = np.random.Generator(np.random.PCG64(7))
+        world_count = 3
+        ngeom_per_world = 40
+        ngeom = world_count * ngeom_per_world
+
+        np_shape_world = np.repeat(np.arange(world_count, dtype=np.int32), ngeom_per_world)
+        centers = rng.random((ngeom, 3)) * 4.0
+        half_extents = rng.random((ngeom, 3)) * 0.3 + 0.05
+        np_cutoff = np.zeros(ngeom, dtype=np.float32)
+        np_collision_group = np.ones(ngeom, dtype=np.int32)
+
+        shape_world = wp.array(np_shape_world, dtype=wp.int32)
+        cutoff = wp.array(np_cutoff)
+        collision_group = wp.array(np_collision_group)
+        max_candidate_pair = ngeom * (ngeom - 1) // 2
+        candidate_pair = wp.zeros(max_candidate_pair, dtype=wp.vec2i)
+        candidate_pair_count = wp.zeros(1, dtype=wp.int32)
+
+        sap_broadphase = BroadPhaseSAP(shape_world, sort_type="incremental", incremental_resort_threshold=0.05)
+
+        # Small jitter exercises the insertion-sort repair, the large jumps force a full sort.
+        step_scales = [0.0, 0.01, 0.02, 0.01, 1.5, 0.01, 0.03, 2.0, 0.0]
+        for step, scale in enumerate(step_scales):
+            centers = centers + (rng.random((ngeom, 3)) - 0.5) * scale
+            if step == 6:
+                sap_broadphase.reset_incremental_state()
+            lower = centers - half_extents
+            upper = centers + half_extents
+
+            candidate_pair_count.zero_()
+            sap_broadphase.launch(
+                wp.array(lower, dtype=wp.vec3),
+                wp.array(upper, dtype=wp.vec3),
+                cutoff,
+                collision_group,
+                shape_world,
+                ngeom,
+                candidate_pair,
+                candidate_pair_count,
+            )
+
+            expected = {
+                (int(a), int(b))
+                for a, b in find_overlapping_pairs_np(
+                    lower, upper, np_cutoff, np_collision_group, shape_world=np_shape_world
+                )
+            }
+
+            count = candidate_pair_count.numpy()[0]
+            found = {tuple(int(v) for v in sorted(pair)) for pair in candidate_pair.numpy()[:count]}
+            self.assertEqual(count, len(found), f"duplicate pairs at step {step}")
+            self.assertEqual(found, expected, f"pair mismatch at step {step}")
+
+            # Both full and repaired sorts must leave every world segment sorted.
+            sorted_lower = sap_broadphase.sap_projection_lower.numpy()[:ngeom].reshape(world_count, -1)
+            self.assertTrue(np.all(np.diff(sorted_lower, axis=1) >= 0.0), f"unsorted keys at step {step}")
+
+    def test_sap_incremental_invalid_threshold(self):
+        shape_world = wp.array(np.zeros(4, dtype=np.int32), dtype=wp.int32)
+        with self.assertRaises(ValueError):
+            BroadPhaseSAP(shape_world, sort_type="incremental", incremental_resort_threshold=-1.0)
+
+    def _spatial_hash_scene(self, seed):
+        rng = np.random.Generator(np.random.PCG64(seed))
+        world_count = 3
+        ngeom = 240
+        shape_world = np.repeat(np.arange(world_count, dtype=np.int32), ngeom // world_count)
+        shape_world[:4] = -1  # shared shapes collide with every world
+        centers = rng.random((ngeom, 3)) * 4.0
+        half_extents = rng.random((ngeom, 3)) * 0.2 + 0.02
+        half_extents[0] = (1.0e6, 1.0e6, 0.01)  # ground-plane-like shared shape
+        half_extents[10] = (2.5, 0.1, 0.1)  # spans many cells
+        lower = centers - half_extents
+        upper = centers + half_extents
+        gap = (rng.random(ngeom) * 0.05).astype(np.float32)
+        collision_group = rng.integers(-2, 3, size=ngeom, dtype=np.int32)
+        shape_flags = np.full(ngeom, int(ShapeFlags.COLLIDE_SHAPES), dtype=np.int32)
+        shape_flags[rng.choice(ngeom, size=20, replace=False)] = 0
+        displacement = (rng.random((ngeom, 3)) - 0.5) * 0.4
+        return lower, upper, gap, collision_group, shape_world, shape_flags, displacement
+
+    def _launch_pairs(self, broad_phase, lower, upper, gap, collision_group, shape_world, **kwargs):
+        ngeom = lower.shape[0]
+        candidate_pair = wp.zeros(ngeom * (ngeom - 1) // 2, dtype=wp.vec2i)
+        candidate_pair_count = wp.zeros(1, dtype=wp.int32)
+        broad_phase.launch(
+            wp.array(lower, dtype=wp.vec3),
+            wp.array(upper, dtype=wp.vec3),
+            wp.array(gap, dtype=wp.float32),
+            wp.array(collision_group, dtype=wp.int32),
+            wp.array(shape_world, dtype=wp.int32),
+            ngeom,
+            candidate_pair,
+            candidate_pair_count,
+            **kwargs,
+        )
+        count = candidate_pair_count.numpy()[0]
+        pairs = [tuple(int(v) for v in pair) for pair in candidate_pair.numpy()[:count]]
+        self.assertEqual(len(pairs), len(set(pairs)), "duplicate candidate pairs")
+        for a, b in pairs:
+            self.assertLess(a, b)
+        return set(pairs)
+
+    def test_spatial_hash_matches_nxn(self):
+        """The spatial hash reports exactly the all-pairs result for any cell size."""
+        lower, upper, gap, collision_group, shape_world, shape_flags, _ = self._spatial_hash_scene(3)
+        filter_pairs = wp.array(np.array([[1, 2], [20, 21], [30, 31]], dtype=np.int32), dtype=wp.vec2i)
+        expected = self._launch_pairs(
+            BroadPhaseAllPairs(shape_world, shape_flags=shape_flags),
+            lower,
+            upper,
+            gap,
+            collision_group,
+            shape_world,
+            filter_pairs=filter_pairs,
+        )
+        self.assertGreater(len(expected), 0)
+
+        for cell_size in (None, 0.01, 0.1, 0.5, 10.0):
+            with self.subTest(cell_size=cell_size):
+                found = self._launch_pairs(
+                    BroadPhaseSpatialHash(shape_world, shape_flags=shape_flags, cell_size=cell_size),
+                    lower,
+                    upper,
+                    gap,
+                    collision_group,
+                    shape_world,
+                    filter_pairs=filter_pairs,
+                )
+                self.assertEqual(found, expected)
+
+    def test_spatial_hash_swept_aabbs(self):
+        """Swept-AABB candidates match the all-pairs result."""
+        lower, upper, gap, collision_group, shape_world, _, displacement = self._spatial_hash_scene(5)
+        shape_displacement = wp.array(displacement, dtype=wp.vec3)
+        expected = self._launch_pairs(
+            BroadPhaseAllPairs(shape_world),
+            lower,
+            upper,
+            gap,
+            collision_group,
+            shape_world,
+            shape_displacement=shape_displacement,
+        )
+        found = self._launch_pairs(
+            BroadPhaseSpatialHash(shape_world, cell_size=0.15),
+            lower,
+            upper,
+            gap,
+            collision_group,
+            shape_world,
+            shape_displacement=shape_displacement,
+        )
+        self.assertEqual(found, expected)
+
+    def test_spatial_hash_reuse_across_launches(self):
+        """Rebuilding the grid every launch gives fresh results."""
+        lower, upper, gap, collision_group, shape_world, _, _ = self._spatial_hash_scene(9)
+        all_pairs = BroadPhaseAllPairs(shape_world)
+        spatial_hash = BroadPhaseSpatialHash(shape_world)
+        for offset in (0.0, 0.3, 7.0):
+            with self.subTest(offset=offset):
+                moved_lower = lower.copy()
+                moved_upper = upper.copy()
+                moved_lower[4:] += offset * np.sin(np.arange(len(lower) - 4))[:, None]
+                moved_upper[4:] += offset * np.sin(np.arange(len(lower) - 4))[:, None]
+                expected = self._launch_pairs(all_pairs, moved_lower, moved_upper, gap, collision_group, shape_world)
+                found = self._launch_pairs(spatial_hash, moved_lower, moved_upper, gap, collision_group, shape_world)
+                self.assertEqual(found, expected)
+
+    def test_spatial_hash_invalid_arguments(self):
+        shape_world = np.zeros(4, dtype=np.int32)
+        with self.assertRaises(ValueError):
+            BroadPhaseSpatialHash(shape_world, cell_size=0.0)
+        with self.assertRaises(ValueError):
+            BroadPhaseSpatialHash(shape_world, max_cells_per_axis=0)
+        with self.assertRaises(ValueError):
+            BroadPhaseSpatialHash(np.array([0, -2], dtype=np.int32))
+
+    def test_sleeping_pairs_are_skipped(self):
+        """Pairs between sleeping or static bodies are filtered; pairs with an awake body are kept."""
+        device = wp.get_device()
+        # Shape 0 is static, shapes 1-3 belong to bodies 0-2; all AABBs overlap.
+        shape_count = 4
+        shape_world = wp.zeros(shape_count, dtype=wp.int32, device=device)
+        shape_group = wp.ones(shape_count, dtype=wp.int32, device=device)
+        shape_body = wp.array([-1, 0, 1, 2], dtype=wp.int32, device=device)
+        body_sleeping = wp.array([1, 1, 0], dtype=wp.int32, device=device)
+        lower = wp.full(shape_count, wp.vec3(-1.0), dtype=wp.vec3, device=device)
+        upper = wp.full(shape_count, wp.vec3(1.0), dtype=wp.vec3, device=device)
+        all_pairs = [(i, j) for i in range(shape_count) for j in range(i + 1, shape_count)]
+        explicit_pairs = wp.array(all_pairs, dtype=wp.vec2i, device=device)
+        expected = {(0, 3), (1, 3), (2, 3)}
+
+        for broad_phase in (
+            BroadPhaseAllPairs(shape_world, device=device),
+            BroadPhaseSAP(shape_world, device=device),
+            BroadPhaseSpatialHash(shape_world, device=device),
+            BroadPhaseExplicit(),
+        ):
+            with self.subTest(broad_phase=type(broad_phase).__name__):
+                candidate_pair = wp.zeros(len(all_pairs), dtype=wp.vec2i, device=device)
+                candidate_pair_count = wp.zeros(1, dtype=wp.int32, device=device)
+                kwargs = {"shape_body": shape_body, "body_sleeping": body_sleeping}
+                if isinstance(broad_phase, BroadPhaseExplicit):
+                    broad_phase.launch(
+                        lower,
+                        upper,
+                        None,
+                        explicit_pairs,
+                        len(all_pairs),
+                        candidate_pair,
+                        candidate_pair_count,
+                        device,
+                        **kwargs,
+                    )
+                else:
+                    broad_phase.launch(
+                        lower,
+                        upper,
+                        None,
+                        shape_group,
+                        shape_world,
+                        shape_count,
+                        candidate_pair,
+                        candidate_pair_count,
+                        device,
+                        **kwargs,
+                    )
+                count = int(candidate_pair_count.numpy()[0])
+                found = {tuple(int(v) for v in pair) for pair in candidate_pair.numpy()[:count]}
+                self.assertEqual(found, expected)
+
     def test_per_shape_gap_broad_phase(self):
         """
         Test that all broad phase modes correctly handle per-shape contact gaps
@@ -1327,14 +1327,23 @@ def test_collision_filter_consistent_across_broadphases(test, device):
         pairs_explicit = _contact_pairs("explicit")
         pairs_nxn = _contact_pairs("nxn")
         pairs_sap = _contact_pairs("sap")
+        pairs_spatial_hash = _contact_pairs("spatial_hash")
 
         # The excluded pair must not appear in any broad phase result
-        for name, pairs in [("EXPLICIT", pairs_explicit), ("NXN", pairs_nxn), ("SAP", pairs_sap)]:
+        for name, pairs in [
+            ("EXPLICIT", pairs_explicit),
+            ("NXN", pairs_nxn),
+            ("SAP", pairs_sap),
+            ("SPATIAL_HASH", pairs_spatial_hash),
+        ]:
             test.assertNotIn(excluded, pairs, f"Excluded pair {excluded} must not appear in {name} contacts")
 
-        # All three broad phases must report the same set of contacting pairs
+        # All broad phases must report the same set of contacting pairs
         test.assertEqual(pairs_explicit, pairs_nxn, "EXPLICIT and NXN should produce the same contact pairs")
         test.assertEqual(pairs_explicit, pairs_sap, "EXPLICIT and SAP should produce the same contact pairs")
+        test.assertEqual(
+            pairs_explicit, pairs_spatial_hash, "EXPLICIT and SPATIAL_HASH should produce the same contact pairs"
+        )
 
         # With 3 shapes and 1 excluded pair, we expect exactly 2 contacting pairs
         test.assertEqual(
@@ -1481,7 +1490,7 @@ def test_rigid_contact_normal_sphere_sphere(test, device, broad_phase: str):
                 )
 
 
-for bp_name in ("explicit", "nxn", "sap"):
+for bp_name in ("explicit", "nxn", "sap", "spatial_hash"):
     add_function_test(
         TestRigidContactNormal,
         f"test_rigid_contact_normal_sphere_sphere_{bp_name}",
@@ -1616,7 +1625,7 @@ def test_box_box_quaternion_perturbation(test, device, broad_phase: str):
             )
 
 
-for bp_name in ("explicit", "nxn", "sap"):
+for bp_name in ("explicit", "nxn", "sap", "spatial_hash"):
     add_function_test(
         TestRigidContactNormal,
         f"test_box_box_quaternion_perturbation_{bp_name}",
@@ -1659,7 +1668,7 @@ def test_box_box_solver_drift_manifold(test, device, broad_phase: str):
         _assert_box_face_manifold(test, contacts, poses_and_sizes)
 
 
-for bp_name in ("explicit", "nxn", "sap"):
+for bp_name in ("explicit", "nxn", "sap", "spatial_hash"):
     add_function_test(
         TestRigidContactNormal,
         f"test_box_box_solver_drift_manifold_{bp_name}",
@@ -1703,7 +1712,7 @@ def test_unequal_box_box_solver_drift_manifold(test, device, broad_phase: str):
         _assert_box_face_manifold(test, contacts, poses_and_sizes)
 
 
-for bp_name in ("explicit", "nxn", "sap"):
+for bp_name in ("explicit", "nxn", "sap", "spatial_hash"):
     add_function_test(
         TestRigidContactNormal,
         f"test_unequal_box_box_solver_drift_manifold_{bp_name}",
@@ -2266,7 +2275,7 @@ class TestShapePairsMaxScaling(unittest.TestCase):
 
         model = builder.finalize()
 
-        for bp_mode in ("nxn", "sap"):
+        for bp_mode in ("nxn", "sap", "spatial_hash"):
             pipeline = newton.CollisionPipeline(model, broad_phase=bp_mode)
 
             global_n = model.shape_count
@@ -12,6 +12,7 @@ import warp.examples
 from newton import ModelBuilder
 from newton._src.sim.graph_coloring import (
     ColoringAlgorithm,
+    IncrementalGraphColoring,
     color_graph,
     construct_trimesh_graph_edges,
     convert_to_color_groups,
@@ -481,6 +482,68 @@ def test_coloring_rigid_body_no_joints(test, device):
         test.assertEqual(model.body_color_groups[0].size, 5, "All 5 bodies should be in same color group")
 
 
+def _triangle_edges(tri_indices):
+    tris = np.asarray(tri_indices, dtype=np.int32).reshape(-1, 3)
+    return np.concatenate([tris[:, [0, 1]], tris[:, [1, 2]], tris[:, [2, 0]]])
+
+
+def test_incremental_coloring_tear_and_attach(test, device):
+    """Incremental recoloring keeps the coloring valid and only touches the affected nodes."""
+    builder = ModelBuilder()
+    builder.add_cloth_grid(
+        pos=wp.vec3(0.0, 0.0, 0.0),
+        rot=wp.quat_identity(),
+        vel=wp.vec3(0.0, 0.0, 0.0),
+        dim_x=8,
+        dim_y=8,
+        cell_x=0.1,
+        cell_y=0.1,
+        mass=0.1,
+    )
+    builder.color()
+    model = builder.finalize(device=device)
+
+    tri_edges = _triangle_edges(builder.tri_indices)
+    coloring = IncrementalGraphColoring(
+        model.particle_count, tri_edges, [group.numpy() for group in model.particle_color_groups]
+    )
+    test.assertEqual(coloring.num_colors, len(model.particle_color_groups))
+
+    with test.assertRaisesRegex(ValueError, "not a valid coloring"):
+        IncrementalGraphColoring(model.particle_count, tri_edges, [np.arange(model.particle_count)])
+
+    # Tear: drop the first row of triangles. Shared edges stay while another triangle still uses them.
+    torn = builder.tri_indices[:16]
+    coloring.remove_edges(_triangle_edges(torn))
+    remaining_edges = _triangle_edges(builder.tri_indices[16:])
+    for u, v in remaining_edges:
+        test.assertIn(int(v), coloring.neighbors(int(u)))
+    test.assertEqual(coloring.update_model(model), [])
+
+    # Attach: connect particles of the first grid row three columns apart, which share colors in the initial coloring.
+    colors_before = coloring.colors
+    attach = np.array([[i, i + 3] for i in range(6)], dtype=np.int32)
+    recolored = coloring.add_edges(attach)
+    test.assertGreater(len(recolored), 0)
+
+    colors_after = coloring.colors
+    changed = np.flatnonzero(colors_before != colors_after)
+    assert_np_equal(np.sort(changed), np.unique(recolored))
+    all_edges = np.concatenate([remaining_edges, attach])
+    test.assertFalse(np.any(colors_after[all_edges[:, 0]] == colors_after[all_edges[:, 1]]))
+
+    groups_list = model.particle_color_groups
+    groups_before = list(groups_list)
+    written = coloring.update_model(model)
+    test.assertIs(model.particle_color_groups, groups_list)
+    test.assertEqual(len(groups_list), coloring.num_colors)
+    for color, group in enumerate(groups_list):
+        assert_np_equal(np.sort(group.numpy()), coloring.color_group(color))
+        if color not in written:
+            test.assertIs(group, groups_before[color])
+    assert_np_equal(model.particle_colors.numpy(), colors_after)
+
+
 devices = get_test_devices()
 
 
@@ -510,6 +573,12 @@ add_function_test(
 add_function_test(
     TestColoring, "test_coloring_rigid_body_no_joints", test_coloring_rigid_body_no_joints, devices=devices
 )
+add_function_test(
+    TestColoring,
+    "test_incremental_coloring_tear_and_attach",
+    test_incremental_coloring_tear_and_attach,
+    devices=devices,
+)
 
 if __name__ == "__main__":
     unittest.main(verbosity=2, failfast=True)
@@ -0,0 +1,133 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for streaming rigid contacts to the host."""
+
+import unittest
+
+import numpy as np
+import warp as wp
+
+import newton
+from newton.tests.unittest_utils import add_function_test, get_test_devices
+
+
+class TestContactStream(unittest.TestCase):
+    pass
+
+
+def _build_multi_world_scene(device, world_count=3):
+    """Build sphere-plane contacts in several worlds sharing one global ground."""
+    world = newton.ModelBuilder()
+    body = world.add_body(xform=wp.transform(wp.vec3(0.0, 0.0, 0.09)))
+    world.add_shape_sphere(body=body, radius=0.1)
+    builder = newton.ModelBuilder()
+    builder.add_ground_plane()
+    for i in range(world_count):
+        builder.add_world(world, xform=wp.transform(wp.vec3(float(i), 0.0, 0.0)))
+    builder.request_contact_attributes("force")
+    model = builder.finalize(device=device)
+    state = model.state()
+    pipeline = newton.CollisionPipeline(model, broad_phase="nxn")
+    return model, state, pipeline, pipeline.contacts()
+
+
+def test_stream_matches_device_contacts(test, device):
+    """Each batch holds the active contacts grouped by world with world-space points."""
+    model, state, pipeline, contacts = _build_multi_world_scene(device)
+    stream = newton.ContactStream(model, contacts)
+
+    pipeline.collide(state, contacts)
+    stream.push(state)
+    batches = list(stream.batches(block=True))
+    test.assertEqual(len(batches), 1)
+    batch = batches[0]
+
+    count = int(contacts.rigid_contact_count.numpy()[0])
+    test.assertGreater(count, 0)
+    test.assertEqual(batch.count, count)
+    test.assertEqual(batch.step, 0)
+    test.assertEqual(batch.world_start.shape, (model.world_count + 2,))
+    test.assertEqual(int(batch.world_start[-1]), count)
+
+    shape_world = model.shape_world.numpy()
+    for w in range(model.world_count):
+        pairs = batch.shape_pairs[batch.world(w)]
+        test.assertGreater(len(pairs), 0)
+        test.assertTrue(np.all(np.maximum(shape_world[pairs[:, 0]], shape_world[pairs[:, 1]]) == w))
+    test.assertEqual(len(batch.shape_pairs[batch.world(-1)]), 0)
+
+    expected_pairs = np.stack(
+        [contacts.rigid_contact_shape0.numpy()[:count], contacts.rigid_contact_shape1.numpy()[:count]], axis=1
+    )
+    test.assertEqual(sorted(map(tuple, batch.shape_pairs)), sorted(map(tuple, expected_pairs)))
+
+    # ground contact points lie on the plane, sphere points on the sphere surface
+    np.testing.assert_allclose(batch.point0[:, 2], 0.0, atol=1.0e-4)
+    np.testing.assert_allclose(batch.point1[:, 2], -0.01, atol=1.0e-4)
+    np.testing.assert_allclose(np.abs(batch.normal[:, 2]), 1.0, atol=1.0e-5)
+    test.assertEqual(batch.force.shape, (count, 6))
+
+
+def test_stream_yields_steps_in_order(test, device):
+    """Steps come out in push order, including those that overflowed the ring."""
+    model, state, pipeline, contacts = _build_multi_world_scene(device, world_count=2)
+    stream = newton.ContactStream(model, contacts, ring_size=2)
+
+    pipeline.collide(state, contacts)
+    for step in (10, 11, 12, 13, 14):
+        stream.push(state, step=step)
+    test.assertEqual(stream.pending_count, 5)
+
+    batches = list(stream.batches(block=True))
+    test.assertEqual([batch.step for batch in batches], [10, 11, 12, 13, 14])
+    test.assertEqual(stream.pending_count, 0)
+    for batch in batches[1:]:
+        np.testing.assert_array_equal(batch.shape_pairs, batches[0].shape_pairs)
+        np.testing.assert_allclose(batch.point0, batches[0].point0)
+
+    stream.push(state)
+    test.assertEqual([batch.step for batch in stream.batches(block=True)], [15])
+
+
+def test_stream_without_force_attribute(test, device):
+    """Force is omitted from batches when the extended attribute is not allocated."""
+    builder = newton.ModelBuilder()
+    builder.add_ground_plane()
+    body = builder.add_body(xform=wp.transform(wp.vec3(0.0, 0.0, 0.09)))
+    builder.add_shape_sphere(body=body, radius=0.1)
+    model = builder.finalize(device=device)
+    state = model.state()
+    pipeline = newton.CollisionPipeline(model, broad_phase="nxn")
+    contacts = pipeline.contacts()
+    stream = newton.ContactStream(model, contacts)
+
+    pipeline.collide(state, contacts)
+    stream.push(state)
+    (batch,) = stream.batches(block=True)
+    test.assertIsNone(batch.force)
+    test.assertEqual(batch.count, int(contacts.rigid_contact_count.numpy()[0]))
+
+
+def test_stream_rejects_empty_ring(test, device):
+    model, _state, _pipeline, contacts = _build_multi_world_scene(device, world_count=1)
+    with test.assertRaises(ValueError):
+        newton.ContactStream(model, contacts, ring_size=0)
+
+
+devices = get_test_devices()
+add_function_test(
+    TestContactStream, "test_stream_matches_device_contacts", test_stream_matches_device_contacts, devices=devices
+)
+add_function_test(
+    TestContactStream, "test_stream_yields_steps_in_order", test_stream_yields_steps_in_order, devices=devices
+)
+add_function_test(
+    TestContactStream, "test_stream_without_force_attribute", test_stream_without_force_attribute, devices=devices
+)
+add_function_test(TestContactStream, "test_stream_rejects_empty_ring", test_stream_rejects_empty_ring, devices=devices)
+
+
+if __name__ == "__main__":
+    wp.clear_kernel_cache()
+    unittest.main(verbosity=2)
@@ -19,6 +19,7 @@ from newton._src.solvers.mujoco.equality import _add_equality_constraint
 from newton._src.solvers.mujoco.kernels import eval_mujoco_coupling_gravity_acceleration_kernel
 from newton.solvers import (
     SolverBase,
+    SolverFeatherstone,
     SolverImplicitMPM,
     SolverMuJoCo,
     SolverSemiImplicit,
@@ -1928,6 +1929,80 @@ class TestSolverCoupledBasic(unittest.TestCase):
         np.testing.assert_allclose(solver.dt_values, [0.1, 0.1, 0.1])
         np.testing.assert_allclose(state.particle_qd.numpy()[0], np.array([0.0, 6.0, 0.0]))
 
+    def test_entry_interval_steps_once_per_window_and_interpolates(self):
+        """Multirate entries step once per window and report interpolated owned state in between."""
+        _StepCountingCopySolver.instances.clear()
+        builder = newton.ModelBuilder(gravity=(0.0, 0.0, 0.0))
+        builder.add_particle(pos=(0.0, 0.0, 0.0), vel=(1.0, 0.0, 0.0), mass=1.0, radius=0.0)
+        builder.add_particle(pos=(0.0, 1.0, 0.0), vel=(0.0, 0.0, 0.0), mass=1.0, radius=0.0)
+        model = builder.finalize(device="cpu")
+
+        for kwargs, message in (
+            ({"interval": 0}, "interval must be an integer >= 1"),
+            ({"interval": 2, "in_place": True}, "cannot combine in_place=True with interval > 1"),
+        ):
+            with self.assertRaisesRegex(ValueError, message):
+                SolverCoupled(
+                    model=model,
+                    entries=[SolverCoupled.Entry(name="slow", solver=SolverSemiImplicit, particles=[0], **kwargs)],
+                )
+
+        coupled = SolverCoupled(
+            model=model,
+            entries=[
+                SolverCoupled.Entry(name="slow", solver=SolverSemiImplicit, particles=[0], interval=3),
+                SolverCoupled.Entry(name="counter", solver=_StepCountingCopySolver, particles=[1], interval=2),
+            ],
+        )
+
+        state_0 = model.state()
+        state_1 = model.state()
+        dt = 0.1
+        positions = []
+        for _ in range(4):
+            coupled.step(state_0, state_1, control=None, contacts=None, dt=dt)
+            state_0, state_1 = state_1, state_0
+            positions.append(state_0.particle_q.numpy()[0, 0])
+
+        # Constant-velocity motion makes the interpolated in-window states exact.
+        np.testing.assert_allclose(positions, [0.1, 0.2, 0.3, 0.4], atol=1.0e-6)
+        counter = _StepCountingCopySolver.instances["counter"]
+        self.assertEqual(counter.step_count, 2)
+        np.testing.assert_allclose(counter.dt_values, [0.2, 0.2])
+
+    def test_entry_interval_interpolates_free_joint_rotation(self):
+        """Interpolated in-window joint coordinates keep free-joint quaternions on the unit sphere."""
+        builder = newton.ModelBuilder(gravity=(0.0, 0.0, 0.0))
+        body = builder.add_body(mass=1.0)
+        builder.add_shape_sphere(body, radius=0.1)
+        model = builder.finalize(device="cpu")
+
+        interval = 4
+        coupled = SolverCoupled(
+            model=model,
+            entries=[
+                SolverCoupled.Entry(name="slow", solver=SolverFeatherstone, bodies=[0], joints=[0], interval=interval)
+            ],
+        )
+        state_0 = model.state()
+        state_1 = model.state()
+        # spin about z so that one window rotates the body by a large angle
+        state_0.joint_qd.assign(np.array([0.0, 0.0, 0.0, 0.0, 0.0, 5.0], dtype=np.float32))
+
+        rotations = []
+        for _ in range(interval):
+            coupled.step(state_0, state_1, control=None, contacts=None, dt=0.1)
+            state_0, state_1 = state_1, state_0
+            rotations.append(state_0.joint_q.numpy()[3:7].copy())
+
+        # the window starts at the identity, so in-window rotations lie on the z-axis slerp path to its end
+        end_angle = 2.0 * np.arctan2(rotations[-1][2], rotations[-1][3])
+        self.assertGreater(end_angle, 1.0)
+        for step, rot in enumerate(rotations):
+            self.assertAlmostEqual(float(np.linalg.norm(rot)), 1.0, places=5)
+            half_angle = 0.5 * end_angle * (step + 1) / interval
+            np.testing.assert_allclose(rot, [0.0, 0.0, np.sin(half_angle), np.cos(half_angle)], atol=1.0e-5)
+
     def test_particle_views_deactivate_non_owned_particles(self):
         """Each particle owner view should expose only its owned particles as active."""
         builder = newton.ModelBuilder()
@@ -2838,6 +2913,54 @@ class TestSolverCoupledBodyProxyInertia(unittest.TestCase):
         expected = 0.25 * np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
         np.testing.assert_allclose(src_solver.input_body_f[1][0], expected, atol=1.0e-6)
 
+    def test_multirate_body_proxy_source_receives_window_averaged_feedback(self):
+        _BodyForceRecordingSolver.instances.clear()
+        _ProxyBodyHookSolver.instances.clear()
+
+        builder = newton.ModelBuilder(gravity=(0.0, 0.0, 0.0))
+        builder.add_body(mass=1.0, inertia=wp.mat33(np.eye(3)))
+        builder.add_body(mass=1.0, inertia=wp.mat33(np.eye(3)))
+        builder.add_body(mass=1.0, inertia=wp.mat33(np.eye(3)))
+        model = builder.finalize(device="cpu")
+
+        coupled = SolverCoupledProxy(
+            model=model,
+            entries=[
+                SolverCoupled.Entry(name="src", solver=_BodyForceRecordingSolver, bodies=[0], interval=2),
+                SolverCoupled.Entry(name="dst", solver=_ProxyBodyHookSolver, bodies=[1]),
+            ],
+            coupling=SolverCoupledProxy.Config(
+                proxies=[
+                    SolverCoupledProxy.Proxy(
+                        source="src",
+                        destination="dst",
+                        bodies=[0],
+                        proxy_bodies=[2],
+                    ),
+                ],
+            ),
+        )
+
+        state_0 = model.state()
+        state_1 = model.state()
+        for _ in range(3):
+            coupled.step(state_0, state_1, control=None, contacts=None, dt=0.5)
+            state_0, state_1 = state_1, state_0
+
+        src_solver = _BodyForceRecordingSolver.instances[-1]
+        dst_solver = _ProxyBodyHookSolver.instances[-1]
+        self.assertEqual(len(src_solver.input_body_f), 2)
+        self.assertEqual(dst_solver.harvest_calls, 3)
+        mapping = coupled._proxy_mappings[0]
+        self.assertEqual(mapping.window_count, 1)
+
+        expected = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        np.testing.assert_allclose(src_solver.input_body_f[1][0], expected, atol=1.0e-6)
+
+        coupled.reset(state_0)
+        self.assertEqual(mapping.window_count, 0)
+        np.testing.assert_array_equal(mapping.window_forces.numpy(), np.zeros_like(mapping.window_forces.numpy()))
+
 
 class TestSolverCoupledParticleProxy(unittest.TestCase):
     """Particle proxy mappings keep proxy particles dynamic in the destination view."""
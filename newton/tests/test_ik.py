@@ -712,7 +712,220 @@ def test_d6_jacobian_compare(test, device):
 
 
 # ----------------------------------------------------------------------------
-# 3.  Test-class registration per device
+# 3.  Early termination and seed pruning
+# ----------------------------------------------------------------------------
+
+
+def _planar_targets_objective(n_problems):
+    targets = wp.array([[1.5, 1.0, 0.0], [1.0, 1.5, 0.0], [1.2, 1.2, 0.0]][:n_problems], dtype=wp.vec3)
+    return targets, ik.IKObjectivePosition(link_index=1, link_offset=wp.vec3(0.5, 0.0, 0.0), target_positions=targets)
+
+
+def test_early_termination_tolerance(test, device, optimizer: ik.IKOptimizer):
+    with wp.ScopedDevice(device):
+        n_problems = 3
+        model = _build_two_link_planar(device)
+        targets, pos_obj = _planar_targets_objective(n_problems)
+        solver = ik.IKSolver(
+            model, n_problems, [pos_obj], optimizer=optimizer, jacobian_mode=ik.IKJacobianType.ANALYTIC
+        )
+
+        joint_q = wp.zeros((n_problems, model.joint_coord_count), dtype=wp.float32)
+        solver.step(joint_q, joint_q, iterations=200, tolerance=1.0e-8, check_interval=5)
+
+        test.assertLess(solver.iterations_run, 200)
+        test.assertEqual(solver.iterations_run % 5, 0)
+        assert_np_equal(solver.problem_converged.numpy(), np.ones(n_problems, dtype=np.int32))
+        assert_np_equal(solver.seed_active.numpy(), np.zeros(n_problems, dtype=np.int32))
+
+        body_q = wp.zeros((n_problems, model.body_count), dtype=wp.transform)
+        joint_qd = wp.zeros((n_problems, model.joint_dof_count), dtype=wp.float32)
+        body_qd = wp.zeros((n_problems, model.body_count), dtype=wp.spatial_vector)
+        eval_fk_batched(model, joint_q, joint_qd, body_q, body_qd)
+        final = _fk_end_effector_positions(model, body_q, n_problems, 1, wp.vec3(0.5, 0.0, 0.0))
+        np.testing.assert_allclose(final, targets.numpy(), atol=1.0e-3)
+
+
+def test_seed_pruning(test, device, optimizer: ik.IKOptimizer):
+    with wp.ScopedDevice(device):
+        n_problems = 2
+        n_seeds = 8
+        model = _build_two_link_planar(device)
+        _targets, pos_obj = _planar_targets_objective(n_problems)
+        solver = ik.IKSolver(
+            model,
+            n_problems,
+            [pos_obj],
+            optimizer=optimizer,
+            jacobian_mode=ik.IKJacobianType.ANALYTIC,
+            sampler=ik.IKSampler.ROBERTS,
+            n_seeds=n_seeds,
+        )
+
+        joint_q = wp.zeros((n_problems, model.joint_coord_count), dtype=wp.float32)
+        solver.step(joint_q, joint_q, iterations=40, prune_interval=5)
+
+        # pruning after 5, 10, and 15 iterations leaves 8 -> 4 -> 2 -> 1 seeds
+        test.assertEqual(solver.iterations_run, 40)
+        active = solver.seed_active.numpy().reshape(n_problems, n_seeds)
+        assert_np_equal(active.sum(axis=1), np.ones(n_problems, dtype=np.int32))
+
+        # the surviving seed is the one selected as the solution
+        costs = solver.costs.numpy().reshape(n_problems, n_seeds)
+        assert_np_equal(np.argmax(active, axis=1), np.argmin(costs, axis=1))
+        test.assertTrue(np.all(costs.min(axis=1) < 1.0e-6))
+
+
+def test_frozen_rows_skip_kernels(test, device, optimizer: ik.IKOptimizer, mode: ik.IKJacobianType):
+    with wp.ScopedDevice(device):
+        n_problems = 3
+        model = _build_two_link_planar(device)
+        targets, pos_obj = _planar_targets_objective(n_problems)
+        solver = ik.IKSolver(model, n_problems, [pos_obj], optimizer=optimizer, jacobian_mode=mode)
+        impl = solver._impl
+
+        joint_q = wp.zeros((n_problems, model.joint_coord_count), dtype=wp.float32)
+        costs_before = impl.compute_costs(joint_q).numpy().copy()
+
+        # poison the frozen row's FK output: any kernel touching it would overwrite the sentinel
+        body_q_np = impl.body_q.numpy().copy()
+        body_q_np[1] = [7.0, 7.0, 7.0, 0.0, 0.0, 0.0, 1.0]
+        impl.body_q.assign(body_q_np)
+
+        active = wp.array([1, 0, 1], dtype=wp.int32)
+        impl.step(joint_q, joint_q, iterations=60, active=active)
+
+        assert_np_equal(impl.body_q.numpy()[1], body_q_np[1])
+        assert_np_equal(joint_q.numpy()[1], np.zeros(model.joint_coord_count, dtype=np.float32))
+        test.assertEqual(float(impl.costs.numpy()[1]), float(costs_before[1]))
+
+        body_q = wp.zeros((n_problems, model.body_count), dtype=wp.transform)
+        joint_qd = wp.zeros((n_problems, model.joint_dof_count), dtype=wp.float32)
+        body_qd = wp.zeros((n_problems, model.body_count), dtype=wp.spatial_vector)
+        eval_fk_batched(model, joint_q, joint_qd, body_q, body_qd)
+        final = _fk_end_effector_positions(model, body_q, n_problems, 1, wp.vec3(0.5, 0.0, 0.0))
+        np.testing.assert_allclose(final[[0, 2]], targets.numpy()[[0, 2]], atol=1.0e-3)
+
+
+def test_early_termination_validation(test, device):
+    with wp.ScopedDevice(device):
+        model = _build_two_link_planar(device)
+        _targets, pos_obj = _planar_targets_objective(1)
+        solver = ik.IKSolver(model, 1, [pos_obj], jacobian_mode=ik.IKJacobianType.ANALYTIC)
+        joint_q = wp.zeros((1, model.joint_coord_count), dtype=wp.float32)
+        with test.assertRaises(ValueError):
+            solver.step(joint_q, joint_q, tolerance=1.0e-6, check_interval=0)
+        with test.assertRaises(ValueError):
+            solver.step(joint_q, joint_q, prune_interval=0)
+
+
+def test_trajectory_warm_start(test, device, optimizer: ik.IKOptimizer):
+    with wp.ScopedDevice(device):
+        n_problems = 2
+        n_frames = 12
+        model = _build_two_link_planar(device)
+
+        # targets sweep along arcs of radius 1.6 and 1.8 around the base
+        angles = np.linspace(0.3, 0.9, n_frames)
+        traj = np.zeros((n_frames, n_problems, 3), dtype=np.float32)
+        for prob, radius in enumerate((1.6, 1.8)):
+            traj[:, prob, 0] = radius * np.cos(angles)
+            traj[:, prob, 1] = radius * np.sin(angles)
+        targets = wp.array(traj, dtype=wp.vec3)
+
+        pos_obj = ik.IKObjectivePosition(
+            link_index=1, link_offset=wp.vec3(0.5, 0.0, 0.0), target_positions=wp.zeros(n_problems, dtype=wp.vec3)
+        )
+        solver = ik.IKSolver(
+            model, n_problems, [pos_obj], optimizer=optimizer, jacobian_mode=ik.IKJacobianType.ANALYTIC
+        )
+
+        joint_q_in = wp.zeros((n_problems, model.joint_coord_count), dtype=wp.float32)
+        joint_q_out = wp.zeros((n_frames, n_problems, model.joint_coord_count), dtype=wp.float32)
+        solver.solve_trajectory(joint_q_in, joint_q_out, {pos_obj: targets}, iterations=15, initial_iterations=60)
+        test.assertEqual(solver.iterations_run, 60 + (n_frames - 1) * 15)
+
+        # the objective holds the last frame's targets afterwards
+        np.testing.assert_allclose(pos_obj.target_positions.numpy(), traj[-1])
+
+        q_np = joint_q_out.numpy()
+        joint_q = wp.zeros((n_problems, model.joint_coord_count), dtype=wp.float32)
+        joint_qd = wp.zeros((n_problems, model.joint_dof_count), dtype=wp.float32)
+        body_q = wp.zeros((n_problems, model.body_count), dtype=wp.transform)
+        body_qd = wp.zeros((n_problems, model.body_count), dtype=wp.spatial_vector)
+        for frame in range(n_frames):
+            joint_q.assign(q_np[frame])
+            eval_fk_batched(model, joint_q, joint_qd, body_q, body_qd)
+            ee = _fk_end_effector_positions(model, body_q, n_problems, 1, wp.vec3(0.5, 0.0, 0.0))
+            np.testing.assert_allclose(ee, traj[frame], atol=1.0e-3, err_msg=f"frame {frame}")
+
+        # warm-started frames stay on the same solution branch
+        test.assertLess(np.abs(np.diff(q_np, axis=0)).max(), 0.5)
+
+
+def test_trajectory_target_jump_lbfgs(test, device):
+    with wp.ScopedDevice(device):
+        # frame 0 stops short of convergence, then every target jumps to a distant point
+        traj = np.array(
+            [
+                [[-1.3688, -0.3361, 0.0], [0.6802, -0.5350, 0.0], [-0.2023, 0.9627, 0.0]],
+                [[-1.2612, 0.6709, 0.0], [-0.8087, 0.3403, 0.0], [1.5704, -0.6979, 0.0]],
+            ],
+            dtype=np.float32,
+        )
+        n_problems = traj.shape[1]
+        model = _build_two_link_planar(device)
+
+        pos_obj = ik.IKObjectivePosition(
+            link_index=1, link_offset=wp.vec3(0.5, 0.0, 0.0), target_positions=wp.zeros(n_problems, dtype=wp.vec3)
+        )
+        solver = ik.IKSolver(
+            model, n_problems, [pos_obj], optimizer=ik.IKOptimizer.LBFGS, jacobian_mode=ik.IKJacobianType.ANALYTIC
+        )
+        joint_q_in = wp.zeros((n_problems, model.joint_coord_count), dtype=wp.float32)
+        joint_q_out = wp.zeros((2, n_problems, model.joint_coord_count), dtype=wp.float32)
+        solver.solve_trajectory(
+            joint_q_in, joint_q_out, {pos_obj: wp.array(traj, dtype=wp.vec3)}, iterations=20, initial_iterations=20
+        )
+
+        # cold start on the jump frame from the same frame-0 solution
+        cold_obj = ik.IKObjectivePosition(
+            link_index=1, link_offset=wp.vec3(0.5, 0.0, 0.0), target_positions=wp.array(traj[1], dtype=wp.vec3)
+        )
+        cold_solver = ik.IKSolver(
+            model, n_problems, [cold_obj], optimizer=ik.IKOptimizer.LBFGS, jacobian_mode=ik.IKJacobianType.ANALYTIC
+        )
+        joint_q_cold = wp.array(joint_q_out.numpy()[0], dtype=wp.float32)
+        cold_solver.step(joint_q_cold, joint_q_cold, iterations=20)
+
+        joint_qd = wp.zeros((n_problems, model.joint_dof_count), dtype=wp.float32)
+        body_q = wp.zeros((n_problems, model.body_count), dtype=wp.transform)
+        body_qd = wp.zeros((n_problems, model.body_count), dtype=wp.spatial_vector)
+        for joint_q in (joint_q_cold, wp.array(joint_q_out.numpy()[1], dtype=wp.float32)):
+            eval_fk_batched(model, joint_q, joint_qd, body_q, body_qd)
+            ee = _fk_end_effector_positions(model, body_q, n_problems, 1, wp.vec3(0.5, 0.0, 0.0))
+            np.testing.assert_allclose(ee, traj[1], atol=1.0e-3)
+
+
+def test_trajectory_validation(test, device):
+    with wp.ScopedDevice(device):
+        model = _build_two_link_planar(device)
+        _targets, pos_obj = _planar_targets_objective(2)
+        limit_obj = ik.IKObjectiveJointLimit(
+            joint_limit_lower=model.joint_limit_lower,
+            joint_limit_upper=model.joint_limit_upper,
+        )
+        solver = ik.IKSolver(model, 2, [pos_obj, limit_obj], jacobian_mode=ik.IKJacobianType.ANALYTIC)
+        joint_q_in = wp.zeros((2, model.joint_coord_count), dtype=wp.float32)
+        joint_q_out = wp.zeros((3, 2, model.joint_coord_count), dtype=wp.float32)
+        with test.assertRaises(ValueError):
+            solver.solve_trajectory(joint_q_in, joint_q_out, {pos_obj: wp.zeros((4, 2), dtype=wp.vec3)})
+        with test.assertRaises(NotImplementedError):
+            solver.solve_trajectory(joint_q_in, joint_q_out, {limit_obj: wp.zeros((3, 2), dtype=wp.vec3)})
+
+
+# ----------------------------------------------------------------------------
+# 4.  Test-class registration per device
 # ----------------------------------------------------------------------------
 
 devices = get_test_devices()
@@ -762,6 +975,41 @@ add_function_test(TestIKModes, "test_rotation_jacobian_compare", test_rotation_j
 add_function_test(TestIKModes, "test_joint_limit_jacobian_compare", test_joint_limit_jacobian_compare, devices)
 add_function_test(TestIKModes, "test_d6_jacobian_compare", test_d6_jacobian_compare, cuda_devices)
 
+# Early termination and seed pruning
+for optimizer in ik.IKOptimizer:
+    add_function_test(
+        TestIKModes,
+        f"test_early_termination_tolerance_{optimizer.value}",
+        test_early_termination_tolerance,
+        devices,
+        optimizer=optimizer,
+    )
+    add_function_test(
+        TestIKModes, f"test_seed_pruning_{optimizer.value}", test_seed_pruning, devices, optimizer=optimizer
+    )
+    for mode in (ik.IKJacobianType.AUTODIFF, ik.IKJacobianType.ANALYTIC):
+        add_function_test(
+            TestIKModes,
+            f"test_frozen_rows_skip_kernels_{optimizer.value}_{mode.value}",
+            test_frozen_rows_skip_kernels,
+            devices,
+            optimizer=optimizer,
+            mode=mode,
+        )
+add_function_test(TestIKModes, "test_early_termination_validation", test_early_termination_validation, devices)
+
+# Trajectory mode
+for optimizer in ik.IKOptimizer:
+    add_function_test(
+        TestIKModes,
+        f"test_trajectory_warm_start_{optimizer.value}",
+        test_trajectory_warm_start,
+        devices,
+        optimizer=optimizer,
+    )
+add_function_test(TestIKModes, "test_trajectory_target_jump_lbfgs", test_trajectory_target_jump_lbfgs, devices)
+add_function_test(TestIKModes, "test_trajectory_validation", test_trajectory_validation, devices)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2, failfast=True)
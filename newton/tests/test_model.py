@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import ast
+import copy
 import hashlib
 import inspect
 import math
@@ -22,6 +23,7 @@ import newton.utils
 from newton import ModelBuilder
 from newton._src.geometry.utils import transform_points
 from newton._src.solvers.mujoco.equality import _add_equality_constraint
+from newton._src.utils import mesh as mesh_utils
 from newton._src.viewer.viewer_file import depointer_as_key, pointer_as_key, transfer_to_model
 from newton.tests.unittest_utils import assert_np_equal, patch_sys_module
 
@@ -868,6 +870,42 @@ class TestModelMesh(unittest.TestCase):
         tris[0, 0] = 99
         self.assertEqual(int(adj.indices[0, 0]), 0)
 
+    def test_mesh_adjacency_edge_tables_cached_by_content(self):
+        newton.utils.MeshAdjacency.clear_cache()
+        tris = [[0, 1, 2], [0, 2, 3]]
+        first = newton.utils.MeshAdjacency(tris)
+        self.assertEqual(len(mesh_utils._edge_adjacency_cache), 1)
+        # Equal content (even as a differently typed input) reuses the cached tables, and callers
+        # get their own copies so mutating one adjacency never leaks into another.
+        first.edge_indices[0, 0] = 99
+        second = newton.utils.MeshAdjacency(np.array(tris, dtype=np.int64))
+        self.assertEqual(len(mesh_utils._edge_adjacency_cache), 1)
+        np.testing.assert_array_equal(second.edge_indices[0], [2, -1, 0, 1])
+
+        # Replicated cloth meshes derive their bending edges from offset-free triangles, so every
+        # copy after the first is a cache hit, and each copy's edges are shifted to its own particles.
+        newton.utils.MeshAdjacency.clear_cache()
+        builder = ModelBuilder()
+        for offset in range(3):
+            builder.add_cloth_mesh(
+                pos=wp.vec3(2.0 * offset, 0.0, 0.0),
+                rot=wp.quat_identity(),
+                scale=1.0,
+                vel=wp.vec3(0.0, 0.0, 0.0),
+                vertices=[
+                    wp.vec3(0.0, 0.0, 0.0),
+                    wp.vec3(1.0, 0.0, 0.0),
+                    wp.vec3(1.0, 1.0, 0.0),
+                    wp.vec3(0.0, 1.0, 0.0),
+                ],
+                indices=[0, 1, 2, 0, 2, 3],
+                density=1.0,
+            )
+        self.assertEqual(len(mesh_utils._edge_adjacency_cache), 1)
+        edges = np.array(builder.edge_indices, dtype=np.int32).reshape(3, 5, 4)
+        np.testing.assert_array_equal(edges[1], np.where(edges[0] >= 0, edges[0] + 4, -1))
+        np.testing.assert_array_equal(edges[2], np.where(edges[0] >= 0, edges[0] + 8, -1))
+
     def test_expand_edge_parameter(self):
         expand = newton.ModelBuilder._expand_edge_parameter
         # Scalars broadcast to one value per generated edge.
@@ -4185,6 +4223,114 @@ class TestModelValidation(unittest.TestCase):
             self.fail(f"control.clear() raised {type(e).__name__}: {e}")
 
 
+class TestModelBuilderColumnar(unittest.TestCase):
+    @staticmethod
+    def _build_scene(columnar: bool) -> ModelBuilder:
+        template = ModelBuilder(columnar=columnar)
+        body = template.add_body(xform=wp.transform((0.0, 0.0, 1.0), wp.quat_identity()), mass=1.0)
+        template.add_shape_box(body=body, hx=0.1, hy=0.2, hz=0.3)
+        template.add_shape_sphere(body=-1, xform=wp.transform((1.0, 0.0, 0.0), wp.quat_identity()), radius=0.5)
+        template.add_particle_grid(
+            pos=wp.vec3(0.0, 0.0, 2.0),
+            rot=wp.quat_identity(),
+            vel=wp.vec3(0.0, 0.0, -1.0),
+            dim_x=3,
+            dim_y=2,
+            dim_z=2,
+            cell_x=0.1,
+            cell_y=0.1,
+            cell_z=0.1,
+            mass=0.5,
+            jitter=0.01,
+            radius_mean=0.05,
+            radius_std=0.01,
+        )
+        template.add_particle((0.0, 1.0, 0.0), (0.0, 0.0, 0.0), 0.0, flags=0)
+
+        builder = ModelBuilder(columnar=columnar)
+        builder.add_ground_plane()
+        builder.replicate(template, 3, spacing=(2.0, 0.0, 0.0))
+        return builder
+
+    def test_columnar_builder_matches_list_builder(self):
+        list_model = self._build_scene(columnar=False).finalize(device="cpu")
+        columnar_builder = self._build_scene(columnar=True)
+        self.assertIsNot(type(columnar_builder.particle_q), list)
+        columnar_model = columnar_builder.finalize(device="cpu")
+
+        for name in (
+            "particle_q",
+            "particle_qd",
+            "particle_mass",
+            "particle_inv_mass",
+            "particle_radius",
+            "particle_flags",
+            "particle_world",
+            "shape_transform",
+            "shape_body",
+            "shape_scale",
+            "shape_margin",
+            "shape_gap",
+            "shape_collision_radius",
+            "shape_world",
+            "body_q",
+            "body_mass",
+        ):
+            with self.subTest(attribute=name):
+                np.testing.assert_allclose(
+                    getattr(columnar_model, name).numpy(), getattr(list_model, name).numpy(), rtol=0.0, atol=1e-6
+                )
+
+    def test_columnar_attributes_behave_like_lists(self):
+        builder = ModelBuilder(columnar=True)
+        builder.add_particle((1.0, 2.0, 3.0), (0.0, 0.0, 0.0), 2.0, radius=0.25)
+        builder.add_particles_batch(np.zeros((2, 3)), mass=[1.0, 0.0])
+
+        self.assertEqual(len(builder.particle_q), 3)
+        self.assertIsInstance(builder.particle_q[0], wp.vec3)
+        self.assertEqual(tuple(builder.particle_q[0]), (1.0, 2.0, 3.0))
+        self.assertEqual(builder.particle_mass, [2.0, 1.0, 0.0])
+        self.assertEqual(builder.particle_mass[-1], 0.0)
+        np.testing.assert_allclose(builder.particle_radius[1:], [builder.default_particle_radius] * 2, rtol=1e-7)
+
+        builder.particle_q[1] = (4.0, 5.0, 6.0)
+        builder.particle_mass[0] += 1.0
+        self.assertEqual(tuple(builder.particle_q[1]), (4.0, 5.0, 6.0))
+        self.assertEqual(builder.particle_mass[0], 3.0)
+        assert_np_equal(np.asarray(builder.particle_q)[1], np.array([4.0, 5.0, 6.0]))
+
+        copied = copy.deepcopy(builder)
+        copied.add_particle((0.0, 0.0, 0.0), (0.0, 0.0, 0.0), 1.0)
+        self.assertEqual(builder.particle_count, 3)
+        self.assertEqual(copied.particle_count, 4)
+
+    def test_add_particles_batch(self):
+        for columnar in (False, True):
+            with self.subTest(columnar=columnar):
+                builder = ModelBuilder(columnar=columnar)
+                builder.begin_world()
+                indices = builder.add_particles_batch(
+                    pos=np.arange(12, dtype=np.float32).reshape(4, 3),
+                    vel=(0.0, 0.0, 1.0),
+                    mass=np.array([1.0, 2.0, 0.0, 4.0]),
+                    radius=0.2,
+                    flags=np.array([1, 1, 0, 1]),
+                )
+                builder.end_world()
+
+                self.assertEqual(indices, range(0, 4))
+                model = builder.finalize(device="cpu")
+                assert_np_equal(model.particle_q.numpy(), np.arange(12, dtype=np.float32).reshape(4, 3))
+                assert_np_equal(model.particle_qd.numpy(), np.tile([0.0, 0.0, 1.0], (4, 1)))
+                assert_np_equal(model.particle_inv_mass.numpy(), np.array([1.0, 0.5, 0.0, 0.25]))
+                assert_np_equal(model.particle_radius.numpy(), np.full(4, 0.2), tol=1e-7)
+                assert_np_equal(model.particle_flags.numpy(), np.array([1, 1, 0, 1]))
+                assert_np_equal(model.particle_world.numpy(), np.zeros(4))
+
+                with self.assertRaisesRegex(ValueError, r"mass shape mismatch: expected 2"):
+                    builder.add_particles_batch(np.zeros((2, 3)), mass=[1.0, 2.0, 3.0])
+
+
 class TestRemovedJointTargetAliases(unittest.TestCase):
     """The 1.3-era ``joint_target_pos`` / ``joint_target_vel`` aliases are gone.
 
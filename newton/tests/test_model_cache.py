@@ -0,0 +1,190 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the on-disk finalized-model cache."""
+
+import shutil
+import tempfile
+import unittest
+import uuid
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import warp as wp
+
+import newton
+from newton._src.sim import _model_cache
+from newton.tests.unittest_utils import add_function_test, get_test_devices
+
+# Runtime handles that differ between a live and a cached model by construction.
+_RUNTIME_ATTRIBUTES = {
+    "shape_source_ptr",
+    "shape_collision_filter_pairs",
+    "particle_grid",
+    "soft_mesh_adjacency_device",
+    "_mesh_keep_alive",
+}
+
+
+def _make_cache_dir(tag: str) -> Path:
+    base = Path(tempfile.gettempdir()) / f"newton_model_cache_test_{tag}_{uuid.uuid4().hex[:8]}"
+    base.mkdir(parents=True, exist_ok=True)
+    return base
+
+
+def _build_scene() -> newton.ModelBuilder:
+    builder = newton.ModelBuilder()
+    builder.add_ground_plane()
+    body = builder.add_body(xform=wp.transform((0.0, 0.0, 1.0), wp.quat_identity()))
+    builder.add_shape_box(body, hx=0.1, hy=0.2, hz=0.3)
+    builder.add_shape_mesh(body, mesh=newton.Mesh.create_sphere(0.1, num_latitudes=8, num_longitudes=8))
+    child = builder.add_body()
+    builder.add_joint_revolute(body, child, axis=newton.Axis.Y)
+    builder.add_shape_capsule(child, radius=0.05, half_height=0.2)
+    builder.add_cloth_grid(
+        pos=wp.vec3(0.0, 0.0, 2.0),
+        rot=wp.quat_identity(),
+        vel=wp.vec3(0.0),
+        dim_x=3,
+        dim_y=3,
+        cell_x=0.1,
+        cell_y=0.1,
+        mass=0.1,
+    )
+    scene = newton.ModelBuilder()
+    scene.replicate(builder, 2)
+    return scene
+
+
+def _assert_models_equal(test, live, cached) -> None:
+    for name, value in vars(live).items():
+        if name in _RUNTIME_ATTRIBUTES or name.startswith("bvh_"):
+            continue
+        with test.subTest(attribute=name):
+            cached_value = getattr(cached, name)
+            if isinstance(value, wp.array):
+                test.assertIsInstance(cached_value, wp.array)
+                test.assertEqual(cached_value.dtype, value.dtype)
+                test.assertEqual(cached_value.device, cached.device)
+                np.testing.assert_array_equal(cached_value.numpy(), value.numpy())
+            elif name == "shape_source":
+                for live_mesh, cached_mesh in zip(value, cached_value, strict=True):
+                    test.assertEqual(live_mesh is None, cached_mesh is None)
+                    if live_mesh is not None:
+                        np.testing.assert_array_equal(cached_mesh.vertices, live_mesh.vertices)
+                        np.testing.assert_array_equal(cached_mesh.indices, live_mesh.indices)
+            elif name == "soft_mesh_adjacency":
+                np.testing.assert_array_equal(cached_value.edge_indices, value.edge_indices)
+            elif isinstance(value, newton.Model.AttributeNamespace):
+                test.assertEqual(sorted(vars(cached_value)), sorted(vars(value)))
+            elif isinstance(value, list) and value and isinstance(value[0], wp.array):
+                for live_item, cached_item in zip(value, cached_value, strict=True):
+                    np.testing.assert_array_equal(cached_item.numpy(), live_item.numpy())
+            else:
+                test.assertEqual(cached_value, value)
+
+
+class TestModelCachePure(unittest.TestCase):
+    """Tests that exercise hashing and on-disk format only."""
+
+    def setUp(self) -> None:
+        self.cache_dir = _make_cache_dir(self._testMethodName)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_hash_is_stable(self) -> None:
+        key = {"asset": "robot.xml", "world_count": 4}
+        self.assertEqual(_model_cache.hash_inputs(key), _model_cache.hash_inputs(dict(key)))
+        self.assertNotEqual(_model_cache.hash_inputs(key), _model_cache.hash_inputs({**key, "world_count": 8}))
+        self.assertNotEqual(_model_cache.hash_inputs(key), _model_cache.hash_inputs(key, requires_grad=True))
+
+    def test_hash_tracks_file_contents(self) -> None:
+        asset = self.cache_dir / "asset.xml"
+        asset.write_text("<mujoco/>")
+        h1 = _model_cache.hash_inputs({"asset": asset})
+        asset.write_text("<mujoco model='edited'/>")
+        self.assertNotEqual(h1, _model_cache.hash_inputs({"asset": asset}))
+
+    def test_missing_file_is_miss(self) -> None:
+        self.assertIsNone(_model_cache.try_load_model(self.cache_dir, "0" * 32, device="cpu"))
+
+    def test_corrupt_npz_is_miss(self) -> None:
+        _model_cache.cache_path(self.cache_dir, "bad").write_bytes(b"not a zip file")
+        with self.assertLogs(_model_cache.logger, level="WARNING"):
+            self.assertIsNone(_model_cache.try_load_model(self.cache_dir, "bad", device="cpu"))
+
+    def test_embedded_version_mismatch_is_miss(self) -> None:
+        model = _build_scene().finalize(device="cpu")
+        path = _model_cache.save_model(self.cache_dir, "key", model)
+        with np.load(path, allow_pickle=False) as npz:
+            arrays = dict(npz)
+        arrays["__cache_format_version__"] = np.asarray(_model_cache.CACHE_FORMAT_VERSION + 1, dtype=np.int32)
+        np.savez(path, **arrays)
+        self.assertIsNone(_model_cache.try_load_model(self.cache_dir, "key", device="cpu"))
+
+    def test_npz_contains_provenance(self) -> None:
+        model = _build_scene().finalize(device="cpu")
+        path = _model_cache.save_model(self.cache_dir, "key", model, newton_version="1.2.3")
+        with zipfile.ZipFile(path) as archive:
+            members = set(archive.namelist())
+        for member in ("__cache_format_version__", "__kind__", "__newton_version__", "__created_utc__", "__model__"):
+            self.assertIn(f"{member}.npy", members)
+        with np.load(path, allow_pickle=False) as npz:
+            self.assertEqual(npz["__kind__"].item(), "newton.model")
+            self.assertEqual(npz["__newton_version__"].item(), "1.2.3")
+        self.assertEqual(list(self.cache_dir.glob("*.tmp.npz")), [])
+
+    def test_uncacheable_model_is_not_written(self) -> None:
+        builder = newton.ModelBuilder()
+        heightfield = newton.Heightfield(data=np.zeros((4, 4), dtype=np.float32), nrow=4, ncol=4, hx=1.0, hy=1.0)
+        builder.add_shape_heightfield(heightfield=heightfield)
+        model = builder.finalize(device="cpu")
+        with self.assertRaises(ValueError):
+            _model_cache.save_model(self.cache_dir, "key", model)
+        _model_cache.write(self.cache_dir, "key", model)
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+
+
+def test_model_cache_round_trip(test, device) -> None:
+    cache_dir = _make_cache_dir("round_trip")
+    try:
+        live = _model_cache.load_or_build_model(_build_scene, cache_dir=cache_dir, key={"scene": 1}, device=device)
+        test.assertEqual(len(list(cache_dir.glob("*.model.npz"))), 1)
+
+        def fail():
+            raise AssertionError("builder must not run on a cache hit")
+
+        cached = _model_cache.load_or_build_model(fail, cache_dir=cache_dir, key={"scene": 1}, device=device)
+        test.assertIsNot(cached, live)
+        _assert_models_equal(test, live, cached)
+        test.assertEqual(cached.shape_collision_filter_pairs, live.shape_collision_filter_pairs)
+        test.assertEqual(
+            np.count_nonzero(cached.shape_source_ptr.numpy()), np.count_nonzero(live.shape_source_ptr.numpy())
+        )
+        test.assertIsNotNone(cached.bvh_shapes)
+
+        # The cached model must be simulation-ready.
+        solver = newton.solvers.SolverXPBD(cached)
+        state_0, state_1 = cached.state(), cached.state()
+        pipeline = newton.CollisionPipeline(cached)
+        contacts = pipeline.contacts()
+        pipeline.collide(state_0, contacts)
+        solver.step(state_0, state_1, cached.control(), contacts, 1.0e-3)
+        test.assertTrue(np.all(np.isfinite(state_1.body_q.numpy())))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+class TestModelCache(unittest.TestCase):
+    pass
+
+
+add_function_test(
+    TestModelCache, "test_model_cache_round_trip", test_model_cache_round_trip, devices=get_test_devices()
+)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
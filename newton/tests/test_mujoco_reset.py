@@ -286,5 +286,63 @@ class TestMuJoCoReset(unittest.TestCase):
         np.testing.assert_allclose(result[1], poisoned[1], atol=1e-6)
 
 
+class TestMuJoCoWarmStartCache(unittest.TestCase):
+    def setUp(self):
+        self.model = _build_two_world_model(world_count=2)
+        self.solver = SolverMuJoCo(self.model, iterations=2, ls_iterations=2, warm_start_cache_size=2)
+        self.state_in = self.model.state()
+        self.state_out = self.model.state()
+        self.control = self.model.control()
+        self.collision_pipeline = newton.CollisionPipeline(self.model)
+        self.contacts = self.collision_pipeline.contacts()
+        newton.eval_fk(self.model, self.state_in.joint_q, self.state_in.joint_qd, self.state_in)
+
+    def _step(self):
+        self.collision_pipeline.collide(self.state_in, self.contacts)
+        self.solver.step(self.state_in, self.state_out, self.control, self.contacts, 1.0 / 60.0)
+
+    def test_miss_then_hit_restores_converged_warm_start(self):
+        """A missed key is stored after the next step and restored on the next reset."""
+        keys = wp.array([3, 3], dtype=wp.int32, device=self.model.device)
+        self.solver.reset(self.state_in, warm_start_keys=keys)
+        self.assertEqual(self.solver.warm_start_misses, 2)
+        self.assertEqual(self.solver.warm_start_hits, 0)
+
+        self._step()
+        converged = self.solver.mjw_data.qacc_warmstart.numpy()[0].copy()
+        if not np.any(converged):
+            self.skipTest("model produced a zero warm start")
+
+        mask = wp.array([False, True, False], dtype=wp.bool, device=self.model.device)
+        self.solver.reset(self.state_out, world_mask=mask, warm_start_keys=keys)
+        self.assertEqual(self.solver.warm_start_hits, 1)
+        warmstart = self.solver.mjw_data.qacc_warmstart.numpy()
+        np.testing.assert_allclose(warmstart[1], converged, atol=1e-5)
+
+    def test_negative_keys_and_clear(self):
+        keys = wp.array([-1, 4], dtype=wp.int32, device=self.model.device)
+        self.solver.reset(self.state_in, warm_start_keys=keys)
+        self.assertEqual(self.solver.warm_start_misses, 1)
+        self._step()
+        self.solver.reset(self.state_in, warm_start_keys=keys)
+        self.assertEqual(self.solver.warm_start_hits, 1)
+        self.assertTrue(np.all(self.solver.mjw_data.qacc_warmstart.numpy()[0] == 0.0))
+
+        self.solver.clear_warm_start_cache()
+        self.assertEqual(self.solver.warm_start_hits, 0)
+        self.assertEqual(self.solver.warm_start_misses, 0)
+        self.solver.reset(self.state_in, warm_start_keys=keys)
+        self.assertEqual(self.solver.warm_start_misses, 1)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.solver.reset(self.state_in, warm_start_keys=wp.zeros(3, dtype=wp.int32, device=self.model.device))
+        solver = SolverMuJoCo(self.model, iterations=2, ls_iterations=2)
+        with self.assertRaises(ValueError):
+            solver.reset(self.state_in, warm_start_keys=wp.zeros(2, dtype=wp.int32, device=self.model.device))
+        with self.assertRaises(ValueError):
+            SolverMuJoCo(self.model, warm_start_cache_size=-1)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import tempfile
+import time
+import unittest
+
+import warp as wp
+
+import newton
+from newton.tests.unittest_utils import add_function_test, get_test_devices
+from newton.utils import Profiler, event_scope, profile_scope
+
+
+@profile_scope
+def _sleep_scope(duration: float):
+    time.sleep(duration)
+
+
+@profile_scope("custom_name")
+def _named_scope():
+    with profile_scope("inner"):
+        pass
+
+
+class TestProfiler(unittest.TestCase):
+    def test_per_step_aggregation(self):
+        """Sum repeated scopes within a step and aggregate statistics across steps."""
+        with Profiler() as profiler:
+            for _ in range(4):
+                _sleep_scope(0.001)
+                _sleep_scope(0.001)
+                _named_scope()
+                profiler.step()
+
+        stats = profiler.stats()
+        sleep_stats = stats[_sleep_scope.__qualname__]
+        self.assertEqual(sleep_stats.count, 4)
+        self.assertEqual(sleep_stats.calls, 8)
+        self.assertGreaterEqual(sleep_stats.min, 2.0)
+        self.assertLessEqual(sleep_stats.min, sleep_stats.mean)
+        self.assertLessEqual(sleep_stats.mean, sleep_stats.max)
+        self.assertLessEqual(sleep_stats.p95, sleep_stats.max)
+        self.assertAlmostEqual(sleep_stats.total, 4.0 * sleep_stats.mean)
+        self.assertEqual(set(stats), {_sleep_scope.__qualname__, "custom_name", "inner"})
+        self.assertIn("custom_name", profiler.report())
+        self.assertEqual(profiler.step_count, 4)
+
+    def test_inactive_and_multiple_profilers(self):
+        """Record nothing outside a profiler and report scopes to every active profiler."""
+        _sleep_scope(0.0)
+        with Profiler() as outer:
+            with Profiler() as inner:
+                _named_scope()
+            _named_scope()
+        self.assertEqual(outer.stats()["custom_name"].calls, 2)
+        self.assertEqual(inner.stats()["custom_name"].calls, 1)
+
+        disabled = Profiler(enabled=False)
+        with disabled:
+            _named_scope()
+        self.assertEqual(disabled.stats(), {})
+
+        with self.assertRaises(ValueError):
+            outer.stats("gpu")
+
+    def test_event_scope_reports_to_profiler(self):
+        """Functions annotated with event_scope appear in the profiler under their qualified name."""
+
+        @event_scope
+        def annotated():
+            pass
+
+        with Profiler() as profiler:
+            annotated()
+        self.assertIn(annotated.__qualname__, profiler.stats())
+
+    def test_chrome_trace_export(self):
+        """Export nested host scopes in the Chrome trace event format."""
+        with Profiler() as profiler:
+            _named_scope()
+            profiler.step()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "trace.json")
+            profiler.export_chrome_trace(path)
+            with open(path) as f:
+                trace = json.load(f)
+
+        events = {e["name"]: e for e in trace["traceEvents"] if e["ph"] == "X"}
+        self.assertEqual(set(events), {"custom_name", "inner"})
+        outer, inner = events["custom_name"], events["inner"]
+        self.assertEqual(inner["args"]["depth"], 1)
+        self.assertGreaterEqual(inner["ts"], outer["ts"])
+        self.assertLessEqual(inner["ts"] + inner["dur"], outer["ts"] + outer["dur"] + 1.0e-3)
+
+
+def test_profiler_hot_paths(test: TestProfiler, device):
+    """Collision, solver step, and sensor update scopes are reported without user annotations."""
+    builder = newton.ModelBuilder()
+    builder.add_ground_plane()
+    body = builder.add_body(xform=wp.transform((0.0, 0.0, 0.5), wp.quat_identity()), label="box")
+    builder.add_shape_box(body, hx=0.1, hy=0.1, hz=0.1)
+    builder.add_site(body, label="imu")
+    model = builder.finalize(device=device)
+
+    solver = newton.solvers.SolverXPBD(model)
+    pipeline = newton.CollisionPipeline(model)
+    sensor = newton.sensors.SensorIMU(model, sites="imu")
+    state_0, state_1 = model.state(), model.state()
+    control = model.control()
+    contacts = pipeline.contacts()
+
+    with Profiler(synchronize=True) as profiler:
+        for _ in range(3):
+            pipeline.collide(state_0, contacts)
+            solver.step(state_0, state_1, control, contacts, 1.0e-3)
+            sensor.update(state_1)
+            state_0, state_1 = state_1, state_0
+            profiler.step()
+
+    stats = profiler.stats()
+    for name in ("CollisionPipeline.collide", "SolverXPBD.step", "SensorIMU.update"):
+        test.assertIn(name, stats)
+        test.assertEqual(stats[name].count, 3)
+    if device.is_cuda:
+        test.assertIn("SolverXPBD.step", profiler.stats("device"))
+
+
+devices = get_test_devices()
+add_function_test(TestProfiler, "test_profiler_hot_paths", test_profiler_hot_paths, devices=devices)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
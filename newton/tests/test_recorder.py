@@ -4,6 +4,7 @@
 import os
 import tempfile
 import unittest
+from types import SimpleNamespace
 from unittest import mock
 
 import numpy as np
@@ -14,6 +15,7 @@ import newton.examples
 from newton._src.utils.import_mjcf import parse_mjcf
 from newton._src.viewer.viewer_file import (
     HAS_CBOR2,
+    RecordingStreamReader,
     RingBuffer,
     depointer_as_key,
     deserialize,
@@ -409,6 +411,275 @@ def test_model_and_state_recorder_binary(test: TestRecorder, device):
     _test_model_and_state_recorder_with_format(test, device, ".bin")
 
 
+def test_model_and_state_recorder_stream(test: TestRecorder, device):
+    """Test model and state recorder with the chunked .nrec format."""
+    if not HAS_CBOR2:
+        test.skipTest("cbor2 library not available for stream format testing")
+
+    _test_model_and_state_recorder_with_format(test, device, ".nrec")
+
+
+def test_stream_recording_appends_chunks(test: TestRecorder, device):
+    """Test that periodic .nrec saves append new frames without rewriting earlier chunks."""
+    if not HAS_CBOR2:
+        test.skipTest("cbor2 library not available for stream format testing")
+
+    builder = newton.ModelBuilder()
+    body = builder.add_body()
+    builder.add_shape_box(body, hx=0.1, hy=0.2, hz=0.3)
+    model = builder.finalize(device=device)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        file_path = os.path.join(tmpdir, "recording.nrec")
+        viewer_file = ViewerFile(file_path, auto_save=True, save_interval=2)
+        viewer_file.set_model(model)
+
+        state = model.state()
+        expected = []
+        prefixes = []
+        for i in range(5):
+            state.body_q.fill_(wp.transform([float(i), 0.0, 0.0], wp.quat_identity()))
+            expected.append(state.body_q.numpy().copy())
+            viewer_file.log_state(state)
+            if i % 2 == 1:
+                with open(file_path, "rb") as f:
+                    prefixes.append(f.read())
+        viewer_file.close()
+
+        with open(file_path, "rb") as f:
+            final_bytes = f.read()
+        # Everything but the trailing index of an earlier save is preserved by later appends
+        reader = RecordingStreamReader(file_path)
+        test.assertEqual(len(reader), 5)
+        test.assertEqual([c[2] for c in reader.chunks], [2, 2, 1])
+        for prefix, chunk in zip(prefixes, reader.chunks[1:], strict=True):
+            test.assertEqual(final_bytes[: chunk[0]], prefix[: chunk[0]])
+        reader.close()
+
+        playback = ViewerFile(file_path, auto_save=False)
+        playback.load_recording()
+        test.assertTrue(playback.has_model())
+        test.assertEqual(playback.get_frame_count(), 5)
+
+        restored_model = newton.Model(device=device)
+        playback.load_model(restored_model)
+        test.assertEqual(restored_model.body_count, model.body_count)
+        test.assertEqual(restored_model.shape_count, model.shape_count)
+
+        restored_state = restored_model.state()
+        for frame_id in (4, 0, 2):
+            playback.load_state(restored_state, frame_id)
+            np.testing.assert_allclose(restored_state.body_q.numpy(), expected[frame_id], atol=1e-6)
+
+        # Closing a loaded recording must not rewrite or truncate it
+        playback.close()
+        with open(file_path, "rb") as f:
+            test.assertEqual(f.read(), final_bytes)
+
+
+def test_stream_recording_recovers_without_index(test: TestRecorder, device):
+    """Test that an .nrec file whose trailing index was lost is recovered by scanning chunks."""
+    if not HAS_CBOR2:
+        test.skipTest("cbor2 library not available for stream format testing")
+
+    builder = newton.ModelBuilder()
+    builder.add_particle(pos=(0.0, 0.0, 0.0), vel=(0.0, 0.0, 0.0), mass=1.0)
+    model = builder.finalize(device=device)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        file_path = os.path.join(tmpdir, "recording.nrec")
+        recorder = ViewerFile(file_path, auto_save=False)
+        recorder.record_model(model)
+        state = model.state()
+        for i in range(3):
+            state.particle_q.fill_(wp.vec3(float(i), 1.0, 2.0))
+            recorder.record(state)
+            recorder.save_recording()
+
+        reader = RecordingStreamReader(file_path)
+        index_offset = reader.index_offset
+        reader.close()
+        with open(file_path, "r+b") as f:
+            f.truncate(index_offset)
+
+        with test.assertWarnsRegex(UserWarning, "no valid index"):
+            reader = RecordingStreamReader(file_path)
+        test.assertEqual(len(reader), 3)
+        np.testing.assert_allclose(reader[2]["particle_q"].numpy(), [[2.0, 1.0, 2.0]])
+        test.assertIsNotNone(reader.read_model())
+        reader.close()
+
+
+def test_stream_recording_lazy_playback(test: TestRecorder, device):
+    """Test memory-mapped .nrec playback decoding selected arrays on demand with an LRU cache."""
+    if not HAS_CBOR2:
+        test.skipTest("cbor2 library not available for stream format testing")
+
+    builder = newton.ModelBuilder()
+    body = builder.add_body()
+    builder.add_shape_sphere(body, radius=0.1)
+    model = builder.finalize(device=device)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        file_path = os.path.join(tmpdir, "recording.nrec")
+        recorder = ViewerFile(file_path, auto_save=False)
+        recorder.record_model(model)
+        state = model.state()
+        for i in range(4):
+            state.body_q.fill_(wp.transform([float(i), 0.0, 0.0], wp.quat_identity()))
+            state.body_qd.fill_(wp.spatial_vector([float(i), 0.0, 0.0, 0.0, 0.0, 0.0]))
+            recorder.record(state)
+        recorder.save_recording()
+
+        reader = RecordingStreamReader(file_path, cache_size=2)
+        test.assertIn("body_qd", reader.frame_attributes(1))
+
+        frame = reader.get_frame(1, attributes=("body_q", "not_recorded"))
+        test.assertEqual(set(frame.keys()), {"body_q"})
+        np.testing.assert_allclose(frame["body_q"].numpy()[0, :3], [1.0, 0.0, 0.0])
+        test.assertEqual((reader.cache_hits, reader.cache_misses), (0, 1))
+
+        # Same subset is served from the cache; requesting another array decodes only that one
+        test.assertIs(reader.get_frame(1, attributes=("body_q",))["body_q"], frame["body_q"])
+        full = reader[1]
+        test.assertIs(full["body_q"], frame["body_q"])
+        test.assertEqual((reader.cache_hits, reader.cache_misses), (1, 2))
+
+        # The least recently used frame is evicted once the cache is full
+        reader.get_frame(2)
+        reader.get_frame(3)
+        reader.get_frame(1)
+        test.assertEqual(reader.cache_misses, 5)
+
+        # Decoded arrays remain valid after the mapping is closed
+        reader.close()
+        np.testing.assert_allclose(full["body_qd"].numpy()[0, 0], 1.0)
+
+        playback = ViewerFile(file_path, auto_save=False, playback_cache_size=1)
+        playback.load_recording()
+        restored_model = newton.Model(device=device)
+        playback.load_model(restored_model)
+        restored_state = restored_model.state()
+        playback.load_state(restored_state, 3, attributes=("body_q",))
+        np.testing.assert_allclose(restored_state.body_q.numpy()[0, :3], [3.0, 0.0, 0.0])
+        np.testing.assert_allclose(restored_state.body_qd.numpy(), np.zeros((1, 6)))
+        playback.close()
+
+
+def test_stream_recording_record_after_load(test: TestRecorder, device):
+    """Test that recording after loading an .nrec file appends to it instead of failing."""
+    if not HAS_CBOR2:
+        test.skipTest("cbor2 library not available for stream format testing")
+
+    builder = newton.ModelBuilder()
+    builder.add_particle(pos=(0.0, 0.0, 0.0), vel=(0.0, 0.0, 0.0), mass=1.0)
+    model = builder.finalize(device=device)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        file_path = os.path.join(tmpdir, "recording.nrec")
+        recorder = ViewerFile(file_path, auto_save=False)
+        recorder.record_model(model)
+        state = model.state()
+        for i in range(2):
+            state.particle_q.fill_(wp.vec3(float(i), 0.0, 0.0))
+            recorder.record(state)
+        recorder.save_recording()
+
+        for max_history_size in (None, 2):
+            resumed = ViewerFile(file_path, auto_save=False, max_history_size=max_history_size)
+            resumed.load_recording()
+            resumed.record_model(model)
+            frame_count = resumed.get_frame_count()
+            state.particle_q.fill_(wp.vec3(float(frame_count), 0.0, 0.0))
+            resumed.record(state)
+            test.assertIsInstance(resumed.history, list if max_history_size is None else RingBuffer)
+            test.assertEqual(len(resumed.history), 1)
+            resumed.save_recording()
+            resumed.close()
+
+        reader = RecordingStreamReader(file_path)
+        test.assertEqual(len(reader), 4)
+        for frame_id in range(4):
+            np.testing.assert_allclose(reader[frame_id]["particle_q"].numpy(), [[float(frame_id), 0.0, 0.0]])
+        reader.close()
+
+
+def test_stream_recording_codec(test: TestRecorder, device):
+    """Test keyframe references and quantized deltas of the .nrec recording codec."""
+    if not HAS_CBOR2:
+        test.skipTest("cbor2 library not available for stream format testing")
+
+    builder = newton.ModelBuilder()
+    for i in range(4):
+        body = builder.add_body(xform=wp.transform((float(i), 0.0, 0.0), wp.quat_identity()))
+        builder.add_shape_sphere(body, radius=0.1)
+    builder.add_particle(pos=(0.0, 0.0, 1.0), vel=(0.0, 0.0, 0.0), mass=1.0)
+    model = builder.finalize(device=device)
+    state = model.state()
+
+    rng = np.random.default_rng(42)
+    frames = []
+    for i in range(6):
+        body_q = state.body_q.numpy()
+        body_q[:, :3] += 0.01 * i
+        quat = rng.normal(size=(model.body_count, 4)).astype(np.float32)
+        body_q[:, 3:] = quat / np.linalg.norm(quat, axis=1, keepdims=True)
+        particle_q = state.particle_q.numpy() + np.float32(0.05 * i)
+        # body_qd never changes and must be stored once per keyframe
+        frames.append(
+            {
+                "body_q": wp.array(body_q, dtype=wp.transform, device=device),
+                "body_qd": wp.clone(state.body_qd),
+                "particle_q": wp.array(particle_q, dtype=wp.vec3, device=device),
+            }
+        )
+
+    for quantization, tolerance in ((None, 0.0), ("fixed", 1.0e-3), ("float16", 1.0e-2)):
+        with test.subTest(quantization=quantization), tempfile.TemporaryDirectory() as tmpdir:
+            codec = newton.viewer.RecordingCodec(
+                keyframe_interval=4,
+                quantization=quantization,
+                position_tolerance=max(tolerance, 1.0e-6),
+                rotation_tolerance=max(tolerance, 1.0e-6),
+            )
+            file_path = os.path.join(tmpdir, "recording.nrec")
+            recorder = ViewerFile(file_path, auto_save=False, codec=codec)
+            recorder.record_model(model)
+            for i, frame in enumerate(frames):
+                recorder.record(SimpleNamespace(**frame))
+                if i % 3 == 2:
+                    recorder.save_recording()
+
+            reader = RecordingStreamReader(file_path)
+            test.assertEqual(len(reader), len(frames))
+            descriptors = reader._get_chunk_meta(0)[0]
+            test.assertEqual(descriptors[1]["body_qd"]["encoding"], "ref")
+            test.assertEqual(descriptors[1]["body_qd"]["keyframe"], 0)
+            test.assertNotIn("nbytes", descriptors[1]["body_qd"])
+            if quantization is not None:
+                test.assertEqual(descriptors[0]["body_q"]["encoding"], quantization)
+                test.assertEqual(descriptors[2]["particle_q"]["keyframe"], 0)
+                # Frame 4 starts a new keyframe in the second chunk
+                test.assertNotIn("keyframe", reader._get_chunk_meta(1)[0][1]["body_q"])
+
+            for frame_id, frame in enumerate(frames):
+                decoded = reader[frame_id]
+                for name in ("body_q", "body_qd", "particle_q"):
+                    np.testing.assert_allclose(
+                        decoded[name].numpy(),
+                        frame[name].numpy(),
+                        rtol=0.0,
+                        atol=tolerance,
+                        err_msg=f"{name} mismatch at frame {frame_id}",
+                    )
+            reader.close()
+
+    with test.assertRaises(ValueError):
+        newton.viewer.RecordingCodec(quantization="int4")
+    with test.assertRaises(ValueError):
+        newton.viewer.RecordingCodec(keyframe_interval=0)
+
+
 devices = get_test_devices()
 
 add_function_test(
@@ -469,6 +740,51 @@ add_function_test(
     check_output=False,  # Ignore "Please install 'psutil'" UserWarning
 )
 
+add_function_test(
+    TestRecorder,
+    "test_model_and_state_recorder_stream",
+    test_model_and_state_recorder_stream,
+    devices=devices,
+)
+
+add_function_test(
+    TestRecorder,
+    "test_stream_recording_appends_chunks",
+    test_stream_recording_appends_chunks,
+    devices=devices,
+    check_output=False,  # ViewerFile prints save/load messages
+)
+
+add_function_test(
+    TestRecorder,
+    "test_stream_recording_recovers_without_index",
+    test_stream_recording_recovers_without_index,
+    devices=devices,
+)
+
+add_function_test(
+    TestRecorder,
+    "test_stream_recording_lazy_playback",
+    test_stream_recording_lazy_playback,
+    devices=devices,
+    check_output=False,  # ViewerFile prints close messages
+)
+
+add_function_test(
+    TestRecorder,
+    "test_stream_recording_record_after_load",
+    test_stream_recording_record_after_load,
+    devices=devices,
+    check_output=False,  # ViewerFile prints close messages
+)
+
+add_function_test(
+    TestRecorder,
+    "test_stream_recording_codec",
+    test_stream_recording_codec,
+    devices=devices,
+)
+
 
 def test_warp_dtype_roundtrip(test: TestRecorder, device):
     """
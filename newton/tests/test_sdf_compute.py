@@ -14,6 +14,7 @@ Note: These tests require GPU (CUDA) since wp.Volume only supports CUDA devices.
 """
 
 import unittest
+from unittest import mock
 
 import numpy as np
 import warp as wp
@@ -857,6 +858,57 @@ class TestMeshSDFCollisionFlag(unittest.TestCase):
         mesh.build_sdf(max_resolution=32)
         self.assertIsNotNone(mesh.sdf)
 
+    def test_build_sdfs_cooks_distinct_meshes_once(self):
+        """build_sdfs() should cook each distinct (mesh content, params) once and keep input order."""
+        cooked = []
+
+        def fake_create_from_mesh(mesh, **kwargs):
+            sdf = object()
+            cooked.append((mesh, sdf))
+            return sdf
+
+        box = create_box_mesh((0.2, 0.2, 0.2))
+        box_copy = create_box_mesh((0.2, 0.2, 0.2))
+        other = create_box_mesh((0.3, 0.2, 0.2))
+        with mock.patch.object(SDF, "create_from_mesh", side_effect=fake_create_from_mesh):
+            sdfs = Mesh.build_sdfs([box, box_copy, other, box], max_resolution=32, max_workers=4)
+
+        self.assertEqual(len(cooked), 2)
+        self.assertIs(sdfs[0], box.sdf)
+        self.assertIs(sdfs[1], box.sdf)
+        self.assertIs(sdfs[3], box.sdf)
+        self.assertIs(sdfs[2], other.sdf)
+        self.assertIsNot(box.sdf, other.sdf)
+        self.assertIs(box_copy._collision_edges, box._collision_edges)
+
+        # Meshes that already carry an SDF are rejected before anything is cooked.
+        fresh = create_box_mesh((0.4, 0.2, 0.2))
+        with mock.patch.object(SDF, "create_from_mesh", side_effect=fake_create_from_mesh):
+            with self.assertRaises(RuntimeError):
+                Mesh.build_sdfs([fresh, box], max_resolution=32)
+        self.assertIsNone(fresh.sdf)
+        self.assertEqual(len(cooked), 2)
+
+        with self.assertRaises(ValueError):
+            Mesh.build_sdfs([fresh], max_workers=0)
+
+    @unittest.skipUnless(_cuda_available, "Requires CUDA device")
+    def test_build_sdfs_matches_sequential_builds(self):
+        """Concurrently cooked SDFs should match SDFs built one at a time."""
+        sizes = [(0.2, 0.2, 0.2), (0.3, 0.1, 0.2), (0.1, 0.25, 0.15), (0.2, 0.3, 0.1)]
+        batch = [create_box_mesh(size) for size in sizes]
+        Mesh.build_sdfs(batch, max_resolution=32, max_workers=4)
+
+        points = np.random.default_rng(0).uniform(-0.35, 0.35, size=(128, 3))
+        for size, mesh in zip(sizes, batch, strict=True):
+            reference = create_box_mesh(size)
+            reference.build_sdf(max_resolution=32)
+            np.testing.assert_allclose(
+                _sample_texture_sdf_at_points(mesh.sdf, points),
+                _sample_texture_sdf_at_points(reference.sdf, points),
+                atol=1e-6,
+            )
+
     @unittest.skipUnless(_cuda_available, "Requires CUDA device")
     def test_sdf_create_from_data_roundtrip(self):
         """Round-trip SDF reconstruction from generated data."""
@@ -19,6 +19,7 @@ import unittest
 import uuid
 import zipfile
 from pathlib import Path
+from unittest import mock
 
 import numpy as np
 import warp as wp
@@ -159,8 +160,11 @@ class TestSDFDiskCachePure(unittest.TestCase):
         self.vertices = np.asarray(self.mesh.vertices, dtype=np.float32)
         self.indices = np.asarray(self.mesh.indices, dtype=np.int32).reshape(-1)
         self.cache_dir = _make_cache_dir(self._testMethodName)
+        # Entries share a content hash across tests; start each one from disk.
+        _sdf_cache.clear_memory_cache()
 
     def tearDown(self) -> None:
+        _sdf_cache.clear_memory_cache()
         _remove_cache_dir(self.cache_dir)
 
     def test_hash_is_stable(self) -> None:
@@ -532,6 +536,107 @@ class TestSDFDiskCachePure(unittest.TestCase):
         np.savez(npz_path, **contents)
         self.assertIsNone(_sdf_cache.try_load_sparse_data(tmp, h))
 
+    def test_memory_cache_serves_repeat_loads(self) -> None:
+        cache_hash, npz_path = self._save_fake_sparse_data()
+        self.assertIsNone(_sdf_cache.try_load_sparse_data(self.cache_dir, "deadbeef"))
+        self.assertIsNotNone(_sdf_cache.try_load_sparse_data(self.cache_dir, cache_hash))
+
+        # The second lookup is served from memory, even after the file is gone.
+        npz_path.unlink()
+        loaded = _sdf_cache.try_load_sparse_data(self.cache_dir, cache_hash)
+        self.assertIsNotNone(loaded)
+        np.testing.assert_array_equal(loaded["coarse_sdf"], self._fake_sparse_data()["coarse_sdf"])
+
+        stats = _sdf_cache.cache_stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["disk_hits"], 1)
+        self.assertEqual(stats["memory_hits"], 1)
+        self.assertEqual(stats["bytes_loaded"], stats["memory_bytes"])
+        self.assertGreater(stats["bytes_loaded"], 0)
+        self.assertEqual(stats["bytes_mapped"], 0)
+        self.assertEqual(stats["memory_entries"], 1)
+
+        _sdf_cache.clear_memory_cache()
+        self.assertIsNone(_sdf_cache.try_load_sparse_data(self.cache_dir, cache_hash))
+        self.assertEqual(_sdf_cache.cache_stats()["misses"], 1)
+
+    def test_memory_cache_evicts_least_recently_used(self) -> None:
+        sparse_data = self._fake_sparse_data()
+        entry_bytes = sum(int(sparse_data[k].nbytes) for k in _sdf_cache._NDARRAY_KEYS)
+        with mock.patch.object(_sdf_cache, "MEMORY_CACHE_MAX_BYTES", 2 * entry_bytes):
+            for key in ("a", "b", "c"):
+                _sdf_cache.write(self.cache_dir, key, sparse_data)
+            # "a" was evicted from memory but is still on disk.
+            self.assertEqual(_sdf_cache.cache_stats()["memory_entries"], 2)
+            self.assertIsNotNone(_sdf_cache.try_load_sparse_data(self.cache_dir, "a"))
+            stats = _sdf_cache.cache_stats()
+            self.assertEqual((stats["disk_hits"], stats["memory_hits"]), (1, 0))
+            self.assertIsNotNone(_sdf_cache.try_load_sparse_data(self.cache_dir, "c"))
+            self.assertEqual(_sdf_cache.cache_stats()["memory_hits"], 1)
+
+    def test_mmap_round_trip_maps_arrays(self) -> None:
+        sparse_data = self._fake_sparse_data()
+        h = _sdf_cache.hash_inputs(**_common_hash_kwargs(self.vertices, self.indices))
+        mmap_path = _sdf_cache.save_sparse_data(
+            self.cache_dir, h, sparse_data, newton_version="test", cache_format="mmap"
+        )
+        self.assertEqual(mmap_path, _sdf_cache.cache_path(self.cache_dir, h, "mmap"))
+        self.assertTrue((mmap_path / "coarse_sdf.npy").is_file())
+        self.assertFalse(_sdf_cache.cache_path(self.cache_dir, h).exists())
+
+        # The npz format does not see mmap entries.
+        self.assertIsNone(_sdf_cache.try_load_sparse_data(self.cache_dir, h))
+        loaded = _sdf_cache.try_load_sparse_data(self.cache_dir, h, cache_format="mmap")
+        self.assertIsNotNone(loaded)
+        for key in _sdf_cache._NDARRAY_KEYS:
+            np.testing.assert_array_equal(loaded[key], sparse_data[key])
+            self.assertFalse(loaded[key].flags.writeable, key)
+        self.assertEqual(loaded["coarse_dims"], sparse_data["coarse_dims"])
+
+        stats = _sdf_cache.cache_stats()
+        self.assertEqual(stats["bytes_loaded"], 0)
+        self.assertGreater(stats["bytes_mapped"], 0)
+
+        with self.assertRaises(ValueError):
+            _sdf_cache.try_load_sparse_data(self.cache_dir, h, cache_format="zip")
+
+    def test_mmap_republish_keeps_existing_entry(self) -> None:
+        # Renaming a directory onto a populated one fails; a peer having already
+        # published the same content hash is treated as success.
+        sparse_data = self._fake_sparse_data()
+        for _ in range(3):
+            _sdf_cache.save_sparse_data(self.cache_dir, "abc", sparse_data, cache_format="mmap")
+        self.assertEqual(list(self.cache_dir.glob("*.tmp")), [])
+        self.assertIsNotNone(_sdf_cache.try_load_sparse_data(self.cache_dir, "abc", cache_format="mmap"))
+
+    def test_mmap_write_replaces_invalid_entry(self) -> None:
+        sparse_data = self._fake_sparse_data()
+        mmap_path = _sdf_cache.cache_path(self.cache_dir, "abc", "mmap")
+
+        # An entry from an older cache format version is re-cooked in place.
+        _sdf_cache.save_sparse_data(self.cache_dir, "abc", sparse_data, cache_format="mmap")
+        np.save(
+            mmap_path / "__cache_format_version__.npy",
+            np.asarray(_sdf_cache.CACHE_FORMAT_VERSION - 1, dtype=np.int32),
+        )
+        self.assertIsNone(_sdf_cache.try_load_sparse_data(self.cache_dir, "abc", cache_format="mmap"))
+        _sdf_cache.write(self.cache_dir, "abc", sparse_data, cache_format="mmap")
+        _sdf_cache.clear_memory_cache()
+        self.assertIsNotNone(_sdf_cache.try_load_sparse_data(self.cache_dir, "abc", cache_format="mmap"))
+
+        # So is an entry with a missing member.
+        (mmap_path / "subgrid_required.npy").unlink()
+        _sdf_cache.write(self.cache_dir, "abc", sparse_data, cache_format="mmap")
+        _sdf_cache.clear_memory_cache()
+        self.assertIsNotNone(_sdf_cache.try_load_sparse_data(self.cache_dir, "abc", cache_format="mmap"))
+        self.assertEqual(list(self.cache_dir.glob("*.tmp")), [])
+        self.assertEqual(list(self.cache_dir.glob("*.stale")), [])
+
+    def test_corrupt_mmap_member_is_miss(self) -> None:
+        _sdf_cache.save_sparse_data(self.cache_dir, "abc", self._fake_sparse_data(), cache_format="mmap")
+        (_sdf_cache.cache_path(self.cache_dir, "abc", "mmap") / "subgrid_required.npy").unlink()
+        self.assertIsNone(_sdf_cache.try_load_sparse_data(self.cache_dir, "abc", cache_format="mmap"))
+
 
 # -----------------------------------------------------------------------------
 # End-to-end hit/miss test (CUDA required)
@@ -554,8 +659,11 @@ def test_disk_cache_hit_matches_live(test, device) -> None:
         points = rng.uniform(-0.6, 0.6, size=(64, 3)).astype(np.float32)
         live_values = _sample(sdf_live.texture_data, points, device)
 
+        # Drop the in-process copy so the second build reads the file.
+        _sdf_cache.clear_memory_cache()
         mesh2 = _make_box_mesh()
         sdf_cached = mesh2.build_sdf(device=device, cache_dir=cache_path)
+        test.assertEqual(_sdf_cache.cache_stats()["disk_hits"], 1)
         cached_values = _sample(sdf_cached.texture_data, points, device)
 
         np.testing.assert_allclose(
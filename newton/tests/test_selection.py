@@ -1436,6 +1436,87 @@ class TestSelection(unittest.TestCase):
         view_with_loop = ArticulationView(model, "robot", include_loop_closing_joints=True)
         self.assertEqual(view_with_loop.joint_names, ["root_joint", "middle_joint", "tip_joint", "loop_joint"])
 
+    def _build_observation_model(self):
+        world = newton.ModelBuilder()
+        for label in ("robot_a", "robot_b"):
+            base = world.add_link(label=f"{label}/base")
+            upper = world.add_link(label=f"{label}/upper")
+            lower = world.add_link(label=f"{label}/lower")
+            j_base = world.add_joint_free(child=base, label=f"{label}/root")
+            j_upper = world.add_joint_revolute(parent=base, child=upper, label=f"{label}/hip")
+            j_lower = world.add_joint_revolute(parent=upper, child=lower, label=f"{label}/knee")
+            world.add_articulation([j_base, j_upper, j_lower], label=label)
+        builder = newton.ModelBuilder()
+        for _ in range(3):
+            builder.add_world(world)
+        model = builder.finalize(device="cpu")
+
+        rng = np.random.default_rng(42)
+        state = model.state()
+        state.joint_q.assign(rng.random(model.joint_coord_count, dtype=np.float32))
+        state.body_q.assign(rng.random((model.body_count, 7), dtype=np.float32))
+        control = model.control()
+        control.joint_f.assign(rng.random(model.joint_dof_count, dtype=np.float32))
+        return model, state, control
+
+    def test_observation_spec_gather(self):
+        model, state, control = self._build_observation_model()
+        # the excluded middle link makes the body layout indexed rather than sliced
+        view = ArticulationView(model, "robot_*", exclude_joints=["root"], exclude_links=["upper"])
+        fields = [("joint_q", state), ("body_q", state), ("joint_f", control), ("joint_target_ke", model)]
+        spec = view.create_observation_spec(fields)
+
+        self.assertEqual(spec.shape, (3, 2, 2 + 2 * 7 + 2 + 2))
+        values = spec.gather().numpy()
+        for name, source in fields:
+            expected = view.get_attribute(name, source).numpy().reshape(3, 2, -1)
+            assert_np_equal(values[..., spec.feature_slices[name]], expected)
+
+        # swapping in another state only changes the state fields
+        other = model.state()
+        out = wp.zeros(spec.shape, dtype=float, device="cpu")
+        spec.gather(state=other, out=out)
+        assert_np_equal(
+            out.numpy()[..., spec.feature_slices["joint_q"]],
+            view.get_attribute("joint_q", other).numpy().reshape(3, 2, -1),
+        )
+        assert_np_equal(out.numpy()[..., spec.feature_slices["joint_f"]], values[..., spec.feature_slices["joint_f"]])
+
+    def test_observation_spec_scatter(self):
+        model, state, control = self._build_observation_model()
+        view = ArticulationView(model, "robot_*", exclude_joints=["root"], exclude_links=["upper"])
+        spec = view.create_observation_spec([("joint_q", state), ("body_q", state), ("joint_f", control)])
+
+        original = spec.gather().numpy().copy()
+        updated = original + 1.0
+        mask = np.array([[True, False], [False, False], [True, True]])
+        spec.scatter(updated, mask=mask)
+
+        expected = np.where(mask[..., None], updated, original)
+        assert_np_equal(spec.gather().numpy(), expected)
+        assert_np_equal(view.get_attribute("joint_f", control).numpy().reshape(3, 2, -1), expected[..., -2:])
+
+        # coordinates outside the selection (the excluded free joints) are left untouched
+        free_q = state.joint_q.numpy().reshape(6, -1)[:, :7].copy()
+        spec.scatter(wp.array(original, dtype=float, device="cpu"))
+        assert_np_equal(spec.gather().numpy(), original)
+        assert_np_equal(state.joint_q.numpy().reshape(6, -1)[:, :7], free_q)
+
+    def test_observation_spec_validation(self):
+        model, state, _control = self._build_observation_model()
+        view = ArticulationView(model, "robot_*")
+
+        with self.assertRaises(TypeError):
+            view.create_observation_spec([("joint_type", model)])
+        with self.assertRaises(ValueError):
+            view.create_observation_spec([("joint_q", state), ("body_q", model.state())])
+        with self.assertRaises(ValueError):
+            view.create_observation_spec([("joint_q", state), ("joint_q", state)])
+
+        spec = view.create_observation_spec([("joint_q", state)])
+        with self.assertRaises(ValueError):
+            spec.gather(out=wp.zeros((1, 1, 1), dtype=float, device="cpu"))
+
 
 class TestSelectionFixedTendons(unittest.TestCase):
     """Tests for fixed tendon support in ArticulationView."""
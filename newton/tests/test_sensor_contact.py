@@ -475,6 +475,81 @@ class TestSensorContact(unittest.TestCase):
         positions = sensor.position_matrix.numpy()
         np.testing.assert_array_equal(positions, 0.0)
 
+    def test_deterministic_matches_atomic(self):
+        """Segmented evaluation reproduces the atomic readings and is repeatable."""
+        device = wp.get_device()
+
+        builder = newton.ModelBuilder()
+        for i in range(4):
+            body = builder.add_body(label=f"body{i}")
+            builder.add_shape_box(body, hx=0.1, hy=0.1, hz=0.1, label=f"box{i}")
+            builder.add_shape_sphere(body, radius=0.1, label=f"ball{i}")
+        builder.add_shape_box(body=-1, hx=0.1, hy=0.1, hz=0.1, label="ground")
+        model = builder.finalize(device=device)
+
+        rng = np.random.default_rng(7)
+        n_contacts, capacity = 40, 64
+        contacts = newton.Contacts(capacity, 0, device=device, requested_attributes={"force"})
+        pairs = rng.choice(model.shape_count, size=(n_contacts, 2))
+        pairs[pairs[:, 0] == pairs[:, 1], 1] = model.shape_count - 1
+        pairs[pairs[:, 0] == pairs[:, 1], 0] = 0
+        with wp.ScopedDevice(device):
+            contacts.rigid_contact_shape0 = wp.array(
+                np.pad(pairs[:, 0], (0, capacity - n_contacts), constant_values=-1), dtype=wp.int32
+            )
+            contacts.rigid_contact_shape1 = wp.array(
+                np.pad(pairs[:, 1], (0, capacity - n_contacts), constant_values=-1), dtype=wp.int32
+            )
+            contacts.rigid_contact_point0 = wp.array(rng.normal(size=(capacity, 3)), dtype=wp.vec3)
+            contacts.rigid_contact_point1 = wp.array(rng.normal(size=(capacity, 3)), dtype=wp.vec3)
+            contacts.rigid_contact_offset0 = wp.array(rng.normal(size=(capacity, 3)) * 0.01, dtype=wp.vec3)
+            contacts.rigid_contact_offset1 = wp.array(rng.normal(size=(capacity, 3)) * 0.01, dtype=wp.vec3)
+            normals = rng.normal(size=(capacity, 3))
+            contacts.rigid_contact_normal = wp.array(
+                normals / np.linalg.norm(normals, axis=1, keepdims=True), dtype=wp.vec3
+            )
+            contacts.rigid_contact_count = wp.array([n_contacts], dtype=wp.int32)
+            contacts.force = wp.array(rng.normal(size=(capacity, 6)), dtype=wp.spatial_vector)
+        state = model.state()
+        state.body_q.assign(
+            [wp.transform(rng.normal(size=3), wp.normalize(wp.quat(*rng.normal(size=4)))) for _ in range(4)]
+        )
+
+        outputs = ("total_force", "total_force_friction", "force_matrix", "force_matrix_friction", "position_matrix")
+        configs = [
+            {"sensing_bodies": "*", "counterpart_shapes": "*"},
+            {"sensing_shapes": "ball*", "counterpart_bodies": "*", "measure_total": False},
+            {"sensing_shapes": ["box1", "box0", "ball3"]},
+        ]
+        for config in configs:
+            with self.subTest(config=config):
+                atomic = SensorContact(model, **config)
+                segmented = SensorContact(model, deterministic=True, **config)
+                atomic.update(state, contacts)
+                segmented.update(state, contacts)
+                first = {}
+                for name in outputs:
+                    expected = getattr(atomic, name)
+                    actual = getattr(segmented, name)
+                    if expected is None:
+                        self.assertIsNone(actual)
+                        continue
+                    np.testing.assert_allclose(actual.numpy(), expected.numpy(), rtol=1e-5, atol=1e-5)
+                    first[name] = actual.numpy().copy()
+
+                segmented.update(state, contacts)
+                for name, values in first.items():
+                    np.testing.assert_array_equal(getattr(segmented, name).numpy(), values)
+
+                # a smaller buffer resizes the scratch arrays; stale segments must not leak into the readings
+                small = create_contacts(device, [tuple(pairs[0])], naconmax=2, forces=[3.0])
+                atomic.update(None, small)
+                segmented.update(None, small)
+                for name in outputs:
+                    expected = getattr(atomic, name)
+                    if expected is not None:
+                        np.testing.assert_allclose(getattr(segmented, name).numpy(), expected.numpy(), atol=1e-6)
+
     def test_duplicate_sensing_objects_raises(self):
         """Duplicate sensing object indices raise ValueError."""
         model = _make_two_world_model()
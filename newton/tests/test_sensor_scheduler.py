@@ -0,0 +1,235 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for SensorScheduler."""
+
+import unittest
+
+import numpy as np
+import warp as wp
+
+import newton
+from newton.sensors import SensorContact, SensorFrameTransform, SensorIMU, SensorScheduler
+
+
+class _RecordingSensor:
+    """Sensor stand-in that records the steps it was updated on."""
+
+    def __init__(self):
+        self.steps = []
+        self.kwargs = []
+        self.step = 0
+
+    def update(self, state, **kwargs):
+        self.steps.append(self.step)
+        self.kwargs.append(kwargs)
+
+
+class _RecordingWorldSensor:
+    """Sensor stand-in that accepts a world mask, like SensorTiledCamera."""
+
+    def __init__(self):
+        self.masks = {}
+        self.step = 0
+
+    def update(self, state, *, world_mask=None):
+        self.masks[self.step] = world_mask.numpy().copy()
+
+
+class _OtherRecordingSensor(_RecordingSensor):
+    """Recording sensor of a distinct type."""
+
+
+def _build_model(world_count=1):
+    world = newton.ModelBuilder()
+    body = world.add_body(xform=wp.transform(wp.vec3(0.0, 0.0, 0.09)))
+    world.add_shape_sphere(body, radius=0.1, label="ball")
+    builder = newton.ModelBuilder()
+    builder.add_ground_plane()
+    for _ in range(world_count):
+        builder.add_world(world)
+    return builder
+
+
+class TestSensorScheduler(unittest.TestCase):
+    def _run(self, scheduler, sensors, steps, state=None, contacts=None):
+        for step in range(steps):
+            for sensor in sensors:
+                sensor.step = step
+            scheduler.update(state, contacts)
+
+    def test_periods_and_offsets(self):
+        model = _build_model().finalize(device="cpu")
+        scheduler = SensorScheduler(model, dt=0.002)
+        every_step = _RecordingSensor()
+        every_third = _RecordingSensor()
+        shifted = _RecordingSensor()
+        by_rate = _RecordingSensor()
+        scheduler.add(every_step)
+        scheduler.add(every_third, period=3, marker=1)
+        scheduler.add(shifted, period=3, offset=1)
+        scheduler.add(by_rate, rate=100.0)
+
+        self._run(scheduler, [every_step, every_third, shifted, by_rate], 12)
+
+        self.assertEqual(every_step.steps, list(range(12)))
+        self.assertEqual(every_third.steps, [0, 3, 6, 9])
+        self.assertEqual(every_third.kwargs[0], {"marker": 1})
+        self.assertEqual(shifted.steps, [2, 5, 8, 11])
+        self.assertEqual(by_rate.steps, [0, 5, 10])
+        self.assertEqual(int(scheduler.step_count.numpy()[0]), 12)
+
+        scheduler.reset()
+        every_third.steps.clear()
+        self._run(scheduler, [every_step, every_third, shifted, by_rate], 1)
+        self.assertEqual(every_third.steps, [0])
+
+    def test_same_schedule_shares_group(self):
+        model = _build_model().finalize(device="cpu")
+        scheduler = SensorScheduler(model)
+        first, second, third = _RecordingSensor(), _OtherRecordingSensor(), _RecordingSensor()
+        scheduler.add(first, period=2)
+        scheduler.add(second, period=2, offset=2)
+        scheduler.add(third, period=2)
+        self.assertEqual(len(scheduler._groups), 1)
+        # sensors of a group update in registration order
+        self.assertEqual(scheduler.sensors, [first, second, third])
+
+        self._run(scheduler, [first, second, third], 5)
+        self.assertEqual(first.steps, [0, 2, 4])
+        self.assertEqual(second.steps, [0, 2, 4])
+        self.assertEqual(third.steps, [0, 2, 4])
+
+    def test_batched_sensors_match_individual_updates(self):
+        builder = newton.ModelBuilder()
+        sites = []
+        for i in range(3):
+            body = builder.add_body(xform=wp.transform(wp.vec3(float(i), 0.0, 1.0), wp.quat_identity()))
+            builder.add_shape_box(body, hx=0.1, hy=0.1, hz=0.1, label=f"box_{i}")
+            sites.append(builder.add_site(body, xform=wp.transform(wp.vec3(0.1, 0.0, 0.0), wp.quat_identity())))
+        model = builder.finalize(device="cpu")
+
+        def make_sensors():
+            return [
+                SensorIMU(model, sites=sites[:2]),
+                SensorFrameTransform(model, shapes=["box_0", "box_1"], reference_sites=[sites[2]]),
+                _RecordingSensor(),
+                SensorIMU(model, sites=sites[2:]),
+                SensorFrameTransform(model, shapes=["box_2"], reference_sites=[sites[0]]),
+            ]
+
+        batched = make_sensors()
+        individual = make_sensors()
+        scheduler = SensorScheduler(model)
+        for sensor in batched:
+            scheduler.add(sensor, period=2)
+
+        rng = np.random.default_rng(42)
+        state = model.state()
+        for step in range(3):
+            q = rng.standard_normal((3, 7)).astype(np.float32)
+            q[:, 3:] /= np.linalg.norm(q[:, 3:], axis=1, keepdims=True)
+            state.body_q.assign(q)
+            state.body_qd.assign(rng.standard_normal((3, 6)).astype(np.float32))
+            state.body_qdd.assign(rng.standard_normal((3, 6)).astype(np.float32))
+            batched[2].step = step
+            scheduler.update(state)
+            if step % 2 == 0:
+                for sensor in individual:
+                    sensor.update(state)
+
+            for ours, reference in zip(batched, individual, strict=True):
+                if isinstance(ours, SensorIMU):
+                    np.testing.assert_allclose(ours.accelerometer.numpy(), reference.accelerometer.numpy(), atol=1e-5)
+                    np.testing.assert_allclose(ours.gyroscope.numpy(), reference.gyroscope.numpy(), atol=1e-5)
+                elif isinstance(ours, SensorFrameTransform):
+                    np.testing.assert_allclose(ours.transforms.numpy(), reference.transforms.numpy(), atol=1e-5)
+        self.assertEqual(batched[2].steps, [0, 2])
+
+        # one fused update per sensor type, with the batch in place of its first sensor
+        plan = scheduler._group_plans[0]
+        self.assertEqual(len(plan), 3)
+        self.assertEqual(plan[2], (batched[2], {}))
+
+    def test_stagger_worlds(self):
+        model = _build_model(world_count=4).finalize(device="cpu")
+        scheduler = SensorScheduler(model)
+        sensor = _RecordingWorldSensor()
+        scheduler.add(sensor, period=2, stagger_worlds=True)
+
+        self._run(scheduler, [sensor], 4)
+
+        # worlds 0-1 refresh on even steps and worlds 2-3 on odd steps
+        self.assertEqual(sorted(sensor.masks), [0, 1, 2, 3])
+        np.testing.assert_array_equal(sensor.masks[0], [True, True, False, False])
+        np.testing.assert_array_equal(sensor.masks[1], [False, False, True, True])
+        np.testing.assert_array_equal(sensor.masks[2], sensor.masks[0])
+
+    def test_contact_sensor(self):
+        builder = _build_model(world_count=2)
+        model = builder.finalize(device="cpu")
+        sensor = SensorContact(model, sensing_shapes="ball")
+        state = model.state()
+        pipeline = newton.CollisionPipeline(model, broad_phase="nxn")
+        contacts = pipeline.contacts()
+        pipeline.collide(state, contacts)
+        contacts.force.fill_(wp.spatial_vector(0.0, 0.0, 1.0, 0.0, 0.0, 0.0))
+
+        scheduler = SensorScheduler(model)
+        scheduler.add(sensor, period=2, offset=1)
+
+        scheduler.update(state, contacts)
+        np.testing.assert_array_equal(sensor.total_force.numpy(), 0.0)
+        scheduler.update(state, contacts)
+        self.assertTrue(np.all(np.abs(sensor.total_force.numpy()[:, 2]) > 0.0))
+
+        with self.assertRaises(ValueError):
+            scheduler.update(state, None)
+
+    def test_validation(self):
+        model = _build_model().finalize(device="cpu")
+        scheduler = SensorScheduler(model)
+        sensor = _RecordingSensor()
+        with self.assertRaises(ValueError):
+            scheduler.add(sensor, rate=30.0)
+        with self.assertRaises(ValueError):
+            scheduler.add(sensor, period=2, rate=30.0)
+        with self.assertRaises(ValueError):
+            scheduler.add(sensor, period=0)
+        with self.assertRaises(ValueError):
+            scheduler.add(sensor, stagger_worlds=True)
+        with self.assertRaises(TypeError):
+            scheduler.add(object())
+
+    @unittest.skipUnless(wp.is_cuda_available(), "Requires CUDA")
+    def test_graph_capture(self):
+        device = wp.get_cuda_device()
+        if not wp.is_conditional_graph_supported():
+            self.skipTest("Conditional graph nodes not supported")
+        builder = _build_model(world_count=2)
+        model = builder.finalize(device=device)
+        state = model.state()
+        pipeline = newton.CollisionPipeline(model, broad_phase="nxn")
+        sensor = SensorContact(model, sensing_shapes="ball")
+        contacts = pipeline.contacts()
+        pipeline.collide(state, contacts)
+        contacts.force.fill_(wp.spatial_vector(0.0, 0.0, 1.0, 0.0, 0.0, 0.0))
+
+        scheduler = SensorScheduler(model)
+        scheduler.add(sensor, period=3, offset=2)
+        scheduler.update(state, contacts)
+        scheduler.reset()
+        sensor.total_force.zero_()
+
+        with wp.ScopedCapture(device) as capture:
+            scheduler.update(state, contacts)
+        wp.capture_launch(capture.graph)
+        np.testing.assert_array_equal(sensor.total_force.numpy(), 0.0)
+        wp.capture_launch(capture.graph)
+        self.assertTrue(np.all(np.abs(sensor.total_force.numpy()[:, 2]) > 0.0))
+        self.assertEqual(int(scheduler.step_count.numpy()[0]), 2)
+
+
+if __name__ == "__main__":
+    wp.clear_kernel_cache()
+    unittest.main(verbosity=2)
@@ -368,6 +368,34 @@ class TestSensorTiledCamera(unittest.TestCase):
             forward_depth_only_image.numpy(), forward_depth_image.numpy(), rtol=1.0e-5, atol=1.0e-5
         )
 
+    def test_world_mask_skips_masked_worlds(self) -> None:
+        world = newton.ModelBuilder(up_axis=newton.Axis.Z)
+        body = world.add_body(xform=wp.transform(p=wp.vec3(0.0, 0.0, -5.0), q=wp.quat_identity()))
+        world.add_shape_box(body, hx=10.0, hy=10.0, hz=0.1)
+        builder = newton.ModelBuilder(up_axis=newton.Axis.Z)
+        builder.add_world(world)
+        builder.add_world(world)
+        model = builder.finalize(device="cpu")
+
+        sensor = SensorTiledCamera(model=model)
+        width, height = 4, 4
+        camera_transforms = wp.array(
+            [[wp.transformf(wp.vec3f(0.0), wp.quatf(0.0, 0.0, 0.0, 1.0))] * 2],
+            dtype=wp.transformf,
+            device="cpu",
+        )
+        camera_rays = sensor.utils.compute_camera_rays_pinhole(width, height, camera_fovs=math.radians(90.0))
+        depth_image = sensor.utils.create_depth_image_output(width, height)
+        depth_image.fill_(-7.0)
+
+        state = model.state()
+        world_mask = wp.array([False, True], dtype=wp.bool, device="cpu")
+        sensor.update(state, camera_transforms, camera_rays, world_mask=world_mask, depth_image=depth_image)
+
+        depth_np = depth_image.numpy()
+        np.testing.assert_array_equal(depth_np[0], -7.0)
+        self.assertTrue(np.all(depth_np[1] > 0.0))
+
     def test_cloth_renders_via_triangle_mesh_construction(self) -> None:
         """wp.Mesh must be lazily constructed on the first render call for cloth models.
 
@@ -0,0 +1,190 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for island-based rigid-body sleeping."""
+
+import unittest
+
+import numpy as np
+import warp as wp
+
+import newton
+from newton.tests.unittest_utils import add_function_test, get_test_devices
+
+_DT = 1.0 / 120.0
+
+
+def _build_stacks(device, stack_count: int = 2, stack_height: int = 2, time_to_sleep: float = 0.25):
+    builder = newton.ModelBuilder()
+    builder.add_ground_plane()
+    for i in range(stack_count):
+        for k in range(stack_height):
+            body = builder.add_body(xform=wp.transform((1.0 * i, 0.0, 0.1 + 0.21 * k), wp.quat_identity()))
+            builder.add_shape_box(body, hx=0.1, hy=0.1, hz=0.1)
+    model = builder.finalize(device=device)
+    sleep = newton.SleepManager(model, time_to_sleep=time_to_sleep)
+    return model, sleep
+
+
+class _Sim:
+    def __init__(self, model, sleep, solver_cls=newton.solvers.SolverXPBD):
+        self.model = model
+        self.sleep = sleep
+        self.solver = solver_cls(model)
+        self.pipeline = newton.CollisionPipeline(model)
+        self.contacts = self.pipeline.contacts()
+        self.state_0 = model.state()
+        self.state_1 = model.state()
+
+    def step(self, count: int = 1):
+        for _ in range(count):
+            self.pipeline.collide(self.state_0, self.contacts)
+            self.solver.step(self.state_0, self.state_1, None, self.contacts, _DT)
+            self.state_0, self.state_1 = self.state_1, self.state_0
+            self.sleep.update(self.state_0, self.contacts, _DT)
+
+
+def test_resting_stacks_fall_asleep(test, device):
+    model, sleep = _build_stacks(device)
+    sim = _Sim(model, sleep)
+    sim.step(120)
+
+    np.testing.assert_array_equal(sim.state_0.body_sleeping.numpy(), 1)
+    np.testing.assert_array_equal(sim.state_0.body_qd.numpy(), 0.0)
+    # Each stack forms its own island.
+    island = sleep.body_island.numpy()
+    test.assertEqual(island[0], island[1])
+    test.assertEqual(island[2], island[3])
+    test.assertNotEqual(island[0], island[2])
+
+    # Sleeping bodies are frozen and generate no contacts.
+    body_q = sim.state_0.body_q.numpy()
+    sim.step(10)
+    np.testing.assert_array_equal(sim.state_0.body_q.numpy(), body_q)
+    test.assertEqual(int(sim.contacts.rigid_contact_count.numpy()[0]), 0)
+
+
+def test_wake_on_contact(test, device):
+    model, sleep = _build_stacks(device)
+    sim = _Sim(model, sleep)
+    sim.step(120)
+    np.testing.assert_array_equal(sim.state_0.body_sleeping.numpy(), 1)
+
+    # Waking the bottom box of the first stack wakes the box resting on it.
+    body_mask = wp.array([True, False, False, False], dtype=wp.bool, device=device)
+    sleep.wake(sim.state_0, body_mask)
+    np.testing.assert_array_equal(sim.state_0.body_sleeping.numpy(), [0, 1, 1, 1])
+    sim.step(1)
+    np.testing.assert_array_equal(sim.state_0.body_sleeping.numpy(), [0, 0, 1, 1])
+
+    # Push the first stack into the second one, which must wake on impact.
+    body_qd = sim.state_0.body_qd.numpy()
+    body_qd[0:2, 0] = 3.0
+    sim.state_0.body_qd.assign(body_qd)
+    woke = False
+    for _ in range(60):
+        sim.step(1)
+        if not sim.state_0.body_sleeping.numpy()[2:].any():
+            woke = True
+            break
+    test.assertTrue(woke)
+
+
+def test_joint_island_wakes_together(test, device):
+    builder = newton.ModelBuilder(gravity=(0.0, 0.0, 0.0))
+    parent = builder.add_body(xform=wp.transform((0.0, 0.0, 1.0), wp.quat_identity()))
+    builder.add_shape_sphere(parent, radius=0.1)
+    child = builder.add_body(xform=wp.transform((0.5, 0.0, 1.0), wp.quat_identity()))
+    builder.add_shape_sphere(child, radius=0.1)
+    builder.add_joint_revolute(parent, child, parent_xform=wp.transform((0.5, 0.0, 0.0), wp.quat_identity()))
+    model = builder.finalize(device=device)
+    sleep = newton.SleepManager(model, time_to_sleep=0.1)
+    sim = _Sim(model, sleep)
+    sim.step(20)
+    np.testing.assert_array_equal(sim.state_0.body_sleeping.numpy(), 1)
+    test.assertEqual(sleep.body_island.numpy()[child], parent)
+
+    sleep.wake(sim.state_0, wp.array([False, True], dtype=wp.bool, device=device))
+    sleep.update(sim.state_0, sim.contacts, _DT)
+    np.testing.assert_array_equal(sim.state_0.body_sleeping.numpy(), 0)
+
+
+def test_semi_implicit_holds_sleeping_bodies(test, device):
+    model, sleep = _build_stacks(device, stack_count=1, stack_height=1)
+    solver = newton.solvers.SolverSemiImplicit(model)
+    state_0, state_1 = model.state(), model.state()
+    state_0.body_sleeping.fill_(1)
+    body_q = state_0.body_q.numpy()
+    solver.step(state_0, state_1, None, None, _DT)
+    np.testing.assert_array_equal(state_1.body_q.numpy(), body_q)
+    np.testing.assert_array_equal(state_1.body_sleeping.numpy(), 1)
+
+    # Awake bodies fall under gravity.
+    sleep.wake(state_0)
+    solver.step(state_0, state_1, None, None, _DT)
+    test.assertLess(state_1.body_qd.numpy()[0, 2], 0.0)
+
+
+def test_kinematic_body_wakes_island(test, device):
+    builder = newton.ModelBuilder()
+    builder.add_ground_plane()
+    box = builder.add_body(xform=wp.transform((0.0, 0.0, 0.1), wp.quat_identity()))
+    builder.add_shape_box(box, hx=0.1, hy=0.1, hz=0.1)
+    pusher = builder.add_body(xform=wp.transform((0.0, 0.0, 0.3), wp.quat_identity()), is_kinematic=True)
+    builder.add_shape_box(pusher, hx=0.1, hy=0.1, hz=0.1)
+    model = builder.finalize(device=device)
+    sleep = newton.SleepManager(model, time_to_sleep=0.1)
+    sim = _Sim(model, sleep)
+    sim.step(60)
+    np.testing.assert_array_equal(sim.state_0.body_sleeping.numpy(), [1, 0])
+
+    body_qd = sim.state_0.body_qd.numpy()
+    body_qd[pusher, 2] = -0.5
+    sim.state_0.body_qd.assign(body_qd)
+    sim.step(1)
+    test.assertEqual(int(sim.state_0.body_sleeping.numpy()[box]), 0)
+
+
+class TestSleep(unittest.TestCase):
+    def test_state_attribute_is_requested(self):
+        model, _sleep = _build_stacks("cpu")
+        self.assertIn("body_sleeping", newton.State.EXTENDED_ATTRIBUTES)
+        state = model.state()
+        self.assertEqual(state.body_sleeping.dtype, wp.int32)
+        self.assertEqual(state.body_sleeping.shape, (model.body_count,))
+
+    def test_missing_state_attribute(self):
+        model, _sleep = _build_stacks("cpu")
+        sleep = newton.SleepManager(model, request_state_attributes=False)
+        state = newton.State()
+        state.body_qd = model.state().body_qd
+        with self.assertRaises(ValueError):
+            sleep.update(state, None, _DT)
+
+    def test_invalid_arguments(self):
+        model, _sleep = _build_stacks("cpu")
+        with self.assertRaises(ValueError):
+            newton.SleepManager(model, linear_velocity_threshold=-1.0)
+        with self.assertRaises(ValueError):
+            newton.SleepManager(model, angular_velocity_threshold=float("nan"))
+        with self.assertRaises(ValueError):
+            newton.SleepManager(model, time_to_sleep=0.0)
+        state = model.state()
+        with self.assertRaises(ValueError):
+            _sleep.update(state, None, -1.0)
+        with self.assertRaises(ValueError):
+            _sleep.wake(state, wp.zeros(1, dtype=wp.bool, device="cpu"))
+
+
+devices = get_test_devices()
+add_function_test(TestSleep, "test_resting_stacks_fall_asleep", test_resting_stacks_fall_asleep, devices=devices)
+add_function_test(TestSleep, "test_wake_on_contact", test_wake_on_contact, devices=devices)
+add_function_test(TestSleep, "test_joint_island_wakes_together", test_joint_island_wakes_together, devices=devices)
+add_function_test(
+    TestSleep, "test_semi_implicit_holds_sleeping_bodies", test_semi_implicit_holds_sleeping_bodies, devices=devices
+)
+add_function_test(TestSleep, "test_kinematic_body_wakes_island", test_kinematic_body_wakes_island, devices=devices)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -1430,6 +1430,8 @@ def _rigid_contact_dual_update_computes_lambda(test, device):
                 contact_rho,
                 contact_rho,
                 0.0,
+                wp.zeros(3, dtype=wp.int32, device=device),  # body_world
+                None,  # world_active
                 penalty_k,
                 contact_lambda,
             ],
@@ -1604,6 +1606,8 @@ def _joint_angular_dual_projects_free_axis_lambda(test, device):
                 joint_rest_angle,
                 drive_limit_support,
                 1.0 / 60.0,
+                wp.zeros(1, dtype=wp.int32, device=device),  # joint_world
+                None,  # world_active
             ],
             outputs=[
                 joint_penalty_k,
@@ -1701,6 +1705,8 @@ def _rod_soft_dual_slots_clear_preserved_lambda(test, device):
                 joint_rest_angle,
                 drive_limit_support,
                 1.0 / 60.0,
+                wp.zeros(1, dtype=wp.int32, device=device),  # joint_world
+                None,  # world_active
             ],
             outputs=[
                 joint_penalty_k,
@@ -3735,6 +3741,72 @@ def _soft_contact_presize_is_world_aware(test, device):
         test.assertEqual(sizes[4], 4 * sizes[1], f"{globals_kind=}")
 
 
+def _adaptive_iterations_mask_converged_worlds(test, device):
+    """Converged worlds stop iterating, and each world matches a fixed-budget solve of its iteration count."""
+    link_count = 3
+    particle_count = 6
+    builder = newton.ModelBuilder(gravity=(0.0, 0.0, 0.0))
+    for _ in range(2):
+        builder.begin_world()
+        parent = -1
+        joints = []
+        for i in range(link_count):
+            body = builder.add_link(xform=wp.transform(wp.vec3(0.5 * i, 0.0, 0.0), wp.quat_identity()), mass=1.0)
+            builder.add_shape_box(body, hx=0.1, hy=0.1, hz=0.1)
+            parent_xform = wp.transform(wp.vec3(0.5 if parent >= 0 else 0.0, 0.0, 0.0), wp.quat_identity())
+            joints.append(builder.add_joint_revolute(parent, body, axis=(0.0, 0.0, 1.0), parent_xform=parent_xform))
+            parent = body
+        builder.add_articulation(joints)
+        particles = [
+            builder.add_particle(pos=(0.2 * i, 1.0, 0.0), vel=(0.0, 0.0, 0.0), mass=1.0) for i in range(particle_count)
+        ]
+        for i in range(particle_count - 1):
+            builder.add_spring(particles[i], particles[i + 1], ke=1.0e4, kd=0.0, control=0.0)
+        builder.end_world()
+    builder.color()
+    model = builder.finalize(device=device)
+
+    # Pull the second world's chain off its joint anchors and stretch its spring chain; the first world is at rest.
+    state_init = model.state()
+    body_q = state_init.body_q.numpy()
+    body_q[link_count + 1 :, 1] += 0.3
+    state_init.body_q.assign(body_q)
+    particle_q = state_init.particle_q.numpy()
+    particle_q[-1, 0] += 0.3
+    state_init.particle_q.assign(particle_q)
+
+    def solve(iterations, tolerance):
+        solver = newton.solvers.SolverVBD(
+            model, iterations=iterations, rigid_compliant_alm=True, convergence_tolerance=tolerance
+        )
+        state_in = model.state()
+        state_out = model.state()
+        state_in.assign(state_init)
+        solver.step(state_in, state_out, None, None, 1.0 / 60.0)
+        return solver.world_iterations, state_out.body_q.numpy(), state_out.particle_q.numpy()
+
+    iterations = 30
+    with test.assertRaises(ValueError):
+        newton.solvers.SolverVBD(model, iterations=iterations, rigid_compliant_alm=True, convergence_tolerance=-1.0)
+    test.assertIsNone(solve(iterations, None)[0])
+
+    world_iterations, body_q_adaptive, particle_q_adaptive = solve(iterations, 3.0e-3)
+    world_iterations = world_iterations.numpy()
+    test.assertEqual(world_iterations[0], 1)
+    test.assertGreater(world_iterations[1], 1)
+    test.assertLess(world_iterations[1], iterations)
+    np.testing.assert_allclose(body_q_adaptive[:link_count], state_init.body_q.numpy()[:link_count], atol=1e-6)
+    np.testing.assert_allclose(
+        particle_q_adaptive[:particle_count], state_init.particle_q.numpy()[:particle_count], atol=1e-6
+    )
+    for world in range(2):
+        _, body_q_fixed, particle_q_fixed = solve(int(world_iterations[world]), None)
+        bodies = slice(link_count * world, link_count * (world + 1))
+        particles = slice(particle_count * world, particle_count * (world + 1))
+        np.testing.assert_allclose(body_q_adaptive[bodies], body_q_fixed[bodies], atol=1e-6)
+        np.testing.assert_allclose(particle_q_adaptive[particles], particle_q_fixed[particles], atol=1e-6)
+
+
 class TestSolverVBD(unittest.TestCase):
     pass
 
@@ -4069,6 +4141,12 @@ add_function_test(
     _soft_contact_presize_is_world_aware,
     devices=devices,
 )
+add_function_test(
+    TestSolverVBD,
+    "test_adaptive_iterations_mask_converged_worlds",
+    _adaptive_iterations_mask_converged_worlds,
+    devices=devices,
+)
 
 
 def _build_edge_over_post(device):
@@ -1840,6 +1840,97 @@ def test_xpbd_aligned_box_stack_remains_stable(test, device):
     )
 
 
+def test_xpbd_adaptive_iterations_per_world(test, device):
+    """Converged worlds stop iterating while unconverged worlds use the full budget."""
+    builder = newton.ModelBuilder(gravity=(0.0, 0.0, 0.0))
+    for _ in range(2):
+        builder.begin_world()
+        parent = builder.add_link()
+        builder.add_shape_sphere(parent, radius=0.1)
+        child = builder.add_link(xform=wp.transform(wp.vec3(0.5, 0.0, 0.0), wp.quat_identity()))
+        builder.add_shape_sphere(child, radius=0.1)
+        root_joint = builder.add_joint_free(child=parent)
+        ball_joint = builder.add_joint_ball(
+            parent=parent,
+            child=child,
+            parent_xform=wp.transform(wp.vec3(0.25, 0.0, 0.0), wp.quat_identity()),
+            child_xform=wp.transform(wp.vec3(-0.25, 0.0, 0.0), wp.quat_identity()),
+        )
+        builder.add_articulation([root_joint, ball_joint])
+        builder.end_world()
+
+    model = builder.finalize(device=device)
+    state_init = model.state()
+    newton.eval_fk(model, model.joint_q, model.joint_qd, state_init)
+
+    # Pull the child of the second world away from its joint anchor.
+    body_q = state_init.body_q.numpy()
+    body_q[3, :3] += np.array((0.3, 0.3, 0.0), dtype=np.float32)
+    state_init.body_q.assign(body_q)
+
+    iterations = 6
+    with test.assertRaises(ValueError):
+        newton.solvers.SolverXPBD(model, iterations=iterations, convergence_tolerance=-1.0)
+    test.assertIsNone(newton.solvers.SolverXPBD(model, iterations=iterations).world_iterations)
+
+    results = []
+    for tolerance in (None, 1.0e-6):
+        solver = newton.solvers.SolverXPBD(model, iterations=iterations, convergence_tolerance=tolerance)
+        state0 = model.state()
+        state1 = model.state()
+        state0.assign(state_init)
+        solver.step(state0, state1, None, None, 1.0 / 240.0)
+        results.append((solver, state1.body_q.numpy()))
+
+    (_, body_q_fixed), (adaptive_solver, body_q_adaptive) = results
+    np.testing.assert_array_equal(adaptive_solver.world_iterations.numpy(), [1, iterations])
+    # The resting world is untouched and the perturbed world matches the fixed-budget solve.
+    np.testing.assert_allclose(body_q_adaptive[:2], state_init.body_q.numpy()[:2], atol=1e-6)
+    np.testing.assert_allclose(body_q_adaptive[2:], body_q_fixed[2:], atol=1e-6)
+
+
+def test_xpbd_adaptive_iterations_contact_force(test, device):
+    """Converged worlds stop accumulating contact impulses into the reported contact force."""
+    radius = 0.25
+    builder = newton.ModelBuilder(gravity=(0.0, 0.0, 0.0))
+    builder.add_ground_plane()
+    for penetration in (0.001, 0.02):
+        builder.begin_world()
+        body = builder.add_body(xform=wp.transform(wp.vec3(0.0, 0.0, radius - penetration), wp.quat_identity()))
+        builder.add_shape_sphere(body=body, radius=radius)
+        builder.end_world()
+    model = builder.finalize(device=device)
+    model.request_contact_attributes("force")
+    collision_pipeline = newton.CollisionPipeline(model)
+
+    def world_forces(iterations, tolerance):
+        solver = newton.solvers.SolverXPBD(model, iterations=iterations, convergence_tolerance=tolerance)
+        state_in = model.state()
+        state_out = model.state()
+        contacts = collision_pipeline.contacts()
+        collision_pipeline.collide(state_in, contacts)
+        solver.step(state_in, state_out, None, contacts, 1.0 / 60.0)
+        solver.update_contacts(contacts, state_out)
+        count = int(contacts.rigid_contact_count.numpy()[0])
+        shape_body = model.shape_body.numpy()
+        bodies = np.maximum(
+            shape_body[contacts.rigid_contact_shape0.numpy()[:count]],
+            shape_body[contacts.rigid_contact_shape1.numpy()[:count]],
+        )
+        force_z = contacts.force.numpy()[:count, 2]
+        return solver.world_iterations, np.array([np.abs(force_z[bodies == b]).sum() for b in range(2)])
+
+    iterations = 8
+    world_iterations, adaptive = world_forces(iterations, 1.0e-3)
+    world_iterations = world_iterations.numpy()
+    test.assertLess(world_iterations[0], world_iterations[1])
+    test.assertGreater(adaptive[0], 0.0)
+    # Each world reports the force of a fixed-budget solve that ran as many iterations as the world used.
+    for world in range(2):
+        _, fixed = world_forces(int(world_iterations[world]), None)
+        np.testing.assert_allclose(adaptive[world], fixed[world], rtol=1e-5)
+
+
 devices = get_test_devices()
 
 
@@ -2052,6 +2143,21 @@ add_function_test(
     check_output=False,
 )
 
+add_function_test(
+    TestSolverXPBD,
+    "test_xpbd_adaptive_iterations_per_world",
+    test_xpbd_adaptive_iterations_per_world,
+    devices=devices,
+)
+
+add_function_test(
+    TestSolverXPBD,
+    "test_xpbd_adaptive_iterations_contact_force",
+    test_xpbd_adaptive_iterations_contact_force,
+    devices=devices,
+    check_output=False,
+)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2, failfast=True)
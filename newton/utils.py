@@ -7,10 +7,13 @@ from typing import TYPE_CHECKING
 # ==================================================================================
 # sim utils
 # ==================================================================================
-from ._src.sim.graph_coloring import color_graph, plot_graph
+from ._src.sim._model_cache import load_or_build_model
+from ._src.sim.graph_coloring import IncrementalGraphColoring, color_graph, plot_graph
 
 __all__ = [
+    "IncrementalGraphColoring",
     "color_graph",
+    "load_or_build_model",
     "plot_graph",
 ]
 
@@ -156,11 +159,21 @@ __all__ += [
 # run benchmark
 # ==================================================================================
 
-from ._src.utils.benchmark import EventTracer, event_scope, run_benchmark  # noqa: E402
+from ._src.utils.benchmark import (  # noqa: E402
+    EventTracer,
+    Profiler,
+    ProfileStats,
+    event_scope,
+    profile_scope,
+    run_benchmark,
+)
 
 __all__ += [
     "EventTracer",
+    "ProfileStats",
+    "Profiler",
     "event_scope",
+    "profile_scope",
     "run_benchmark",
 ]
 
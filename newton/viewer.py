@@ -4,6 +4,7 @@
 # Import all viewer classes (they handle missing dependencies at instantiation time)
 from ._src.viewer import (
     Layer,
+    RecordingCodec,
     ViewerBase,
     ViewerFile,
     ViewerGL,
@@ -16,6 +17,7 @@ from ._src.viewer import (
 
 __all__ = [
     "Layer",
+    "RecordingCodec",
     "ViewerBase",
     "ViewerFile",
     "ViewerGL",